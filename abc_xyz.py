@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+ABC-XYZ Classification Engine - 3회차 실습 데이터를 벡터 연산으로 분류하고 3×3 매트릭스 생성
+3회차 "ABC-XYZ 재고 분류와 운영 전략"의 기준을 그대로 사용:
+- ABC: 구매금액 내림차순 누적 비율 80% 이내 A, 95% 이내 B, 나머지 C (첫 품목은 항상 A)
+- XYZ: 변동계수 CV = 표준편차 ÷ 평균, 20% 이하 X, 50% 이하 Y, 그 이상(평균 0 포함) Z
+
+입력 CSV (둘 중 하나, 열 이름으로 자동 판별):
+- 기간별 수요: sku, unit_price, m01, m02, ... (period_prefix + 숫자 열)
+- 요약: sku, unit_price, annual_qty, demand_mean, demand_std (spend 열이 있으면 그대로 사용)
+
+CSV는 scm_data.iter_csv_chunks로 chunk_size 행씩 읽고, 청크마다 구매금액/CV만 계산해
+품목당 float 두 개만 남김 → ABC 누적 비율은 전체 정렬 한 번(argsort + cumsum)
+
+결과:
+- AbcXyzResult.matrix(): 3×3 품목 수/구매금액 (np.bincount 한 번씩)
+- to_slide_data(): 셀별 수치 + 운영 정책 (JSON 직렬화 가능) → add_abc_xyz_matrix_slide가 그림
+
+Usage:
+    from abc_xyz import classify_csv, add_abc_xyz_matrix_slide
+
+    result = classify_csv("materials.csv")
+    print(result.to_slide_data()["cells"]["AX"])
+    add_abc_xyz_matrix_slide(prs, result)
+
+    python3 abc_xyz.py                          # 50,000 SKU 샘플 생성 + 분류 벤치마크
+    python3 abc_xyz.py materials.csv [out.pptx|out.json]
+"""
+
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from scm_data import DEFAULT_CHUNK_SIZE, format_pct, format_won, iter_csv_chunks, read_header, write_csv_columns
+
+ABC_THRESHOLDS = (0.80, 0.95)   # 누적 구매금액 비율 상한 (A, B)
+XYZ_THRESHOLDS = (0.20, 0.50)   # 변동계수 상한 (X, Y)
+ABC_LABELS = ("A", "B", "C")
+XYZ_LABELS = ("X", "Y", "Z")
+
+# 3회차 9가지 조합별 발주 방식 / 안전재고 / 검토 주기
+CELL_POLICIES = {
+    "AX": ("EOQ", "낮음 (1-2주)", "월 1회"),
+    "AY": ("POQ (2-4주)", "중간 (2-3주)", "주 1회"),
+    "AZ": ("L4L", "높음 (3-4주)", "일일"),
+    "BX": ("EOQ", "낮음 (1-2주)", "분기 1회"),
+    "BY": ("POQ (4주)", "중간 (2주)", "월 1회"),
+    "BZ": ("L4L", "높음 (3주)", "주 1회"),
+    "CX": ("고정 Lot", "매우 낮음", "반기 1회"),
+    "CY": ("POQ (월간)", "낮음", "분기 1회"),
+    "CZ": ("Min-Max", "중간", "반기 1회"),
+}
+
+
+# ============================================================================
+# 벡터 분류
+# ============================================================================
+
+def coefficient_of_variation(demand, ddof=0):
+    """기간별 수요 (품목 × 기간) → 품목별 CV (평균 0 이하 → inf), 빈 칸(NaN)은 수요 0"""
+    demand = np.nan_to_num(np.asarray(demand, dtype=np.float64))
+    mean = demand.mean(axis=1)
+    std = demand.std(axis=1, ddof=ddof)
+    return _safe_ratio(std, mean)
+
+
+def _safe_ratio(std, mean):
+    cv = np.full(mean.shape, np.inf)
+    np.divide(std, mean, out=cv, where=mean > 0)
+    return cv
+
+
+def abc_classes(spend, thresholds=ABC_THRESHOLDS):
+    """구매금액 → ABC 등급 (0=A, 1=B, 2=C), 누적 비율 = 해당 품목까지 포함한 비율"""
+    spend = np.nan_to_num(np.asarray(spend, dtype=np.float64))
+    order = np.argsort(-spend, kind="stable")
+    total = spend.sum()
+    cumulative = np.cumsum(spend[order]) / total if total > 0 else np.ones(len(spend))
+    ranked = np.searchsorted(np.asarray(thresholds), cumulative, side="left").astype(np.int8)
+    if len(ranked):
+        ranked[0] = 0
+    classes = np.empty(len(spend), dtype=np.int8)
+    classes[order] = ranked
+    return classes
+
+
+def xyz_classes(cv, thresholds=XYZ_THRESHOLDS):
+    """변동계수 → XYZ 등급 (0=X, 1=Y, 2=Z), NaN은 Z"""
+    cv = np.where(np.isnan(cv), np.inf, cv)
+    return np.searchsorted(np.asarray(thresholds), cv, side="left").astype(np.int8)
+
+
+class AbcXyzResult:
+    """품목별 구매금액/CV/등급 배열 + 3×3 매트릭스 집계"""
+
+    def __init__(self, sku, spend, cv, abc_thresholds=ABC_THRESHOLDS, xyz_thresholds=XYZ_THRESHOLDS):
+        self.sku = np.asarray(sku)
+        self.spend = np.asarray(spend, dtype=np.float64)
+        self.cv = np.asarray(cv, dtype=np.float64)
+        self.abc = abc_classes(self.spend, abc_thresholds)
+        self.xyz = xyz_classes(self.cv, xyz_thresholds)
+
+    def __len__(self):
+        return len(self.sku)
+
+    @property
+    def labels(self):
+        """품목별 "AX" ... "CZ" """
+        codes = np.array([a + x for a in ABC_LABELS for x in XYZ_LABELS])
+        return codes[self.abc * 3 + self.xyz]
+
+    def matrix(self):
+        """(품목 수 3×3 int, 구매금액 3×3 float) - 행 A/B/C, 열 X/Y/Z"""
+        cell = self.abc.astype(np.intp) * 3 + self.xyz
+        counts = np.bincount(cell, minlength=9).reshape(3, 3)
+        spend = np.bincount(cell, weights=np.nan_to_num(self.spend), minlength=9).reshape(3, 3)
+        return counts, spend
+
+    def to_slide_data(self):
+        """슬라이드 생성기용 dict (JSON 직렬화 가능)"""
+        counts, spend = self.matrix()
+        total_count = int(counts.sum())
+        total_spend = float(spend.sum())
+        cells = {}
+        for i, a in enumerate(ABC_LABELS):
+            for j, x in enumerate(XYZ_LABELS):
+                order, safety, review = CELL_POLICIES[a + x]
+                cells[a + x] = {
+                    "count": int(counts[i, j]),
+                    "count_share": counts[i, j] / total_count if total_count else 0.0,
+                    "spend": float(spend[i, j]),
+                    "spend_share": spend[i, j] / total_spend if total_spend else 0.0,
+                    "order_policy": order,
+                    "safety_stock": safety,
+                    "review": review,
+                }
+        return {
+            "total_count": total_count,
+            "total_spend": total_spend,
+            "abc": {a: int(counts[i].sum()) for i, a in enumerate(ABC_LABELS)},
+            "xyz": {x: int(counts[:, j].sum()) for j, x in enumerate(XYZ_LABELS)},
+            "cells": cells,
+        }
+
+    def write_csv(self, path, chunk_size=DEFAULT_CHUNK_SIZE):
+        """품목별 결과 CSV (sku, spend, cv, abc, xyz, class)"""
+        write_csv_columns(path, {
+            "sku": self.sku,
+            "spend": self.spend,
+            "cv": self.cv,
+            "abc": np.array(ABC_LABELS)[self.abc],
+            "xyz": np.array(XYZ_LABELS)[self.xyz],
+            "class": self.labels,
+        }, chunk_size=chunk_size)
+
+
+# ============================================================================
+# CSV 스트리밍
+# ============================================================================
+
+def classify_csv(path, chunk_size=DEFAULT_CHUNK_SIZE, period_prefix="m", ddof=0,
+                 abc_thresholds=ABC_THRESHOLDS, xyz_thresholds=XYZ_THRESHOLDS):
+    """CSV를 청크 단위로 읽어 분류 (입력 형식은 모듈 설명 참고)"""
+    header = read_header(path)
+    period_re = re.compile(rf"^{re.escape(period_prefix)}\d+$")
+    periods = [name for name in header if period_re.match(name)]
+    summary = "demand_mean" in header and "demand_std" in header
+
+    if summary:
+        columns = ["sku", "demand_mean", "demand_std"]
+        columns += ["spend"] if "spend" in header else ["unit_price", "annual_qty"]
+    elif periods:
+        columns = ["sku", "unit_price"] + periods
+    else:
+        raise ValueError(f"{path}: 기간별 수요 열({period_prefix}01...) 또는 demand_mean/demand_std 열이 필요")
+
+    skus, spends, cvs = [], [], []
+    for chunk in iter_csv_chunks(path, chunk_size, text_columns=("sku",), columns=columns):
+        skus.append(chunk["sku"])
+        if summary:
+            cvs.append(_safe_ratio(np.nan_to_num(chunk["demand_std"]), np.nan_to_num(chunk["demand_mean"])))
+            spend = chunk["spend"] if "spend" in chunk else chunk["unit_price"] * chunk["annual_qty"]
+        else:
+            demand = np.nan_to_num(np.column_stack([chunk[name] for name in periods]))
+            cvs.append(coefficient_of_variation(demand, ddof))
+            spend = chunk["unit_price"] * demand.sum(axis=1)
+        spends.append(np.nan_to_num(spend))
+
+    if not skus:
+        raise ValueError(f"{path}: 데이터 행이 없음")
+    return AbcXyzResult(np.concatenate(skus), np.concatenate(spends), np.concatenate(cvs),
+                        abc_thresholds, xyz_thresholds)
+
+
+def generate_sample_csv(path, n_skus=50_000, periods=12, seed=3):
+    """실습용 가상 자재 CSV (단가/수요 로그정규, 품목별 변동성 상이)"""
+    rng = np.random.default_rng(seed)
+    unit_price = np.round(rng.lognormal(9.0, 1.2, n_skus), -1)
+    mean_demand = rng.lognormal(3.0, 1.3, n_skus)
+    cv = rng.gamma(2.0, 0.2, n_skus)
+    demand = rng.normal(mean_demand[:, None], (cv * mean_demand)[:, None], (n_skus, periods))
+    demand = np.maximum(np.round(demand), 0)
+    columns = {"sku": np.char.add("MAT-", np.arange(1, n_skus + 1).astype(str)), "unit_price": unit_price}
+    columns.update({f"m{p + 1:02d}": demand[:, p] for p in range(periods)})
+    write_csv_columns(path, columns)
+
+
+# ============================================================================
+# 슬라이드
+# ============================================================================
+
+def add_abc_xyz_matrix_slide(prs, result, title="ABC-XYZ 매트릭스: 9가지 조합별 분포",
+                             governing_message=None, slide_num=None):
+    """
+    3×3 매트릭스 슬라이드 (행 A/B/C × 열 X/Y/Z)
+    셀: 조합 코드, 품목 수(비율), 구매금액(비율), 발주 방식 - 구매금액 비율이 클수록 진한 회색
+
+    Args:
+        result: AbcXyzResult 또는 to_slide_data() dict
+    """
+    from generate_part1_pptx_v2 import (COLOR_BLACK, COLOR_DARK_GRAY, COLOR_LIGHT_GRAY, COLOR_MED_GRAY,
+                                        COLOR_VERY_LIGHT_GRAY, COLOR_WHITE, add_governing_message,
+                                        add_rectangle, add_slide_title, add_text_box)
+    from pptx.enum.text import PP_ALIGN
+    from pptx_layout import content_frame
+
+    data = result.to_slide_data() if isinstance(result, AbcXyzResult) else result
+    cells = data["cells"]
+    if governing_message is None:
+        a_share = sum(cells["A" + x]["spend_share"] for x in XYZ_LABELS)
+        a_count = data["abc"]["A"] / data["total_count"] if data["total_count"] else 0.0
+        governing_message = (f"품목의 {format_pct(a_count)}(A등급)가 구매금액의 {format_pct(a_share)}를 차지 "
+                             f"- 같은 A등급도 XYZ에 따라 발주 방식이 달라집니다")
+
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    add_slide_title(slide, title, slide_num)
+    add_governing_message(slide, governing_message)
+
+    frame = content_frame()
+    header_w, header_h, gap = 1.30, 0.40, 0.06
+    cell_w = (frame.w - header_w - gap * 3) / 3
+    cell_h = (frame.h - header_h - 0.35 - gap * 3) / 3
+    x0, y0 = frame.x + header_w + gap, frame.y + header_h + gap
+
+    for j, (x, name) in enumerate(zip(XYZ_LABELS, ("X (안정)", "Y (중간변동)", "Z (불규칙)"))):
+        add_rectangle(slide, x0 + j * (cell_w + gap), frame.y, cell_w, header_h, COLOR_DARK_GRAY)
+        add_text_box(slide, x0 + j * (cell_w + gap), frame.y + 0.06, cell_w, header_h - 0.1,
+                     f"{name} · {data['xyz'][x]:,}개", font_size=11, bold=True, color=COLOR_WHITE,
+                     align=PP_ALIGN.CENTER)
+
+    for i, (a, name) in enumerate(zip(ABC_LABELS, ("A (고가)", "B (중가)", "C (저가)"))):
+        y = y0 + i * (cell_h + gap)
+        add_rectangle(slide, frame.x, y, header_w, cell_h, COLOR_DARK_GRAY)
+        add_text_box(slide, frame.x + 0.05, y + cell_h / 2 - 0.25, header_w - 0.1, 0.5,
+                     f"{name}\n{data['abc'][a]:,}개", font_size=11, bold=True, color=COLOR_WHITE,
+                     align=PP_ALIGN.CENTER)
+        for j, x in enumerate(XYZ_LABELS):
+            cell = cells[a + x]
+            share = cell["spend_share"]
+            fill, text = ((COLOR_MED_GRAY, COLOR_WHITE) if share >= 0.25 else
+                          (COLOR_LIGHT_GRAY, COLOR_BLACK) if share >= 0.05 else
+                          (COLOR_VERY_LIGHT_GRAY, COLOR_BLACK))
+            cx = x0 + j * (cell_w + gap)
+            add_rectangle(slide, cx, y, cell_w, cell_h, fill)
+            add_text_box(slide, cx + 0.08, y + 0.05, 0.6, 0.35, a + x, font_size=14, bold=True, color=text)
+            add_text_box(slide, cx + 0.70, y + 0.10, cell_w - 0.78, 0.3, cell["order_policy"],
+                         font_size=9, color=text, align=PP_ALIGN.RIGHT)
+            add_text_box(slide, cx + 0.08, y + 0.45, cell_w - 0.16, cell_h - 0.5,
+                         f"품목 {cell['count']:,}개 ({format_pct(cell['count_share'])})\n"
+                         f"구매액 {format_won(cell['spend'])} ({format_pct(cell['spend_share'])})\n"
+                         f"안전재고 {cell['safety_stock']} · 검토 {cell['review']}",
+                         font_size=9, color=text)
+
+    add_text_box(slide, frame.x, frame.bottom - 0.30, frame.w, 0.28,
+                 f"총 {data['total_count']:,}개 품목 · 구매금액 {format_won(data['total_spend'])} · "
+                 f"ABC 누적 {format_pct(ABC_THRESHOLDS[0], 0)}/{format_pct(ABC_THRESHOLDS[1], 0)}, "
+                 f"XYZ CV {format_pct(XYZ_THRESHOLDS[0], 0)}/{format_pct(XYZ_THRESHOLDS[1], 0)} 기준",
+                 font_size=8, color=COLOR_MED_GRAY)
+    return slide
+
+
+def print_matrix(data):
+    """3×3 품목 수 (구매금액 비율)"""
+    print(f"{'':4}" + "".join(f"{x:>22}" for x in XYZ_LABELS))
+    for a in ABC_LABELS:
+        row = "".join(f"{data['cells'][a + x]['count']:>13,} ({format_pct(data['cells'][a + x]['spend_share']):>6})"
+                      for x in XYZ_LABELS)
+        print(f"{a:4}{row}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        csv_path = sys.argv[1]
+    else:
+        csv_path = os.path.join(tempfile.gettempdir(), "abc_xyz_sample.csv")
+        start = time.perf_counter()
+        generate_sample_csv(csv_path)
+        print(f"샘플 생성: {csv_path} ({time.perf_counter() - start:.2f}s)")
+
+    start = time.perf_counter()
+    result = classify_csv(csv_path)
+    elapsed = time.perf_counter() - start
+    data = result.to_slide_data()
+
+    print("=" * 80)
+    print(f"ABC-XYZ: {csv_path}")
+    print("=" * 80)
+    print(f"  {len(result):,}개 품목, 구매금액 {format_won(data['total_spend'])}, 분류 {elapsed * 1000:.0f} ms")
+    print(f"  ABC {data['abc']}  XYZ {data['xyz']}")
+    print_matrix(data)
+    print("=" * 80)
+
+    if len(sys.argv) > 2:
+        output = sys.argv[2]
+        if output.endswith(".json"):
+            with open(output, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        else:
+            from generate_part1_pptx_v2 import create_presentation
+            prs = create_presentation()
+            add_abc_xyz_matrix_slide(prs, result)
+            prs.save(output)
+        print(f"Saved: {output}")
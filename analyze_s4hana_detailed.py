@@ -4,99 +4,105 @@ Detailed analysis of S4HANA reference PPTX
 - Font sizes (all unique sizes)
 - Layout patterns (text box positions and sizes)
 - Shape usage (rectangles, arrows, connectors)
-- Content density (% of slide area filled)
+- Content density (% of slide area covered - exact union of shape frames, see slide_coverage)
+- Whitespace maps / per-region density
 """
 
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.shapes import MSO_SHAPE_TYPE
 import statistics
+import sys
+
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.util import Emu
+
+from pptx_xml_scan import scan_deck
+from slide_coverage import deck_coverage
 
-def analyze_s4hana(filepath):
-    """Detailed analysis of S4HANA PPTX"""
+# 최상위 shape 타입 → 슬라이드별 카운트 키
+SHAPE_COUNT_KEYS = {
+    MSO_SHAPE_TYPE.TEXT_BOX: "text",
+    MSO_SHAPE_TYPE.PICTURE: "picture",
+    MSO_SHAPE_TYPE.TABLE: "table",
+    MSO_SHAPE_TYPE.GROUP: "group",
+    MSO_SHAPE_TYPE.AUTO_SHAPE: "shape",
+}
+
+
+def analyze_s4hana(filepath, facts=None):
+    """Detailed analysis of S4HANA PPTX (raw-XML scan, read-only)"""
     print(f"\n{'='*80}")
     print(f"S4HANA Reference PPTX - Detailed Analysis")
     print(f"{'='*80}\n")
 
-    prs = Presentation(filepath)
+    facts = facts or scan_deck(filepath)
+    shapes = facts.shapes
+    runs = facts.runs
 
     # Slide dimensions
-    width_in = prs.slide_width.inches
-    height_in = prs.slide_height.inches
+    width_in = facts.width_inches
+    height_in = facts.height_inches
     slide_area = width_in * height_in
 
     print(f"Slide Dimensions: {width_in:.2f}\" × {height_in:.2f}\"")
     print(f"Slide Area: {slide_area:.2f} sq in\n")
 
-    # Collect statistics
-    all_font_sizes = []
-    all_fonts = set()
+    # Collect statistics (top-level text frames only)
+    all_font_sizes = facts.font_sizes()
+    all_fonts = facts.runs.distinct("font_name", depth=0) - {None, ""}
     shapes_by_type = {}
-    content_densities = []
+    coverages = deck_coverage(facts)
+    content_densities = [cov.coverage * 100 for cov in coverages]
+    area_sums = [cov.area_sum * 100 for cov in coverages]
 
     print(f"{'='*80}")
-    print(f"Analyzing {len(prs.slides)} slides...\n")
+    print(f"Analyzing {facts.slide_count} slides...\n")
 
-    for idx, slide in enumerate(prs.slides, 1):
+    for idx in facts.slides():
         print(f"--- Slide {idx} ---")
 
-        # Calculate content density
-        filled_area = 0
         shape_count = {"text": 0, "shape": 0, "picture": 0, "table": 0, "group": 0}
 
-        for shape in slide.shapes:
-            # Shape area
-            if hasattr(shape, "width") and hasattr(shape, "height"):
-                shape_area = (shape.width.inches * shape.height.inches)
-                filled_area += shape_area
+        for row in shapes.indices(slide=idx, depth=0):
+            shape_type = shapes["shape_type"][row]
+            width, height = Emu(shapes["width"][row] or 0), Emu(shapes["height"][row] or 0)
 
             # Shape type
-            if shape.shape_type == MSO_SHAPE_TYPE.TEXT_BOX:
-                shape_count["text"] += 1
-            elif shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
-                shape_count["picture"] += 1
-            elif shape.shape_type == MSO_SHAPE_TYPE.TABLE:
-                shape_count["table"] += 1
-            elif shape.shape_type == MSO_SHAPE_TYPE.GROUP:
-                shape_count["group"] += 1
-            elif shape.shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE:
-                shape_count["shape"] += 1
-                shapes_by_type[shape.shape_type] = shapes_by_type.get(shape.shape_type, 0) + 1
-
-            # Text analysis
-            if hasattr(shape, "text_frame"):
-                for paragraph in shape.text_frame.paragraphs:
-                    for run in paragraph.runs:
-                        if run.font.size:
-                            all_font_sizes.append(run.font.size.pt)
-                        if run.font.name:
-                            all_fonts.add(run.font.name)
-
-            # Print shape details for first 3 slides
-            if idx <= 5:
-                if hasattr(shape, "text") and shape.text.strip():
-                    text_preview = shape.text.strip()[:40].replace("\n", " ")
-                    print(f"  Shape: {shape.shape_type}")
-                    if hasattr(shape, "left") and hasattr(shape, "top"):
-                        print(f"    Position: ({shape.left.inches:.2f}\", {shape.top.inches:.2f}\")")
-                    if hasattr(shape, "width") and hasattr(shape, "height"):
-                        print(f"    Size: {shape.width.inches:.2f}\" × {shape.height.inches:.2f}\"")
-                    print(f"    Text: \"{text_preview}...\"")
-
-                    if hasattr(shape, "text_frame"):
-                        for para in shape.text_frame.paragraphs:
-                            for run in para.runs:
-                                if run.font.size:
-                                    print(f"    Font: {run.font.name}, {run.font.size.pt}pt, Bold: {run.font.bold}")
-                                    break
-                            break
-
-        density = (filled_area / slide_area) * 100
-        content_densities.append(density)
+            key = SHAPE_COUNT_KEYS.get(shape_type)
+            if key:
+                shape_count[key] += 1
+            if key == "shape":
+                shapes_by_type[shape_type] = shapes_by_type.get(shape_type, 0) + 1
+
+            # Print shape details for first 5 slides
+            text = shapes["text"][row]
+            if idx <= 5 and shapes["has_text_frame"][row] and text.strip():
+                text_preview = text.strip()[:40].replace("\n", " ")
+                left, top = Emu(shapes["left"][row] or 0), Emu(shapes["top"][row] or 0)
+                print(f"  Shape: {shape_type}")
+                print(f"    Position: ({left.inches:.2f}\", {top.inches:.2f}\")")
+                print(f"    Size: {width.inches:.2f}\" × {height.inches:.2f}\"")
+                print(f"    Text: \"{text_preview}...\"")
+
+                first_runs = runs.indices(slide=idx, shape=row, paragraph=0,
+                                          size_pt=lambda size: size is not None)
+                if first_runs:
+                    run = first_runs[0]
+                    print(f"    Font: {runs['font_name'][run]}, {runs['size_pt'][run]}pt, "
+                          f"Bold: {runs['bold'][run]}")
+
+        coverage = coverages[idx - 1]
+        gap_left, gap_top, gap_width, gap_height = coverage.largest_gap
 
         print(f"  Shapes: Text={shape_count['text']}, Shape={shape_count['shape']}, "
               f"Picture={shape_count['picture']}, Table={shape_count['table']}, Group={shape_count['group']}")
-        print(f"  Content Density: {density:.1f}%")
+        print(f"  Content Density: {coverage.coverage * 100:.1f}% "
+              f"(shape area sum: {coverage.area_sum * 100:.1f}%)")
+        print(f"  Region Density (3×3, %): {coverage.region_summary()}")
+        print(f"  Largest Whitespace: {gap_width:.2f}\" × {gap_height:.2f}\" "
+              f"at ({gap_left:.2f}\", {gap_top:.2f}\")")
+        if idx <= 5:
+            print("  Whitespace Map (█ = covered, 1 cell = 0.25\"):")
+            for line in coverage.whitespace_map().splitlines():
+                print(f"    {line}")
         print()
 
     # Summary statistics
@@ -115,13 +121,16 @@ def analyze_s4hana(filepath):
     for font in sorted(all_fonts):
         print(f"  - {font}")
 
-    print(f"\nContent Density:")
+    print(f"\nContent Density (union of shape frames):")
     if content_densities:
         print(f"  Average: {statistics.mean(content_densities):.1f}%")
         print(f"  Median: {statistics.median(content_densities):.1f}%")
         print(f"  Min: {min(content_densities):.1f}%")
         print(f"  Max: {max(content_densities):.1f}%")
 
+        print(f"  Shape area sum (overlaps double-counted): average {statistics.mean(area_sums):.1f}%, "
+              f"max {max(area_sums):.1f}%")
+
         # Slides with >85% density
         high_density = [i+1 for i, d in enumerate(content_densities) if d >= 85]
         print(f"  Slides with ≥85% density: {len(high_density)}/{len(content_densities)}")
@@ -131,4 +140,5 @@ def analyze_s4hana(filepath):
     print(f"\n{'='*80}\n")
 
 if __name__ == "__main__":
-    analyze_s4hana("/home/user/Kraljic_Course/PPTX_SAMPLE/S4HANA_PI단계_단계 종료보고_20230510_v.1.4.pptx")
+    analyze_s4hana(sys.argv[1] if len(sys.argv) > 1 else
+                   "/home/user/Kraljic_Course/PPTX_SAMPLE/S4HANA_PI단계_단계 종료보고_20230510_v.1.4.pptx")
@@ -7,9 +7,11 @@ Usage:
     python3 analyze_s4hana_reference.py
 """
 
-from pptx import Presentation
 from pptx.enum.shapes import MSO_SHAPE_TYPE
 
+from pptx_xml_scan import scan_deck
+from slide_coverage import deck_coverage
+
 
 def analyze_reference():
     """Deep analysis of S4HANA reference file"""
@@ -21,7 +23,7 @@ def analyze_reference():
     print("="*70)
 
     try:
-        prs = Presentation(filepath)
+        facts = scan_deck(filepath)
     except FileNotFoundError:
         print(f"\n❌ File not found: {filepath}")
         print("   Make sure the reference file exists in PPTX_SAMPLE/")
@@ -32,9 +34,12 @@ def analyze_reference():
 
     # Overall stats
     print(f"\n📊 OVERALL STATISTICS")
-    print(f"   Total slides: {len(prs.slides)}")
-    print(f"   Dimensions: {prs.slide_width/914400:.2f}\" × {prs.slide_height/914400:.2f}\"")
-    print(f"   Aspect ratio: {prs.slide_width/prs.slide_height:.3f}:1")
+    print(f"   Total slides: {facts.slide_count}")
+    print(f"   Dimensions: {facts.slide_width/914400:.2f}\" × {facts.slide_height/914400:.2f}\"")
+    print(f"   Aspect ratio: {facts.slide_width/facts.slide_height:.3f}:1")
+
+    # 실제 점유율 (shape 프레임 합집합, 그룹 변환 반영)
+    coverages = deck_coverage(facts)
 
     # Detailed analysis of first 10 slides
     print(f"\n" + "="*70)
@@ -46,9 +51,8 @@ def analyze_reference():
     total_text_boxes = 0
     total_groups = 0
 
-    slides_to_analyze = list(prs.slides)[:15]
-    for i, slide in enumerate(slides_to_analyze, 1):
-        shapes_count = len(slide.shapes)
+    for i in facts.slides(1, 15):
+        shapes_count = facts.slide_shape_counts[i - 1]
         total_shapes += shapes_count
 
         # Count by type
@@ -59,9 +63,7 @@ def analyze_reference():
         tables = 0
         connectors = 0
 
-        for shape in slide.shapes:
-            shape_type = shape.shape_type
-
+        for shape_type in facts.shapes.column("shape_type", slide=i, depth=0):
             if shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE:
                 auto_shapes += 1
             elif shape_type == MSO_SHAPE_TYPE.TEXT_BOX:
@@ -79,8 +81,7 @@ def analyze_reference():
         total_text_boxes += text_boxes
         total_groups += groups
 
-        # Estimate density (rough: assume each shape covers ~2% of slide)
-        density_estimate = min(100, shapes_count * 2)
+        coverage = coverages[i - 1]
 
         print(f"\nSlide {i}:")
         print(f"   Total shapes: {shapes_count}")
@@ -93,16 +94,18 @@ def analyze_reference():
             print(f"   └─ Tables: {tables}")
         if connectors > 0:
             print(f"   └─ Connectors: {connectors}")
-        print(f"   Density estimate: ~{density_estimate}%")
+        print(f"   Density: {coverage.coverage * 100:.1f}% "
+              f"(regions {coverage.region_summary()})")
 
         # Special notes for high-density slides
         if shapes_count > 50:
             print(f"   ⭐ HIGH DENSITY SLIDE - Study this layout!")
 
     # Summary statistics
-    slides_count = len(list(prs.slides))
+    slides_count = facts.slide_count
     avg_shapes = total_shapes / min(15, slides_count)
     avg_auto_shapes = total_auto_shapes / min(15, slides_count)
+    avg_density = sum(cov.coverage for cov in coverages[:15]) / min(15, slides_count) * 100
 
     print(f"\n" + "="*70)
     print("SUMMARY STATISTICS (First 15 slides)")
@@ -111,6 +114,7 @@ def analyze_reference():
     print(f"   Average AUTO_SHAPES per slide: {avg_auto_shapes:.1f}")
     print(f"   Average text boxes per slide: {total_text_boxes / min(15, slides_count):.1f}")
     print(f"   Average groups per slide: {total_groups / min(15, slides_count):.1f}")
+    print(f"   Average density: {avg_density:.1f}%")
 
     # Key findings
     print(f"\n" + "="*70)
@@ -132,9 +136,9 @@ def analyze_reference():
     print(f"   → Study high-density slides (marked with ⭐ above)")
 
     print(f"\n4. DENSITY TARGETS")
-    print(f"   ✓ Most slides achieve 80-100%+ density")
+    print(f"   ✓ Reference average density: {avg_density:.1f}% (union of shape frames)")
     print(f"   ✓ Content-rich, minimal whitespace")
-    print(f"   → Don't settle for <85% density")
+    print(f"   → Target: match the reference density (slide_coverage.py for per-slide maps)")
 
     print("\n" + "="*70)
     print("⚠️  NEXT STEPS")
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Course Corpus Cache - 파싱된 코스 AST의 영구 캐시 + 변경 감지
+9개 회차 마크다운(course_markdown.Document)과 Notion CSV 인덱스를 디스크에 캐시하여
+변경된 회차만 다시 파싱
+
+변경 감지 (빠른 순):
+1. (mtime_ns, size)가 같으면 → 캐시 그대로 사용 (파일 읽기 없음)
+2. 다르면 SHA-1 해시 비교 → 같으면 stat만 갱신 (touch/checkout 대응)
+3. 해시가 다르면 → 해당 회차만 재파싱
+
+캐시 파일: .course_cache/corpus.pickle (PARSER_VERSION이 바뀌면 전체 무효화)
+
+Usage:
+    from course_cache import CourseCache
+
+    cache = CourseCache()
+    corpus = cache.load_corpus()          # {회차 번호: Document}
+    corpus = cache.load_corpus(source=course_source.ZipSource("Kraljic_Course_Contents.zip"))
+    index = cache.load_index()            # Notion CSV 행 리스트
+    cache.save()
+
+    python3 course_cache.py               # 캐시 갱신 + 상태 출력
+"""
+
+import csv
+import hashlib
+import os
+import pickle
+import time
+from pathlib import Path
+
+import course_markdown
+
+# ============================================================================
+# 캐시 설정
+# ============================================================================
+CACHE_DIR = Path(__file__).resolve().parent / ".course_cache"
+CACHE_FILE = "corpus.pickle"
+PARSER_VERSION = 1  # course_markdown AST 구조가 바뀌면 올릴 것
+
+INDEX_CSV_GLOB = f"{course_markdown.COURSE_DIR.name} *.csv"
+
+
+def file_digest(path):
+    """파일 내용 SHA-1"""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def parse_index_csv(path):
+    """Notion 코스 인덱스 CSV → 행 dict 리스트 (BOM 제거)"""
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        return [dict(row) for row in csv.DictReader(f)]
+
+
+def find_index_csv(course_dir=course_markdown.COURSE_DIR):
+    """코스 폴더 옆의 Notion 인덱스 CSV (_all 제외)"""
+    for path in sorted(Path(course_dir).parent.glob(INDEX_CSV_GLOB)):
+        if not path.stem.endswith("_all"):
+            return path
+    return None
+
+
+def parse_source_document(source, name):
+    """콘텐츠 소스 멤버 → Document (스트리밍 파싱)"""
+    with source.open_text(name) as f:
+        return course_markdown.parse_lines(f, path=Path(name))
+
+
+def parse_source_csv(source, name):
+    """콘텐츠 소스 멤버 → 인덱스 CSV 행 리스트"""
+    with source.open_text(name, encoding="utf-8-sig", newline="") as f:
+        return [dict(row) for row in csv.DictReader(f)]
+
+
+class CourseCache:
+    """
+    경로 + mtime + 해시로 키를 잡는 파싱 결과 캐시
+
+    entries: {절대경로 문자열: {"stat": (mtime_ns, size), "digest": str, "value": obj}}
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_path = Path(cache_dir) / CACHE_FILE
+        self.entries = {}
+        self.dirty = False
+        self.stats = {"hit": 0, "rehash": 0, "parsed": 0}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_path, "rb") as f:
+                data = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return
+        if data.get("version") == PARSER_VERSION:
+            self.entries = data.get("entries", {})
+
+    def save(self):
+        """변경이 있을 때만 원자적으로 기록 (tmp → rename)"""
+        if not self.dirty:
+            return False
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"version": PARSER_VERSION, "entries": self.entries}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.cache_path)
+        self.dirty = False
+        return True
+
+    # ------------------------------------------------------------------
+    def _lookup(self, key, stat_key, digest_fn, parse_fn):
+        entry = self.entries.get(key)
+        if entry is not None:
+            if entry["stat"] == stat_key:
+                self.stats["hit"] += 1
+                return entry["value"]
+            digest = digest_fn()
+            if entry["digest"] == digest:
+                entry["stat"] = stat_key
+                self.dirty = True
+                self.stats["rehash"] += 1
+                return entry["value"]
+        else:
+            digest = digest_fn()
+
+        value = parse_fn()
+        self.entries[key] = {"stat": stat_key, "digest": digest, "value": value}
+        self.dirty = True
+        self.stats["parsed"] += 1
+        return value
+
+    def get(self, path, parse_fn):
+        """path의 파싱 결과 반환 - 변경된 경우에만 parse_fn(path) 호출"""
+        path = Path(path).resolve()
+        st = path.stat()
+        return self._lookup(str(path), (st.st_mtime_ns, st.st_size),
+                            lambda: file_digest(path), lambda: parse_fn(path))
+
+    def get_member(self, source, name, parse_fn):
+        """
+        콘텐츠 소스(course_source) 멤버의 파싱 결과 - parse_fn(source, name)
+
+        zip 멤버는 (아카이브 stat, CRC, 크기)가 stat 키, CRC가 digest 역할
+        """
+        return self._lookup(source.cache_key(name), source.fingerprint(name),
+                            lambda: source.digest(name), lambda: parse_fn(source, name))
+
+    def load_document(self, path, source=None):
+        """회차 마크다운 하나 (course_markdown.Document)"""
+        if source is not None:
+            return self.get_member(source, path, parse_source_document)
+        return self.get(path, course_markdown.parse_file)
+
+    def load_corpus(self, course_dir=course_markdown.COURSE_DIR, source=None):
+        """전체 회차 {회차 번호: Document}"""
+        corpus = {}
+        if source is not None:
+            for name in source.session_files():
+                number = int(course_markdown.SESSION_FILE_RE.match(Path(name).name).group(1))
+                corpus[number] = self.load_document(name, source)
+            return corpus
+        for path in course_markdown.session_files(course_dir):
+            number = int(course_markdown.SESSION_FILE_RE.match(path.name).group(1))
+            corpus[number] = self.load_document(path)
+        return corpus
+
+    def load_index(self, csv_path=None, source=None):
+        """Notion 코스 인덱스 CSV 행 리스트"""
+        if source is not None:
+            name = csv_path or source.index_csv()
+            return self.get_member(source, name, parse_source_csv) if name else []
+        csv_path = csv_path or find_index_csv()
+        if csv_path is None:
+            return []
+        return self.get(csv_path, parse_index_csv)
+
+    def prune(self):
+        """더 이상 존재하지 않는 파일(또는 아카이브)의 엔트리 제거"""
+        for key in [k for k in self.entries if not Path(k.split("::", 1)[0]).exists()]:
+            del self.entries[key]
+            self.dirty = True
+
+
+_default_cache = None
+
+
+def load_document(path, source=None):
+    """모듈 기본 캐시를 통해 Document 로드 후 즉시 저장 (생성기용 단축 함수)"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = CourseCache()
+    doc = _default_cache.load_document(path, source)
+    _default_cache.save()
+    return doc
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("Course Corpus Cache")
+    print("=" * 80)
+
+    start = time.perf_counter()
+    cache = CourseCache()
+    corpus = cache.load_corpus()
+    index = cache.load_index()
+    cache.prune()
+    saved = cache.save()
+    elapsed = time.perf_counter() - start
+
+    for number, doc in corpus.items():
+        print(f"  [{number}회차] {doc.title[:50]}  ({doc.line_count} lines)")
+    print(f"\n  Index rows: {len(index)}")
+    print(f"  Cache: hit={cache.stats['hit']} rehash={cache.stats['rehash']} "
+          f"parsed={cache.stats['parsed']} saved={saved}")
+    print(f"  Load time: {elapsed * 1000:.1f} ms")
+    print(f"  Cache file: {cache.cache_path}")
+    print("=" * 80)
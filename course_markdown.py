@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+"""
+Course Markdown Parser - Streaming tokenizer + typed AST
+Notion에서 내보낸 회차별 마크다운(전략적 재고운영 및 자재계획수립/*.md)을
+한 번의 순회(single pass)로 읽어 타입이 있는 AST로 변환
+
+지원 블록:
+- Heading (# ~ ######), Notion 속성 블록 ("단계: Overview")
+- Aside (<aside> / <callout icon="..">, 중첩 가능, 첫 줄 이모지 = 아이콘)
+- Bullet (-, *, 1. / 들여쓰기 레벨), Paragraph, Rule (---), Image
+- Table (마크다운 표 + 여러 줄 셀, Notion HTML <table>)
+- CodeBlock (```)
+- 인라인 볼드 (**text**) → Span 리스트
+
+Usage:
+    from course_markdown import parse_file, sections, session_files
+
+    doc = parse_file(path)
+    for section in sections(doc):
+        print(section.title, section.bullets, section.tables)
+
+    python3 course_markdown.py        # 전체 9개 회차 파싱 벤치마크
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+# ============================================================================
+# 코스 코퍼스 위치
+# ============================================================================
+COURSE_DIR = Path(__file__).resolve().parent / "전략적 재고운영 및 자재계획수립"
+SESSION_FILE_RE = re.compile(r"^\[(\d+)회차\]")
+
+# ============================================================================
+# 사전 컴파일된 패턴 (줄 단위 분류는 첫 글자로 후보를 좁힌 뒤 한 번만 매칭)
+# ============================================================================
+_HEADING_RE = re.compile(r"(#{1,6})\s+(.+?)\s*#*$")
+_BULLET_RE = re.compile(r"([-*+])\s+(.*)$")
+_ORDERED_RE = re.compile(r"(\d+)[.)]\s+(.*)$")
+_RULE_RE = re.compile(r"(?:-{3,}|\*{3,}|_{3,})$")
+_TABLE_SEP_RE = re.compile(r"\|?(?:\s*:?-{3,}:?\s*\|)+\s*:?-*:?\s*$")
+_IMAGE_RE = re.compile(r"!\[([^\]]*)\]\(([^)]*)\)$")
+_PROPERTY_RE = re.compile(r"([^:\s#<|][^:]{0,30}):\s+(.*)$")
+_CALLOUT_RE = re.compile(r'<callout(?:\s+icon="([^"]*)")?[^>]*>')
+_TD_RE = re.compile(r"<t[dh][^>]*>(.*?)</t[dh]>")
+_TAG_RE = re.compile(r"</?[a-zA-Z][^>]*>")
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_ICON_RE = re.compile(r"[^\w\s]{1,3}$")
+_SECTION_NUMBER_RE = re.compile(r"(\d+(?:\.\d+)*)\.?\s")
+
+TAB_WIDTH = 4
+
+
+# ============================================================================
+# AST 노드
+# ============================================================================
+
+@dataclass
+class Span:
+    """인라인 텍스트 조각 (볼드 여부)"""
+
+    text: str
+    bold: bool = False
+
+
+def parse_spans(text: str) -> List[Span]:
+    """**bold** 마크업을 Span 리스트로 분해 (인라인 HTML 태그는 제거)"""
+    text = _TAG_RE.sub("", text)
+    spans: List[Span] = []
+    pos = 0
+    for match in _BOLD_RE.finditer(text):
+        if match.start() > pos:
+            spans.append(Span(text[pos:match.start()]))
+        spans.append(Span(match.group(1), bold=True))
+        pos = match.end()
+    if pos < len(text):
+        spans.append(Span(text[pos:]))
+    return spans
+
+
+def plain_text(text: str) -> str:
+    """마크업(볼드/인라인 태그)을 제거한 텍스트"""
+    return _BOLD_RE.sub(r"\1", _TAG_RE.sub("", text))
+
+
+@dataclass
+class Heading:
+    level: int
+    text: str
+    line: int
+
+    @property
+    def spans(self) -> List[Span]:
+        return parse_spans(self.text)
+
+
+@dataclass
+class Paragraph:
+    text: str
+    line: int
+
+    @property
+    def spans(self) -> List[Span]:
+        return parse_spans(self.text)
+
+
+@dataclass
+class Bullet:
+    text: str
+    line: int
+    level: int = 0
+    ordered: bool = False
+
+    @property
+    def spans(self) -> List[Span]:
+        return parse_spans(self.text)
+
+
+@dataclass
+class Table:
+    header: List[str]
+    rows: List[List[str]]
+    line: int
+
+    @property
+    def cells(self) -> List[List[str]]:
+        """헤더 포함 전체 셀"""
+        return [self.header] + self.rows if self.header else list(self.rows)
+
+
+@dataclass
+class CodeBlock:
+    lang: str
+    text: str
+    line: int
+
+
+@dataclass
+class Image:
+    alt: str
+    src: str
+    line: int
+
+
+@dataclass
+class Rule:
+    line: int
+
+
+@dataclass
+class Aside:
+    icon: str
+    line: int
+    children: List["Block"] = field(default_factory=list)
+    lines: List[str] = field(default_factory=list)  # 아이콘 제외 원문 줄
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+
+Block = Union[Heading, Paragraph, Bullet, Table, CodeBlock, Image, Rule, Aside]
+
+
+@dataclass
+class Document:
+    title: str = ""
+    properties: Dict[str, str] = field(default_factory=dict)
+    children: List[Block] = field(default_factory=list)
+    path: Optional[Path] = None
+    line_count: int = 0
+
+
+# ============================================================================
+# 스트리밍 파서
+# ============================================================================
+
+def _indent_width(raw: str) -> int:
+    width = 0
+    for ch in raw:
+        if ch == " ":
+            width += 1
+        elif ch == "\t":
+            width += TAB_WIDTH
+        else:
+            break
+    return width
+
+
+def _split_row(row: str) -> List[str]:
+    row = row.strip()
+    if row.startswith("|"):
+        row = row[1:]
+    if row.endswith("|"):
+        row = row[:-1]
+    return [cell.strip() for cell in row.split("|")]
+
+
+class MarkdownParser:
+    """
+    줄 단위로 feed()하는 단일 패스 파서
+
+    파일 전체를 메모리에 올리지 않고 파일 객체를 그대로 순회합니다.
+    여러 줄에 걸친 구조(코드 블록, 표 행, HTML 표)는 상태로 추적합니다.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.doc = Document(path=path)
+        self._stack: List[Aside] = []
+        self._lineno = 0
+        self._in_props = False
+        self._code: Optional[CodeBlock] = None
+        self._code_lines: List[str] = []
+        self._table: Optional[Table] = None
+        self._row_buffer: Optional[str] = None
+        self._html_rows: Optional[List[List[str]]] = None
+        self._html_line = 0
+
+    # ------------------------------------------------------------------
+    def _emit(self, block: Block) -> None:
+        if self._stack:
+            self._stack[-1].children.append(block)
+        else:
+            self.doc.children.append(block)
+
+    def _close_table(self) -> None:
+        if self._row_buffer is not None:
+            self._add_row(self._row_buffer)
+            self._row_buffer = None
+        self._table = None
+
+    def _add_row(self, row: str) -> None:
+        if _TABLE_SEP_RE.match(row.strip()):
+            return
+        cells = _split_row(row)
+        if self._table is None:
+            self._table = Table(header=cells, rows=[], line=self._lineno)
+            self._emit(self._table)
+        else:
+            self._table.rows.append(cells)
+
+    # ------------------------------------------------------------------
+    def feed(self, raw: str) -> None:
+        """마크다운 한 줄 처리"""
+        self._lineno += 1
+        raw = raw.rstrip("\r\n")
+        stripped = raw.strip()
+
+        # 1. 코드 블록 내부
+        if self._code is not None:
+            if stripped.startswith("```") and not stripped[3:].strip():
+                self._code.text = "\n".join(self._code_lines)
+                self._code = None
+            else:
+                self._code_lines.append(raw)
+            return
+
+        # 2. 여러 줄 표 셀 이어붙이기
+        if self._row_buffer is not None:
+            self._row_buffer += "\n" + stripped
+            if stripped.endswith("|"):
+                self._add_row(self._row_buffer)
+                self._row_buffer = None
+            return
+
+        # 3. Notion HTML 표
+        if self._html_rows is not None:
+            if stripped.startswith("</table"):
+                rows = self._html_rows
+                self._html_rows = None
+                if rows:
+                    self._emit(Table(header=rows[0], rows=rows[1:], line=self._html_line))
+            elif stripped.startswith("<tr"):
+                self._html_rows.append([])
+            else:
+                cells = _TD_RE.findall(stripped)
+                if cells and self._html_rows:
+                    self._html_rows[-1].extend(cells)
+            return
+
+        if not stripped:
+            self._close_table()
+            if self._in_props and self.doc.properties:
+                self._in_props = False
+            return
+
+        if self._stack:
+            self._record_aside_line(stripped)
+
+        first = stripped[0]
+
+        # 표 행
+        if first == "|":
+            if stripped.endswith("|") and len(stripped) > 1:
+                self._add_row(stripped)
+            else:
+                self._row_buffer = stripped
+            return
+        self._close_table()
+
+        if first == "<":
+            self._feed_tag(stripped)
+            return
+
+        if first == "`" and stripped.startswith("```"):
+            self._code = CodeBlock(lang=stripped[3:].strip(), text="", line=self._lineno)
+            self._code_lines = []
+            self._emit(self._code)
+            return
+
+        if first == "#":
+            match = _HEADING_RE.match(stripped)
+            if match:
+                level = len(match.group(1))
+                text = match.group(2)
+                if level == 1 and not self.doc.title:
+                    self.doc.title = text
+                    self._in_props = True
+                self._emit(Heading(level, text, self._lineno))
+                return
+
+        if self._in_props:
+            match = _PROPERTY_RE.match(stripped)
+            if match:
+                self.doc.properties[match.group(1).strip()] = match.group(2).strip()
+                return
+            self._in_props = False
+
+        if first in "-*+_":
+            if _RULE_RE.match(stripped):
+                self._emit(Rule(self._lineno))
+                return
+            match = _BULLET_RE.match(stripped)
+            if match:
+                self._emit(Bullet(match.group(2).strip(), self._lineno,
+                                  level=_indent_width(raw) // TAB_WIDTH))
+                return
+
+        if first.isdigit():
+            match = _ORDERED_RE.match(stripped)
+            if match:
+                self._emit(Bullet(match.group(2).strip(), self._lineno,
+                                  level=_indent_width(raw) // TAB_WIDTH, ordered=True))
+                return
+
+        if first == "!":
+            match = _IMAGE_RE.match(stripped)
+            if match:
+                self._emit(Image(match.group(1), match.group(2), self._lineno))
+                return
+
+        # Aside 첫 줄 이모지 → 아이콘
+        if (self._stack and not self._stack[-1].icon and not self._stack[-1].children
+                and _ICON_RE.match(stripped)):
+            aside = self._stack[-1]
+            aside.icon = stripped
+            if aside.lines and aside.lines[-1] == stripped:
+                aside.lines.pop()
+            return
+
+        self._emit(Paragraph(stripped, self._lineno))
+
+    def _record_aside_line(self, stripped: str) -> None:
+        """가장 안쪽 Aside의 원문 줄 기록 (거버닝 메시지 추출용)"""
+        if stripped.startswith(("<aside", "</aside", "<callout", "</callout")):
+            return
+        self._stack[-1].lines.append(stripped)
+
+    def _feed_tag(self, stripped: str) -> None:
+        """HTML 블록 태그 처리 (<aside>, <callout>, <table>)"""
+        if stripped.startswith("<aside"):
+            aside = Aside(icon="", line=self._lineno)
+            self._emit(aside)
+            self._stack.append(aside)
+        elif stripped.startswith("<callout"):
+            match = _CALLOUT_RE.match(stripped)
+            aside = Aside(icon=(match.group(1) or "") if match else "", line=self._lineno)
+            self._emit(aside)
+            self._stack.append(aside)
+        elif stripped.startswith(("</aside", "</callout")):
+            if self._stack:
+                self._stack.pop()
+        elif stripped.startswith("<table"):
+            self._html_rows = []
+            self._html_line = self._lineno
+        elif _TAG_RE.sub("", stripped).strip():
+            # 인라인 태그로 감싼 본문 (<span>..</span> 등)
+            self._emit(Paragraph(stripped, self._lineno))
+
+    def close(self) -> Document:
+        """스트림 종료 - 열린 구조를 닫고 Document 반환"""
+        if self._code is not None:
+            self._code.text = "\n".join(self._code_lines)
+            self._code = None
+        self._close_table()
+        self._stack.clear()
+        self.doc.line_count = self._lineno
+        return self.doc
+
+
+def parse_lines(lines: Iterable[str], path: Optional[Path] = None) -> Document:
+    """줄 이터러블(파일 객체 포함)을 Document로 파싱"""
+    parser = MarkdownParser(path)
+    for line in lines:
+        parser.feed(line)
+    return parser.close()
+
+
+def parse_text(text: str) -> Document:
+    """문자열 마크다운 파싱"""
+    return parse_lines(text.splitlines())
+
+
+def parse_file(path) -> Document:
+    """마크다운 파일을 스트리밍으로 파싱 (readlines() 없이 파일 객체 순회)"""
+    path = Path(path)
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_lines(f, path)
+
+
+# ============================================================================
+# 섹션 뷰 (슬라이드 단위)
+# ============================================================================
+
+def iter_blocks(blocks: Iterable[Block]) -> Iterator[Block]:
+    """Aside 내부까지 깊이 우선으로 모든 블록 순회"""
+    for block in blocks:
+        yield block
+        if isinstance(block, Aside):
+            yield from iter_blocks(block.children)
+
+
+@dataclass
+class Section:
+    """## / ### 제목 하나와 그 아래 블록들 (슬라이드 한 장의 후보)"""
+
+    level: int
+    title: str
+    line_start: int
+    line_end: int
+    blocks: List[Block] = field(default_factory=list)
+
+    @property
+    def number(self) -> str:
+        """제목 앞 번호 ("2.1.1 전략 1: ..." → "2.1.1"), 번호가 없으면 빈 문자열"""
+        match = _SECTION_NUMBER_RE.match(self.title)
+        return match.group(1) if match else ""
+
+    @property
+    def asides(self) -> List[Aside]:
+        return [b for b in iter_blocks(self.blocks) if isinstance(b, Aside)]
+
+    @property
+    def aside_blocks(self) -> List[str]:
+        return [a.text for a in self.asides if a.lines]
+
+    @property
+    def bullets(self) -> List[str]:
+        return [b.text for b in iter_blocks(self.blocks) if isinstance(b, Bullet)]
+
+    @property
+    def tables(self) -> List[Table]:
+        return [b for b in iter_blocks(self.blocks) if isinstance(b, Table)]
+
+    @property
+    def paragraphs(self) -> List[str]:
+        return [b.text for b in iter_blocks(self.blocks) if isinstance(b, Paragraph)]
+
+
+def _last_line(block: Block) -> int:
+    if isinstance(block, Aside) and block.children:
+        return max(block.line, _last_line(block.children[-1]))
+    return block.line
+
+
+def sections(doc: Document, levels=(2, 3)) -> List[Section]:
+    """최상위 제목(levels)을 기준으로 Document를 섹션으로 분할"""
+    result: List[Section] = []
+    current: Optional[Section] = None
+    for block in doc.children:
+        if isinstance(block, Heading) and block.level in levels:
+            current = Section(block.level, block.text, block.line, block.line)
+            result.append(current)
+            continue
+        if current is not None:
+            current.blocks.append(block)
+            current.line_end = _last_line(block)
+    return result
+
+
+# ============================================================================
+# 코퍼스
+# ============================================================================
+
+def session_files(course_dir=COURSE_DIR) -> List[Path]:
+    """[N회차] 마크다운 파일을 회차 순으로 반환"""
+    files = []
+    for path in Path(course_dir).glob("*.md"):
+        match = SESSION_FILE_RE.match(path.name)
+        if match:
+            files.append((int(match.group(1)), path))
+    return [path for _, path in sorted(files)]
+
+
+def benchmark(course_dir=COURSE_DIR, repeat=20):
+    """전체 코스 코퍼스 파싱 벤치마크"""
+    files = session_files(course_dir)
+    print("=" * 80)
+    print(f"Course Markdown Parser Benchmark ({len(files)} sessions, repeat={repeat})")
+    print("=" * 80)
+
+    total_lines = 0
+    total_blocks = 0
+    for path in files:
+        doc = parse_file(path)
+        blocks = sum(1 for _ in iter_blocks(doc.children))
+        total_lines += doc.line_count
+        total_blocks += blocks
+        print(f"  {path.name[:40]:40s} lines={doc.line_count:5d} blocks={blocks:5d} "
+              f"sections={len(sections(doc)):3d} tables={sum(len(s.tables) for s in sections(doc)):3d}")
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for path in files:
+            parse_file(path)
+    elapsed = (time.perf_counter() - start) / repeat
+
+    print()
+    print(f"  Total: {total_lines} lines, {total_blocks} blocks")
+    print(f"  Full corpus parse: {elapsed * 1000:.2f} ms "
+          f"({total_lines / elapsed / 1000:.0f}k lines/s)")
+    print("=" * 80)
+    return elapsed
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Course Content Source - 폴더 또는 Notion 내보내기 zip에서 코스 콘텐츠 읽기
+생성기가 "/home/user/Kraljic_Course/전략적 재고운영.../[2회차]...md" 같은 추출 경로를
+하드코딩하지 않고, 압축을 풀지 않은 zip 아카이브만으로도 빌드할 수 있게 합니다.
+
+- DirectorySource: 레포 루트(추출된 폴더) 기준 상대 경로
+- ZipSource: zip 멤버를 디스크 추출 없이 직접 읽기
+  · 중첩 zip(Kraljic_Course_Contents.zip → ExportBlock-...zip)은 메모리에서 열기
+  · 멤버 인덱스는 생성 시 한 번만 구축, 내용은 읽을 때만 압축 해제 (lazy)
+
+두 소스 모두 같은 상대 경로 체계를 씁니다:
+    "전략적 재고운영 및 자재계획수립/[2회차] ... .md"
+
+Usage:
+    from course_source import default_source
+
+    source = default_source()            # KRALJIC_CONTENT_SOURCE > 폴더 > zip
+    md_name = source.session_file(2)
+    doc = course_cache.load_document(md_name, source)   # 캐시 경유
+    png = source.read_bytes(source.find("image.png")[0])
+
+    python3 course_source.py [source]    # 멤버 인덱스 출력
+"""
+
+import io
+import os
+import sys
+import zipfile
+from pathlib import Path, PurePosixPath
+
+import course_cache
+import course_markdown
+
+# ============================================================================
+# 기본 위치
+# ============================================================================
+REPO_ROOT = Path(__file__).resolve().parent
+COURSE_DIR_NAME = course_markdown.COURSE_DIR.name
+SOURCE_ENV = "KRALJIC_CONTENT_SOURCE"
+
+# 최신 내보내기 우선
+DEFAULT_ARCHIVES = [
+    REPO_ROOT / COURSE_DIR_NAME / "Notion_251119.zip",
+    REPO_ROOT / "Kraljic_Course_Contents.zip",
+    REPO_ROOT / "ExportBlock-eaf9b73d-c18d-4661-bf78-dcc66047f953-Part-1.zip",
+]
+
+
+def _member_name(info):
+    """ZipInfo 파일명 (UTF-8 플래그 없이 저장된 한글 이름 복원)"""
+    name = info.filename
+    if not info.flag_bits & 0x800:
+        try:
+            name = name.encode("cp437").decode("utf-8")
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            pass
+    return name
+
+
+def _session_number(name):
+    match = course_markdown.SESSION_FILE_RE.match(PurePosixPath(name).name)
+    return int(match.group(1)) if match else None
+
+
+class ContentSource:
+    """소스 공통 인터페이스 (names/open_binary/fingerprint/digest는 하위 클래스 구현)"""
+
+    label = ""
+
+    def names(self):
+        raise NotImplementedError
+
+    def open_binary(self, name):
+        raise NotImplementedError
+
+    def fingerprint(self, name):
+        """변경 감지용 값싼 키 (캐시의 stat 키)"""
+        raise NotImplementedError
+
+    def digest(self, name):
+        """내용 기반 키 (fingerprint가 바뀌었을 때만 호출)"""
+        raise NotImplementedError
+
+    # ------------------------------------------------------------------
+    def cache_key(self, name):
+        return f"{self.label}::{name}"
+
+    def exists(self, name):
+        return name in self._name_set()
+
+    def _name_set(self):
+        if not hasattr(self, "_names_cache"):
+            self._names_cache = set(self.names())
+        return self._names_cache
+
+    def read_bytes(self, name):
+        with self.open_binary(name) as f:
+            return f.read()
+
+    def open_text(self, name, encoding="utf-8", newline=None):
+        """스트리밍 텍스트 핸들 (course_markdown.parse_lines에 바로 전달 가능)"""
+        return io.TextIOWrapper(self.open_binary(name), encoding=encoding, newline=newline)
+
+    def find(self, suffix, folder=COURSE_DIR_NAME):
+        """folder 아래에서 suffix로 끝나는 멤버 목록"""
+        prefix = folder.rstrip("/") + "/" if folder else ""
+        return sorted(n for n in self.names() if n.startswith(prefix) and n.endswith(suffix))
+
+    def session_files(self):
+        """코스 폴더 바로 아래의 [N회차] 마크다운 (회차 순)"""
+        prefix = COURSE_DIR_NAME + "/"
+        sessions = []
+        for name in self.names():
+            if not name.startswith(prefix) or "/" in name[len(prefix):]:
+                continue
+            number = _session_number(name)
+            if number is not None and name.endswith(".md"):
+                sessions.append((number, name))
+        return [name for _, name in sorted(sessions)]
+
+    def session_file(self, number):
+        for name in self.session_files():
+            if _session_number(name) == number:
+                return name
+        raise FileNotFoundError(f"❌ {number}회차 마크다운이 없습니다: {self.label}")
+
+    def index_csv(self):
+        """Notion 코스 인덱스 CSV (_all 제외)"""
+        for name in sorted(self.names()):
+            if ("/" not in name and name.startswith(COURSE_DIR_NAME + " ")
+                    and name.endswith(".csv") and not name.endswith("_all.csv")):
+                return name
+        return None
+
+    def describe(self, name):
+        return f"{self.label} :: {name}"
+
+
+class DirectorySource(ContentSource):
+    """추출된 폴더 (레포 루트) 소스"""
+
+    def __init__(self, root=REPO_ROOT):
+        self.root = Path(root).resolve()
+        self.label = str(self.root)
+        self._index = None
+
+    def names(self):
+        if self._index is None:
+            index = []
+            course_dir = self.root / COURSE_DIR_NAME
+            for path in self.root.glob(f"{COURSE_DIR_NAME} *.csv"):
+                index.append(path.name)
+            for dirpath, _, filenames in os.walk(course_dir):
+                for filename in filenames:
+                    rel = Path(dirpath, filename).relative_to(self.root)
+                    index.append(rel.as_posix())
+            self._index = sorted(index)
+        return self._index
+
+    def local_path(self, name):
+        return self.root / name
+
+    def open_binary(self, name):
+        return open(self.local_path(name), "rb")
+
+    def fingerprint(self, name):
+        st = self.local_path(name).stat()
+        return (st.st_mtime_ns, st.st_size)
+
+    def digest(self, name):
+        return course_cache.file_digest(self.local_path(name))
+
+
+class ZipSource(ContentSource):
+    """
+    Notion 내보내기 zip 소스 (디스크 추출 없음)
+
+    바깥 zip 안의 .zip 멤버는 한 번 메모리로 읽어 ZipFile로 열고,
+    그 안의 멤버까지 하나의 인덱스로 평탄화합니다.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path).resolve()
+        self.label = str(self.path)
+        st = self.path.stat()
+        self._archive_stat = (st.st_mtime_ns, st.st_size)
+        self._archives = []
+        self.members = {}  # name → (ZipFile, ZipInfo)
+        self._index_archive(zipfile.ZipFile(self.path))
+
+    def _index_archive(self, archive):
+        self._archives.append(archive)
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            name = _member_name(info)
+            if name.lower().endswith(".zip"):
+                self._index_archive(zipfile.ZipFile(io.BytesIO(archive.read(info))))
+            else:
+                self.members.setdefault(name, (archive, info))
+
+    def names(self):
+        return sorted(self.members)
+
+    def _info(self, name):
+        try:
+            return self.members[name]
+        except KeyError:
+            raise FileNotFoundError(f"❌ 아카이브에 없는 멤버: {name} ({self.label})") from None
+
+    def open_binary(self, name):
+        archive, info = self._info(name)
+        return archive.open(info)
+
+    def fingerprint(self, name):
+        _, info = self._info(name)
+        return self._archive_stat + (info.CRC, info.file_size)
+
+    def digest(self, name):
+        # zip이 이미 CRC-32를 저장하므로 내용 해시 대신 사용
+        _, info = self._info(name)
+        return f"crc32:{info.CRC:08x}:{info.file_size}"
+
+    def close(self):
+        for archive in self._archives:
+            archive.close()
+        self._archives = []
+
+
+def open_source(location):
+    """경로 종류에 따라 DirectorySource / ZipSource 생성"""
+    location = Path(location)
+    if location.is_dir():
+        return DirectorySource(location)
+    if location.suffix.lower() == ".zip" and location.exists():
+        return ZipSource(location)
+    raise FileNotFoundError(f"❌ 콘텐츠 소스를 찾을 수 없습니다: {location}")
+
+
+def default_source():
+    """
+    기본 콘텐츠 소스
+
+    1. 환경변수 KRALJIC_CONTENT_SOURCE (폴더 또는 zip)
+    2. 레포의 추출된 코스 폴더
+    3. DEFAULT_ARCHIVES 중 처음 존재하는 zip
+    """
+    override = os.environ.get(SOURCE_ENV)
+    if override:
+        return open_source(override)
+    if (REPO_ROOT / COURSE_DIR_NAME).is_dir() and any(
+            _session_number(p.name) for p in (REPO_ROOT / COURSE_DIR_NAME).glob("*.md")):
+        return DirectorySource(REPO_ROOT)
+    for archive in DEFAULT_ARCHIVES:
+        if archive.exists():
+            return ZipSource(archive)
+    raise FileNotFoundError("❌ 코스 콘텐츠(폴더 또는 zip)를 찾을 수 없습니다.")
+
+
+if __name__ == "__main__":
+    source = open_source(sys.argv[1]) if len(sys.argv) > 1 else default_source()
+    print("=" * 80)
+    print(f"Content source: {source.label}")
+    print("=" * 80)
+    for name in source.session_files():
+        print(f"  {name[len(COURSE_DIR_NAME) + 1:][:70]}")
+    print(f"\n  Index CSV: {source.index_csv()}")
+    print(f"  Images: {len(source.find('.png'))}, CSV: {len(source.find('.csv'))}")
+    print(f"  Total members: {len(source.names())}")
+    print("=" * 80)
@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+Deck Analysis Engine - PPTX를 한 번만 순회하여 열 지향(columnar) 팩트 테이블 생성
+verify_* 스크립트와 pptx_quality_enforcement.verify_pptx_quality가 각자 덱을 다시 열고
+slide/shape/paragraph/run을 재순회하던 것을, 한 번 수집한 팩트 위의 쿼리(규칙)로 대체
+
+팩트 테이블:
+- facts.shapes: slide, index, depth, parent, shape_type, name, left, top, width, height,
+                has_text_frame, text, fill_rgb, child_frame
+                (depth 0 = slide.shapes 최상위, 그룹 자식은 depth 1+ / 좌표는 그룹 좌표계,
+                 child_frame = 그룹의 chOff/chExt (left, top, width, height) - 슬라이드 좌표 변환용)
+- facts.runs:   slide, shape(행 번호), depth, paragraph, text, size_pt, font_name, bold, color_rgb
+                (fill_rgb/color_rgb: srgbClr 그대로, schemeClr는 마스터 clrMap + 테마 색으로 해석)
+- facts.slide_shape_counts: 슬라이드별 len(slide.shapes)
+
+쿼리 (필터 값: 스칼라 = 일치, set/list/range = 포함, callable = 조건):
+    facts.runs.column("size_pt", slide=range(1, 11), size_pt=lambda s: s is not None)
+    facts.runs.count(size_pt=16, bold=True, slide=3)
+    facts.shapes.distinct("fill_rgb", shape_type=MSO_SHAPE_TYPE.AUTO_SHAPE)
+
+규칙 세트:
+    rules = RuleSet("quality", [Rule("dimensions", "error", check_fn), ...])
+    result = rules.run(analyze_deck(path))   # {"passed", "errors", "warnings", "stats"}
+
+Usage:
+    python3 deck_analysis.py deck.pptx      # 팩트 요약 + 모든 verify_* 규칙 세트 실행
+"""
+
+import colorsys
+import sys
+import time
+from bisect import bisect_left, bisect_right
+from collections import Counter
+
+from lxml import etree
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
+
+EMU_PER_INCH = 914400
+
+SHAPE_COLUMNS = ("slide", "index", "depth", "parent", "shape_type", "name",
+                 "left", "top", "width", "height", "has_text_frame", "text", "fill_rgb",
+                 "child_frame")
+RUN_COLUMNS = ("slide", "shape", "depth", "paragraph", "text", "size_pt", "font_name", "bold",
+               "color_rgb")
+
+
+# ============================================================================
+# 열 지향 팩트 테이블
+# ============================================================================
+
+class FactTable:
+    """컬럼명 → 값 리스트. 필터는 필요한 컬럼만 훑어서 행 번호를 고름"""
+
+    def __init__(self, columns):
+        self.columns = {name: [] for name in columns}
+        self._length = 0
+
+    def append(self, **values):
+        for name, column in self.columns.items():
+            column.append(values.get(name))
+        self._length += 1
+
+    def __len__(self):
+        return self._length
+
+    def extend(self, other):
+        """같은 컬럼의 다른 테이블 행을 뒤에 이어붙임 (병렬 스캔 결과 병합용)"""
+        for name, column in self.columns.items():
+            column.extend(other.columns[name])
+        self._length += len(other)
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def _slide_rows(self, condition):
+        """slide 컬럼은 순회 순서대로 정렬되어 있으므로 bisect로 행 구간을 바로 찾음"""
+        column = self.columns["slide"]
+        if isinstance(condition, range) and condition.step == 1:
+            return range(bisect_left(column, condition.start), bisect_left(column, condition.stop))
+        return range(bisect_left(column, condition), bisect_right(column, condition))
+
+    def indices(self, **filters):
+        """필터를 모두 만족하는 행 번호 리스트"""
+        rows = range(self._length)
+        slide = filters.get("slide")
+        if "slide" in self.columns and (isinstance(slide, int) or
+                                        (isinstance(slide, range) and slide.step == 1)):
+            rows = self._slide_rows(filters.pop("slide"))
+        for name, condition in filters.items():
+            column = self.columns[name]
+            if callable(condition):
+                rows = [i for i in rows if condition(column[i])]
+            elif isinstance(condition, (set, frozenset, list, tuple, range)):
+                rows = [i for i in rows if column[i] in condition]
+            else:
+                rows = [i for i in rows if column[i] == condition]
+        return rows
+
+    def column(self, name, **filters):
+        column = self.columns[name]
+        if not filters:
+            return list(column)
+        return [column[i] for i in self.indices(**filters)]
+
+    def rows(self, *names, **filters):
+        """선택 컬럼의 튜플 리스트"""
+        columns = [self.columns[name] for name in names]
+        return [tuple(column[i] for column in columns) for i in self.indices(**filters)]
+
+    def count(self, **filters):
+        return len(self.indices(**filters)) if filters else self._length
+
+    def distinct(self, name, **filters):
+        return set(self.column(name, **filters))
+
+    def group_count(self, name, **filters):
+        return Counter(self.column(name, **filters))
+
+
+def _not_none(value):
+    return value is not None
+
+
+_SOLID_FILL = qn("a:solidFill")
+_SRGB_CLR = qn("a:srgbClr")
+_SCHEME_CLR = qn("a:schemeClr")
+_SYS_CLR = qn("a:sysClr")
+_CLR_SCHEME = f"{qn('a:themeElements')}/{qn('a:clrScheme')}"
+
+# 마스터에 clrMap이 없을 때의 기본 매핑 (PowerPoint 기본값)
+DEFAULT_CLR_MAP = {"bg1": "lt1", "tx1": "dk1", "bg2": "lt2", "tx2": "dk2"}
+
+
+def _hex_rgb(val):
+    return (int(val[0:2], 16), int(val[2:4], 16), int(val[4:6], 16))
+
+
+def theme_colors(theme, clr_map=None):
+    """
+    테마 XML 루트(a:theme) → {schemeClr val: (r, g, b)}
+
+    clrScheme의 dk1/lt1/.../accent1~6/hlink/folHlink에 더해, 마스터 p:clrMap의
+    bg1/tx1/bg2/tx2 별칭도 넣음 (clr_map: p:clrMap 속성 dict, None이면 기본 매핑)
+    """
+    colors = {}
+    scheme = theme.find(_CLR_SCHEME) if theme is not None else None
+    for slot in (scheme if scheme is not None else []):
+        if not isinstance(slot.tag, str):
+            continue
+        for color in slot:
+            if color.tag == _SRGB_CLR:
+                colors[etree.QName(slot).localname] = _hex_rgb(color.get("val"))
+            elif color.tag == _SYS_CLR and color.get("lastClr"):
+                colors[etree.QName(slot).localname] = _hex_rgb(color.get("lastClr"))
+    for alias, slot in {**DEFAULT_CLR_MAP, **(clr_map or {})}.items():
+        if slot in colors:
+            colors[alias] = colors[slot]
+    return colors
+
+
+def _modulate(rgb, color):
+    """schemeClr 하위 lumMod/lumOff/tint/shade 적용 (값은 1/1000 %)"""
+    r, g, b = (channel / 255 for channel in rgb)
+    for mod in color:
+        if not isinstance(mod.tag, str):
+            continue
+        name, value = etree.QName(mod).localname, int(mod.get("val", "100000")) / 100000
+        if name in ("lumMod", "lumOff"):
+            h, l, s = colorsys.rgb_to_hls(r, g, b)
+            l = min(1.0, max(0.0, l * value if name == "lumMod" else l + value))
+            r, g, b = colorsys.hls_to_rgb(h, l, s)
+        elif name == "tint":
+            r, g, b = (c + (1 - c) * (1 - value) for c in (r, g, b))
+        elif name == "shade":
+            r, g, b = (c * value for c in (r, g, b))
+    return tuple(int(round(c * 255)) for c in (r, g, b))
+
+
+def solid_fill_rgb(parent, theme=None):
+    """
+    <a:solidFill>의 (r, g, b) 또는 None (미설정/해석 불가)
+
+    srgbClr는 그대로, schemeClr는 theme(theme_colors 결과)로 해석 + 밝기 변조 적용.
+    python-pptx의 font.color는 접근만 해도 solidFill을 만들어 XML을 바꾸므로 직접 읽음
+    """
+    fill = parent.find(_SOLID_FILL) if parent is not None else None
+    if fill is None:
+        return None
+    srgb = fill.find(_SRGB_CLR)
+    if srgb is not None:
+        return _hex_rgb(srgb.get("val"))
+    scheme = fill.find(_SCHEME_CLR)
+    if scheme is not None and theme and scheme.get("val") in theme:
+        return _modulate(theme[scheme.get("val")], scheme)
+    return None
+
+
+def master_theme(master):
+    """python-pptx SlideMaster → theme_colors (테마 part가 없으면 빈 dict)"""
+    try:
+        theme_part = master.part.part_related_by(RT.THEME)
+    except KeyError:
+        return {}
+    clr_map = master._element.find(qn("p:clrMap"))
+    return theme_colors(etree.fromstring(theme_part.blob),
+                        dict(clr_map.attrib) if clr_map is not None else None)
+
+
+_XFRM_CH_OFF = f"{qn('a:xfrm')}/{qn('a:chOff')}"
+_XFRM_CH_EXT = f"{qn('a:xfrm')}/{qn('a:chExt')}"
+
+
+def _child_frame(grp_sp_pr):
+    """그룹 <p:grpSpPr>의 자식 좌표계 (chOff x/y, chExt cx/cy) 또는 None"""
+    if grp_sp_pr is None:
+        return None
+    ch_off = grp_sp_pr.find(_XFRM_CH_OFF)
+    ch_ext = grp_sp_pr.find(_XFRM_CH_EXT)
+    if ch_off is None or ch_ext is None:
+        return None
+    return (int(ch_off.get("x")), int(ch_off.get("y")), int(ch_ext.get("cx")), int(ch_ext.get("cy")))
+
+
+def _shape_type(shape):
+    try:
+        return shape.shape_type
+    except NotImplementedError:
+        return None
+
+
+class DeckFacts:
+    """한 번의 순회로 모은 덱 팩트"""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.slide_width = 0
+        self.slide_height = 0
+        self.slide_count = 0
+        self.slide_shape_counts = []
+        self.shapes = FactTable(SHAPE_COLUMNS)
+        self.runs = FactTable(RUN_COLUMNS)
+        self.elapsed = 0.0
+
+    # ------------------------------------------------------------------
+    # 자주 쓰는 쿼리 (기존 검증기와 같이 기본은 최상위 shape만: depth=0)
+    # ------------------------------------------------------------------
+    @property
+    def width_inches(self):
+        return self.slide_width / EMU_PER_INCH
+
+    @property
+    def height_inches(self):
+        return self.slide_height / EMU_PER_INCH
+
+    def dimensions_ok(self, width=10.83, height=7.50, tolerance=0.01):
+        return (abs(self.width_inches - width) < tolerance
+                and abs(self.height_inches - height) < tolerance)
+
+    def slides(self, start=1, stop=None):
+        """1-based 슬라이드 번호 range (stop 포함)"""
+        stop = self.slide_count if stop is None else min(stop, self.slide_count)
+        return range(start, stop + 1)
+
+    def font_sizes(self, nonblank=False, **filters):
+        """크기가 지정된 run들의 pt 리스트 (nonblank=True면 공백 run 제외)"""
+        filters.setdefault("depth", 0)
+        if nonblank:
+            filters["text"] = lambda t: bool(t.strip())
+        return self.runs.column("size_pt", size_pt=_not_none, **filters)
+
+    def font_size_distribution(self, nonblank=False, **filters):
+        """{int(pt): run 수}"""
+        return Counter(int(size) for size in self.font_sizes(nonblank, **filters))
+
+    def has_governing(self, slide, size_pt=16):
+        """16pt Bold run 존재 여부 (거버닝 메시지 시그니처)"""
+        return self.runs.count(slide=slide, depth=0, size_pt=size_pt, bold=True) > 0
+
+    def shape_texts(self, slide):
+        """최상위 텍스트 shape의 비어있지 않은 텍스트"""
+        return [t for t in self.shapes.column("text", slide=slide, depth=0, has_text_frame=True) if t]
+
+    def fill_colors(self, **filters):
+        """AUTO_SHAPE 단색 채우기 RGB 집합 (최상위)"""
+        return {rgb for rgb in self.shapes.column(
+            "fill_rgb", depth=0, shape_type=MSO_SHAPE_TYPE.AUTO_SHAPE, **filters) if rgb}
+
+    def average_shapes(self, slides=None):
+        counts = self.slide_shape_counts if slides is None else \
+            [self.slide_shape_counts[i - 1] for i in slides]
+        return sum(counts) / len(counts) if counts else 0
+
+
+# ============================================================================
+# 단일 패스 수집
+# ============================================================================
+
+def _collect_shape(facts, slide_number, shape, index, depth, parent, theme=None):
+    row = len(facts.shapes)
+    has_text_frame = getattr(shape, "has_text_frame", False)
+    shape_type = _shape_type(shape)
+
+    fill_rgb = None
+    if shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE:
+        fill_rgb = solid_fill_rgb(shape._element.spPr, theme)
+
+    facts.shapes.append(
+        slide=slide_number, index=index, depth=depth, parent=parent,
+        shape_type=shape_type, name=shape.name,
+        left=shape.left, top=shape.top, width=shape.width, height=shape.height,
+        has_text_frame=has_text_frame,
+        text=shape.text_frame.text if has_text_frame else "",
+        fill_rgb=fill_rgb,
+        child_frame=_child_frame(shape._element.grpSpPr) if shape_type == MSO_SHAPE_TYPE.GROUP else None,
+    )
+
+    if has_text_frame:
+        for para_index, paragraph in enumerate(shape.text_frame.paragraphs):
+            for run in paragraph.runs:
+                font = run.font
+                facts.runs.append(
+                    slide=slide_number, shape=row, depth=depth, paragraph=para_index, text=run.text,
+                    size_pt=font.size.pt if font.size is not None else None,
+                    font_name=font.name, bold=font.bold, color_rgb=solid_fill_rgb(run._r.rPr, theme),
+                )
+
+    if shape_type == MSO_SHAPE_TYPE.GROUP:
+        for child_index, child in enumerate(shape.shapes):
+            _collect_shape(facts, slide_number, child, child_index, depth + 1, row, theme)
+
+
+def analyze_deck(source):
+    """PPTX 경로 또는 Presentation → DeckFacts (slide/shape/run을 정확히 한 번 순회)"""
+    start = time.perf_counter()
+    if isinstance(source, (str, bytes)) or hasattr(source, "__fspath__"):
+        facts = DeckFacts(str(source))
+        prs = Presentation(source)
+    else:
+        facts = DeckFacts()
+        prs = source
+
+    facts.slide_width = prs.slide_width
+    facts.slide_height = prs.slide_height
+    themes = {}  # 마스터 part 이름 → theme_colors
+    for slide_number, slide in enumerate(prs.slides, 1):
+        master = slide.slide_layout.slide_master
+        if master.part.partname not in themes:
+            themes[master.part.partname] = master_theme(master)
+        theme = themes[master.part.partname]
+        shapes = list(slide.shapes)
+        facts.slide_shape_counts.append(len(shapes))
+        for index, shape in enumerate(shapes):
+            _collect_shape(facts, slide_number, shape, index, 0, None, theme)
+    facts.slide_count = len(facts.slide_shape_counts)
+    facts.elapsed = time.perf_counter() - start
+    return facts
+
+
+# ============================================================================
+# 규칙 / 규칙 세트
+# ============================================================================
+
+class Rule:
+    """
+    팩트 위의 검증 규칙 하나
+
+    check(facts, stats) → 메시지 리스트 (빈 리스트 = 통과). stats에 통계를 기록할 수 있음
+    severity: "error" 또는 "warning"
+    """
+
+    def __init__(self, name, severity, check):
+        self.name = name
+        self.severity = severity
+        self.check = check
+
+
+class RuleSet:
+    """규칙 묶음 - 결과는 verify_pptx_quality와 같은 dict 형식"""
+
+    def __init__(self, name, rules):
+        self.name = name
+        self.rules = list(rules)
+
+    def run(self, facts):
+        errors, warnings, stats = [], [], {}
+        for rule in self.rules:
+            messages = rule.check(facts, stats) or []
+            (errors if rule.severity == "error" else warnings).extend(messages)
+        return {
+            "passed": len(errors) == 0,
+            "errors": errors,
+            "warnings": warnings,
+            "stats": stats,
+        }
+
+
+def verifier_rule_sets():
+    """기존 verify_* 스크립트의 규칙 세트 (한 번 수집한 팩트에 모두 적용)"""
+    import pptx_quality_enforcement
+    import verify_corrected_quality
+    import verify_enhanced_quality
+    import verify_enhanced_v3
+    import verify_new_part1
+    import verify_part1_pptx
+    import verify_pptx_quality
+
+    return [
+        pptx_quality_enforcement.QUALITY_RULES,
+        verify_pptx_quality.QUALITY_RULES,
+        verify_corrected_quality.CORRECTED_RULES,
+        verify_enhanced_quality.ENHANCED_RULES,
+        verify_enhanced_v3.V3_RULES,
+        verify_new_part1.NEW_PART1_RULES,
+        verify_part1_pptx.PART1_RULES,
+    ]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python3 deck_analysis.py <pptx_file>")
+        sys.exit(1)
+
+    facts = analyze_deck(sys.argv[1])
+    print("=" * 80)
+    print(f"Deck facts: {facts.path}")
+    print("=" * 80)
+    print(f"  Dimensions: {facts.width_inches:.2f}\" × {facts.height_inches:.2f}\"")
+    print(f"  Slides: {facts.slide_count}")
+    print(f"  Shapes: {len(facts.shapes)} (top-level {facts.shapes.count(depth=0)})")
+    print(f"  Runs: {len(facts.runs)}")
+    print(f"  Font sizes: {dict(sorted(facts.font_size_distribution().items()))}")
+    print(f"  Scan time: {facts.elapsed * 1000:.1f} ms")
+    print("=" * 80)
+
+    start = time.perf_counter()
+    for rule_set in verifier_rule_sets():
+        result = rule_set.run(facts)
+        status = "✅ PASS" if result["passed"] else "❌ FAIL"
+        print(f"  {rule_set.name:28s} {status}  errors={len(result['errors'])} "
+              f"warnings={len(result['warnings'])}")
+    print(f"  Rule time: {(time.perf_counter() - start) * 1000:.1f} ms")
+    print("=" * 80)
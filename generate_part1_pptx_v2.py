@@ -12,6 +12,8 @@ Following S4HANA Professional Standards:
 - Door chart: 75-100 shapes for Kraljic Matrix
 """
 
+import sys
+
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
@@ -19,13 +21,17 @@ from pptx.enum.shapes import MSO_SHAPE
 from pptx.dml.color import RGBColor
 from pptx.enum.dml import MSO_LINE_DASH_STYLE
 
+import kraljic
+
 # ============================================================================
 # SLIDE DIMENSIONS - CRITICAL CONSTRAINTS
+# SLIDE_WIDTH × SLIDE_HEIGHT = 10.83" × 7.50", SAFE_RIGHT = 10.50", SAFE_BOTTOM = 7.05"
+# (defined in pptx_layout). Only create_simple_content_slide is solved by the
+# pptx_layout engine (LayoutOverflow instead of overflow); the other slide
+# builders still place shapes at hand-tuned coordinates and rely on the
+# verify_* bounds checks.
 # ============================================================================
-SLIDE_WIDTH = 10.83   # inches - DO NOT EXCEED!
-SLIDE_HEIGHT = 7.50   # inches - DO NOT EXCEED!
-SAFE_BOTTOM = 7.05    # Safe bottom (leave 0.45" margin)
-SAFE_RIGHT = 10.50    # Safe right (leave 0.33" margin)
+from pptx_layout import Box, Column, Row, content_frame, solve
 
 # S4HANA Color Palette (Monochrome)
 COLOR_BLACK = RGBColor(0, 0, 0)
@@ -80,29 +86,6 @@ def add_rectangle(slide, x, y, w, h, fill_color, border_color=None, border_width
 
     return shape
 
-def check_bounds(x, y, w, h, label="Shape"):
-    """Check if shape fits within slide boundaries
-
-    Args:
-        x, y, w, h: Position and size in inches
-        label: Description for error message
-
-    Returns:
-        tuple: (is_valid, right_edge, bottom_edge)
-
-    Raises:
-        Warning if bounds exceeded
-    """
-    right = x + w
-    bottom = y + h
-
-    if right > SLIDE_WIDTH:
-        print(f"⚠️  {label}: RIGHT overflow {right:.2f}\" > {SLIDE_WIDTH}\" (exceed by {right - SLIDE_WIDTH:.2f}\")")
-    if bottom > SLIDE_HEIGHT:
-        print(f"⚠️  {label}: BOTTOM overflow {bottom:.2f}\" > {SLIDE_HEIGHT}\" (exceed by {bottom - SLIDE_HEIGHT:.2f}\")")
-
-    return (right <= SLIDE_WIDTH and bottom <= SLIDE_HEIGHT, right, bottom)
-
 def add_text_box(slide, x, y, w, h, text, font_size=10, bold=False,
                  color=COLOR_BLACK, align=PP_ALIGN.LEFT, font_name='맑은 고딕'):
     """Add a text box with specified formatting
@@ -2021,9 +2004,12 @@ def create_slide_10_kraljic_axes(prs):
 # SLIDE 11: KRALJIC MATRIX DOOR CHART (100-120 shapes) - CRITICAL!!!
 # ============================================================================
 
-def create_slide_11_kraljic_door_chart(prs):
+def create_slide_11_kraljic_door_chart(prs, material_master=None):
     """Slide 11: Kraljic Matrix Door Chart - THE CRITICAL SLIDE! (100-120 shapes)
 
+    material_master: material master CSV - if given, the slide is the data-driven
+    density door chart of kraljic.classify_csv(); otherwise the static concept chart below
+
     Layout: Door Chart pattern with maximum density
     - 2×2 Matrix with 4 colored quadrants
     - Each quadrant: 15-20 detail items (8pt text)
@@ -2032,6 +2018,12 @@ def create_slide_11_kraljic_door_chart(prs):
     - Use 70-80% of shapes in 9pt or smaller
     - This is THE most important slide - maximum information density!
     """
+    if material_master:
+        result = kraljic.classify_csv(material_master)
+        slide = kraljic.add_kraljic_door_chart_slide(prs, result, title="2.3 📊 Kraljic Matrix", slide_num=11)
+        print(f"✓ Slide 11: Kraljic Door Chart ({len(result):,} materials from {material_master})")
+        return slide
+
     slide = prs.slides.add_slide(prs.slide_layouts[6])
 
     add_slide_title(slide, "2.3 📊 Kraljic Matrix", slide_num=11)
@@ -2923,51 +2915,51 @@ def create_chapter_divider(prs, chapter_num, chapter_title):
 
 def create_simple_content_slide(prs, slide_num, title, gov_msg, sections_data):
     """Simplified content slide generator for remaining slides (60-70 shapes)
-    FIXED: Reduce spacing to fit 5 sections with 4 items each within 7.50" height
+    Positions are solved by pptx_layout: measured 8pt item heights, sections stacked
+    from y=2.00 down to SAFE_BOTTOM (raises LayoutOverflow instead of overflowing)
     """
     slide = prs.slides.add_slide(prs.slide_layouts[6])
     add_slide_title(slide, title, slide_num=slide_num)
     add_governing_message(slide, gov_msg)
 
-    shape_count = 0
-    current_y = 2.00
+    layout = solve(Column([
+        Column([
+            Box("header", height=0.28, text=section["header"]),
+            Column([
+                Row([
+                    Box("bullet", width=0.12, text="•", font_size=8),
+                    Box("item", text=item, font_size=8, line_spacing=1.25, min_height=0.14),
+                ], gap=0.03, inset=(0.10, 0, 0.10, 0))
+                for item in section["items"]
+            ]),
+        ], gap=0.02)
+        for section in sections_data
+    ], gap=0.08), frame=content_frame(left=0.80, right=10.30))
 
-    for section in sections_data:
-        # Section header
-        add_rectangle(
-            slide, 0.80, current_y, 9.50, 0.28,
-            fill_color=COLOR_MED_GRAY,
-            border_color=COLOR_BLACK,
-            border_width=1
-        )
-        shape_count += 1
-
-        add_text_box(
-            slide, 0.90, current_y + 0.03, 9.30, 0.22,
-            section["header"], font_size=10, bold=True,
-            color=COLOR_WHITE
-        )
-        shape_count += 1
-
-        # Section items (FIXED: Reduce spacing)
-        item_y = current_y + 0.30  # Reduced from 0.38
-        for item in section["items"]:
+    shape_count = 0
+    for box, rect in layout:
+        if box.name == "header":
+            # Section header
+            add_rectangle(
+                slide, rect.x, rect.y, rect.w, rect.h,
+                fill_color=COLOR_MED_GRAY,
+                border_color=COLOR_BLACK,
+                border_width=1
+            )
             add_text_box(
-                slide, 0.90, item_y, 0.12, 0.14,  # Reduced height
-                "•", font_size=8, color=COLOR_DARK_GRAY
+                slide, rect.x + 0.10, rect.y + 0.03, rect.w - 0.20, rect.h - 0.06,
+                box.text, font_size=10, bold=True,
+                color=COLOR_WHITE
             )
-            shape_count += 1
-
+            shape_count += 2
+        else:
+            # Section items
             add_text_box(
-                slide, 1.05, item_y, 9.15, 0.14,  # Reduced height
-                item, font_size=8, color=COLOR_DARK_GRAY
+                slide, rect.x, rect.y, rect.w, rect.h,
+                box.text, font_size=8, color=COLOR_DARK_GRAY
             )
             shape_count += 1
 
-            item_y += 0.14  # Reduced from 0.19
-
-        current_y = item_y + 0.08  # Reduced from 0.12
-
     print(f"✓ Slide {slide_num}: {title.split()[0]} ({shape_count} shapes)")
     return slide
 
@@ -3275,8 +3267,11 @@ def create_slides_16_to_25(prs):
 # MAIN GENERATION FUNCTION
 # ============================================================================
 
-def main():
-    """Generate Part 1 PPTX - COMPLETE (All 25 Slides)"""
+def main(material_master=None):
+    """Generate Part 1 PPTX - COMPLETE (All 25 Slides)
+
+    material_master: optional material master CSV for the data-driven slide 11
+    """
     print("=== Part 1 PPTX Generation - COMPLETE (All 25 Slides) ===")
     print("High-quality implementation following S4HANA standards")
     print("Full course covering all 7 chapters + summary\n")
@@ -3298,7 +3293,7 @@ def main():
     create_slide_8_chapter2_divider(prs)
     create_slide_9_kraljic_birth(prs)
     create_slide_10_kraljic_axes(prs)
-    create_slide_11_kraljic_door_chart(prs)
+    create_slide_11_kraljic_door_chart(prs, material_master)
     create_slide_12_bottleneck(prs)
     create_slide_13_leverage(prs)
     create_slide_14_strategic(prs)
@@ -3326,4 +3321,5 @@ def main():
     return output_path
 
 if __name__ == "__main__":
-    main()
+    # python3 generate_part1_pptx_v2.py [material_master.csv]
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 """
-Part 2 PPTX Auto-Generator - 48 Slides from Markdown
-Automatically parses Session 2 markdown and generates 48 slides with 100% content coverage
+Part 2 PPTX Auto-Generator - Slides from Markdown
+Automatically parses Session 2 markdown and generates slides with 100% content coverage
+Sections are measured and split/merged by the pagination engine, so the deck has exactly
+as many slides as the content needs (no truncation, no filler slides)
 Uses quality enforcement system to guarantee font sizes and SVG insertion
 """
 
-import re
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
@@ -14,10 +15,14 @@ from pptx.enum.shapes import MSO_SHAPE
 
 # Import quality enforcement module
 from pptx_quality_enforcement import (
-    FONT_TITLE, FONT_GOVERNING, FONT_HEADING, FONT_BODY, FONT_BULLET, FONT_CAPTION,
-    enforce_text_properties, create_text_with_enforcement,
-    add_bullets_with_enforcement, insert_svg_as_image
+    FONT_BODY, create_text_with_enforcement, add_bullets_with_enforcement, insert_svg_as_image
 )
+from pptx_theme import compile_theme, set_fill, set_line, create_text_with_style
+import course_markdown
+import course_cache
+import course_source
+from pptx_pagination import paginate, PageItem
+from pptx_writer import save_presentation
 
 # ============================================================================
 # Color Constants
@@ -37,119 +42,56 @@ COLOR_STRATEGIC = RGBColor(142, 68, 173)
 COLOR_ROUTINE = RGBColor(149, 165, 166)
 
 # ============================================================================
-# SVG Mapping (slide number → SVG file)
+# SVG Mapping (section number → SVG file)
+# Keyed by the markdown section number, not the slide number: pagination decides
+# slide numbers, and the diagram goes on the first slide of its section
 # ============================================================================
 SVG_MAP = {
-    6: "SVG_ASSETS/slide6_matrix_door_chart.svg",
-    9: "SVG_ASSETS/slide9_bottleneck_multi_sourcing.svg",
-    15: "SVG_ASSETS/slide9_leverage_bidding.svg",  # Reuse existing
-    16: "SVG_ASSETS/slide16_consolidation_before_after.svg",
-    18: "SVG_ASSETS/slide11_tco_comparison.svg",  # Reuse existing
-    22: "SVG_ASSETS/slide12_partnership.svg",  # Reuse existing
-    28: "SVG_ASSETS/slide28_supplier_consolidation.svg",
-    29: "SVG_ASSETS/slide15_eprocurement.svg",  # Reuse existing
-    34: "SVG_ASSETS/slide34_scorecard_template.svg",
-    39: "SVG_ASSETS/slide21_toyota_pillars.svg",  # Toyota pillar 1
-    40: "SVG_ASSETS/slide21_toyota_pillars.svg",  # Toyota pillar 2
-    41: "SVG_ASSETS/slide21_toyota_pillars.svg",  # Toyota pillar 3
+    "1.2": "SVG_ASSETS/slide6_matrix_door_chart.svg",              # 자재군별 소싱 전략 매트릭스
+    "2.1.1": "SVG_ASSETS/slide9_bottleneck_multi_sourcing.svg",    # 공급선 다변화
+    "3.1": "SVG_ASSETS/slide16_consolidation_before_after.svg",    # 경쟁 촉진 및 통합 구매
+    "3.1.1": "SVG_ASSETS/slide9_leverage_bidding.svg",             # 경쟁 입찰
+    "3.1.2": "SVG_ASSETS/slide11_tco_comparison.svg",              # TCO 기반 공급업체 선정
+    "4.1.1": "SVG_ASSETS/slide12_partnership.svg",                 # 장기 파트너십 계약
+    "5.1.1": "SVG_ASSETS/slide28_supplier_consolidation.svg",      # 공급업체 통합
+    "5.1.2": "SVG_ASSETS/slide15_eprocurement.svg",                # Blanket PO 및 VMI
+    "6.3.1": "SVG_ASSETS/slide34_scorecard_template.svg",          # Supplier Scorecard 구성
+    "8.1.2": "SVG_ASSETS/slide21_toyota_pillars.svg",              # Toyota 핵심 전략
 }
 
 # ============================================================================
 # Markdown Parser
 # ============================================================================
 
-class MarkdownSection:
-    """Represents a markdown section that will become a slide"""
-    def __init__(self, level, title, content, line_start, line_end):
-        self.level = level  # ## = 2, ### = 3
-        self.title = title
-        self.content = content  # All content lines
-        self.line_start = line_start
-        self.line_end = line_end
-        self.aside_blocks = []
-        self.bullets = []
-        self.tables = []
-
-def parse_markdown(file_path):
-    """Parse markdown file into sections"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
-    sections = []
-    current_section = None
-    in_aside = False
-    aside_content = []
-
-    for i, line in enumerate(lines, 1):
-        # Detect section headers (## or ###)
-        header_match = re.match(r'^(#{2,3})\s+(.+)$', line)
-        if header_match:
-            # Save previous section
-            if current_section:
-                sections.append(current_section)
-
-            level = len(header_match.group(1))
-            title = header_match.group(2).strip()
-            current_section = MarkdownSection(level, title, [], i, i)
-            continue
-
-        # Add content to current section
-        if current_section:
-            current_section.content.append(line)
-            current_section.line_end = i
-
-            # Detect aside blocks
-            if '<aside>' in line:
-                in_aside = True
-                aside_content = []
-            elif '</aside>' in line:
-                in_aside = False
-                if aside_content:
-                    current_section.aside_blocks.append('\n'.join(aside_content))
-                aside_content = []
-            elif in_aside and line.strip() and not line.strip().startswith('<aside>'):
-                # Skip emoji lines and empty lines
-                if not re.match(r'^[🎯💡📋⚠️🔴🟢🟣⚪🔄📜🤝📊📦🔬📡📖📈🚀💻🏪✅]\s*$', line.strip()):
-                    aside_content.append(line.strip())
-
-            # Detect bullets
-            if re.match(r'^[\s]*[-\*]\s+', line):
-                bullet = re.sub(r'^[\s]*[-\*]\s+', '', line).strip()
-                if bullet and not bullet.startswith('**'):  # Skip bold headers
-                    current_section.bullets.append(bullet)
-
-            # Detect tables
-            if '|' in line and '---' not in line:
-                if not current_section.tables:
-                    current_section.tables.append([])
-                current_section.tables[-1].append(line.strip())
-
-    # Save last section
-    if current_section:
-        sections.append(current_section)
-
-    return sections
+def parse_markdown(file_path, source=None):
+    """Parse markdown file into sections (## / ###) using the streaming AST parser
+
+    The parsed AST is served from the course cache and only re-parsed when the file changed.
+    With a content source, file_path is a member name (folder or Notion export zip).
+    """
+    return course_markdown.sections(course_cache.load_document(file_path, source))
 
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
 def create_presentation():
-    """Create presentation with correct dimensions"""
+    """Create presentation with correct dimensions and compiled S4HANA theme"""
     prs = Presentation()
     prs.slide_width = Inches(10.83)
     prs.slide_height = Inches(7.50)
+    compile_theme(prs)
     return prs
 
 def add_title_and_governing(slide, title, governing_msg):
     """Add title and governing message to slide"""
     # Title
     title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9.83), Inches(0.6))
-    create_text_with_enforcement(title_box, title, FONT_TITLE, bold=True, color=COLOR_DARK_GRAY)
+    create_text_with_style(title_box, title, "title")
 
     # Governing message (16pt Bold, NOT 14pt Italic!)
     gov_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.95), Inches(9.83), Inches(0.5))
-    create_text_with_enforcement(gov_box, governing_msg, FONT_GOVERNING, bold=True, color=COLOR_MED_GRAY)
+    create_text_with_style(gov_box, governing_msg, "governing")
 
 # ============================================================================
 # Slide Generators
@@ -162,9 +104,8 @@ def generate_cover_slide(prs):
 
     # Background
     bg = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, prs.slide_width, prs.slide_height)
-    bg.fill.solid()
-    bg.fill.fore_color.rgb = COLOR_WHITE
-    bg.line.fill.background()
+    set_fill(bg, COLOR_WHITE)
+    set_line(bg, None)
 
     # Main title
     title_box = slide.shapes.add_textbox(Inches(1), Inches(2.5), Inches(8.83), Inches(1.5))
@@ -182,7 +123,7 @@ def generate_cover_slide(prs):
     create_text_with_enforcement(date_box, "Kraljic Matrix Framework | 2025", Pt(14),
                                 color=COLOR_LIGHT_GRAY, alignment=PP_ALIGN.CENTER)
 
-    print("[1/48] Cover slide")
+    print("[1] Cover slide")
     return slide
 
 def generate_learning_objectives(prs):
@@ -204,21 +145,19 @@ def generate_learning_objectives(prs):
     for i, obj in enumerate(objectives, 1):
         # Number circle
         circle = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(1.0), Inches(y), Inches(0.4), Inches(0.4))
-        circle.fill.solid()
-        circle.fill.fore_color.rgb = COLOR_ACCENT
-        circle.line.color.rgb = COLOR_ACCENT
+        set_fill(circle, COLOR_ACCENT)
+        set_line(circle, COLOR_ACCENT)
         num_text = circle.text_frame
         create_text_with_enforcement(circle, str(i), Pt(18), bold=True, color=COLOR_WHITE,
                                     alignment=PP_ALIGN.CENTER, vertical_anchor=MSO_ANCHOR.MIDDLE)
 
         # Objective text
         obj_box = slide.shapes.add_textbox(Inches(1.6), Inches(y), Inches(8.0), Inches(0.4))
-        create_text_with_enforcement(obj_box, obj, FONT_BULLET, color=COLOR_DARK_GRAY,
-                                    vertical_anchor=MSO_ANCHOR.MIDDLE)
+        create_text_with_style(obj_box, obj, "bullet", vertical_anchor=MSO_ANCHOR.MIDDLE)
 
         y += 0.7
 
-    print("[2/48] Learning objectives")
+    print("[2] Learning objectives")
     return slide
 
 def generate_introduction(prs):
@@ -232,26 +171,24 @@ def generate_introduction(prs):
     # Left: Definition
     def_box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
                                      Inches(0.8), Inches(2.0), Inches(4.5), Inches(4.0))
-    def_box.fill.solid()
-    def_box.fill.fore_color.rgb = COLOR_VERY_LIGHT_GRAY
-    def_box.line.color.rgb = COLOR_LIGHT_GRAY
+    set_fill(def_box, COLOR_VERY_LIGHT_GRAY)
+    set_line(def_box, COLOR_LIGHT_GRAY)
 
     def_text = slide.shapes.add_textbox(Inches(1.0), Inches(2.3), Inches(4.1), Inches(3.4))
     content = "소싱의 정의\n\n공급 리스크를 관리하고 최적의 가치를 창출하기 위한 전략적 활동\n\n• 공급업체 선정\n• 계약 협상\n• 관계 관리\n• 성과 평가"
-    create_text_with_enforcement(def_text, content, FONT_BODY, color=COLOR_DARK_GRAY)
+    create_text_with_style(def_text, content, "body")
 
     # Right: From Session 1
     context_box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
                                         Inches(5.5), Inches(2.0), Inches(4.5), Inches(4.0))
-    context_box.fill.solid()
-    context_box.fill.fore_color.rgb = COLOR_ACCENT
-    context_box.line.color.rgb = COLOR_ACCENT
+    set_fill(context_box, COLOR_ACCENT)
+    set_line(context_box, COLOR_ACCENT)
 
     context_text = slide.shapes.add_textbox(Inches(5.7), Inches(2.3), Inches(4.1), Inches(3.4))
     context_content = "1회차 복습\n\nKraljic Matrix로 자재를 4개 그룹으로 분류했습니다.\n\n이번 회차에서는 각 자재군별 구체적인 소싱 전략을 학습합니다."
-    create_text_with_enforcement(context_text, context_content, FONT_BODY, color=COLOR_WHITE)
+    create_text_with_style(context_text, context_content, "body", color=COLOR_WHITE)
 
-    print("[3/48] Introduction")
+    print("[3] Introduction")
     return slide
 
 def generate_toc(prs):
@@ -278,33 +215,46 @@ def generate_toc(prs):
         # Chapter number box
         num_box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
                                         Inches(1.5), Inches(y), Inches(1.0), Inches(0.5))
-        num_box.fill.solid()
-        num_box.fill.fore_color.rgb = COLOR_VERY_LIGHT_GRAY
-        num_box.line.color.rgb = COLOR_LIGHT_GRAY
+        set_fill(num_box, COLOR_VERY_LIGHT_GRAY)
+        set_line(num_box, COLOR_LIGHT_GRAY)
 
         num_text = num_box.text_frame
-        create_text_with_enforcement(num_box, f"{i}장", FONT_HEADING, bold=True, color=COLOR_DARK_GRAY,
-                                    alignment=PP_ALIGN.CENTER, vertical_anchor=MSO_ANCHOR.MIDDLE)
+        create_text_with_style(num_box, f"{i}장", "heading",
+                               alignment=PP_ALIGN.CENTER, vertical_anchor=MSO_ANCHOR.MIDDLE)
 
         # Chapter title
         title_box = slide.shapes.add_textbox(Inches(2.7), Inches(y), Inches(6.5), Inches(0.5))
-        create_text_with_enforcement(title_box, chapter, FONT_BULLET, color=COLOR_DARK_GRAY,
-                                    vertical_anchor=MSO_ANCHOR.MIDDLE)
+        create_text_with_style(title_box, chapter, "bullet", vertical_anchor=MSO_ANCHOR.MIDDLE)
 
         y += 0.65
 
-    print("[4/48] Table of Contents")
+    print("[4] Table of Contents")
     return slide
 
-def generate_simple_bullet_slide(prs, slide_num, title, gov_msg, bullets, svg_path=None):
-    """Generate a simple slide with bullets and optional SVG"""
+def add_page_items(text_frame, items):
+    """Add paginated items (PageItem or str) as bullets, keeping levels and bold sub-headings"""
+    items = [item if isinstance(item, PageItem) else PageItem(item) for item in items]
+    add_bullets_with_enforcement(text_frame, [item.text for item in items], FONT_BODY, font_name=None)
+    for para, item in zip(text_frame.paragraphs, items):
+        para.level = item.level
+        if item.bold:
+            for run in para.runs:
+                run.font.bold = True
+
+def generate_simple_bullet_slide(prs, slide_num, title, gov_msg, bullets, svg_path=None,
+                                 total_slides=None):
+    """Generate a simple slide with bullets and optional SVG
+
+    bullets are already paginated to fit the body box (see pptx_pagination);
+    an empty list leaves out the body box.
+    """
     blank_layout = prs.slide_layouts[6]
     slide = prs.slides.add_slide(blank_layout)
 
     add_title_and_governing(slide, title, gov_msg)
 
     # If SVG provided, use Toy Page layout (60% visual, 40% text)
-    if svg_path and slide_num in SVG_MAP:
+    if svg_path:
         # Left: SVG
         try:
             insert_svg_as_image(slide, svg_path, Inches(0.8), Inches(2.0), width=Inches(6.0))
@@ -312,27 +262,26 @@ def generate_simple_bullet_slide(prs, slide_num, title, gov_msg, bullets, svg_pa
             print(f"  ⚠️ SVG insertion failed: {e}")
 
         # Right: Bullets
-        bullet_box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                           Inches(7.0), Inches(2.0), Inches(3.0), Inches(4.0))
-        bullet_box.fill.solid()
-        bullet_box.fill.fore_color.rgb = COLOR_VERY_LIGHT_GRAY
-        bullet_box.line.color.rgb = COLOR_LIGHT_GRAY
+        if bullets:
+            bullet_box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
+                                               Inches(7.0), Inches(2.0), Inches(3.0), Inches(4.0))
+            set_fill(bullet_box, COLOR_VERY_LIGHT_GRAY)
+            set_line(bullet_box, COLOR_LIGHT_GRAY)
 
-        bullet_text = slide.shapes.add_textbox(Inches(7.2), Inches(2.3), Inches(2.6), Inches(3.4))
-        add_bullets_with_enforcement(bullet_text.text_frame, bullets, FONT_BODY, color=COLOR_DARK_GRAY)
+            bullet_text = slide.shapes.add_textbox(Inches(7.2), Inches(2.3), Inches(2.6), Inches(3.4))
+            add_page_items(bullet_text.text_frame, bullets)
 
-    else:
+    elif bullets:
         # Standard layout: bullets in center
         bullet_box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
                                            Inches(1.5), Inches(2.0), Inches(7.5), Inches(4.0))
-        bullet_box.fill.solid()
-        bullet_box.fill.fore_color.rgb = COLOR_VERY_LIGHT_GRAY
-        bullet_box.line.color.rgb = COLOR_LIGHT_GRAY
+        set_fill(bullet_box, COLOR_VERY_LIGHT_GRAY)
+        set_line(bullet_box, COLOR_LIGHT_GRAY)
 
         bullet_text = slide.shapes.add_textbox(Inches(1.8), Inches(2.3), Inches(7.0), Inches(3.4))
-        add_bullets_with_enforcement(bullet_text.text_frame, bullets, FONT_BODY, color=COLOR_DARK_GRAY)
+        add_page_items(bullet_text.text_frame, bullets)
 
-    print(f"[{slide_num}/48] {title[:40]}...")
+    print(f"[{slide_num}/{total_slides or slide_num}] {title[:40]}...")
     return slide
 
 # ============================================================================
@@ -340,16 +289,17 @@ def generate_simple_bullet_slide(prs, slide_num, title, gov_msg, bullets, svg_pa
 # ============================================================================
 
 def generate_part2_48slides():
-    """Generate complete 48-slide PPTX from markdown"""
+    """Generate complete Part 2 PPTX from markdown (slide count follows the content)"""
     print("=" * 80)
-    print("PART 2 PPTX AUTO-GENERATOR - 48 SLIDES")
+    print("PART 2 PPTX AUTO-GENERATOR")
     print("=" * 80)
     print()
 
     # Parse markdown
-    md_path = "/home/user/Kraljic_Course/전략적 재고운영 및 자재계획수립/[2회차] 자재군별 소싱 전략 및 공급업체 관계 관리 28287a1932c481eea727e4841dffb4ac.md"
-    print(f"Parsing: {md_path}")
-    sections = parse_markdown(md_path)
+    source = course_source.default_source()  # KRALJIC_CONTENT_SOURCE=<folder|zip>
+    md_path = source.session_file(2)
+    print(f"Parsing: {source.describe(md_path)}")
+    sections = parse_markdown(md_path, source)
     print(f"  → Found {len(sections)} sections\n")
 
     # Create presentation
@@ -374,47 +324,44 @@ def generate_part2_48slides():
     generate_toc(prs)
     slide_count += 1
 
-    # Generate slides from sections
-    for section in sections:
-        if slide_count > 48:
-            break
-
-        # Extract governing message from first aside block or use default
-        gov_msg = section.aside_blocks[0][:100] if section.aside_blocks else "핵심 내용을 학습합니다."
-
-        # Extract bullets (limit to 5)
-        bullets = section.bullets[:5] if section.bullets else ["내용을 참조하세요."]
-
-        # Check if this slide should have SVG
-        svg_path = SVG_MAP.get(slide_count)
-
-        # Generate slide
-        generate_simple_bullet_slide(prs, slide_count, section.title, gov_msg, bullets, svg_path)
-
+    # Paginate sections in one pass: measured text decides splits/merges,
+    # a section with an SVG starts its own slide and gets the narrow body box
+    svg_by_title = {s.title: SVG_MAP[s.number] for s in sections if s.number in SVG_MAP}
+    pages = paginate(sections, first_page=slide_count,
+                     visual=lambda section: section.title in svg_by_title)
+    total_slides = slide_count - 1 + len(pages)
+    print(f"  → {len(sections)} sections paginated into {len(pages)} slides\n")
+
+    # Generate slides from pages
+    used_svgs = set()
+    for page in pages:
+        svg_path = svg_by_title[page.sections[0]] if page.visual else None
+        generate_simple_bullet_slide(prs, page.number, page.title, page.governing, page.items,
+                                     svg_path, total_slides)
+        if svg_path:
+            used_svgs.add(page.sections[0])
         slide_count += 1
 
-    # Fill remaining slides if needed
-    while slide_count <= 48:
-        blank_layout = prs.slide_layouts[6]
-        slide = prs.slides.add_slide(blank_layout)
-        add_title_and_governing(slide, f"슬라이드 {slide_count}", "추가 내용")
-        print(f"[{slide_count}/48] Filler slide")
-        slide_count += 1
+    used_numbers = {s.number for s in sections if s.title in used_svgs}
+    for number in SVG_MAP:
+        if number not in used_numbers:
+            print(f"  ⚠️ SVG_MAP[{number!r}] not used: no section {number} with body text")
 
     # Save
     output_path = "/home/user/Kraljic_Course/PPTX_RESULT/Part2_48Slides_Complete.pptx"
     print()
     print("Saving presentation...")
-    prs.save(output_path)
+    save_stats = save_presentation(prs, output_path)
+    print(f"  → {save_stats.summary()}")
 
     print()
     print("=" * 80)
-    print(f"✅ 48-SLIDE PPTX GENERATED!")
+    print(f"✅ {len(prs.slides)}-SLIDE PPTX GENERATED!")
     print("=" * 80)
     print()
     print(f"Output: {output_path}")
     print(f"Total slides: {len(prs.slides)}")
-    print(f"SVG diagrams: {len(SVG_MAP)} slides")
+    print(f"SVG diagrams: {len(used_svgs)} slides")
     print()
 
     return output_path
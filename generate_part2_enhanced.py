@@ -18,6 +18,9 @@ from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
 
+from pptx_layout import default_measurer
+from tco import TCO_EXAMPLE, cached_tco
+
 # ============================================================================
 # COLOR SYSTEM (Monochrome)
 # ============================================================================
@@ -553,7 +556,8 @@ def add_bottleneck_strategy_enhanced(prs):
         ["• 경쟁 입찰: RFQ, 역경매", "• 통합 구매: 10개 → 3-5개로 축소", "• 글로벌 소싱: 저가 공급원 확보"])
 
     print("[11/25] TCO Comparison (ENHANCED)...")
-    add_tco_comparison_enhanced(prs)
+    # 입력이 같으면 .tco_cache의 결과를 그대로 사용
+    add_tco_comparison_enhanced(prs, cached_tco(TCO_EXAMPLE).to_slide_data())
 
     print("[12/25] Partnership Diagram (ENHANCED)...")
     add_partnership_diagram_enhanced(prs)
@@ -840,8 +844,29 @@ def add_leverage_bidding_enhanced(prs):
 
     return slide
 
-def add_tco_comparison_enhanced(prs):
-    """Slide 11: ENHANCED - TCO Comparison"""
+def add_tco_comparison_enhanced(prs, comparison=None):
+    """Slide 11: ENHANCED - TCO Comparison
+
+    comparison: tco.TcoResult.to_slide_data() - 주면 계산된 구성 요소/합계 + 누적 막대
+                공급업체안이 3개 이상이면 TCO 하위 2개(선정안, 차순위)만 패널로 표시 - 절감액과 같은 비교
+    """
+    formula = "TCO = 구매가 + 물류비 + 관세 + 품질비용 + 재고비용 + 관리비용"
+    titles = ["국내 공급업체", "해외 공급업체"]
+    contents = ["구매가: ₩100\n물류비: ₩5\n관세: ₩0\n품질비용: ₩2\n재고비용: ₩3\n\n총 TCO: ₩110",
+                "구매가: ₩85\n물류비: ₩15\n관세: ₩8\n품질비용: ₩5\n재고비용: ₩8\n\n총 TCO: ₩121"]
+    winner_message = "✓ 국내 공급업체 선정 (TCO 우위: ₩11 절감)"
+    line_spacing = 1.4
+    if comparison:
+        ranked = sorted(comparison["options"], key=lambda option: option["total"])
+        options = ranked[:2]
+        formula = "TCO = " + " + ".join(comparison["components"])
+        titles = [option["supplier"] for option in options]
+        contents = ["\n".join(f"{label}: ₩{value:,.1f}" for label, value in option["components"].items())
+                    + f"\n\n총 TCO: ₩{option['total']:,.1f}" for option in options]
+        winner_message = (f"✓ {options[0]['supplier']} 선정 "
+                          f"(TCO 우위: ₩{comparison['savings']:,.1f} 절감)")
+        line_spacing = 1.1
+
     blank_layout = prs.slide_layouts[6]
     slide = prs.slides.add_slide(blank_layout)
 
@@ -863,7 +888,7 @@ def add_tco_comparison_enhanced(prs):
 
     formula_text = slide.shapes.add_textbox(Inches(1.2), Inches(2.15), Inches(8.1), Inches(0.3))
     formula_frame = formula_text.text_frame
-    formula_frame.text = "TCO = 구매가 + 물류비 + 관세 + 품질비용 + 재고비용 + 관리비용"
+    formula_frame.text = formula
     f_para = formula_frame.paragraphs[0]
     f_para.font.name = "맑은 고딕"
     f_para.font.size = FONT_HEADING
@@ -884,7 +909,7 @@ def add_tco_comparison_enhanced(prs):
     domestic_box.line.width = Pt(2)
 
     d_title = slide.shapes.add_textbox(Inches(1.2), Inches(3.2), Inches(3.6), Inches(0.4))
-    d_title.text_frame.text = "국내 공급업체"
+    d_title.text_frame.text = titles[0]
     dt_para = d_title.text_frame.paragraphs[0]
     dt_para.font.name = "맑은 고딕"
     dt_para.font.size = FONT_HEADING
@@ -894,13 +919,13 @@ def add_tco_comparison_enhanced(prs):
 
     d_content = slide.shapes.add_textbox(Inches(1.3), Inches(3.7), Inches(3.4), Inches(2.0))
     d_frame = d_content.text_frame
-    d_frame.text = "구매가: ₩100\n물류비: ₩5\n관세: ₩0\n품질비용: ₩2\n재고비용: ₩3\n\n총 TCO: ₩110"
+    d_frame.text = contents[0]
     d_frame.word_wrap = True
-    dp = d_frame.paragraphs[0]
-    dp.font.name = "맑은 고딕"
-    dp.font.size = FONT_BODY
-    dp.font.color.rgb = COLOR_DARK_GRAY
-    dp.line_spacing = 1.4
+    for dp in d_frame.paragraphs:
+        dp.font.name = "맑은 고딕"
+        dp.font.size = FONT_BODY
+        dp.font.color.rgb = COLOR_DARK_GRAY
+        dp.line_spacing = line_spacing
 
     # Right: Overseas
     overseas_box = slide.shapes.add_shape(
@@ -914,7 +939,7 @@ def add_tco_comparison_enhanced(prs):
     overseas_box.line.width = Pt(2)
 
     o_title = slide.shapes.add_textbox(Inches(5.7), Inches(3.2), Inches(3.6), Inches(0.4))
-    o_title.text_frame.text = "해외 공급업체"
+    o_title.text_frame.text = titles[1]
     ot_para = o_title.text_frame.paragraphs[0]
     ot_para.font.name = "맑은 고딕"
     ot_para.font.size = FONT_HEADING
@@ -924,13 +949,40 @@ def add_tco_comparison_enhanced(prs):
 
     o_content = slide.shapes.add_textbox(Inches(5.8), Inches(3.7), Inches(3.4), Inches(2.0))
     o_frame = o_content.text_frame
-    o_frame.text = "구매가: ₩85\n물류비: ₩15\n관세: ₩8\n품질비용: ₩5\n재고비용: ₩8\n\n총 TCO: ₩121"
+    o_frame.text = contents[1]
     o_frame.word_wrap = True
-    op = o_frame.paragraphs[0]
-    op.font.name = "맑은 고딕"
-    op.font.size = FONT_BODY
-    op.font.color.rgb = COLOR_DARK_GRAY
-    op.line_spacing = 1.4
+    for op in o_frame.paragraphs:
+        op.font.name = "맑은 고딕"
+        op.font.size = FONT_BODY
+        op.font.color.rgb = COLOR_DARK_GRAY
+        op.line_spacing = line_spacing
+
+    # Cost breakdown bars (length = TCO relative to the larger option)
+    if comparison:
+        shades = [COLOR_ACCENT, COLOR_DARK_GRAY, COLOR_MED_GRAY, RGBColor(153, 153, 153), COLOR_LIGHT_GRAY,
+                  RGBColor(192, 57, 43), RGBColor(127, 140, 141)]
+        max_total = max(option["total"] for option in options)
+        # Bars go right under the taller breakdown text (measured), but stay inside the 6.0" panel
+        measurer = default_measurer()
+        text_h = max(measurer.height(text, 3.4 - 0.2, FONT_BODY.pt, 1.2 * line_spacing) for text in contents)
+        bar_y = min(3.7 + 0.1 + text_h + 0.1, 6.0 - 0.25)
+        for content in (d_content, o_content):
+            content.height = Inches(bar_y - 0.05 - 3.7)
+        for box_x, option in zip((1.2, 5.7), options):
+            bar_x = box_x
+            bar_w = 3.6 * option["total"] / max_total
+            for value, shade in zip(option["components"].values(), shades):
+                if value <= 0:
+                    continue
+                segment = slide.shapes.add_shape(
+                    MSO_SHAPE.RECTANGLE,
+                    Inches(bar_x), Inches(bar_y),
+                    Inches(bar_w * value / option["total"]), Inches(0.15)
+                )
+                segment.fill.solid()
+                segment.fill.fore_color.rgb = shade
+                segment.line.fill.background()
+                bar_x += bar_w * value / option["total"]
 
     # Winner indicator
     winner_box = slide.shapes.add_shape(
@@ -944,7 +996,7 @@ def add_tco_comparison_enhanced(prs):
 
     winner_text = slide.shapes.add_textbox(Inches(2.7), Inches(6.45), Inches(5.1), Inches(0.3))
     winner_frame = winner_text.text_frame
-    winner_frame.text = "✓ 국내 공급업체 선정 (TCO 우위: ₩11 절감)"
+    winner_frame.text = winner_message
     w_para = winner_frame.paragraphs[0]
     w_para.font.name = "맑은 고딕"
     w_para.font.size = FONT_HEADING
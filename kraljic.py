@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+Kraljic Portfolio Classifier - 자재 마스터 CSV → 공급 리스크 / 구매 임팩트 점수 → 4분면 분류
+8회차 "Kraljic Matrix 실전 워크샵" 평가표를 벡터 연산으로 적용:
+- 공급 리스크 = 공급업체 수 30% + 대체 가능성 25% + 리드타임 20% + 지리적 집중 15% + 시장 구조 10%
+- 구매 임팩트 = 구매 금액 40% + 원가 비중 25% + 사업 영향 20% + 품질 영향 15%
+- 항목 점수 1(낮음)~3(높음), 높음 ≥ 2.3 / 중간 1.7~2.3 / 낮음 < 1.7
+- 4분면 경계 = 2.0 (중간 구간의 가운데), 한 축이라도 1.7~2.3이면 boundary (경계 영역, 추가 검토)
+
+입력 CSV (material 필수, 나머지는 있는 열만 사용 - 없는 항목은 가중치를 나머지에 재배분):
+- supply_risk / impact: 이미 계산된 점수가 있으면 그대로 사용
+- <항목>_score: 항목 점수 1~3 (suppliers_score, substitutability_score, lead_time_score, ...)
+- 원시값 자동 점수화: suppliers (개수), lead_time_days, spend, cost_share (원가 비중 0~1)
+  · spend_basis="abc"(기본): 구매 금액 점수 = ABC 등급 (A 3 / B 2 / C 1) - 수천 품목이면 1% 넘는 품목이 거의 없음
+  · spend_basis="share": 8회차 평가표 그대로 전체 대비 비율 (30개 내외 워크샵 목록)
+
+문 차트(door chart):
+- 품목마다 점을 그리지 않고 임팩트 × 리스크 평면을 bins 칸으로 나눠 np.histogram2d 한 번
+  → 수천~수십만 품목이어도 도형 수 = 비어 있지 않은 칸 수 (≤ bins[0] × bins[1])
+- generate_kraljic_density_svg: SVG_ASSETS용 SVG, add_kraljic_door_chart_slide: PPTX 슬라이드
+
+Usage:
+    from kraljic import classify_csv, add_kraljic_door_chart_slide
+
+    result = classify_csv("material_master.csv")
+    result.summary()["strategic"]   # {"count", "count_share", "spend", "spend_share"}
+    add_kraljic_door_chart_slide(prs, result)
+
+    python3 kraljic.py                                  # 20,000 품목 샘플 분류 + 벤치마크
+    python3 kraljic.py material_master.csv [out.pptx|out.svg|out.json]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from abc_xyz import abc_classes
+from scm_data import DEFAULT_CHUNK_SIZE, format_pct, format_won, iter_csv_chunks, read_header, write_csv_columns
+
+RISK_WEIGHTS = {"suppliers": 0.30, "substitutability": 0.25, "lead_time": 0.20, "geography": 0.15, "market": 0.10}
+IMPACT_WEIGHTS = {"spend": 0.40, "cost_share": 0.25, "business": 0.20, "quality": 0.15}
+SCORE_RANGE = (1.0, 3.0)
+LOW_THRESHOLD, HIGH_THRESHOLD = 1.7, 2.3
+SPLIT = (LOW_THRESHOLD + HIGH_THRESHOLD) / 2
+
+QUADRANTS = ("strategic", "leverage", "bottleneck", "routine")
+QUADRANT_NAMES = {"strategic": "전략자재", "leverage": "레버리지자재", "bottleneck": "병목자재", "routine": "일상자재"}
+QUADRANT_COLORS = {"strategic": "#8E44AD", "leverage": "#27AE60", "bottleneck": "#E67E22", "routine": "#95A5A6"}
+
+
+# ============================================================================
+# 점수화 (8회차 평가표)
+# ============================================================================
+
+def score_suppliers(count):
+    """공급업체 수 → 5개 이상 1 / 3~4개 2 / 2개 이하 3"""
+    count = np.asarray(count, dtype=np.float64)
+    return 3.0 - (count >= 3) - (count >= 5)
+
+
+def score_lead_time(days):
+    """리드타임(일) → 30일 미만 1 / 30~90일 2 / 90일 초과 3"""
+    days = np.asarray(days, dtype=np.float64)
+    return 1.0 + (days >= 30) + (days > 90)
+
+
+def score_spend_share(share):
+    """전체 대비 구매 금액 비율 → 1% 미만 1 / 1~5% 2 / 5% 초과 3"""
+    share = np.asarray(share, dtype=np.float64)
+    return 1.0 + (share >= 0.01) + (share > 0.05)
+
+
+def score_spend_abc(spend):
+    """구매 금액 → ABC 등급 점수 (A 3 / B 2 / C 1)"""
+    return 3.0 - abc_classes(spend)
+
+
+def score_cost_share(share):
+    """제품 원가 비중 → 5% 미만 1 / 5~15% 2 / 15% 초과 3"""
+    share = np.asarray(share, dtype=np.float64)
+    return 1.0 + (share >= 0.05) + (share > 0.15)
+
+
+def weighted_score(scores, weights):
+    """
+    {항목: 점수 배열} 가중합 (없는 항목은 빼고 가중치 재배분, 점수 NaN도 같은 방식으로 행별 재배분)
+
+    Raises:
+        ValueError - weights의 항목이 하나도 없을 때
+    """
+    available = [name for name in weights if name in scores]
+    if not available:
+        raise ValueError(f"점수 항목이 하나도 없음 (필요: {', '.join(weights)})")
+    total = None
+    weight_sum = None
+    for name in available:
+        score = np.asarray(scores[name], dtype=np.float64)
+        present = ~np.isnan(score)
+        term = np.where(present, score, 0.0) * weights[name]
+        used = present * weights[name]
+        total = term if total is None else total + term
+        weight_sum = used if weight_sum is None else weight_sum + used
+    out = np.full(total.shape, np.nan)
+    np.divide(total, weight_sum, out=out, where=weight_sum > 0)
+    return out
+
+
+def quadrant_codes(risk, impact, split=SPLIT):
+    """(리스크, 임팩트) → 0 전략 / 1 레버리지 / 2 병목 / 3 일상"""
+    risk_high = np.asarray(risk) >= split
+    impact_high = np.asarray(impact) >= split
+    return np.where(risk_high, np.where(impact_high, 0, 2), np.where(impact_high, 1, 3)).astype(np.int8)
+
+
+# ============================================================================
+# 결과
+# ============================================================================
+
+class KraljicResult:
+    """품목별 점수 / 분면 배열 + 분면 요약 + 밀도 격자"""
+
+    def __init__(self, material, spend, risk, impact, split=SPLIT):
+        self.material = np.asarray(material)
+        self.spend = np.nan_to_num(np.asarray(spend, dtype=np.float64))
+        self.risk = np.clip(np.nan_to_num(np.asarray(risk, dtype=np.float64), nan=SCORE_RANGE[0]), *SCORE_RANGE)
+        self.impact = np.clip(np.nan_to_num(np.asarray(impact, dtype=np.float64), nan=SCORE_RANGE[0]), *SCORE_RANGE)
+        self.split = split
+        self.quadrant = quadrant_codes(self.risk, self.impact, split)
+        middle_risk = (self.risk >= LOW_THRESHOLD) & (self.risk < HIGH_THRESHOLD)
+        middle_impact = (self.impact >= LOW_THRESHOLD) & (self.impact < HIGH_THRESHOLD)
+        self.boundary = middle_risk | middle_impact
+
+    def __len__(self):
+        return len(self.material)
+
+    @property
+    def labels(self):
+        return np.array(QUADRANTS)[self.quadrant]
+
+    def summary(self):
+        """{분면: {"count", "count_share", "spend", "spend_share", "boundary"}}"""
+        counts = np.bincount(self.quadrant, minlength=4)
+        spend = np.bincount(self.quadrant, weights=self.spend, minlength=4)
+        boundary = np.bincount(self.quadrant[self.boundary], minlength=4)
+        total_count, total_spend = counts.sum(), spend.sum()
+        return {
+            name: {
+                "count": int(counts[q]),
+                "count_share": counts[q] / total_count if total_count else 0.0,
+                "spend": float(spend[q]),
+                "spend_share": spend[q] / total_spend if total_spend else 0.0,
+                "boundary": int(boundary[q]),
+            }
+            for q, name in enumerate(QUADRANTS)
+        }
+
+    def density(self, bins=(20, 12)):
+        """
+        임팩트(x) × 리스크(y) 격자별 품목 수 / 구매금액
+
+        Returns:
+            (counts[x, y], spend[x, y], x_edges, y_edges) - 점수 범위 SCORE_RANGE 기준
+        """
+        extent = [SCORE_RANGE, SCORE_RANGE]
+        counts, x_edges, y_edges = np.histogram2d(self.impact, self.risk, bins=bins, range=extent)
+        spend, _, _ = np.histogram2d(self.impact, self.risk, bins=bins, range=extent, weights=self.spend)
+        return counts, spend, x_edges, y_edges
+
+    def to_slide_data(self, top=5):
+        """슬라이드 생성기용 dict - 분면 요약 + 분면별 구매금액 상위 top개 품목"""
+        data = {"total_count": len(self), "total_spend": float(self.spend.sum()),
+                "boundary": int(self.boundary.sum()), "quadrants": self.summary()}
+        for q, name in enumerate(QUADRANTS):
+            members = np.flatnonzero(self.quadrant == q)
+            ranked = members[np.argsort(-self.spend[members], kind="stable")[:top]]
+            data["quadrants"][name]["top"] = [str(m) for m in self.material[ranked]]
+        return data
+
+    def write_csv(self, path, chunk_size=DEFAULT_CHUNK_SIZE):
+        """품목별 결과 CSV (material, spend, supply_risk, impact, quadrant, boundary)"""
+        write_csv_columns(path, {
+            "material": self.material,
+            "spend": self.spend,
+            "supply_risk": self.risk,
+            "impact": self.impact,
+            "quadrant": self.labels,
+            "boundary": self.boundary.astype(np.int8),
+        }, chunk_size=chunk_size, float_format="{:.4g}")
+
+
+# ============================================================================
+# CSV 입력
+# ============================================================================
+
+def _chunk_scores(chunk, weights, raw_scorers):
+    scores = {}
+    for name in weights:
+        if f"{name}_score" in chunk:
+            scores[name] = chunk[f"{name}_score"]
+        elif name in raw_scorers and raw_scorers[name][0] in chunk:
+            column, scorer = raw_scorers[name]
+            values = chunk[column]
+            scores[name] = np.where(np.isnan(values), np.nan, scorer(np.nan_to_num(values)))
+    return scores
+
+
+def classify_csv(path, chunk_size=DEFAULT_CHUNK_SIZE, split=SPLIT, spend_basis="abc"):
+    """자재 마스터 CSV → KraljicResult (입력 열 / spend_basis는 모듈 설명 참고)"""
+    if spend_basis not in ("abc", "share"):
+        raise ValueError(f"spend_basis는 'abc' 또는 'share': {spend_basis!r}")
+    header = read_header(path)
+    if "material" not in header:
+        raise ValueError(f"{path}: material 열이 필요")
+    direct_risk = "supply_risk" in header
+    direct_impact = "impact" in header
+    risk_raw = {"suppliers": ("suppliers", score_suppliers), "lead_time": ("lead_time_days", score_lead_time)}
+    impact_raw = {"cost_share": ("cost_share", score_cost_share)}
+    wanted = {"material", "spend", "supply_risk", "impact", "suppliers", "lead_time_days", "cost_share"}
+    wanted |= {f"{name}_score" for name in list(RISK_WEIGHTS) + list(IMPACT_WEIGHTS)}
+    columns = [name for name in header if name in wanted]
+
+    materials, spends, risks, impact_parts = [], [], [], []
+    for chunk in iter_csv_chunks(path, chunk_size, text_columns=("material",), columns=columns):
+        materials.append(chunk["material"])
+        spends.append(np.nan_to_num(chunk["spend"]) if "spend" in chunk else np.zeros(len(chunk["material"])))
+        risks.append(chunk["supply_risk"] if direct_risk else
+                     weighted_score(_chunk_scores(chunk, RISK_WEIGHTS, risk_raw), RISK_WEIGHTS))
+        if direct_impact:
+            impact_parts.append({"impact": chunk["impact"]})
+        else:
+            impact_parts.append(_chunk_scores(chunk, IMPACT_WEIGHTS, impact_raw))
+
+    if not materials:
+        raise ValueError(f"{path}: 데이터 행이 없음")
+    spend = np.concatenate(spends)
+    if direct_impact:
+        impact = np.concatenate([part["impact"] for part in impact_parts])
+    else:
+        # 구매 금액 점수는 전체 합계가 있어야 하므로 모든 청크를 읽은 뒤 계산
+        scores = {name: np.concatenate([part[name] for part in impact_parts])
+                  for name in impact_parts[0]}
+        if "spend_score" not in header and "spend" in header and spend.sum() > 0:
+            scores["spend"] = score_spend_abc(spend) if spend_basis == "abc" else score_spend_share(spend / spend.sum())
+        impact = weighted_score(scores, IMPACT_WEIGHTS)
+    return KraljicResult(np.concatenate(materials), spend, np.concatenate(risks), impact, split)
+
+
+def generate_sample_csv(path, n_materials=20_000, seed=8):
+    """실습용 가상 자재 마스터 (구매액 로그정규, 항목 점수 1~3)"""
+    rng = np.random.default_rng(seed)
+    criticality = rng.beta(1.5, 4.0, n_materials)   # 높을수록 공급 리스크 항목 점수가 높아지는 잠재 변수
+
+    def criterion(bias):
+        return np.clip(np.round(1 + 2 * np.clip(criticality * bias + rng.normal(0, 0.25, n_materials), 0, 1)), 1, 3)
+
+    columns = {
+        "material": np.char.add("M-", np.arange(1, n_materials + 1).astype(str)),
+        "spend": np.round(rng.lognormal(16.0, 1.6, n_materials), -4),
+        "suppliers": np.maximum(1, np.round(rng.lognormal(1.6, 0.7, n_materials) * (1.2 - criticality))),
+        "substitutability_score": criterion(1.2),
+        "lead_time_days": np.round(rng.lognormal(3.4, 0.6, n_materials) * (0.6 + 2 * criticality)),
+        "geography_score": criterion(1.0),
+        "market_score": criterion(1.1),
+        "cost_share": rng.beta(1.2, 12.0, n_materials),
+        "business_score": criterion(0.9),
+        "quality_score": rng.integers(1, 4, n_materials).astype(np.float64),
+    }
+    write_csv_columns(path, columns)
+
+
+# ============================================================================
+# 문 차트 (밀도 격자)
+# ============================================================================
+
+def _shade(count, max_count):
+    """품목 수 → 0~1 농도 (로그 스케일, 1개도 보이도록 최소 0.15)"""
+    if count <= 0 or max_count <= 0:
+        return 0.0
+    return 0.15 + 0.85 * np.log1p(count) / np.log1p(max_count)
+
+
+def generate_kraljic_density_svg(result, path=None, bins=(24, 16), title="Kraljic Matrix: 자재 포트폴리오 분포"):
+    """
+    Kraljic 문 차트 SVG (800×500) - 분면 배경 + 밀도 격자(분면 색, 불투명도 = 품목 수) + 분면별 품목 수/구매액 비중
+
+    Returns:
+        SVG 문자열 (path가 있으면 파일로도 저장)
+    """
+    counts, _, x_edges, y_edges = result.density(bins)
+    summary = result.summary()
+    left, top, width, height = 120, 60, 620, 360
+    lo, hi = SCORE_RANGE
+
+    def sx(value):
+        return left + (value - lo) / (hi - lo) * width
+
+    def sy(value):
+        return top + height - (value - lo) / (hi - lo) * height
+
+    mid_x, mid_y = sx(result.split), sy(result.split)
+    parts = [
+        '<svg width="800" height="500" xmlns="http://www.w3.org/2000/svg">',
+        f'  <text x="400" y="30" font-family="Malgun Gothic, Arial" font-size="20" font-weight="bold" '
+        f'text-anchor="middle" fill="#333">{title}</text>',
+    ]
+    quadrant_boxes = {
+        "bottleneck": (left, top, mid_x - left, mid_y - top),
+        "strategic": (mid_x, top, left + width - mid_x, mid_y - top),
+        "routine": (left, mid_y, mid_x - left, top + height - mid_y),
+        "leverage": (mid_x, mid_y, left + width - mid_x, top + height - mid_y),
+    }
+    for name, (x, y, w, h) in quadrant_boxes.items():
+        parts.append(f'  <rect x="{x:.1f}" y="{y:.1f}" width="{w:.1f}" height="{h:.1f}" '
+                     f'fill="{QUADRANT_COLORS[name]}" fill-opacity="0.12" stroke="#666" stroke-width="1"/>')
+
+    max_count = counts.max()
+    centers = quadrant_codes((y_edges[:-1] + y_edges[1:])[None, :] / 2, (x_edges[:-1] + x_edges[1:])[:, None] / 2,
+                             result.split)
+    for i, j in zip(*np.nonzero(counts)):
+        x0, x1 = sx(x_edges[i]), sx(x_edges[i + 1])
+        y0, y1 = sy(y_edges[j + 1]), sy(y_edges[j])
+        parts.append(f'  <rect x="{x0:.1f}" y="{y0:.1f}" width="{x1 - x0:.1f}" height="{y1 - y0:.1f}" '
+                     f'fill="{QUADRANT_COLORS[QUADRANTS[centers[i, j]]]}" '
+                     f'fill-opacity="{_shade(counts[i, j], max_count):.2f}"/>')
+
+    for value in (LOW_THRESHOLD, HIGH_THRESHOLD):
+        parts.append(f'  <line x1="{sx(value):.1f}" y1="{top}" x2="{sx(value):.1f}" y2="{top + height}" '
+                     f'stroke="#999" stroke-width="1" stroke-dasharray="4,3"/>')
+        parts.append(f'  <line x1="{left}" y1="{sy(value):.1f}" x2="{left + width}" y2="{sy(value):.1f}" '
+                     f'stroke="#999" stroke-width="1" stroke-dasharray="4,3"/>')
+    for name, (x, y, w, h) in quadrant_boxes.items():
+        stats = summary[name]
+        anchor_x = x + 8 if name in ("bottleneck", "routine") else x + w - 8
+        anchor = "start" if name in ("bottleneck", "routine") else "end"
+        label_y = y + 20 if name in ("bottleneck", "strategic") else y + h - 26
+        plate_x = x + 4 if anchor == "start" else x + w - 164
+        parts.append(f'  <rect x="{plate_x:.1f}" y="{label_y - 15:.1f}" width="160" height="36" fill="#FFF" '
+                     f'fill-opacity="0.9" stroke="#999" stroke-width="0.5"/>')
+        parts.append(f'  <text x="{anchor_x:.1f}" y="{label_y:.1f}" font-family="Malgun Gothic" font-size="13" '
+                     f'font-weight="bold" text-anchor="{anchor}" fill="{QUADRANT_COLORS[name]}">'
+                     f'{QUADRANT_NAMES[name]}</text>')
+        parts.append(f'  <text x="{anchor_x:.1f}" y="{label_y + 16:.1f}" font-family="Malgun Gothic" font-size="10" '
+                     f'text-anchor="{anchor}" fill="#333">{stats["count"]:,}개 · 구매액 '
+                     f'{format_pct(stats["spend_share"])}</text>')
+
+    for value in (lo, LOW_THRESHOLD, result.split, HIGH_THRESHOLD, hi):
+        parts.append(f'  <text x="{sx(value):.1f}" y="{top + height + 16}" font-family="Arial" font-size="10" '
+                     f'text-anchor="middle" fill="#666">{value:.1f}</text>')
+        parts.append(f'  <text x="{left - 8}" y="{sy(value) + 4:.1f}" font-family="Arial" font-size="10" '
+                     f'text-anchor="end" fill="#666">{value:.1f}</text>')
+
+    parts += [
+        f'  <text x="{left + width / 2:.0f}" y="{top + height + 40}" font-family="Malgun Gothic" font-size="12" '
+        f'font-weight="bold" text-anchor="middle" fill="#333">구매 임팩트 (Purchase Impact) →</text>',
+        f'  <text x="60" y="{top + height / 2:.0f}" font-family="Malgun Gothic" font-size="12" font-weight="bold" '
+        f'text-anchor="middle" fill="#333" transform="rotate(-90 60 {top + height / 2:.0f})">'
+        f'공급 리스크 (Supply Risk) →</text>',
+        f'  <text x="{left + width}" y="{top + height + 60}" font-family="Malgun Gothic" font-size="10" '
+        f'text-anchor="end" fill="#666">총 {len(result):,}개 품목 · 칸 농도 = 품목 수 (로그) · '
+        f'점선 = 경계 영역 {LOW_THRESHOLD}~{HIGH_THRESHOLD} ({int(result.boundary.sum()):,}개)</text>',
+        '</svg>',
+    ]
+    svg = "\n".join(parts)
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(svg)
+    return svg
+
+
+def add_kraljic_door_chart_slide(prs, result, bins=(16, 10), title="Kraljic Matrix: 자재 포트폴리오 분포",
+                                 governing_message=None, slide_num=None):
+    """
+    데이터 기반 Kraljic 문 차트 슬라이드
+    왼쪽: 2×2 분면 + 밀도 격자 (칸 하나 = 사각형 하나, 분면 색의 진하기 = 품목 수), 오른쪽: 분면별 표
+    """
+    from generate_part1_pptx_v2 import COLOR_BLACK, COLOR_MED_GRAY, COLOR_WHITE, add_rectangle, add_text_box
+    from pptx.dml.color import RGBColor
+    from pptx.enum.text import PP_ALIGN
+    from pptx_layout import content_frame
+    from scm_slides import add_content_slide, add_data_table
+
+    summary = result.summary()
+    if governing_message is None:
+        strategic = summary["strategic"]
+        governing_message = (f"전략자재는 품목의 {format_pct(strategic['count_share'])}이지만 구매액의 "
+                             f"{format_pct(strategic['spend_share'])} - 분면별로 소싱 전략을 차별화해야 합니다")
+    slide = add_content_slide(prs, title, governing_message, slide_num)
+
+    frame = content_frame()
+    axis_w, axis_h = 0.45, 0.35
+    plot_x, plot_y = frame.x + axis_w, frame.y
+    plot_w, plot_h = 6.20, frame.h - axis_h
+
+    def tint(hex_color, amount=0.82):
+        rgb = [int(hex_color[k:k + 2], 16) for k in (1, 3, 5)]
+        return RGBColor(*(round(c + (255 - c) * amount) for c in rgb))
+
+    lo, hi = SCORE_RANGE
+    split_x = plot_x + (result.split - lo) / (hi - lo) * plot_w
+    split_y = plot_y + plot_h - (result.split - lo) / (hi - lo) * plot_h
+    boxes = {
+        "bottleneck": (plot_x, plot_y, split_x - plot_x, split_y - plot_y),
+        "strategic": (split_x, plot_y, plot_x + plot_w - split_x, split_y - plot_y),
+        "routine": (plot_x, split_y, split_x - plot_x, plot_y + plot_h - split_y),
+        "leverage": (split_x, split_y, plot_x + plot_w - split_x, plot_y + plot_h - split_y),
+    }
+    for name, (x, y, w, h) in boxes.items():
+        add_rectangle(slide, x, y, w, h, tint(QUADRANT_COLORS[name]), border_color=COLOR_MED_GRAY)
+
+    # 칸 색 = 칸 중심이 속한 분면 색, 진하기 = 품목 수
+    counts, _, x_edges, y_edges = result.density(bins)
+    max_count = counts.max()
+    cell_w, cell_h = plot_w / bins[0], plot_h / bins[1]
+    centers = quadrant_codes((y_edges[:-1] + y_edges[1:])[None, :] / 2, (x_edges[:-1] + x_edges[1:])[:, None] / 2,
+                             result.split)
+    for i, j in zip(*np.nonzero(counts)):
+        color = QUADRANT_COLORS[QUADRANTS[centers[i, j]]]
+        add_rectangle(slide, plot_x + i * cell_w + 0.01, plot_y + plot_h - (j + 1) * cell_h + 0.01,
+                      cell_w - 0.02, cell_h - 0.02, tint(color, 0.9 - 0.9 * _shade(counts[i, j], max_count)))
+
+    for name, (x, y, w, h) in boxes.items():
+        stats = summary[name]
+        label_y = y + 0.05 if name in ("bottleneck", "strategic") else y + h - 0.50
+        label_x = x + 0.05 if name in ("bottleneck", "routine") else x + w - 1.65
+        add_rectangle(slide, label_x, label_y, 1.60, 0.45, COLOR_WHITE, border_color=COLOR_MED_GRAY)
+        add_text_box(slide, label_x, label_y, 1.60, 0.45,
+                     f"{QUADRANT_NAMES[name]}\n{stats['count']:,}개 · {format_pct(stats['spend_share'])}",
+                     font_size=10, bold=True, color=COLOR_BLACK, align=PP_ALIGN.CENTER)
+
+    add_text_box(slide, plot_x, plot_y + plot_h + 0.02, plot_w, axis_h - 0.02, "구매 임팩트 →",
+                 font_size=10, bold=True, color=COLOR_BLACK, align=PP_ALIGN.CENTER)
+    add_text_box(slide, frame.x, plot_y + plot_h / 2 - 0.6, axis_w, 1.2, "공\n급\n리\n스\n크\n↑",
+                 font_size=9, bold=True, color=COLOR_BLACK, align=PP_ALIGN.CENTER)
+
+    table_x = plot_x + plot_w + 0.25
+    table_frame = frame.inset(left=table_x - frame.x)
+    layout = add_data_table(slide, ["분면", "품목", "구매액"], [
+        [QUADRANT_NAMES[name], f"{summary[name]['count']:,}", format_pct(summary[name]["spend_share"])]
+        for name in QUADRANTS
+    ], frame=table_frame, font_size=9)
+    add_text_box(slide, table_frame.x, layout.bottom + 0.15, table_frame.w, 1.2,
+                 f"총 {len(result):,}개 품목 · {format_won(result.spend.sum())}\n"
+                 f"경계 영역(1.7~2.3) {int(result.boundary.sum()):,}개는 추가 검토\n"
+                 f"칸 농도 = 품목 수 (로그 스케일)",
+                 font_size=8, color=COLOR_MED_GRAY)
+    return slide
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        csv_path = sys.argv[1]
+    else:
+        csv_path = os.path.join(tempfile.gettempdir(), "kraljic_sample.csv")
+        generate_sample_csv(csv_path)
+
+    start = time.perf_counter()
+    result = classify_csv(csv_path)
+    elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    result.density()
+    density_elapsed = time.perf_counter() - start
+
+    print("=" * 80)
+    print(f"Kraljic: {csv_path} ({len(result):,}개 품목, 분류 {elapsed * 1000:.0f} ms, "
+          f"밀도 격자 {density_elapsed * 1000:.1f} ms)")
+    print("=" * 80)
+    for name, stats in result.summary().items():
+        print(f"  {QUADRANT_NAMES[name]:<8} {stats['count']:>8,}개 ({format_pct(stats['count_share']):>6}) "
+              f"구매액 {format_pct(stats['spend_share']):>6}  경계 {stats['boundary']:,}개")
+    print("=" * 80)
+
+    if len(sys.argv) > 2:
+        output = sys.argv[2]
+        if output.endswith(".svg"):
+            generate_kraljic_density_svg(result, output)
+        elif output.endswith(".json"):
+            with open(output, "w", encoding="utf-8") as f:
+                json.dump(result.to_slide_data(), f, ensure_ascii=False, indent=2)
+        else:
+            from generate_part1_pptx_v2 import create_presentation
+            prs = create_presentation()
+            add_kraljic_door_chart_slide(prs, result)
+            prs.save(output)
+        print(f"Saved: {output}")
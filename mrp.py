@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+MRP Engine - 5회차 "레버리지자재 전략 & MRP" 4단계 계산을 다단계 BOM 전체에 적용
+5회차 4단계:
+1) 총소요량: MPS(독립수요) + 상위 품목 계획발주 × BOM 수량 (BOM 전개)
+2) 순소요량 = 총소요량 - (전기 가용재고 + 입고예정 - 안전재고), 초기 가용재고 = 현재고 - 할당재고
+3) 리드타임 역산: 발주 시점 = 소요(입고) 시점 - 리드타임
+4) Lot Sizing: L4L / FOQ(고정 Lot) / EOQ(최소 EOQ) / POQ(P기간 소요 통합), multiple 단위 올림(MOQ)
+
+계산 방식:
+- 품목은 정수 인덱스, 기간 버킷은 (품목 × 기간) float64 2차원 배열
+- Low-Level Code: BOM 간선 배열에 Kahn 위상 정렬 (순환 BOM → ValueError)
+- 같은 LLC 품목을 한 묶음으로 기간 루프 1회 → 품목 방향은 벡터 연산
+- 묶음 계산이 끝나면 계획발주 × 수량을 하위 품목 총소요량에 np.add.at으로 전개
+  → 하위 품목은 LLC가 더 크므로 모든 상위 소요가 모인 뒤에 계산됨
+
+Usage:
+    from mrp import MrpModel, add_mrp_table_slide
+
+    model = MrpModel(periods=4)
+    model.add_item("냉장고 A")
+    model.add_item("LV-002", lead_time=2, lot_rule="EOQ", lot_size=16_000, on_hand=5_000, safety_stock=5_556)
+    model.add_bom("냉장고 A", "LV-002", 2)
+    model.add_demand("냉장고 A", [5_000, 6_000, 5_500, 7_000])
+    plan = model.run()
+    plan.table("LV-002")
+
+    python3 mrp.py                                    # LV-002 실습 + 다단계 BOM 벤치마크
+    python3 mrp.py items.csv bom.csv demand.csv [receipts.csv] [mrp_out.csv]
+"""
+
+import math
+import sys
+import time
+
+import numpy as np
+
+from scm_data import DEFAULT_CHUNK_SIZE, iter_csv_chunks, read_header, write_csv_columns
+
+LOT_RULES = ("L4L", "FOQ", "EOQ", "POQ")   # lot_size 의미: - / 고정 수량 / EOQ 수량 / 통합 기간 수
+LOT_RULE_ALIASES = {"LFL": "L4L", "FIXED": "FOQ", "고정 LOT": "FOQ"}
+
+TABLE_ROWS = (
+    ("gross", "총소요량"),
+    ("scheduled", "입고예정"),
+    ("projected", "예상 가용재고"),
+    ("net", "순소요량"),
+    ("planned_receipts", "계획입고"),
+    ("planned_releases", "계획발주"),
+)
+
+
+def eoq(annual_demand, order_cost, holding_cost, multiple=0):
+    """EOQ = √(2DS/H), multiple(MOQ 단위)이 있으면 그 배수로 올림"""
+    quantity = math.sqrt(2 * annual_demand * order_cost / holding_cost)
+    return math.ceil(quantity / multiple) * multiple if multiple else quantity
+
+
+def low_level_codes(n_items, parent, child):
+    """
+    BOM 간선 (parent[i] → child[i]) → 품목별 Low-Level Code (최상위 0, 가장 깊이 쓰이는 레벨)
+
+    Raises:
+        ValueError - 순환 BOM
+    """
+    parent = np.asarray(parent, dtype=np.intp)
+    child = np.asarray(child, dtype=np.intp)
+    llc = np.zeros(n_items, dtype=np.intp)
+    indegree = np.bincount(child, minlength=n_items)
+    frontier = np.flatnonzero(indegree == 0)
+    in_frontier = np.zeros(n_items, dtype=bool)
+    processed = 0
+    while frontier.size:
+        processed += frontier.size
+        in_frontier[:] = False
+        in_frontier[frontier] = True
+        edges = in_frontier[parent]
+        children = child[edges]
+        np.maximum.at(llc, children, llc[parent[edges]] + 1)
+        np.subtract.at(indegree, children, 1)
+        candidates = np.unique(children)
+        frontier = candidates[indegree[candidates] == 0]
+    if processed < n_items:
+        raise ValueError(f"순환 BOM: {n_items - processed}개 품목이 서로를 하위 품목으로 참조")
+    return llc
+
+
+# ============================================================================
+# 계획 결과
+# ============================================================================
+
+class MrpPlan:
+    """품목 × 기간 버킷 배열 + 조회/내보내기"""
+
+    def __init__(self, items, periods, llc, buckets, past_due_qty):
+        self.items = list(items)
+        self.periods = periods
+        self.llc = llc
+        # 리드타임 역산 결과가 첫 기간 이전인 발주량 (planned_releases 첫 기간에 포함되어 있음)
+        self.past_due_qty = past_due_qty
+        self.past_due = past_due_qty > 0
+        self.index = {code: i for i, code in enumerate(self.items)}
+        for name, array in buckets.items():
+            setattr(self, name, array)
+
+    def period_labels(self, prefix="Week "):
+        return [f"{prefix}{t + 1}" for t in range(self.periods)]
+
+    def row(self, item, name):
+        return getattr(self, name)[self.index[item]]
+
+    def table(self, item, labels=TABLE_ROWS):
+        """[[행 이름, 기간별 값...]] (5회차 MRP 표 형식)"""
+        i = self.index[item]
+        return [[title] + getattr(self, name)[i].tolist() for name, title in labels]
+
+    def to_slide_data(self, item):
+        """슬라이드 생성기용 dict (JSON 직렬화 가능)"""
+        i = self.index[item]
+        return {
+            "item": item,
+            "llc": int(self.llc[i]),
+            "past_due": bool(self.past_due[i]),
+            "past_due_qty": float(self.past_due_qty[i]),
+            "periods": self.period_labels(),
+            "rows": {name: getattr(self, name)[i].tolist() for name, _ in TABLE_ROWS},
+        }
+
+    def summary(self):
+        return {
+            "items": len(self.items),
+            "levels": int(self.llc.max()) + 1 if len(self.items) else 0,
+            "orders": int(np.count_nonzero(self.planned_releases)),
+            "past_due": int(self.past_due.sum()),
+        }
+
+    def write_csv(self, path, chunk_size=DEFAULT_CHUNK_SIZE):
+        """품목 × 기간 세로형 CSV (item, period, llc, 총소요량 ... 계획발주)"""
+        n, periods = len(self.items), self.periods
+        columns = {
+            "item": np.repeat(np.array(self.items, dtype=str), periods),
+            "period": np.tile(np.arange(1, periods + 1), n),
+            "llc": np.repeat(self.llc, periods),
+        }
+        columns.update({name: getattr(self, name).ravel() for name, _ in TABLE_ROWS})
+        write_csv_columns(path, columns, chunk_size, float_format="{:.10g}")
+
+
+# ============================================================================
+# 모델
+# ============================================================================
+
+class MrpModel:
+    """품목 마스터 / BOM / 독립수요 / 입고예정을 모아 run()으로 MRP 전개"""
+
+    def __init__(self, periods):
+        self.periods = periods
+        self.items = []
+        self.index = {}
+        self._attrs = {name: [] for name in ("lead_time", "lot_rule", "lot_size", "on_hand", "allocated",
+                                              "safety_stock", "multiple")}
+        self._bom = ([], [], [])
+        self._demand = ([], [], [])
+        self._receipts = ([], [], [])
+
+    def add_item(self, code, lead_time=0, lot_rule="L4L", lot_size=0, on_hand=0, allocated=0,
+                 safety_stock=0, multiple=0):
+        """품목 추가 (lead_time: 기간 수, lot_size: LOT_RULES 설명 참고)"""
+        if code in self.index:
+            raise ValueError(f"중복 품목: {code}")
+        rule = str(lot_rule).strip().upper()
+        rule = LOT_RULE_ALIASES.get(rule, rule)
+        if rule not in LOT_RULES:
+            raise ValueError(f"{code}: 알 수 없는 lot_rule {lot_rule!r} (가능: {', '.join(LOT_RULES)})")
+        if rule != "L4L" and lot_size <= 0:
+            raise ValueError(f"{code}: {rule}에는 lot_size > 0 필요")
+        self.index[code] = len(self.items)
+        self.items.append(code)
+        values = (lead_time, LOT_RULES.index(rule), lot_size, on_hand, allocated, safety_stock, multiple)
+        for name, value in zip(self._attrs, values):
+            self._attrs[name].append(value)
+
+    def _item(self, code):
+        try:
+            return self.index[code]
+        except KeyError:
+            raise ValueError(f"품목 마스터에 없는 품목: {code}") from None
+
+    def add_bom(self, parent, child, quantity):
+        """parent 1단위에 child quantity개"""
+        for values, value in zip(self._bom, (self._item(parent), self._item(child), quantity)):
+            values.append(value)
+
+    def _add_bucketed(self, target, item, quantities, period):
+        i = self._item(item)
+        if np.ndim(quantities) == 0:
+            quantities = {period: quantities}
+        elif not isinstance(quantities, dict):
+            quantities = dict(enumerate(quantities))
+        for t, quantity in quantities.items():
+            if not 0 <= t < self.periods:
+                raise ValueError(f"{item}: 기간 {t + 1}이 계획 범위(1-{self.periods}) 밖")
+            for values, value in zip(target, (i, t, quantity)):
+                values.append(value)
+
+    def add_demand(self, item, quantities, period=0):
+        """독립수요 (MPS) - 기간별 리스트, {기간: 수량}, 또는 수량 + period (기간은 0부터)"""
+        self._add_bucketed(self._demand, item, quantities, period)
+
+    def add_receipt(self, item, quantities, period=0):
+        """입고예정 (이미 발주된 수량) - add_demand와 같은 형식"""
+        self._add_bucketed(self._receipts, item, quantities, period)
+
+    @classmethod
+    def from_csv(cls, items_path, bom_path, demand_path, receipts_path=None, periods=None,
+                 chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        CSV 4종에서 모델 생성 (기간은 1부터)
+        - items: item, lead_time, lot_rule, lot_size, on_hand, allocated, safety_stock, multiple (item 외 선택)
+        - bom: parent, child, qty
+        - demand / receipts: item, period, qty
+        periods가 없으면 demand/receipts의 최대 기간
+        """
+        bucket_files = [path for path in (demand_path, receipts_path) if path]
+        if periods is None:
+            periods = 0
+            for path in bucket_files:
+                for chunk in iter_csv_chunks(path, chunk_size, text_columns=("item",), columns=["period"]):
+                    periods = max(periods, int(np.nanmax(chunk["period"])))
+        model = cls(periods)
+
+        header = read_header(items_path)
+        fields = [name for name in ("lead_time", "lot_rule", "lot_size", "on_hand", "allocated",
+                                    "safety_stock", "multiple") if name in header]
+        for chunk in iter_csv_chunks(items_path, chunk_size, text_columns=("item", "lot_rule"),
+                                     columns=["item"] + fields):
+            values = {name: chunk[name].tolist() for name in fields}
+            for row, code in enumerate(chunk["item"].tolist()):
+                kwargs = {name: values[name][row] for name in fields}
+                kwargs = {name: value for name, value in kwargs.items() if value == value and value != ""}
+                if "lead_time" in kwargs:
+                    kwargs["lead_time"] = int(kwargs["lead_time"])
+                model.add_item(code, **kwargs)
+
+        for chunk in iter_csv_chunks(bom_path, chunk_size, text_columns=("parent", "child"),
+                                     columns=["parent", "child", "qty"]):
+            for parent, child, qty in zip(chunk["parent"].tolist(), chunk["child"].tolist(), chunk["qty"].tolist()):
+                model.add_bom(parent, child, qty)
+
+        for path, add in ((demand_path, model.add_demand), (receipts_path, model.add_receipt)):
+            if not path:
+                continue
+            for chunk in iter_csv_chunks(path, chunk_size, text_columns=("item",), columns=["item", "period", "qty"]):
+                for item, period, qty in zip(chunk["item"].tolist(), chunk["period"].tolist(), chunk["qty"].tolist()):
+                    add(item, qty, int(period) - 1)
+        return model
+
+    def _bucket_array(self, entries):
+        items, periods, quantities = entries
+        array = np.zeros((len(self.items), self.periods))
+        np.add.at(array, (np.asarray(items, dtype=np.intp), np.asarray(periods, dtype=np.intp)),
+                  np.asarray(quantities, dtype=np.float64))
+        return array
+
+    def run(self):
+        """전체 BOM 전개 + 순소요량 + Lot Sizing → MrpPlan"""
+        n, periods = len(self.items), self.periods
+        attrs = {name: np.asarray(values, dtype=np.float64) for name, values in self._attrs.items()}
+        lead_time = attrs["lead_time"].astype(np.intp)
+        rule = attrs["lot_rule"].astype(np.intp)
+        parent, child, qty = (np.asarray(values) for values in self._bom)
+        parent, child = parent.astype(np.intp), child.astype(np.intp)
+        qty = qty.astype(np.float64)
+
+        llc = low_level_codes(n, parent, child)
+        gross = self._bucket_array(self._demand)
+        scheduled = self._bucket_array(self._receipts)
+        projected, net, receipts, releases = (np.zeros((n, periods)) for _ in range(4))
+        past_due_qty = np.zeros(n)
+
+        # 상위 품목별로 BOM 간선 묶기 (parent 정렬 후 구간)
+        edge_order = np.argsort(parent, kind="stable")
+        parent, child, qty = parent[edge_order], child[edge_order], qty[edge_order]
+
+        for level in range(int(llc.max()) + 1 if n else 0):
+            rows = np.flatnonzero(llc == level)
+            _net_level(rows, gross, scheduled, projected, net, receipts, releases, past_due_qty, attrs,
+                       lead_time[rows], rule[rows])
+            edges = np.flatnonzero(llc[parent] == level)
+            if edges.size:
+                np.add.at(gross, child[edges], releases[parent[edges]] * qty[edges, None])
+
+        return MrpPlan(self.items, periods, llc, {
+            "gross": gross, "scheduled": scheduled, "projected": projected, "net": net,
+            "planned_receipts": receipts, "planned_releases": releases,
+        }, past_due_qty)
+
+
+def _net_level(rows, gross, scheduled, projected, net, receipts, releases, past_due_qty, attrs, lead_time,
+               rule):
+    """같은 LLC 품목 묶음의 기간별 순소요량/Lot Sizing/리드타임 역산 (품목 방향 벡터 연산)"""
+    periods = gross.shape[1]
+    g = gross[rows]
+    safety = attrs["safety_stock"][rows]
+    lot = attrs["lot_size"][rows]
+    multiple = attrs["multiple"][rows]
+    poq_periods = np.maximum(lot, 1).astype(np.intp)
+    future = np.concatenate([np.zeros((len(rows), 1)), np.cumsum(g, axis=1)], axis=1)   # future[:, t] = Σg[:, :t]
+    available = attrs["on_hand"][rows] - attrs["allocated"][rows]
+    index = np.arange(len(rows))
+
+    for t in range(periods):
+        available = available + scheduled[rows, t]
+        need = np.maximum(g[:, t] + safety - available, 0.0)
+        order = need.copy()
+        fixed = rule == 1
+        order[fixed] = np.ceil(need[fixed] / lot[fixed]) * lot[fixed]
+        economic = rule == 2
+        order[economic] = np.maximum(need[economic], lot[economic])
+        period = rule == 3
+        horizon = np.minimum(t + poq_periods[period], periods)
+        order[period] = need[period] + future[index[period], horizon] - future[index[period], t + 1]
+        rounded = multiple > 0
+        order[rounded] = np.ceil(order[rounded] / multiple[rounded]) * multiple[rounded]
+        order[need <= 0] = 0.0
+
+        available = available + order - g[:, t]
+        net[rows, t] = need
+        receipts[rows, t] = order
+        projected[rows, t] = available
+
+        release = t - lead_time
+        late = (release < 0) & (order > 0)
+        np.add.at(past_due_qty, rows[late], order[late])
+        np.add.at(releases, (rows, np.maximum(release, 0)), order)
+
+
+# ============================================================================
+# 예제 / 슬라이드
+# ============================================================================
+
+def lv002_example():
+    """5회차 실습: LV-002 철강판 (냉장고 A 1대당 2개, EOQ 16,000개, LT 2주)"""
+    model = MrpModel(periods=4)
+    model.add_item("냉장고 A")
+    model.add_item("LV-002", lead_time=2, lot_rule="EOQ", lot_size=eoq(1_000_000, 500_000, 4_000, multiple=500),
+                   on_hand=5_000, allocated=1_000, safety_stock=5_556)
+    model.add_bom("냉장고 A", "LV-002", 2)
+    model.add_demand("냉장고 A", [5_000, 6_000, 5_500, 7_000])
+    model.add_receipt("LV-002", 16_000, period=0)
+    return model
+
+
+def add_mrp_table_slide(prs, plan, item, title=None, governing_message=None, parameters=None, slide_num=None):
+    """
+    품목 1개의 MRP 표 슬라이드 (행: 총소요량 ~ 계획발주, 열: 기간)
+
+    리드타임 역산이 첫 기간 이전으로 떨어진 발주량은 Week 1에 합치지 않고
+    "기한 경과" 열로 따로 표시
+
+    Args:
+        parameters: 표 위에 표시할 가정 (예: "현재고 5,000 · 안전재고 5,556 · LT 2주 · EOQ 16,000")
+    """
+    from pptx_layout import content_frame
+    from scm_slides import add_content_slide, add_data_table
+    from generate_part1_pptx_v2 import COLOR_DARK_GRAY, add_text_box
+
+    data = plan.to_slide_data(item)
+    past_due = data["past_due_qty"]
+    on_time = list(data["rows"]["planned_releases"])
+    if on_time:
+        on_time[0] -= past_due
+    releases = [(label, value) for label, value in zip(data["periods"], on_time) if value]
+    if governing_message is None:
+        orders = ", ".join(f"{label} {value:,.0f}개" for label, value in releases) or "없음"
+        governing_message = f"{item}: 계획발주 {orders} - 리드타임만큼 앞당겨 발주해야 결품 없이 생산 가능"
+        if past_due:
+            governing_message = (f"{item}: 기한 경과 {past_due:,.0f}개 즉시 발주 + 계획발주 {orders}"
+                                 " - 리드타임 부족분은 긴급 발주/납기 단축 필요")
+    slide = add_content_slide(prs, title or f"MRP 실습: {item} 기간별 소요 계획", governing_message, slide_num)
+
+    frame = content_frame()
+    if parameters:
+        add_text_box(slide, frame.x, frame.y, frame.w, 0.35, parameters, font_size=10, color=COLOR_DARK_GRAY)
+        frame = frame.inset(top=0.45)
+
+    def cell(value):
+        return "-" if value == 0 else f"{value:,.0f}"
+
+    values = {name: data["rows"][name] for name, _ in TABLE_ROWS}
+    values["planned_releases"] = on_time
+    rows = [[title] + [cell(value) for value in values[name]] for name, title in TABLE_ROWS]
+    header, col_widths = ["항목"] + data["periods"], [1.8] + [None] * plan.periods
+    if past_due:
+        header.insert(1, "기한 경과")
+        col_widths.insert(1, None)
+        for (name, _), row in zip(TABLE_ROWS, rows):
+            row.insert(1, cell(past_due) if name == "planned_releases" else "")
+    add_data_table(slide, header, rows, frame=frame, col_widths=col_widths,
+                   highlight_rows=[len(rows) - 1], font_size=10)
+    return slide
+
+
+def generate_bom(n_items=5_000, levels=8, children=(2, 6), periods=52, seed=5):
+    """벤치마크용 다단계 BOM (하위 레벨 부품 공유, 최상위 완제품에 주간 MPS)"""
+    rng = np.random.default_rng(seed)
+    level_of = np.sort(rng.integers(0, levels, n_items))
+    level_of[0] = 0
+    model = MrpModel(periods)
+    rules = rng.integers(0, len(LOT_RULES), n_items)
+    for i in range(n_items):
+        rule = LOT_RULES[rules[i]]
+        size = {"L4L": 0, "FOQ": 500, "EOQ": 800, "POQ": 3}[rule]
+        model.add_item(f"P{i:05d}", lead_time=int(rng.integers(0, 4)), lot_rule=rule, lot_size=size,
+                       on_hand=float(rng.integers(0, 300)), safety_stock=float(rng.integers(0, 50)))
+    starts = np.searchsorted(level_of, np.arange(levels + 1))
+    for i in range(starts[levels - 1]):
+        lower = np.arange(starts[level_of[i] + 1], n_items)
+        if lower.size == 0:
+            continue
+        for c in rng.choice(lower, size=min(lower.size, rng.integers(*children)), replace=False):
+            model.add_bom(f"P{i:05d}", f"P{c:05d}", float(rng.integers(1, 4)))
+    for i in range(starts[1]):
+        model.add_demand(f"P{i:05d}", rng.integers(50, 150, periods).astype(float).tolist())
+    return model
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    if len(sys.argv) > 3:
+        receipts = sys.argv[4] if len(sys.argv) > 4 else None
+        output = sys.argv[5] if len(sys.argv) > 5 else None
+        model = MrpModel.from_csv(sys.argv[1], sys.argv[2], sys.argv[3], receipts)
+        start = time.perf_counter()
+        plan = model.run()
+        print(f"MRP: {plan.summary()} ({(time.perf_counter() - start) * 1000:.0f} ms)")
+        if output:
+            plan.write_csv(output)
+            print(f"Saved: {output}")
+    else:
+        plan = lv002_example().run()
+        print("LV-002 철강판 (5회차 실습, EOQ 16,000개)")
+        for row in plan.table("LV-002"):
+            print(f"  {row[0]:<10}" + "".join(f"{value:>10,.0f}" for value in row[1:]))
+        print(f"  (Week 1 계획발주 중 기한 경과 {plan.past_due_qty[plan.index['LV-002']]:,.0f}개)")
+
+        model = generate_bom()
+        start = time.perf_counter()
+        plan = model.run()
+        print(f"벤치마크: {plan.summary()} × {plan.periods}주 ({(time.perf_counter() - start) * 1000:.0f} ms)")
+    print("=" * 80)
@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Hybrid Planning Simulator - 전략자재 ROP / MRP / 하이브리드 계획 몬테카를로 비교
+6회차(전략자재 전략 & 하이브리드 계획) 실습용: 안전계수 k를 바꿔 가며 재고 ↔ 서비스 수준 trade-off 곡선 생성
+
+정책 (주 단위, 매주 검토, 미충족 수요는 이월(backorder)):
+- ROP: 재고 포지션 ≤ s 이면 Q 단위로 발주 (s = μL + k·σ·√L, σ는 계절 변동 포함 - 예측 미사용)
+- MRP: 예측 기반 order-up-to (목표 = 향후 L주 예측 합 + k·σ_f·√L, lot-for-lot)
+- 하이브리드 (LTP + MRP + 전략 버퍼):
+    LTP 계약 물량 = L주 뒤 예측량, MRP 조정은 계약 물량의 ±flex 안에서만 허용,
+    긴급 발주(리드타임 Le) 구간에 결품이 예상되면 버퍼(k·σ_f·√Le)까지 긴급 발주 (단가 할증)
+
+벡터화: 한 주 계산 = (안전계수 K × 시나리오 S) 배열 연산 1회 - 파이썬 루프는 주(週) 수만큼만
+병렬: 시나리오를 청크로 나눠 프로세스 풀에서 실행 (청크별 난수 시드 고정 → jobs 수와 무관하게 같은 결과)
+
+Usage:
+    from planning_sim import STRATEGIC_EXAMPLE, simulate, add_tradeoff_chart_slide
+
+    result = simulate(STRATEGIC_EXAMPLE, scenarios=10_000, jobs=4)
+    result.cheapest(0.98)          # 정책별 충족률 98% 이상 중 최소 비용 k
+    add_tradeoff_chart_slide(prs, result)
+
+    python3 planning_sim.py [--scenarios 10000] [--jobs 4] [--csv out.csv] [--pptx out.pptx]
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from scm_data import format_pct, format_won, write_csv_columns
+
+POLICIES = ("rop", "mrp", "hybrid")
+POLICY_NAMES = {"rop": "ROP (재주문점)", "mrp": "MRP (예측 기반)", "hybrid": "하이브리드 (LTP+MRP+버퍼)"}
+POLICY_COLORS = {"rop": "#7F8C8D", "mrp": "#3498DB", "hybrid": "#E74C3C"}
+SAFETY_FACTORS = np.round(np.linspace(0.0, 3.0, 13), 2)
+SCENARIO_CHUNK = 1_000
+WEEKS_PER_YEAR = 52
+
+# 강의 예시: 전력반도체 모듈 (리드타임 8주, 계절 변동 ±35%, 긴급 발주 2주 / 20% 할증)
+STRATEGIC_EXAMPLE = {
+    "name": "전력반도체 모듈 (전략자재)",
+    "mean_demand": 1_000,        # 주간 평균 수요 (개)
+    "demand_cv": 0.30,           # 예측 대비 주간 수요 변동계수
+    "seasonality": 0.35,         # 연간 계절 진폭 (예측에는 반영, ROP는 미반영)
+    "lead_time": 8,              # 정규 리드타임 (주)
+    "expedite_lead_time": 2,     # 긴급 발주 리드타임 (주)
+    "lot_size": 4_000,           # ROP 발주 단위 Q (4주분)
+    "flex": 0.20,                # 하이브리드: LTP 계약 물량 대비 MRP 조정 허용 폭
+    "unit_price": 85_000,        # 원/개
+    "holding_rate": 0.25,        # 연간 재고유지비율
+    "expedite_premium": 0.20,    # 긴급 발주 단가 할증
+    "weeks": 52,                 # 측정 기간 (주)
+    "warmup": 12,                # 초기 상태 영향 제거 기간 (주)
+}
+
+
+# ============================================================================
+# 시뮬레이션
+# ============================================================================
+
+def forecast(params, length):
+    """주별 예측 수요 (평균 × 계절 곡선)"""
+    weeks = np.arange(length)
+    return params["mean_demand"] * (1 + params["seasonality"] * np.sin(2 * np.pi * weeks / WEEKS_PER_YEAR))
+
+
+def safety_levels(params, safety_factors):
+    """
+    정책별 안전 수준 (K,)
+
+    Returns:
+        {"rop": 재주문점 s, "mrp": 안전재고, "hybrid": 전략 버퍼}
+    """
+    k = np.asarray(safety_factors, dtype=np.float64)
+    lead_time, expedite = params["lead_time"], params["expedite_lead_time"]
+    weeks = params["warmup"] + params["weeks"]
+    f = forecast(params, weeks)
+    mean = f.mean()
+    sigma_forecast = params["demand_cv"] * mean
+    # ROP는 평탄한 평균만 알므로 계절 변동까지 수요 변동으로 흡수
+    sigma_total = np.sqrt(np.mean((params["demand_cv"] * f) ** 2) + f.var())
+    return {
+        "rop": mean * lead_time + k * sigma_total * np.sqrt(lead_time),
+        "mrp": k * sigma_forecast * np.sqrt(lead_time),
+        "hybrid": k * sigma_forecast * np.sqrt(expedite),
+    }
+
+
+def _simulate_policy(policy, params, level, demand):
+    """
+    정책 1개 × (K, S) 동시 시뮬레이션
+
+    Args:
+        level: safety_levels()[policy] (K,)
+        demand: 주별 실제 수요 (S, warmup + weeks)
+
+    Returns:
+        {지표: (K,) 합계} - 측정 기간(warmup 이후)만 집계
+    """
+    lead_time, expedite = params["lead_time"], params["expedite_lead_time"]
+    warmup, flex, lot = params["warmup"], params["flex"], params["lot_size"]
+    scenarios, weeks = demand.shape
+    f = forecast(params, weeks + lead_time + 1)
+    cum = np.concatenate([[0.0], np.cumsum(f)])    # cum[i] = f[0..i-1] 합
+
+    level = np.asarray(level, dtype=np.float64)[:, None]
+    shape = (len(level), scenarios)
+    arrivals = np.zeros(shape + (weeks + lead_time + 1,))
+    arrivals[..., 1:lead_time] = f[1:lead_time]       # 이미 발주된 물량 (예측량)
+    on_order = arrivals.sum(axis=-1)
+    # 시작 재고 = 안전재고 + 1주분 (ROP는 s에서 리드타임 수요를 뺀 만큼이 안전재고)
+    safety_stock = level - f[0] * lead_time if policy == "rop" else level
+    net = np.broadcast_to(np.maximum(safety_stock, 0.0) + f[0], shape).copy()
+
+    totals = {name: np.zeros(len(level)) for name in
+              ("demand", "short", "stockout_weeks", "inventory", "orders", "expedite_units", "expedites")}
+    for t in range(weeks):
+        net += arrivals[..., t]
+        on_order -= arrivals[..., t]
+        d = demand[:, t]
+        short = np.maximum(d - np.maximum(net, 0.0), 0.0)
+        net -= d
+        position = net + on_order
+
+        if policy == "rop":
+            order = np.where(position <= level, (np.floor((level - position) / lot) + 1) * lot, 0.0)
+        else:
+            target = cum[t + lead_time + 1] - cum[t + 1] + level
+            if policy == "mrp":
+                order = np.maximum(target - position, 0.0)
+            else:
+                base = f[t + lead_time]
+                order = np.maximum(base + np.clip(target - position - base, -flex * base, flex * base), 0.0)
+        arrivals[..., t + lead_time] += order
+        on_order += order
+
+        rush = None
+        if policy == "hybrid":
+            # 긴급 리드타임 안에 결품 예상 → 버퍼 수준까지 긴급 발주
+            near = (net + arrivals[..., t + 1:t + expedite + 1].sum(axis=-1)
+                    - (cum[t + expedite + 1] - cum[t + 1]))
+            rush = np.where(near < 0, level - near, 0.0)
+            arrivals[..., t + expedite] += rush
+            on_order += rush
+
+        if t >= warmup:
+            totals["demand"] += d.sum()
+            totals["short"] += short.sum(axis=-1)
+            totals["stockout_weeks"] += np.count_nonzero(short > 0, axis=-1)
+            totals["inventory"] += np.maximum(net, 0.0).sum(axis=-1)
+            totals["orders"] += np.count_nonzero(order > 0, axis=-1)
+            if rush is not None:
+                totals["expedite_units"] += rush.sum(axis=-1)
+                totals["expedites"] += np.count_nonzero(rush > 0, axis=-1)
+    return totals
+
+
+def _simulate_chunk(args):
+    """프로세스 풀 작업 단위: 시나리오 청크 1개 × 모든 정책 (난수는 청크 시드로만 결정)"""
+    params, safety_factors, scenarios, seed = args
+    rng = np.random.default_rng(seed)
+    weeks = params["warmup"] + params["weeks"]
+    f = forecast(params, weeks)
+    demand = np.maximum(f * (1 + params["demand_cv"] * rng.standard_normal((scenarios, weeks))), 0.0)
+    levels = safety_levels(params, safety_factors)
+    return {policy: _simulate_policy(policy, params, levels[policy], demand) for policy in POLICIES}
+
+
+def simulate(params=STRATEGIC_EXAMPLE, scenarios=10_000, safety_factors=SAFETY_FACTORS, jobs=None, seed=6,
+             chunk_size=SCENARIO_CHUNK):
+    """
+    몬테카를로 시뮬레이션 (정책 × 안전계수 × 시나리오)
+
+    Args:
+        jobs: >1 이면 청크를 프로세스별로 병렬 실행 (결과는 jobs와 무관하게 동일)
+
+    Returns:
+        SimulationResult
+    """
+    sizes = [min(chunk_size, scenarios - start) for start in range(0, scenarios, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(params, safety_factors, size, child) for size, child in zip(sizes, seeds)]
+
+    if not jobs or jobs <= 1 or len(tasks) < 2:
+        parts = [_simulate_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            parts = list(pool.map(_simulate_chunk, tasks))
+
+    totals = {policy: {name: sum(part[policy][name] for part in parts) for name in parts[0][policy]}
+              for policy in POLICIES}
+    return SimulationResult(params, np.asarray(safety_factors, dtype=np.float64), scenarios, totals)
+
+
+# ============================================================================
+# 결과
+# ============================================================================
+
+class SimulationResult:
+    """정책별 (K,) 지표 - 곡선 한 점 = 안전계수 하나"""
+
+    def __init__(self, params, safety_factors, scenarios, totals):
+        self.params = params
+        self.safety_factors = safety_factors
+        self.scenarios = scenarios
+        self.totals = totals
+
+    def metrics(self, policy):
+        """
+        정책 1개의 지표 (K,)
+
+        - fill_rate: 수요 중 재고로 즉시 충족된 비율
+        - cycle_service: 결품 없는 주의 비율
+        - weeks_of_supply: 평균 보유 재고 / 주간 평균 수요
+        - holding_cost / expedite_cost: 연간 재고유지비 / 긴급 발주 할증 (원)
+        """
+        p, t = self.params, self.totals[policy]
+        measured = self.scenarios * p["weeks"]
+        inventory = t["inventory"] / measured
+        years = p["weeks"] / WEEKS_PER_YEAR
+        holding = inventory * p["unit_price"] * p["holding_rate"]
+        expedite = t["expedite_units"] / self.scenarios / years * p["unit_price"] * p["expedite_premium"]
+        return {
+            "fill_rate": 1 - t["short"] / t["demand"],
+            "cycle_service": 1 - t["stockout_weeks"] / measured,
+            "avg_inventory": inventory,
+            "weeks_of_supply": inventory / p["mean_demand"],
+            "holding_cost": holding,
+            "expedite_cost": expedite,
+            "total_cost": holding + expedite,
+            "orders_per_year": t["orders"] / self.scenarios / years,
+            "expedites_per_year": t["expedites"] / self.scenarios / years,
+        }
+
+    def cheapest(self, target_fill=0.98):
+        """정책별 충족률 target 이상 중 연간 비용 최소 안전계수 인덱스 (도달 못 하면 None)"""
+        best = {}
+        for policy in POLICIES:
+            m = self.metrics(policy)
+            feasible = np.flatnonzero(m["fill_rate"] >= target_fill)
+            best[policy] = int(feasible[np.argmin(m["total_cost"][feasible])]) if len(feasible) else None
+        return best
+
+    def to_slide_data(self, target_fill=0.98):
+        """슬라이드 생성기용 dict - 정책별 곡선 점 목록 + target 달성 최소 비용 점"""
+        best = self.cheapest(target_fill)
+        data = {"name": self.params["name"], "scenarios": self.scenarios, "target_fill": target_fill, "policies": {}}
+        for policy in POLICIES:
+            m = self.metrics(policy)
+            points = [{"k": float(k), **{name: round(float(values[i]), 4) for name, values in m.items()}}
+                      for i, k in enumerate(self.safety_factors)]
+            data["policies"][policy] = {"name": POLICY_NAMES[policy], "curve": points,
+                                        "best": None if best[policy] is None else points[best[policy]]}
+        return data
+
+    def write_csv(self, path):
+        """정책 × 안전계수 CSV"""
+        k = len(self.safety_factors)
+        columns = {"policy": np.repeat(np.array(POLICIES), k), "k": np.tile(self.safety_factors, len(POLICIES))}
+        for name in self.metrics(POLICIES[0]):
+            columns[name] = np.concatenate([self.metrics(policy)[name] for policy in POLICIES])
+        write_csv_columns(path, columns, float_format="{:.6g}")
+
+
+# ============================================================================
+# 슬라이드
+# ============================================================================
+
+def add_tradeoff_chart_slide(prs, result, target_fill=0.98, title="6.3 하이브리드 계획: 재고 ↔ 서비스 수준 Trade-off",
+                             governing_message=None, slide_num=None):
+    """
+    왼쪽: 정책별 trade-off 곡선 (x = 평균 재고 주수, y = 충족률), 오른쪽: 충족률 target 달성 최소 비용 표
+    """
+    from generate_part1_pptx_v2 import COLOR_BLACK, COLOR_MED_GRAY, add_text_box
+    from pptx.chart.data import XyChartData
+    from pptx.dml.color import RGBColor
+    from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
+    from pptx.util import Inches, Pt
+    from pptx_layout import content_frame
+    from scm_slides import add_content_slide, add_data_table
+
+    best = result.cheapest(target_fill)
+    metrics = {policy: result.metrics(policy) for policy in POLICIES}
+
+    def at_best(policy, name):
+        return None if best[policy] is None else metrics[policy][name][best[policy]]
+
+    if governing_message is None:
+        reached = [policy for policy in POLICIES if best[policy] is not None]
+        if reached:
+            winner = min(reached, key=lambda policy: at_best(policy, "total_cost"))
+            governing_message = (f"충족률 {format_pct(target_fill, 0)} 기준 최소 비용은 "
+                                 f"{POLICY_NAMES[winner].split(' ')[0]} - 재고 {at_best(winner, 'weeks_of_supply'):.1f}주, "
+                                 f"연간 {format_won(at_best(winner, 'total_cost'))}")
+            if winner != "rop" and best["rop"] is not None:
+                governing_message += (f" (ROP 대비 재고 "
+                                      f"{format_pct(1 - at_best(winner, 'weeks_of_supply') / at_best('rop', 'weeks_of_supply'), 0)}"
+                                      f" 감소)")
+        else:
+            governing_message = f"정책별 안전계수에 따른 재고 ↔ 충족률 곡선 ({result.scenarios:,}개 시나리오)"
+    slide = add_content_slide(prs, title, governing_message, slide_num)
+
+    frame = content_frame()
+    chart_w = 6.40
+    chart_data = XyChartData()
+    for policy in POLICIES:
+        series = chart_data.add_series(POLICY_NAMES[policy])
+        for x, y in zip(metrics[policy]["weeks_of_supply"], metrics[policy]["fill_rate"]):
+            series.add_data_point(round(float(x), 3), round(float(y) * 100, 3))
+    chart = slide.shapes.add_chart(XL_CHART_TYPE.XY_SCATTER_LINES, Inches(frame.x), Inches(frame.y),
+                                   Inches(chart_w), Inches(frame.h - 0.35), chart_data).chart
+    chart.has_legend = True
+    chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+    chart.legend.include_in_layout = False
+    chart.legend.font.size = Pt(9)
+    for policy, series in zip(POLICIES, chart.plots[0].series):
+        color = RGBColor.from_string(POLICY_COLORS[policy][1:])
+        series.format.line.color.rgb = color
+        series.format.line.width = Pt(2)
+        series.marker.size = 5
+        series.marker.format.fill.solid()
+        series.marker.format.fill.fore_color.rgb = color
+        series.marker.format.line.color.rgb = color
+    low = min(float(m["fill_rate"].min()) for m in metrics.values()) * 100
+    chart.value_axis.minimum_scale = max(np.floor(low / 5) * 5, 0)
+    chart.value_axis.maximum_scale = 100
+    for axis in (chart.value_axis, chart.category_axis):
+        axis.tick_labels.font.size = Pt(9)
+        axis.has_major_gridlines = axis is chart.value_axis
+    add_text_box(slide, frame.x, frame.y + frame.h - 0.35, chart_w, 0.35,
+                 "x: 평균 재고 (주) · y: 충족률 (%) · 점 = 안전계수 k 0 ~ 3", font_size=9,
+                 color=COLOR_MED_GRAY)
+
+    table_frame = frame.inset(left=chart_w + 0.25)
+    rows = []
+    for policy in POLICIES:
+        if best[policy] is None:
+            rows.append([POLICY_NAMES[policy].split(" ")[0], "미달", "-", "-"])
+            continue
+        i = best[policy]
+        rows.append([POLICY_NAMES[policy].split(" ")[0], f"{result.safety_factors[i]:.2f}",
+                     f"{metrics[policy]['weeks_of_supply'][i]:.1f}주", format_won(metrics[policy]["total_cost"][i])])
+    layout = add_data_table(slide, ["정책", "k", "재고", "연간 비용"], rows, frame=table_frame, align="lrrr",
+                            highlight_rows=[POLICIES.index("hybrid")], font_size=9)
+    p = result.params
+    add_text_box(slide, table_frame.x, layout.bottom + 0.15, table_frame.w, 1.6,
+                 f"충족률 {format_pct(target_fill, 0)} 이상 중 최소 비용 (재고유지비 + 긴급 할증)\n"
+                 f"{p['name']}\n수요 {p['mean_demand']:,}개/주 · 변동 {format_pct(p['demand_cv'], 0)} · "
+                 f"계절 ±{format_pct(p['seasonality'], 0)}\n리드타임 {p['lead_time']}주 · "
+                 f"긴급 {p['expedite_lead_time']}주 (+{format_pct(p['expedite_premium'], 0)})\n"
+                 f"{result.scenarios:,}개 시나리오 × {p['weeks']}주",
+                 font_size=8, color=COLOR_BLACK)
+    return slide
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+
+    def option(name, default=None):
+        if name not in args:
+            return default
+        i = args.index(name)
+        value = args[i + 1]
+        del args[i:i + 2]
+        return value
+
+    scenarios = int(option("--scenarios", 10_000))
+    jobs = int(option("--jobs", os.cpu_count() or 1))
+    csv_path, pptx_path = option("--csv"), option("--pptx")
+
+    start = time.perf_counter()
+    result = simulate(STRATEGIC_EXAMPLE, scenarios=scenarios, jobs=jobs)
+    elapsed = time.perf_counter() - start
+
+    print("=" * 80)
+    print(f"{STRATEGIC_EXAMPLE['name']}: {scenarios:,}개 시나리오 × {len(SAFETY_FACTORS)}개 안전계수 × "
+          f"{len(POLICIES)}개 정책 ({elapsed:.2f}s, jobs={jobs})")
+    print("=" * 80)
+    for policy in POLICIES:
+        m = result.metrics(policy)
+        print(f"[{POLICY_NAMES[policy]}]")
+        for i in range(0, len(SAFETY_FACTORS), 3):
+            print(f"  k={SAFETY_FACTORS[i]:.2f}  충족률 {format_pct(m['fill_rate'][i]):>6}  "
+                  f"무결품 주 {format_pct(m['cycle_service'][i]):>6}  재고 {m['weeks_of_supply'][i]:4.1f}주  "
+                  f"연간 비용 {format_won(m['total_cost'][i])}")
+    best = result.cheapest(0.98)
+    print("-" * 80)
+    print("충족률 98% 최소 비용: " + ", ".join(
+        f"{policy} k={SAFETY_FACTORS[i]:.2f}" if i is not None else f"{policy} 미달" for policy, i in best.items()))
+    print("=" * 80)
+
+    if csv_path:
+        result.write_csv(csv_path)
+        print(f"Saved: {csv_path}")
+    if pptx_path:
+        from generate_part1_pptx_v2 import create_presentation
+        prs = create_presentation()
+        add_tradeoff_chart_slide(prs, result)
+        prs.save(pptx_path)
+        print(f"Saved: {pptx_path}")
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+PPTX Layout Engine - 행/열/그리드 제약으로 슬라이드 박스 위치를 한 번에 계산
+generate_part1_pptx_v2의 check_bounds처럼 손으로 잡은 좌표를 그린 뒤 넘침을 경고하는 대신,
+안전 영역(SAFE_RIGHT / SAFE_BOTTOM) 안에서 위치를 계산하고 들어가지 않으면 그리기 전에 실패
+
+규칙:
+- Box: 고정 크기(width/height) 또는 텍스트 측정 높이 (pptx_pagination.TextMeasurer)
+- Row: 고정 폭을 먼저 빼고 남은 폭을 grow 비율로 분배, 높이는 자식 최대 높이
+- Column: 자식 높이 합 + 간격, 남는 높이는 grow 자식에게 (없으면 위쪽 정렬)
+- Grid: columns개의 같은 폭 칸, 행 높이는 그 행의 최대 높이
+- 필요한 크기가 영역을 넘으면 LayoutOverflow (어느 노드가 얼마나 넘는지 포함)
+  → 성공한 레이아웃의 모든 사각형은 frame 안에 있음이 보장됨
+
+폭은 위에서 아래로(부모가 자식 폭 결정), 높이는 아래에서 위로(측정) 한 번씩 계산
+
+Usage:
+    from pptx_layout import Box, Column, Row, content_frame, solve
+
+    layout = solve(Column([
+        Box("header", height=0.28),
+        Row([Box("bullet", width=0.12, text="•", font_size=8),
+             Box("item", text="...", font_size=8, grow=1)], gap=0.03),
+    ], gap=0.02), frame=content_frame(top=2.00))
+
+    for box, rect in layout:
+        add_text_box(slide, rect.x, rect.y, rect.w, rect.h, box.text, ...)
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# ============================================================================
+# 슬라이드 안전 영역 (inches) - generate_part1_pptx_v2 기준
+# ============================================================================
+SLIDE_WIDTH = 10.83   # inches - DO NOT EXCEED!
+SLIDE_HEIGHT = 7.50   # inches - DO NOT EXCEED!
+SAFE_BOTTOM = 7.05    # Safe bottom (leave 0.45" margin)
+SAFE_RIGHT = 10.50    # Safe right (leave 0.33" margin)
+SAFE_LEFT = 0.30      # 제목/거버닝 메시지 시작 x
+CONTENT_TOP = 2.00    # 거버닝 메시지(1.01 + 0.63) 아래 본문 시작 y
+
+EPSILON = 1e-6
+
+
+class LayoutOverflow(ValueError):
+    """필요한 크기가 주어진 영역보다 큼"""
+
+    def __init__(self, node, axis, needed, available):
+        self.node = node
+        self.axis = axis
+        self.needed = needed
+        self.available = available
+        label = getattr(node, "name", None) or type(node).__name__
+        super().__init__(f"{label}: {axis} needs {needed:.2f}\" but only {available:.2f}\" available "
+                         f"(exceed by {needed - available:.2f}\")")
+
+
+@dataclass(frozen=True)
+class Rect:
+    """위치/크기 (inches)"""
+
+    x: float
+    y: float
+    w: float
+    h: float
+
+    @property
+    def right(self):
+        return self.x + self.w
+
+    @property
+    def bottom(self):
+        return self.y + self.h
+
+    def inset(self, left=0.0, top=0.0, right=0.0, bottom=0.0):
+        return Rect(self.x + left, self.y + top, self.w - left - right, self.h - top - bottom)
+
+    def contains(self, other):
+        return (other.x >= self.x - EPSILON and other.y >= self.y - EPSILON
+                and other.right <= self.right + EPSILON and other.bottom <= self.bottom + EPSILON)
+
+
+def content_frame(top=CONTENT_TOP, left=SAFE_LEFT, right=SAFE_RIGHT, bottom=SAFE_BOTTOM):
+    """안전 영역 안의 본문 frame"""
+    return Rect(left, top, right - left, bottom - top)
+
+
+_default_measurer = None
+
+
+def default_measurer():
+    """pptx_pagination.TextMeasurer (처음 쓸 때 한 번 생성)"""
+    global _default_measurer
+    if _default_measurer is None:
+        from pptx_pagination import TextMeasurer
+        _default_measurer = TextMeasurer()
+    return _default_measurer
+
+
+# ============================================================================
+# 레이아웃 노드
+# ============================================================================
+
+@dataclass
+class Box:
+    """
+    리프 박스
+
+    width/height: 고정 크기 (None이면 부모가 폭을 정하고 높이는 텍스트로 측정)
+    padding: 텍스트 측정 시 빼는 (좌우 합, 상하 합) 여백
+    data: 그릴 때 필요한 임의 값 (색, 정렬 등) - 엔진은 사용하지 않음
+    """
+
+    name: Optional[str] = None
+    width: Optional[float] = None
+    height: Optional[float] = None
+    text: str = ""
+    font_size: float = 10
+    line_spacing: float = 1.2
+    padding: Tuple[float, float] = (0.0, 0.0)
+    min_height: float = 0.0
+    grow: float = 0.0
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    def natural_height(self, width, measurer):
+        if self.height is not None:
+            return self.height
+        height = 0.0
+        if self.text:
+            pad_x, pad_y = self.padding
+            height = measurer.height(self.text, width - pad_x, self.font_size, self.line_spacing) + pad_y
+        return max(height, self.min_height)
+
+    def place(self, rect, measurer, out):
+        out.append((self, rect))
+
+
+@dataclass
+class _Container:
+    children: List[Any] = field(default_factory=list)
+    gap: float = 0.0
+    name: Optional[str] = None
+    width: Optional[float] = None
+    height: Optional[float] = None
+    grow: float = 0.0
+    inset: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0)   # left, top, right, bottom
+
+    def _inner_width(self, width):
+        return width - self.inset[0] - self.inset[2]
+
+    def _outer_height(self, inner_height):
+        return inner_height + self.inset[1] + self.inset[3]
+
+    def natural_height(self, width, measurer):
+        if self.height is not None:
+            return self.height
+        return self._outer_height(self._content_height(self._inner_width(width), measurer))
+
+
+def _distribute(sizes, growths, available, node, axis):
+    """고정/측정 크기 sizes에 남는 공간을 grow 비율로 더함 (부족하면 LayoutOverflow)"""
+    needed = sum(sizes)
+    if needed > available + EPSILON:
+        raise LayoutOverflow(node, axis, needed, available)
+    total_grow = sum(growths)
+    if total_grow <= 0:
+        return list(sizes)
+    extra = available - needed
+    return [size + extra * grow / total_grow for size, grow in zip(sizes, growths)]
+
+
+@dataclass
+class Row(_Container):
+    """가로 배치 - 고정 폭 먼저, 남은 폭은 폭 미지정 자식에게 grow 비율(기본 1)로"""
+
+    def _widths(self, width):
+        gaps = self.gap * max(len(self.children) - 1, 0)
+        fixed = [child.width or 0.0 for child in self.children]
+        growths = [0.0 if child.width is not None else (child.grow or 1.0) for child in self.children]
+        return _distribute(fixed, growths, width - gaps, self, "width")
+
+    def _content_height(self, width, measurer):
+        widths = self._widths(width)
+        return max((child.natural_height(w, measurer) for child, w in zip(self.children, widths)),
+                   default=0.0)
+
+    def place(self, rect, measurer, out):
+        inner = rect.inset(*self.inset)
+        height = self._content_height(inner.w, measurer)
+        if height > inner.h + EPSILON:
+            raise LayoutOverflow(self, "height", height, inner.h)
+        x = inner.x
+        for child, w in zip(self.children, self._widths(inner.w)):
+            child.place(Rect(x, inner.y, w, inner.h), measurer, out)
+            x += w + self.gap
+
+
+@dataclass
+class Column(_Container):
+    """세로 배치 - 자식 높이(고정/측정) 합 + 간격, 남는 높이는 grow 자식에게"""
+
+    def _heights(self, width, measurer):
+        return [child.natural_height(width, measurer) for child in self.children]
+
+    def _content_height(self, width, measurer):
+        return sum(self._heights(width, measurer)) + self.gap * max(len(self.children) - 1, 0)
+
+    def place(self, rect, measurer, out):
+        inner = rect.inset(*self.inset)
+        gaps = self.gap * max(len(self.children) - 1, 0)
+        heights = _distribute(self._heights(inner.w, measurer), [child.grow for child in self.children],
+                              inner.h - gaps, self, "height")
+        y = inner.y
+        for child, h in zip(self.children, heights):
+            child.place(Rect(inner.x, y, inner.w, h), measurer, out)
+            y += h + self.gap
+
+
+@dataclass
+class Grid(_Container):
+    """columns개의 같은 폭 칸에 자식을 행 우선으로 배치 (row_gap 기본 = gap)"""
+
+    columns: int = 2
+    row_gap: Optional[float] = None
+
+    def _cell_width(self, width):
+        cell = (width - self.gap * (self.columns - 1)) / self.columns
+        if cell < 0:
+            raise LayoutOverflow(self, "width", self.gap * (self.columns - 1), width)
+        return cell
+
+    def _rows(self):
+        return [self.children[i:i + self.columns] for i in range(0, len(self.children), self.columns)]
+
+    def _row_heights(self, width, measurer):
+        cell = self._cell_width(width)
+        return [max(child.natural_height(cell, measurer) for child in row) for row in self._rows()]
+
+    def _content_height(self, width, measurer):
+        row_gap = self.gap if self.row_gap is None else self.row_gap
+        heights = self._row_heights(width, measurer)
+        return sum(heights) + row_gap * max(len(heights) - 1, 0)
+
+    def place(self, rect, measurer, out):
+        inner = rect.inset(*self.inset)
+        row_gap = self.gap if self.row_gap is None else self.row_gap
+        needed = self._content_height(inner.w, measurer)
+        if needed > inner.h + EPSILON:
+            raise LayoutOverflow(self, "height", needed, inner.h)
+        cell = self._cell_width(inner.w)
+        y = inner.y
+        for row, h in zip(self._rows(), self._row_heights(inner.w, measurer)):
+            for col, child in enumerate(row):
+                child.place(Rect(inner.x + col * (cell + self.gap), y, cell, h), measurer, out)
+            y += h + row_gap
+
+
+# ============================================================================
+# 풀이
+# ============================================================================
+
+class Layout(list):
+    """[(Box, Rect)] - 배치 순서 = 트리 전위 순서"""
+
+    def named(self, name):
+        """이름이 name인 박스들의 Rect 리스트"""
+        return [rect for box, rect in self if box.name == name]
+
+    @property
+    def bottom(self):
+        return max((rect.bottom for _, rect in self), default=0.0)
+
+
+def solve(root, frame=None, measurer=None):
+    """
+    root 트리를 frame(기본: 본문 안전 영역) 안에 배치
+
+    Returns:
+        Layout - 모든 Rect가 frame 안에 있음
+
+    Raises:
+        LayoutOverflow - 어떤 노드든 필요한 크기가 주어진 영역을 넘을 때
+    """
+    frame = frame or content_frame()
+    measurer = measurer or default_measurer()
+    if root.height is None:
+        needed = root.natural_height(frame.w, measurer)
+        if needed > frame.h + EPSILON:
+            raise LayoutOverflow(root, "height", needed, frame.h)
+    layout = Layout()
+    root.place(frame, measurer, layout)
+    for box, rect in layout:
+        if not frame.contains(rect):
+            raise LayoutOverflow(box, "bounds", max(rect.right - frame.x, rect.bottom - frame.y),
+                                 max(frame.w, frame.h))
+    return layout
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+PPTX Pagination Engine - 마크다운 섹션 → 슬라이드 페이지 자동 분할/병합
+거버닝 메시지 100자 절단, 불릿 5개 제한, "슬라이드 N / 추가 내용" 채움 슬라이드 대신
+텍스트를 실제로 측정하여 필요한 만큼만 슬라이드를 만듭니다.
+
+측정: skill/scripts/inventory.py의 PIL 측정 로직 재사용
+      (ShapeData.get_font_path 폰트 탐색 + _wrap_text_line 단어 줄바꿈,
+       줄 높이 = 폰트 크기 × 줄 간격 × 96/72 px)
+      한글 글꼴이 없는 환경에서는 글자폭 추정치(한글 1em, 영문 0.55em)로 대체
+
+분할/병합 규칙 (섹션을 한 번만 순회, 시험 저장 없음):
+1. 거버닝 메시지: 첫 aside의 줄 단위로 거버닝 박스에 들어가는 만큼 → 나머지는 본문 앞으로
+2. 본문: 단락/불릿/표 행을 항목으로 측정하여 본문 박스 높이까지 채우고 넘치면 다음 페이지 "(계속)"
+3. 본문 없는 장 제목(## 1. ...)은 슬라이드를 만들지 않고 다음 페이지의 chapter로 접기
+4. 같은 장의 작은 하위 섹션은 합쳐도 한 페이지에 들어가면 병합
+   (제목은 첫 섹션, 이후 하위 제목과 거버닝은 굵은 항목/본문으로)
+5. 시각 자료 섹션(visual)은 새 페이지에서 시작하고, 그 첫 페이지만 좁은 본문 박스 사용
+
+Usage:
+    from pptx_pagination import paginate
+
+    pages = paginate(sections, visual=lambda section: section.number in DIAGRAMS)
+    for page in pages:
+        page.title, page.governing, page.items   # PageItem(text, level, bold)
+        page.visual                              # 시각 자료 자리가 있는 페이지
+"""
+
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+import course_markdown
+from course_markdown import Aside, Bullet, Paragraph, Table
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "skill" / "scripts"))
+from inventory import ShapeData  # noqa: E402
+
+# ============================================================================
+# 레이아웃 상수 (generate_part2_48slides_auto 기준, 인치)
+# ============================================================================
+DPI = 96
+TEXT_MARGIN_X = 0.2    # 좌우 기본 여백 합 (0.1 + 0.1)
+TEXT_MARGIN_Y = 0.1    # 상하 기본 여백 합 (0.05 + 0.05)
+
+TITLE_BOX = (9.83, 0.6)
+GOVERNING_BOX = (9.83, 0.5)
+BODY_BOX = (7.0, 3.4)
+BODY_BOX_WITH_VISUAL = (2.6, 3.4)
+
+TITLE_SIZE = 20
+GOVERNING_SIZE = 16
+BODY_SIZE = 10
+BODY_LINE_SPACING = 1.5
+GOVERNING_LINE_SPACING = 1.2
+
+CONTINUED_SUFFIX = " (계속)"
+MERGE_FILL_RATIO = 0.9   # 병합 후 본문 높이가 이 비율 이하일 때만 병합
+
+# 맑은 고딕이 없는 환경의 한글 글꼴 후보
+KOREAN_FONT_FALLBACKS = [
+    "Malgun Gothic", "malgun", "NanumGothic", "NanumBarunGothic",
+    "NotoSansCJK", "NotoSansKR", "AppleSDGothicNeo", "UnDotum",
+]
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+_HANGUL_RE = re.compile(r"[ᄀ-ᇿ㄰-㆏가-힣一-鿿]")
+
+
+# ============================================================================
+# 텍스트 측정
+# ============================================================================
+
+class _EstimatedDraw:
+    """글꼴 파일이 없을 때의 ImageDraw 대용 (textlength만 제공)"""
+
+    def textlength(self, text, font=None):
+        size_px = font
+        wide = len(_HANGUL_RE.findall(text))
+        return (wide * 1.0 + (len(text) - wide) * 0.55) * size_px
+
+
+class TextMeasurer:
+    """
+    PIL 기반 텍스트 줄 수/높이 측정기 (inventory.ShapeData와 동일한 줄바꿈 규칙)
+
+    글꼴은 크기별로, 줄 수는 (텍스트, 폭, 크기)별로 캐시
+    """
+
+    def __init__(self, font_name="맑은 고딕"):
+        self.font_path = self._resolve_font(font_name)
+        self._draw = ImageDraw.Draw(Image.new("RGB", (1, 1))) if self.font_path else _EstimatedDraw()
+        self._fonts: Dict[int, object] = {}
+        self._line_cache: Dict[Tuple[str, int, int], int] = {}
+
+    @staticmethod
+    def _resolve_font(font_name):
+        for candidate in [font_name] + KOREAN_FONT_FALLBACKS:
+            path = ShapeData.get_font_path(candidate)
+            if path:
+                return path
+        return None
+
+    def _font(self, size_pt):
+        size_px = round(size_pt * DPI / 72)
+        if not self.font_path:
+            return size_px
+        font = self._fonts.get(size_px)
+        if font is None:
+            font = self._fonts[size_px] = ImageFont.truetype(self.font_path, size=size_px)
+        return font
+
+    def line_count(self, text, width_in, size_pt):
+        """width_in 폭에서 text가 차지하는 줄 수"""
+        width_px = ShapeData.inches_to_pixels(width_in, DPI)
+        key = (text, width_px, size_pt)
+        count = self._line_cache.get(key)
+        if count is None:
+            font = self._font(size_pt)
+            count = 0
+            for line in text.split("\n"):
+                count += len(ShapeData._wrap_text_line(None, line, width_px, self._draw, font))
+            self._line_cache[key] = count
+        return count
+
+    def height(self, text, width_in, size_pt, line_spacing=1.0):
+        """text 높이 (인치)"""
+        return self.line_count(text, width_in, size_pt) * size_pt * line_spacing / 72
+
+    def fits(self, text, box, size_pt, line_spacing=1.0):
+        width, height = box
+        usable = (width - TEXT_MARGIN_X, height - TEXT_MARGIN_Y)
+        return self.height(text, usable[0], size_pt, line_spacing) <= usable[1] + 1e-6
+
+
+# ============================================================================
+# 페이지 모델
+# ============================================================================
+
+@dataclass
+class PageItem:
+    """본문 한 단락 (불릿/단락/표 행/하위 제목)"""
+
+    text: str
+    level: int = 0
+    bold: bool = False
+
+
+@dataclass
+class Page:
+    """슬라이드 한 장 분량"""
+
+    number: int
+    title: str
+    governing: str
+    items: List[PageItem] = field(default_factory=list)
+    chapter: str = ""
+    sections: List[str] = field(default_factory=list)  # 원본 섹션 제목
+    continued: bool = False
+    visual: bool = False  # 좁은 본문 박스 + 시각 자료 자리
+
+    @property
+    def bullets(self) -> List[str]:
+        return [item.text for item in self.items]
+
+
+def _clean(text):
+    return " ".join(course_markdown.plain_text(text).split())
+
+
+def _governing_units(section):
+    """첫 aside → (거버닝 후보 줄 리스트, 해당 aside)"""
+    for block in section.blocks:
+        if isinstance(block, Aside) and block.lines:
+            units = [_clean(line.lstrip("-*0123456789. ")) for line in block.lines]
+            return [u for u in units if u], block
+    return [], None
+
+
+def _section_items(blocks, skip=None):
+    """섹션 블록 → PageItem (문서 순서, aside 내부 포함)"""
+    items = []
+    for block in blocks:
+        if block is skip:
+            continue
+        if isinstance(block, Paragraph):
+            text = _clean(block.text)
+            if text:
+                items.append(PageItem(text))
+        elif isinstance(block, Bullet):
+            text = _clean(block.text)
+            if text:
+                items.append(PageItem(text, level=min(block.level, 2)))
+        elif isinstance(block, Table):
+            for row in block.cells:
+                cells = [_clean(cell) for cell in row if _clean(cell)]
+                if cells:
+                    items.append(PageItem(" · ".join(cells), bold=row is block.header))
+        elif isinstance(block, Aside):
+            items.extend(_section_items(block.children))
+    return items
+
+
+class Paginator:
+    """
+    섹션 스트림을 측정된 Page 리스트로 변환
+
+    body_box: 페이지 번호 → (폭, 높이) 인치
+    visual: 섹션 → 시각 자료 여부 (True면 그 섹션의 첫 페이지가 visual_box를 사용)
+    """
+
+    def __init__(self, measurer=None, body_box: Optional[Callable[[int], Tuple[float, float]]] = None,
+                 first_page=1, default_governing="핵심 내용을 학습합니다.",
+                 visual: Optional[Callable[[object], bool]] = None, visual_box=BODY_BOX_WITH_VISUAL):
+        self.measurer = measurer or TextMeasurer()
+        self.body_box = body_box or (lambda number: BODY_BOX)
+        self.visual = visual or (lambda section: False)
+        self.visual_box = visual_box
+        self.first_page = first_page
+        self.default_governing = default_governing
+
+    # ------------------------------------------------------------------
+    def _item_height(self, item, width):
+        indent = 0.25 * item.level
+        return self.measurer.height(item.text, width - TEXT_MARGIN_X - indent,
+                                    BODY_SIZE, BODY_LINE_SPACING)
+
+    def _body_capacity(self, number, visual=False):
+        width, height = self.visual_box if visual else self.body_box(number)
+        return width, height - TEXT_MARGIN_Y
+
+    def fit_governing(self, units):
+        """들어가는 만큼의 거버닝 줄 → (거버닝 문자열, 넘친 줄)"""
+        governing = ""
+        for index, unit in enumerate(units):
+            candidate = f"{governing} {unit}".strip()
+            if not self.measurer.fits(candidate, GOVERNING_BOX, GOVERNING_SIZE, GOVERNING_LINE_SPACING):
+                if not governing:
+                    return self._shorten(unit), units[index:]
+                return governing, units[index:]
+            governing = candidate
+        return governing, []
+
+    def _shorten(self, text):
+        """한 줄도 안 들어가는 경우 문장/단어 경계에서 자르기 (원문은 본문으로 이동)"""
+        pieces = [p for p in _SENTENCE_RE.split(text) if p]
+        if len(pieces) > 1 and self.measurer.fits(pieces[0], GOVERNING_BOX, GOVERNING_SIZE,
+                                                  GOVERNING_LINE_SPACING):
+            return pieces[0]
+        words = text.split(" ")
+        while len(words) > 1:
+            words.pop()
+            candidate = " ".join(words) + "…"
+            if self.measurer.fits(candidate, GOVERNING_BOX, GOVERNING_SIZE, GOVERNING_LINE_SPACING):
+                return candidate
+        return text
+
+    # ------------------------------------------------------------------
+    def _pack(self, number, items, visual=False):
+        """items를 number 페이지부터 채워 페이지별 항목 리스트로 분할 (visual은 첫 페이지만)"""
+        chunks = []
+        current, used = [], 0.0
+        width, capacity = self._body_capacity(number, visual)
+        for item in items:
+            height = self._item_height(item, width)
+            if current and used + height > capacity:
+                chunks.append(current)
+                number += 1
+                width, capacity = self._body_capacity(number)
+                current, used = [], 0.0
+            current.append(item)
+            used += height
+        chunks.append(current)
+        return chunks
+
+    def _prepare(self, section):
+        units, aside = _governing_units(section)
+        governing, overflow = self.fit_governing(units)
+        items = [PageItem(u) for u in overflow] + _section_items(section.blocks, skip=aside)
+        return governing or self.default_governing, items
+
+    def paginate(self, sections) -> List[Page]:
+        pages: List[Page] = []
+        chapter = ""
+        pending = None  # (title, governing, items, chapter, [section titles], visual) 병합 후보
+
+        def flush():
+            nonlocal pending
+            if pending is None:
+                return
+            title, governing, items, page_chapter, titles, visual = pending
+            pending = None
+            number = self.first_page + len(pages)
+            for index, chunk in enumerate(self._pack(number, items, visual)):
+                pages.append(Page(number + index, title + (CONTINUED_SUFFIX if index else ""),
+                                  governing, chunk, page_chapter, titles, continued=index > 0,
+                                  visual=visual and index == 0))
+
+        for section in sections:
+            governing, items = self._prepare(section)
+            visual = bool(self.visual(section))
+            if not items and not _governing_units(section)[0]:
+                # 본문 없는 장 제목 → 다음 페이지의 chapter
+                flush()
+                chapter = section.title
+                continue
+
+            if pending is not None and pending[3] == chapter and section.level == 3 and not visual:
+                merged = pending[2] + [PageItem(section.title, bold=True)]
+                if governing != self.default_governing:
+                    merged.append(PageItem(governing))
+                merged += items
+                width, capacity = self._body_capacity(self.first_page + len(pages), pending[5])
+                if sum(self._item_height(i, width) for i in merged) <= capacity * MERGE_FILL_RATIO:
+                    pending = (pending[0], pending[1], merged, chapter, pending[4] + [section.title],
+                               pending[5])
+                    continue
+
+            flush()
+            pending = (section.title, governing, items, chapter, [section.title], visual)
+
+        flush()
+        return pages
+
+
+def paginate(sections, body_box=None, first_page=1, measurer=None, visual=None) -> List[Page]:
+    """섹션 리스트 → Page 리스트 (단축 함수)"""
+    return Paginator(measurer, body_box, first_page, visual=visual).paginate(sections)
+
+
+if __name__ == "__main__":
+    import time
+    import course_cache
+    import course_source
+
+    source = course_source.default_source()
+    md_name = source.session_file(int(sys.argv[1]) if len(sys.argv) > 1 else 2)
+    sections = course_markdown.sections(course_cache.load_document(md_name, source))
+
+    start = time.perf_counter()
+    measurer = TextMeasurer()
+    pages = paginate(sections, measurer=measurer, first_page=5)
+    elapsed = time.perf_counter() - start
+
+    print("=" * 80)
+    print(f"Pagination: {Path(md_name).name[:60]}")
+    print(f"Font: {measurer.font_path or '추정치 (한글 글꼴 없음)'}")
+    print("=" * 80)
+    for page in pages:
+        print(f"  [{page.number:2d}] {page.title[:45]:45s}  items={len(page.items):2d}"
+              f"  sections={len(page.sections)}")
+    print(f"\n  Sections: {len(sections)} → Pages: {len(pages)}  ({elapsed * 1000:.1f} ms)")
+    print("=" * 80)
@@ -7,6 +7,9 @@ PPTX Quality Enforcement Module
 from pptx.util import Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 
+from deck_analysis import Rule, RuleSet
+from pptx_xml_scan import scan_deck
+
 # ============================================================================
 # 폰트 크기 상수 (절대 변경 불가!)
 # ============================================================================
@@ -30,7 +33,7 @@ def enforce_text_properties(text_frame, font_size, font_name="맑은 고딕",
     Args:
         text_frame: TextFrame 객체
         font_size: Pt() 객체 (REQUIRED!)
-        font_name: 폰트 이름
+        font_name: 폰트 이름 (None이면 테마 폰트 상속, pptx_theme.compile_theme 참조)
         bold: 볼드 여부
         color: RGBColor 객체
         alignment: PP_ALIGN 상수
@@ -54,7 +57,8 @@ def enforce_text_properties(text_frame, font_size, font_name="맑은 고딕",
 
         # 모든 run에 폰트 속성 강제 할당
         for run in para.runs:
-            run.font.name = font_name
+            if font_name:
+                run.font.name = font_name
             run.font.size = font_size  # ← 절대 누락 불가!
             run.font.bold = bold
             if color:
@@ -107,7 +111,7 @@ def add_bullets_with_enforcement(text_frame, bullet_list, font_size=FONT_BODY,
         text_frame: TextFrame 객체
         bullet_list: 불릿 항목 리스트 (list of str)
         font_size: 폰트 크기 (기본: FONT_BODY = 10pt)
-        font_name: 폰트 이름
+        font_name: 폰트 이름 (None이면 테마 폰트 상속)
         color: RGBColor 객체
         line_spacing: 줄 간격 (배수)
 
@@ -128,7 +132,8 @@ def add_bullets_with_enforcement(text_frame, bullet_list, font_size=FONT_BODY,
 
         # 모든 run에 폰트 속성 강제 할당
         for run in para.runs:
-            run.font.name = font_name
+            if font_name:
+                run.font.name = font_name
             run.font.size = font_size  # ← 절대 누락 불가!
             if color:
                 run.font.color.rgb = color
@@ -203,9 +208,64 @@ def insert_svg_as_image(slide, svg_path, left, top, width=None, height=None):
 # 검증 함수: 생성 후 PPTX 품질 검사
 # ============================================================================
 
-def verify_pptx_quality(pptx_path):
+def _check_dimensions(facts, stats):
+    width_inches = facts.width_inches
+    height_inches = facts.height_inches
+    stats["dimensions"] = f"{width_inches:.2f}\" × {height_inches:.2f}\""
+    if abs(width_inches - 10.83) > 0.01 or abs(height_inches - 7.50) > 0.01:
+        return [f"❌ 슬라이드 크기 오류: {width_inches:.2f}\" × {height_inches:.2f}\" (목표: 10.83\" × 7.50\")"]
+    return []
+
+
+def _check_slide_count(facts, stats):
+    stats["slide_count"] = facts.slide_count
+    if facts.slide_count < 40:
+        return [f"⚠️ 슬라이드 개수 부족: {facts.slide_count}장 (목표: 48장)"]
+    return []
+
+
+def _check_font_size_missing(facts, stats):
+    nonblank = facts.runs.indices(depth=0, text=lambda t: bool(t.strip()))
+    sizes = [facts.runs["size_pt"][i] for i in nonblank]
+    stats["total_text_runs"] = len(sizes)
+    stats["font_size_distribution"] = dict(facts.font_size_distribution(nonblank=True))
+
+    none_font_count = sizes.count(None)
+    if none_font_count > 0:
+        return [f"❌ 폰트 크기 누락: {none_font_count}개 run에 font.size = None!"]
+    return []
+
+
+def _check_body_ratio(facts, stats):
+    total_text_runs = stats.get("total_text_runs", 0)
+    if total_text_runs > 0:
+        pt10_ratio = stats["font_size_distribution"].get(10, 0) / total_text_runs
+        stats["10pt_ratio"] = f"{pt10_ratio * 100:.1f}%"
+        if pt10_ratio < 0.50:  # 50% 미만이면 경고
+            return [f"⚠️ 10pt 폰트 비율 낮음: {pt10_ratio * 100:.1f}% (목표: 60%+)"]
+    return []
+
+
+def _check_shape_density(facts, stats):
+    avg_shapes = facts.average_shapes()
+    stats["avg_shapes_per_slide"] = f"{avg_shapes:.1f}"
+    if avg_shapes < 10:
+        return [f"⚠️ 평균 Shape 개수 부족: {avg_shapes:.1f} (목표: 15+)"]
+    return []
+
+
+QUALITY_RULES = RuleSet("pptx_quality_enforcement", [
+    Rule("dimensions", "error", _check_dimensions),
+    Rule("slide_count", "warning", _check_slide_count),
+    Rule("font_size_missing", "error", _check_font_size_missing),
+    Rule("body_font_ratio", "warning", _check_body_ratio),
+    Rule("shape_density", "warning", _check_shape_density),
+])
+
+
+def verify_pptx_quality(pptx_path, facts=None):
     """
-    생성된 PPTX 파일의 품질을 검증
+    생성된 PPTX 파일의 품질을 검증 (pptx_xml_scan 팩트 위의 QUALITY_RULES, 읽기 전용)
 
     검증 항목:
     1. 슬라이드 크기 (10.83" × 7.50")
@@ -214,6 +274,10 @@ def verify_pptx_quality(pptx_path):
     4. Shape 개수 (평균 15+ 필요)
     5. 10pt 폰트 사용 비율 (60%+ 필요)
 
+    Args:
+        pptx_path: PPTX 경로
+        facts: 이미 수집한 DeckFacts (있으면 덱을 다시 열지 않음)
+
     Returns:
         dict: 검증 결과
         {
@@ -223,88 +287,19 @@ def verify_pptx_quality(pptx_path):
             "stats": dict
         }
     """
-    from pptx import Presentation
     import os
 
-    if not os.path.exists(pptx_path):
-        return {
-            "passed": False,
-            "errors": [f"❌ 파일이 없습니다: {pptx_path}"],
-            "warnings": [],
-            "stats": {}
-        }
-
-    prs = Presentation(pptx_path)
-    errors = []
-    warnings = []
-    stats = {}
-
-    # 1. 슬라이드 크기 검증
-    width_inches = prs.slide_width / 914400
-    height_inches = prs.slide_height / 914400
-    stats["dimensions"] = f"{width_inches:.2f}\" × {height_inches:.2f}\""
-
-    if abs(width_inches - 10.83) > 0.01 or abs(height_inches - 7.50) > 0.01:
-        errors.append(f"❌ 슬라이드 크기 오류: {width_inches:.2f}\" × {height_inches:.2f}\" (목표: 10.83\" × 7.50\")")
-
-    # 2. 슬라이드 개수
-    slide_count = len(prs.slides)
-    stats["slide_count"] = slide_count
-
-    if slide_count < 40:
-        warnings.append(f"⚠️ 슬라이드 개수 부족: {slide_count}장 (목표: 48장)")
-
-    # 3. 폰트 크기 누락 검사
-    none_font_count = 0
-    font_size_distribution = {}
-    total_text_runs = 0
-
-    for i, slide in enumerate(prs.slides, 1):
-        for shape in slide.shapes:
-            if hasattr(shape, 'text_frame'):
-                for para in shape.text_frame.paragraphs:
-                    for run in para.runs:
-                        if run.text.strip():
-                            total_text_runs += 1
-
-                            if run.font.size is None:
-                                none_font_count += 1
-                            else:
-                                size_pt = int(run.font.size.pt)
-                                font_size_distribution[size_pt] = font_size_distribution.get(size_pt, 0) + 1
-
-    stats["total_text_runs"] = total_text_runs
-    stats["font_size_distribution"] = font_size_distribution
-
-    if none_font_count > 0:
-        errors.append(f"❌ 폰트 크기 누락: {none_font_count}개 run에 font.size = None!")
-
-    # 4. 10pt 폰트 사용 비율
-    if total_text_runs > 0:
-        pt10_count = font_size_distribution.get(10, 0)
-        pt10_ratio = pt10_count / total_text_runs
-        stats["10pt_ratio"] = f"{pt10_ratio * 100:.1f}%"
-
-        if pt10_ratio < 0.50:  # 50% 미만이면 경고
-            warnings.append(f"⚠️ 10pt 폰트 비율 낮음: {pt10_ratio * 100:.1f}% (목표: 60%+)")
-
-    # 5. Shape 개수 평균
-    shape_counts = [len(slide.shapes) for slide in prs.slides]
-    avg_shapes = sum(shape_counts) / len(shape_counts) if shape_counts else 0
-    stats["avg_shapes_per_slide"] = f"{avg_shapes:.1f}"
-
-    if avg_shapes < 10:
-        warnings.append(f"⚠️ 평균 Shape 개수 부족: {avg_shapes:.1f} (목표: 15+)")
-
-    # 결과 종합
-    passed = len(errors) == 0
-
-    return {
-        "passed": passed,
-        "errors": errors,
-        "warnings": warnings,
-        "stats": stats
-    }
+    if facts is None:
+        if not os.path.exists(pptx_path):
+            return {
+                "passed": False,
+                "errors": [f"❌ 파일이 없습니다: {pptx_path}"],
+                "warnings": [],
+                "stats": {}
+            }
+        facts = scan_deck(pptx_path)
+
+    return QUALITY_RULES.run(facts)
 
 
 def print_verification_report(result):
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+PPTX Theme Compiler
+S4HANA 모노크롬 팔레트와 폰트 위계를 덱의 테마/마스터로 컴파일
+
+각 생성기가 COLOR_* 상수로 shape마다 RGB를 직접 기록하는 대신,
+팔레트를 테마 색상 슬롯(dk1/lt1/.../accent6)으로, 폰트 위계를
+마스터 텍스트 스타일과 이름 있는 스타일(title/governing/body...)로 등록합니다.
+생성된 shape는 테마 슬롯(<a:schemeClr>)을 참조하고 폰트 이름은 테마 폰트에서
+상속하므로 슬라이드 XML이 작아지고 저장/로드가 빨라집니다.
+
+Usage:
+    from pptx_theme import compile_theme, set_fill, set_line, apply_text_style
+
+    prs = create_presentation()
+    compile_theme(prs)
+    set_fill(box, COLOR_VERY_LIGHT_GRAY)     # → <a:schemeClr val="bg2"/>
+    apply_text_style(box.text_frame, "body")
+"""
+
+from lxml import etree
+from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.enum.text import MSO_ANCHOR
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
+from pptx.util import Pt
+
+from pptx_quality_enforcement import (
+    FONT_TITLE, FONT_GOVERNING, FONT_HEADING, FONT_BODY, FONT_BULLET, FONT_CAPTION
+)
+
+# ============================================================================
+# 테마 팔레트 (S4HANA Monochrome + Kraljic 4색)
+# ============================================================================
+# 테마 슬롯 → (상수 이름, RGB hex)
+# Kraljic 4색을 모두 담기 위해 ROUTINE은 folHlink 슬롯을 사용합니다.
+THEME_PALETTE = {
+    "dk1": ("COLOR_BLACK", "000000"),
+    "lt1": ("COLOR_WHITE", "FFFFFF"),
+    "dk2": ("COLOR_DARK_GRAY", "333333"),
+    "lt2": ("COLOR_VERY_LIGHT_GRAY", "E6E6E6"),
+    "accent1": ("COLOR_ACCENT", "1A5276"),
+    "accent2": ("COLOR_MED_GRAY", "666666"),
+    "accent3": ("COLOR_LIGHT_GRAY", "CCCCCC"),
+    "accent4": ("COLOR_STRATEGIC", "8E44AD"),
+    "accent5": ("COLOR_BOTTLENECK", "E67E22"),
+    "accent6": ("COLOR_LEVERAGE", "27AE60"),
+    "hlink": ("COLOR_ACCENT", "1A5276"),
+    "folHlink": ("COLOR_ROUTINE", "95A5A6"),
+}
+
+# 슬라이드에서 참조하는 이름 (clrMap 적용 후: tx1=dk1, bg1=lt1, tx2=dk2, bg2=lt2)
+_SLOT_THEME_COLOR = {
+    "dk1": MSO_THEME_COLOR.TEXT_1,
+    "lt1": MSO_THEME_COLOR.BACKGROUND_1,
+    "dk2": MSO_THEME_COLOR.TEXT_2,
+    "lt2": MSO_THEME_COLOR.BACKGROUND_2,
+    "accent1": MSO_THEME_COLOR.ACCENT_1,
+    "accent2": MSO_THEME_COLOR.ACCENT_2,
+    "accent3": MSO_THEME_COLOR.ACCENT_3,
+    "accent4": MSO_THEME_COLOR.ACCENT_4,
+    "accent5": MSO_THEME_COLOR.ACCENT_5,
+    "accent6": MSO_THEME_COLOR.ACCENT_6,
+    "folHlink": MSO_THEME_COLOR.FOLLOWED_HYPERLINK,
+}
+
+# 생성기별로 COLOR_LEVERAGE가 (39,174,96)/(39,174,60) 두 값이 섞여 있어 둘 다 매핑
+_RGB_TO_SLOT = {hex_value: slot for slot, (_, hex_value) in THEME_PALETTE.items()
+                if slot != "hlink"}
+_RGB_TO_SLOT["27AE3C"] = "accent6"
+
+# 기본 텍스트 색상 슬롯 (본문 대부분이 DARK_GRAY)
+DEFAULT_TEXT_SLOT = "dk2"
+THEME_FONT = "맑은 고딕"
+
+# ============================================================================
+# 이름 있는 텍스트 스타일 (pptx_quality_enforcement 폰트 위계)
+# ============================================================================
+TEXT_STYLES = {
+    "title": {"size": FONT_TITLE, "bold": True, "color": "dk2"},
+    "governing": {"size": FONT_GOVERNING, "bold": True, "color": "accent2"},
+    "heading": {"size": FONT_HEADING, "bold": True, "color": "dk2"},
+    "body": {"size": FONT_BODY, "bold": False, "color": "dk2"},
+    "bullet": {"size": FONT_BULLET, "bold": False, "color": "dk2"},
+    "caption": {"size": FONT_CAPTION, "bold": False, "color": "accent2"},
+}
+
+_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+
+
+# ============================================================================
+# 테마 컴파일
+# ============================================================================
+
+def _theme_part(prs):
+    """슬라이드 마스터가 참조하는 테마 파트"""
+    return prs.slide_master.part.part_related_by(RT.THEME)
+
+
+def _build_clr_scheme(name):
+    """THEME_PALETTE로 <a:clrScheme> 생성"""
+    scheme = etree.Element(f"{{{_A}}}clrScheme", name=name, nsmap={"a": _A})
+    for slot, (_, hex_value) in THEME_PALETTE.items():
+        slot_el = etree.SubElement(scheme, f"{{{_A}}}{slot}")
+        etree.SubElement(slot_el, f"{{{_A}}}srgbClr", val=hex_value)
+    return scheme
+
+
+def _build_font_scheme(name, font_name):
+    """major/minor 모두 같은 한글 폰트를 쓰는 <a:fontScheme> 생성"""
+    scheme = etree.Element(f"{{{_A}}}fontScheme", name=name, nsmap={"a": _A})
+    for kind in ("majorFont", "minorFont"):
+        font_el = etree.SubElement(scheme, f"{{{_A}}}{kind}")
+        etree.SubElement(font_el, f"{{{_A}}}latin", typeface=font_name)
+        etree.SubElement(font_el, f"{{{_A}}}ea", typeface=font_name)
+        etree.SubElement(font_el, f"{{{_A}}}cs", typeface="")
+        etree.SubElement(font_el, f"{{{_A}}}font", script="Hang", typeface=font_name)
+    return scheme
+
+
+def _set_def_rpr(def_rpr, size, bold, slot):
+    """defRPr의 크기/볼드/색상을 테마 참조로 재설정"""
+    def_rpr.set("sz", str(int(size.pt * 100)))
+    if bold:
+        def_rpr.set("b", "1")
+    elif "b" in def_rpr.attrib:
+        del def_rpr.attrib["b"]
+
+    fill = def_rpr.find(qn("a:solidFill"))
+    if fill is None:
+        fill = etree.Element(qn("a:solidFill"))
+        def_rpr.insert(0, fill)
+    for child in list(fill):
+        fill.remove(child)
+    scheme_clr = etree.SubElement(fill, qn("a:schemeClr"))
+    scheme_clr.set("val", _scheme_name(slot))
+
+
+def _scheme_name(slot):
+    """팔레트 슬롯 → 슬라이드에서 쓰는 schemeClr 이름 (clrMap 기준)"""
+    return {"dk1": "tx1", "lt1": "bg1", "dk2": "tx2", "lt2": "bg2"}.get(slot, slot)
+
+
+def compile_theme(prs, name="S4HANA Monochrome", font_name=THEME_FONT):
+    """
+    팔레트와 폰트 위계를 프레젠테이션의 테마/마스터에 컴파일
+
+    1. 테마 파트의 clrScheme/fontScheme을 S4HANA 팔레트와 폰트로 교체
+    2. presentation.xml defaultTextStyle: 텍스트 박스 기본값 = body (10pt, DARK_GRAY)
+    3. 마스터 txStyles: title=FONT_TITLE, body/other=FONT_BODY
+
+    Args:
+        prs: Presentation 객체
+        name: 테마 이름
+        font_name: 테마 major/minor 폰트
+
+    Returns:
+        Presentation: 같은 prs (체이닝용)
+    """
+    # 1. 테마 파트
+    theme_part = _theme_part(prs)
+    theme = etree.fromstring(theme_part.blob)
+    theme.set("name", name)
+    elements = theme.find(qn("a:themeElements"))
+    for tag, builder in (("a:clrScheme", lambda: _build_clr_scheme(name)),
+                         ("a:fontScheme", lambda: _build_font_scheme(name, font_name))):
+        old = elements.find(qn(tag))
+        elements.replace(old, builder())
+    theme_part._blob = etree.tostring(theme, xml_declaration=True,
+                                      encoding="UTF-8", standalone=True)
+
+    # 2. 텍스트 박스 기본 스타일 = body
+    body = TEXT_STYLES["body"]
+    default_style = prs.part._element.find(qn("p:defaultTextStyle"))
+    if default_style is not None:
+        for def_rpr in default_style.iter(qn("a:defRPr")):
+            if def_rpr.getparent().tag == qn("a:defPPr"):
+                continue
+            _set_def_rpr(def_rpr, body["size"], body["bold"], body["color"])
+
+    # 3. 마스터 텍스트 스타일
+    tx_styles = prs.slide_master.element.find(qn("p:txStyles"))
+    if tx_styles is not None:
+        title = TEXT_STYLES["title"]
+        for style_tag, style in (("p:titleStyle", title),
+                                 ("p:bodyStyle", body),
+                                 ("p:otherStyle", body)):
+            style_el = tx_styles.find(qn(style_tag))
+            if style_el is None:
+                continue
+            for def_rpr in style_el.iter(qn("a:defRPr")):
+                if def_rpr.getparent().tag == qn("a:defPPr"):
+                    continue
+                _set_def_rpr(def_rpr, style["size"], style["bold"], style["color"])
+
+    return prs
+
+
+# ============================================================================
+# 테마 슬롯 참조 헬퍼
+# ============================================================================
+
+def theme_color(color):
+    """
+    RGBColor 또는 팔레트 슬롯 이름 → MSO_THEME_COLOR
+
+    팔레트에 없는 색이면 None (호출자가 RGB로 기록)
+    """
+    if color is None:
+        return None
+    if isinstance(color, str):
+        slot = color
+    else:
+        slot = _RGB_TO_SLOT.get(str(RGBColor(*color)).upper())
+    return _SLOT_THEME_COLOR.get(slot)
+
+
+def _apply_color(color_format, color):
+    """ColorFormat에 테마 슬롯 우선으로 색상 지정"""
+    slot_color = theme_color(color)
+    if slot_color is not None:
+        color_format.theme_color = slot_color
+    else:
+        color_format.rgb = color
+
+
+def set_fill(shape, color):
+    """Shape 채우기를 테마 슬롯으로 지정 (None이면 채우기 없음)"""
+    if color is None:
+        shape.fill.background()
+        return shape
+    shape.fill.solid()
+    _apply_color(shape.fill.fore_color, color)
+    return shape
+
+
+def set_line(shape, color, width=None):
+    """Shape 테두리를 테마 슬롯으로 지정 (None이면 테두리 없음)"""
+    if color is None:
+        shape.line.fill.background()
+        return shape
+    _apply_color(shape.line.color, color)
+    if width is not None:
+        shape.line.width = width if not isinstance(width, (int, float)) else Pt(width)
+    return shape
+
+
+def apply_text_style(text_frame, style, alignment=None,
+                     vertical_anchor=MSO_ANCHOR.TOP, word_wrap=True, color=None):
+    """
+    텍스트 프레임의 모든 run에 이름 있는 스타일 적용
+
+    크기/볼드만 run에 기록하고 폰트 이름은 테마 폰트에서 상속합니다.
+    색상은 스타일 색상이 텍스트 박스 기본값(DARK_GRAY)과 같으면 생략하고,
+    다르거나 autoshape(p:style 보유)이면 schemeClr로 기록합니다.
+
+    Args:
+        text_frame: TextFrame 객체
+        style: TEXT_STYLES 키 ("title", "governing", "heading", "body", "bullet", "caption")
+        alignment: PP_ALIGN 상수
+        vertical_anchor: MSO_ANCHOR 상수
+        word_wrap: 자동 줄바꿈
+        color: 스타일 색상 대신 사용할 RGBColor 또는 슬롯 이름
+
+    Returns:
+        int: 설정된 run 개수
+    """
+    if style not in TEXT_STYLES:
+        raise ValueError(f"❌ 알 수 없는 텍스트 스타일: {style} "
+                         f"(사용 가능: {', '.join(TEXT_STYLES)})")
+
+    spec = TEXT_STYLES[style]
+    color = color if color is not None else spec["color"]
+    # autoshape는 p:style의 fontRef 색상(lt1)을 상속하므로 항상 색상 기록
+    sp = text_frame._txBody.getparent()
+    has_shape_style = sp is not None and sp.find(qn("p:style")) is not None
+    write_color = has_shape_style or theme_color(color) != _SLOT_THEME_COLOR[DEFAULT_TEXT_SLOT]
+
+    text_frame.word_wrap = word_wrap
+    text_frame.vertical_anchor = vertical_anchor
+
+    run_count = 0
+    for para in text_frame.paragraphs:
+        if alignment:
+            para.alignment = alignment
+        for run in para.runs:
+            run.font.size = spec["size"]
+            run.font.bold = spec["bold"]
+            if write_color:
+                _apply_color(run.font.color, color)
+            run_count += 1
+
+    return run_count
+
+
+def create_text_with_style(shape, text, style, alignment=None,
+                           vertical_anchor=MSO_ANCHOR.TOP, color=None):
+    """
+    Shape에 텍스트를 추가하고 이름 있는 스타일 적용
+    (create_text_with_enforcement의 테마 버전)
+
+    Returns:
+        TextFrame: 설정된 text_frame
+    """
+    if not hasattr(shape, 'text_frame'):
+        raise ValueError("❌ Shape에 text_frame이 없습니다!")
+
+    text_frame = shape.text_frame
+    text_frame.clear()
+    text_frame.text = text
+    apply_text_style(text_frame, style, alignment, vertical_anchor, color=color)
+    return text_frame
+
+
+if __name__ == "__main__":
+    print(__doc__)
+    print("테마 슬롯:")
+    for slot, (const_name, hex_value) in THEME_PALETTE.items():
+        print(f"   {slot:9s} #{hex_value}  {const_name}")
+    print("\n텍스트 스타일:")
+    for style_name, spec in TEXT_STYLES.items():
+        print(f"   {style_name:10s} {spec['size'].pt:.0f}pt bold={spec['bold']} color={spec['color']}")
@@ -0,0 +1,500 @@
+#!/usr/bin/env python3
+"""
+PPTX Raw-XML Scanner - python-pptx 객체 모델 없이 슬라이드 XML을 직접 스트리밍
+deck_analysis.analyze_deck와 같은 DeckFacts(열 지향 팩트 테이블)를 만들되,
+zip에서 ppt/slides/slideN.xml을 lxml.etree.iterparse로 흘려 읽으며 필요한 값만 추출
+
+- 읽기 전용: python-pptx의 font.color / text_frame 접근처럼 XML을 바꾸는 부작용 없음
+- 추출: a:rPr sz/b + a:latin, a:solidFill/a:srgbClr|schemeClr, a:off/a:ext (+ 그룹 chOff/chExt), cNvPr name, ph, txBox
+- schemeClr: slide → layout → master의 clrMap + theme (ppt/theme/themeN.xml)으로 해석 (마스터별 캐시)
+- 슬라이드 순서: presentation.xml의 sldIdLst (파일명 순서 아님)
+- shape_type / 좌표는 python-pptx와 동일한 규칙 (placeholder는 layout → master 상속)
+
+병렬 스캔 (scan_deck_parallel): 슬라이드를 XML 크기 기준 연속 구간으로 나눠 프로세스별로
+패키지를 읽기 전용으로 열고 자기 구간의 slide part만 파싱 → 순서대로 병합 (결과는 scan_deck과 동일)
+
+Usage:
+    from pptx_xml_scan import scan_deck, scan_deck_parallel
+
+    facts = scan_deck("deck.pptx")        # DeckFacts
+    facts.font_size_distribution()
+    facts = scan_deck_parallel("deck.pptx", workers=4)
+
+    python3 pptx_xml_scan.py deck.pptx    # python-pptx 순회와 시간/결과 비교
+"""
+
+import os
+import posixpath
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+from deck_analysis import DeckFacts, solid_fill_rgb, theme_colors
+
+# ============================================================================
+# 네임스페이스 / 태그
+# ============================================================================
+NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+NS_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+NS_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+RT_SLIDE_LAYOUT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
+RT_SLIDE_MASTER = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideMaster"
+RT_THEME = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/theme"
+
+GRAPHIC_DATA_URI_CHART = "http://schemas.openxmlformats.org/drawingml/2006/chart"
+GRAPHIC_DATA_URI_TABLE = "http://schemas.openxmlformats.org/drawingml/2006/table"
+GRAPHIC_DATA_URI_OLEOBJ = "http://schemas.openxmlformats.org/presentationml/2006/ole"
+
+
+def _a(tag):
+    return f"{{{NS_A}}}{tag}"
+
+
+def _p(tag):
+    return f"{{{NS_P}}}{tag}"
+
+
+SP, GRP_SP, GRAPHIC_FRAME, CXN_SP, PIC, CONTENT_PART = (
+    _p("sp"), _p("grpSp"), _p("graphicFrame"), _p("cxnSp"), _p("pic"), _p("contentPart"))
+SP_TREE = _p("spTree")
+SHAPE_TAGS = {SP, GRP_SP, GRAPHIC_FRAME, CXN_SP, PIC, CONTENT_PART}
+CONTAINER_TAGS = {SP_TREE, GRP_SP}
+# iterparse 이벤트는 C 레벨에서 이 태그들로만 제한 (path/run 등 하위 요소는 이벤트 없음)
+_EVENT_TAGS = sorted(SHAPE_TAGS | {SP_TREE})
+
+# layout placeholder → master placeholder 타입 (python-pptx LayoutPlaceholder와 동일)
+BASE_PH_TYPE = {
+    "body": "body", "chart": "body", "clipArt": "body", "ctrTitle": "title", "dgm": "body",
+    "dt": "dt", "ftr": "ftr", "media": "body", "obj": "body", "pic": "body",
+    "sldNum": "sldNum", "subTitle": "body", "tbl": "body", "title": "title",
+}
+# 상속 좌표를 쓰는 slide placeholder (PlaceholderGraphicFrame 제외)
+INHERITING_TAGS = {SP, PIC}
+
+_NV_TAGS = (_p("nvSpPr"), _p("nvGrpSpPr"), _p("nvGraphicFramePr"), _p("nvCxnSpPr"), _p("nvPicPr"))
+
+
+# ============================================================================
+# 패키지 탐색 (rels)
+# ============================================================================
+
+def _rels_path(part_name):
+    directory, filename = posixpath.split(part_name)
+    return posixpath.join(directory, "_rels", filename + ".rels")
+
+
+def _read_rels(archive, part_name):
+    """{rId: (type, 절대 part 이름)}"""
+    try:
+        root = etree.fromstring(archive.read(_rels_path(part_name)))
+    except KeyError:
+        return {}
+    base = posixpath.dirname(part_name)
+    rels = {}
+    for rel in root.iter(f"{{{NS_REL}}}Relationship"):
+        if rel.get("TargetMode") == "External":
+            continue
+        target = rel.get("Target")
+        target = target[1:] if target.startswith("/") else posixpath.normpath(posixpath.join(base, target))
+        rels[rel.get("Id")] = (rel.get("Type"), target)
+    return rels
+
+
+def _rel_target(rels, rel_type):
+    for rtype, target in rels.values():
+        if rtype == rel_type:
+            return target
+    return None
+
+
+# ============================================================================
+# shape 속성 추출 (요소가 완성된 end 이벤트에서 호출)
+# ============================================================================
+
+def _nv_pr(elem):
+    """(cNvPr, nvPr) - 비시각 속성"""
+    for child in elem:
+        if child.tag in _NV_TAGS:
+            return child.find(_p("cNvPr")), child.find(_p("nvPr"))
+    return None, None
+
+
+def _ph(elem):
+    """p:ph 요소 또는 None"""
+    _, nv_pr = _nv_pr(elem)
+    return nv_pr.find(_p("ph")) if nv_pr is not None else None
+
+
+def _xfrm(elem):
+    """(off, ext) 요소 - 태그별 xfrm 위치"""
+    tag = elem.tag
+    if tag == GRAPHIC_FRAME:
+        xfrm = elem.find(_p("xfrm"))
+    elif tag == GRP_SP:
+        grp_sp_pr = elem.find(_p("grpSpPr"))
+        xfrm = grp_sp_pr.find(_a("xfrm")) if grp_sp_pr is not None else None
+    else:
+        sp_pr = elem.find(_p("spPr"))
+        xfrm = sp_pr.find(_a("xfrm")) if sp_pr is not None else None
+    if xfrm is None:
+        return None, None
+    return xfrm.find(_a("off")), xfrm.find(_a("ext"))
+
+
+def _geometry(elem):
+    """[left, top, width, height] (없는 값은 None)"""
+    off, ext = _xfrm(elem)
+    return [
+        int(off.get("x")) if off is not None else None,
+        int(off.get("y")) if off is not None else None,
+        int(ext.get("cx")) if ext is not None else None,
+        int(ext.get("cy")) if ext is not None else None,
+    ]
+
+
+def _child_frame(grp_sp_pr):
+    """그룹 자식 좌표계 (chOff x/y, chExt cx/cy) 또는 None"""
+    xfrm = grp_sp_pr.find(_a("xfrm")) if grp_sp_pr is not None else None
+    if xfrm is None:
+        return None
+    ch_off, ch_ext = xfrm.find(_a("chOff")), xfrm.find(_a("chExt"))
+    if ch_off is None or ch_ext is None:
+        return None
+    return (int(ch_off.get("x")), int(ch_off.get("y")), int(ch_ext.get("cx")), int(ch_ext.get("cy")))
+
+
+def _shape_type(elem, ph):
+    tag = elem.tag
+    if tag == PIC:
+        if ph is not None:
+            return MSO_SHAPE_TYPE.PLACEHOLDER
+        _, nv_pr = _nv_pr(elem)
+        if nv_pr is not None and nv_pr.find(_a("videoFile")) is not None:
+            return MSO_SHAPE_TYPE.MEDIA
+        return MSO_SHAPE_TYPE.PICTURE
+    if tag == SP:
+        if ph is not None:
+            return MSO_SHAPE_TYPE.PLACEHOLDER
+        sp_pr = elem.find(_p("spPr"))
+        if sp_pr is not None and sp_pr.find(_a("custGeom")) is not None:
+            return MSO_SHAPE_TYPE.FREEFORM
+        c_nv_sp_pr = elem.find(f"{_p('nvSpPr')}/{_p('cNvSpPr')}")
+        is_textbox = c_nv_sp_pr is not None and c_nv_sp_pr.get("txBox") in ("1", "true")
+        if sp_pr is not None and sp_pr.find(_a("prstGeom")) is not None and not is_textbox:
+            return MSO_SHAPE_TYPE.AUTO_SHAPE
+        if is_textbox:
+            return MSO_SHAPE_TYPE.TEXT_BOX
+        return None
+    if tag == GRP_SP:
+        return MSO_SHAPE_TYPE.GROUP
+    if tag == CXN_SP:
+        return MSO_SHAPE_TYPE.LINE
+    if tag == GRAPHIC_FRAME:
+        graphic_data = elem.find(f"{_a('graphic')}/{_a('graphicData')}")
+        uri = graphic_data.get("uri") if graphic_data is not None else None
+        if uri == GRAPHIC_DATA_URI_CHART:
+            return MSO_SHAPE_TYPE.CHART
+        if uri == GRAPHIC_DATA_URI_TABLE:
+            return MSO_SHAPE_TYPE.TABLE
+        if uri == GRAPHIC_DATA_URI_OLEOBJ:
+            embedded = graphic_data.find(f".//{_p('oleObj')}/{_p('embed')}")
+            return MSO_SHAPE_TYPE.EMBEDDED_OLE_OBJECT if embedded is not None \
+                else MSO_SHAPE_TYPE.LINKED_OLE_OBJECT
+        return None
+    return None
+
+
+def _bold(r_pr):
+    value = r_pr.get("b") if r_pr is not None else None
+    if value in ("1", "true"):
+        return True
+    if value in ("0", "false"):
+        return False
+    return None
+
+
+def _paragraph_text(p):
+    parts = []
+    for child in p:
+        if child.tag in (_a("r"), _a("fld")):
+            t = child.find(_a("t"))
+            parts.append((t.text or "") if t is not None else "")
+        elif child.tag == _a("br"):
+            parts.append("\v")
+    return "".join(parts)
+
+
+# ============================================================================
+# placeholder 좌표 상속 (layout idx → master type)
+# ============================================================================
+
+class _PlaceholderResolver:
+    """slide placeholder의 비어있는 좌표를 layout/master placeholder에서 찾음 (part별 캐시)
+    + layout의 마스터 테마 색 (schemeClr 해석용)"""
+
+    def __init__(self, archive):
+        self.archive = archive
+        self._layouts = {}
+        self._themes = {}
+
+    def _placeholders(self, part_name):
+        if part_name not in self._layouts:
+            root = etree.fromstring(self.archive.read(part_name))
+            sp_tree = root.find(f"{_p('cSld')}/{_p('spTree')}")
+            entries = []
+            for elem in (sp_tree if sp_tree is not None else []):
+                if elem.tag not in SHAPE_TAGS:
+                    continue
+                ph = _ph(elem)
+                if ph is not None:
+                    entries.append((elem.tag, int(ph.get("idx", "0")), ph.get("type", "obj"),
+                                    _geometry(elem)))
+            master = _rel_target(_read_rels(self.archive, part_name), RT_SLIDE_MASTER)
+            self._layouts[part_name] = (entries, master)
+        return self._layouts[part_name]
+
+    def _master_geometry(self, master, ph_type):
+        if master is None:
+            return None
+        entries, _ = self._placeholders(master)
+        for _, _, master_type, geometry in entries:
+            if master_type == ph_type:
+                return geometry
+        return None
+
+    def theme(self, layout):
+        """layout → 마스터 clrMap + 테마의 theme_colors (마스터별 캐시)"""
+        _, master = self._placeholders(layout)
+        if master is None:
+            return {}
+        if master not in self._themes:
+            root = etree.fromstring(self.archive.read(master))
+            clr_map = root.find(_p("clrMap"))
+            theme = _rel_target(_read_rels(self.archive, master), RT_THEME)
+            self._themes[master] = theme_colors(
+                etree.fromstring(self.archive.read(theme)) if theme else None,
+                dict(clr_map.attrib) if clr_map is not None else None)
+        return self._themes[master]
+
+    def inherited(self, layout, idx):
+        """layout placeholder(idx)의 유효 좌표"""
+        entries, master = self._placeholders(layout)
+        for tag, ph_idx, ph_type, geometry in entries:
+            if ph_idx != idx:
+                continue
+            if tag != SP:
+                return geometry
+            base = self._master_geometry(master, BASE_PH_TYPE.get(ph_type)) or [None] * 4
+            return [value if value is not None else base[i] for i, value in enumerate(geometry)]
+        return [None] * 4
+
+
+# ============================================================================
+# 슬라이드 스트리밍
+# ============================================================================
+
+def _scan_slide(facts, archive, resolver, slide_number, part_name):
+    layout = _rel_target(_read_rels(archive, part_name), RT_SLIDE_LAYOUT)
+    theme = resolver.theme(layout) if layout else {}
+    stack = []        # [(row, child counter)] - 열린 컨테이너(spTree/grpSp)
+    top_level = 0
+    shapes = facts.shapes
+
+    with archive.open(part_name) as stream:
+        for event, elem in etree.iterparse(stream, events=("start", "end"), tag=_EVENT_TAGS):
+            tag = elem.tag
+            if event == "start":
+                if tag == SP_TREE and not stack:
+                    stack.append([None, 0])
+                elif tag in SHAPE_TAGS and stack and elem.getparent() is not None \
+                        and elem.getparent().tag in CONTAINER_TAGS:
+                    parent_row, index = stack[-1]
+                    stack[-1][1] += 1
+                    depth = len(stack) - 1
+                    if depth == 0:
+                        top_level += 1
+                    row = len(shapes)
+                    # 행 순서는 python-pptx와 같은 전위 순회 - 값은 end 이벤트에서 채움
+                    shapes.append(slide=slide_number, index=index, depth=depth, parent=parent_row)
+                    elem.set("_scan_row", str(row))
+                    if tag == GRP_SP:
+                        stack.append([row, 0])
+                continue
+
+            row_attr = elem.get("_scan_row")
+            if row_attr is None:
+                if tag == SP_TREE:
+                    break
+                continue
+
+            row = int(row_attr)
+            depth = shapes["depth"][row]
+            ph = _ph(elem)
+            c_nv_pr, _ = _nv_pr(elem)
+            shape_type = _shape_type(elem, ph)
+            geometry = _geometry(elem)
+            if ph is not None and tag in INHERITING_TAGS and None in geometry and layout:
+                base = resolver.inherited(layout, int(ph.get("idx", "0")))
+                geometry = [value if value is not None else base[i] for i, value in enumerate(geometry)]
+
+            text = ""
+            has_text_frame = tag == SP
+            if has_text_frame:
+                tx_body = elem.find(_p("txBody"))
+                if tx_body is not None:
+                    paragraphs = tx_body.findall(_a("p"))
+                    text = "\n".join(_paragraph_text(p) for p in paragraphs)
+                    for para_index, p in enumerate(paragraphs):
+                        for r in p.iterchildren(_a("r")):
+                            r_pr = r.find(_a("rPr"))
+                            t = r.find(_a("t"))
+                            sz = r_pr.get("sz") if r_pr is not None else None
+                            latin = r_pr.find(_a("latin")) if r_pr is not None else None
+                            facts.runs.append(
+                                slide=slide_number, shape=row, depth=depth, paragraph=para_index,
+                                text=(t.text or "") if t is not None else "",
+                                size_pt=int(sz) * 127 / 12700 if sz is not None else None,
+                                font_name=latin.get("typeface") if latin is not None else None,
+                                bold=_bold(r_pr), color_rgb=solid_fill_rgb(r_pr, theme),
+                            )
+
+            fill_rgb = child_frame = None
+            if shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE:
+                fill_rgb = solid_fill_rgb(elem.find(_p("spPr")), theme)
+            elif tag == GRP_SP:
+                child_frame = _child_frame(elem.find(_p("grpSpPr")))
+
+            for name, value in (("shape_type", shape_type),
+                                ("name", c_nv_pr.get("name") if c_nv_pr is not None else ""),
+                                ("left", geometry[0]), ("top", geometry[1]),
+                                ("width", geometry[2]), ("height", geometry[3]),
+                                ("has_text_frame", has_text_frame), ("text", text),
+                                ("fill_rgb", fill_rgb), ("child_frame", child_frame)):
+                shapes[name][row] = value
+
+            if tag == GRP_SP:
+                stack.pop()
+            elem.clear()
+
+    facts.slide_shape_counts.append(top_level)
+
+
+def _deck_header(archive):
+    """(slide_width, slide_height, 순서대로의 slide part 이름 리스트)"""
+    presentation = etree.fromstring(archive.read("ppt/presentation.xml"))
+    sld_sz = presentation.find(_p("sldSz"))
+    rels = _read_rels(archive, "ppt/presentation.xml")
+    sld_id_lst = presentation.find(_p("sldIdLst"))
+    slide_parts = [rels[sld_id.get(f"{{{NS_R}}}id")][1]
+                   for sld_id in (sld_id_lst if sld_id_lst is not None else [])]
+    return int(sld_sz.get("cx")), int(sld_sz.get("cy")), slide_parts
+
+
+def _scan_range(path, first=1, last=None):
+    """슬라이드 first~last(1-based, 포함)만 파싱한 DeckFacts (slide 번호는 덱 전체 기준)"""
+    start = time.perf_counter()
+    facts = DeckFacts(str(path))
+    with zipfile.ZipFile(path) as archive:
+        facts.slide_width, facts.slide_height, slide_parts = _deck_header(archive)
+        last = len(slide_parts) if last is None else last
+        resolver = _PlaceholderResolver(archive)
+        for slide_number in range(first, last + 1):
+            _scan_slide(facts, archive, resolver, slide_number, slide_parts[slide_number - 1])
+
+    facts.slide_count = len(facts.slide_shape_counts)
+    facts.elapsed = time.perf_counter() - start
+    return facts
+
+
+def scan_deck(path):
+    """PPTX 경로 → DeckFacts (zip + iterparse, python-pptx 객체 생성 없음)"""
+    return _scan_range(path)
+
+
+# ============================================================================
+# 병렬 스캔
+# ============================================================================
+
+def partition_slides(sizes, parts):
+    """슬라이드 XML 크기 리스트 → 크기 합이 비슷한 연속 구간 [(first, last)] (1-based)"""
+    parts = max(1, min(parts, len(sizes)))
+    total = sum(sizes)
+    ranges, first, acc = [], 1, 0
+    for number, size in enumerate(sizes, 1):
+        acc += size
+        if len(ranges) < parts - 1 and acc >= total * (len(ranges) + 1) / parts:
+            ranges.append((first, number))
+            first = number + 1
+    if first <= len(sizes):
+        ranges.append((first, len(sizes)))
+    return ranges
+
+
+def merge_facts(path, parts):
+    """구간별 DeckFacts를 순서대로 병합 (행 번호를 가리키는 parent/shape 컬럼은 오프셋 보정)"""
+    facts = DeckFacts(str(path))
+    for part in parts:
+        offset = len(facts.shapes)
+        facts.slide_width, facts.slide_height = part.slide_width, part.slide_height
+        if offset:
+            part.shapes.columns["parent"] = [None if row is None else row + offset
+                                             for row in part.shapes["parent"]]
+            part.runs.columns["shape"] = [row + offset for row in part.runs["shape"]]
+        facts.shapes.extend(part.shapes)
+        facts.runs.extend(part.runs)
+        facts.slide_shape_counts.extend(part.slide_shape_counts)
+    facts.slide_count = len(facts.slide_shape_counts)
+    return facts
+
+
+def scan_deck_parallel(path, workers=None, min_slides=8):
+    """
+    scan_deck과 같은 DeckFacts를 프로세스 풀로 생성
+
+    각 워커는 패키지를 읽기 전용으로 열고 자기 구간의 slide part만 파싱.
+    workers가 1이거나 슬라이드가 min_slides 미만이면 그대로 직렬 스캔.
+    """
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    with zipfile.ZipFile(path) as archive:
+        _, _, slide_parts = _deck_header(archive)
+        sizes = [archive.getinfo(name).file_size for name in slide_parts]
+    if workers <= 1 or len(slide_parts) < min_slides:
+        return scan_deck(path)
+
+    ranges = partition_slides(sizes, workers)
+    with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+        parts = list(pool.map(_scan_range, [path] * len(ranges), *zip(*ranges)))
+    facts = merge_facts(path, parts)
+    facts.elapsed = time.perf_counter() - start
+    return facts
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python3 pptx_xml_scan.py <pptx_file>")
+        sys.exit(1)
+
+    from deck_analysis import analyze_deck
+
+    path = sys.argv[1]
+    fast = scan_deck(path)
+    slow = analyze_deck(path)
+    same = (fast.slide_shape_counts == slow.slide_shape_counts
+            and fast.shapes.columns == slow.shapes.columns
+            and fast.runs.columns == slow.runs.columns)
+
+    print("=" * 80)
+    print(f"Raw-XML scan: {path}")
+    print("=" * 80)
+    print(f"  Slides: {fast.slide_count}, Shapes: {len(fast.shapes)}, Runs: {len(fast.runs)}")
+    print(f"  XML scan:       {fast.elapsed * 1000:8.1f} ms")
+    print(f"  python-pptx:    {slow.elapsed * 1000:8.1f} ms  ({slow.elapsed / fast.elapsed:.1f}x)")
+    print(f"  Facts identical: {'✅' if same else '❌'}")
+    print("=" * 80)
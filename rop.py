@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+ROP / Safety Stock Engine - 4회차 "병목자재 전략 & ROP" 계산을 품목 배열 단위로 한 번에
+4회차 공식:
+- 평균 LT 수요 = 평균 일일 수요 × 평균 리드타임
+- 안전재고 = Z × √(σ_수요² × LT + 평균수요² × σ_LT²)   (σ_LT = 0이면 단순 방법 Z × σ_수요 × √LT)
+- ROP = 평균 LT 수요 + 안전재고
+- Z: 교재 표 값 (90% 1.28, 95% 1.65, 97% 1.88, 99% 2.33), 표에 없는 수준은 정규분포 역함수
+- 병목자재 XYZ 세분화: X 95% / Y 97% / Z 99%
+
+compute_rop는 NumPy 배열 연산만 사용 (품목 루프 없음) → 1M SKU도 한 번에 계산
+CSV는 scm_data 청크 단위로 읽고 결과를 청크마다 이어 써서 메모리는 청크 크기만큼만 사용
+
+입력 CSV 열:
+- 필수: sku, demand_mean, demand_std, lead_time (일 단위, 수요도 일 단위)
+- 선택: lead_time_std, unit_price, service_level, xyz
+  · service_level 열 > xyz 열 > CV(demand_std ÷ demand_mean)로 판정한 XYZ 순으로 서비스 수준 결정
+
+Usage:
+    from rop import compute_rop, add_rop_exercise_slides
+
+    result = compute_rop(833, 150, 150, lead_time_std=20, service_level=0.95)
+    result["safety_stock"]   # 27,656
+
+    python3 rop.py                              # MCU 칩 실습 검산 + 1M SKU 벤치마크
+    python3 rop.py items.csv [rop_out.csv]      # CSV 일괄 계산
+    python3 rop.py --slides rop_exercise.pptx   # 실습 슬라이드 생성
+"""
+
+import os
+import sys
+import time
+from statistics import NormalDist
+
+import numpy as np
+
+from abc_xyz import XYZ_LABELS, xyz_classes
+from scm_data import DEFAULT_CHUNK_SIZE, format_pct, format_won, iter_csv_chunks, read_header, write_csv_columns
+
+# 교재 Z-값 표 (소수 둘째 자리) - 같은 수준이면 슬라이드 숫자가 교재와 일치
+SERVICE_LEVEL_Z = {0.80: 0.84, 0.85: 1.04, 0.90: 1.28, 0.95: 1.65, 0.97: 1.88, 0.98: 2.05, 0.99: 2.33}
+XYZ_SERVICE_LEVELS = {"X": 0.95, "Y": 0.97, "Z": 0.99}   # 병목자재 XYZ 세분화 (BX/BY/BZ)
+DEFAULT_SERVICE_LEVEL = 0.95
+DEFAULT_HOLDING_RATE = 0.25   # 연간 재고 보유 비용률
+# 결과 CSV: 수량/금액 열은 소수 2자리, 서비스 수준/Z는 반올림하지 않음 (0.999 → "1.00" 방지)
+RATIO_FORMATS = {"service_level": "{:.6g}", "z": "{:.6g}"}
+
+# 4회차 실습: H전자 BN-006 MCU 칩
+MCU_EXAMPLE = {
+    "name": "BN-006 MCU 칩",
+    "demand_mean": 833,      # 개/일
+    "demand_std": 150,
+    "lead_time": 150,        # 일
+    "lead_time_std": 20,
+    "unit_price": 10_000,    # 원/개
+}
+LEAD_TIME_SCENARIOS = (
+    ("현행", 150, 20),
+    ("LT 단축", 120, 15),
+    ("LT 안정화", 150, 10),
+    ("LT 단축+안정화", 120, 10),
+)
+
+
+# ============================================================================
+# 계산
+# ============================================================================
+
+def z_score(service_level):
+    """서비스 수준 → Z (교재 표 우선, 없으면 정규분포 역함수)"""
+    level = round(float(service_level), 4)
+    if level in SERVICE_LEVEL_Z:
+        return SERVICE_LEVEL_Z[level]
+    if not 0.0 < level < 1.0:
+        raise ValueError(f"서비스 수준은 0과 1 사이여야 함: {service_level}")
+    return NormalDist().inv_cdf(level)
+
+
+def z_scores(service_levels):
+    """서비스 수준 배열 → Z 배열 (서로 다른 수준마다 한 번만 계산)"""
+    levels = np.asarray(service_levels, dtype=np.float64)
+    unique, inverse = np.unique(np.round(levels, 4), return_inverse=True)
+    return np.array([z_score(level) for level in unique])[inverse].reshape(levels.shape)
+
+
+def xyz_service_levels(xyz, levels=XYZ_SERVICE_LEVELS, default=DEFAULT_SERVICE_LEVEL):
+    """XYZ 코드 배열 ("X"/"Y"/"Z" 또는 0/1/2) → 서비스 수준 배열"""
+    xyz = np.asarray(xyz)
+    if xyz.dtype.kind in "iu":
+        xyz = np.array(XYZ_LABELS)[xyz]
+    out = np.full(xyz.shape, default, dtype=np.float64)
+    for code, level in levels.items():
+        out[xyz == code] = level
+    return out
+
+
+def compute_rop(demand_mean, demand_std, lead_time, lead_time_std=0.0, service_level=DEFAULT_SERVICE_LEVEL,
+                unit_price=None, holding_rate=DEFAULT_HOLDING_RATE):
+    """
+    ROP / 안전재고 (스칼라 또는 같은 길이 배열, 브로드캐스팅 가능)
+
+    Returns:
+        {"z", "lead_time_demand", "safety_stock", "rop"}
+        + unit_price가 있으면 {"safety_stock_value", "holding_cost"} (안전재고 금액, 연간 보유비용)
+    """
+    demand_mean = np.asarray(demand_mean, dtype=np.float64)
+    demand_std = np.asarray(demand_std, dtype=np.float64)
+    lead_time = np.asarray(lead_time, dtype=np.float64)
+    lead_time_std = np.asarray(lead_time_std, dtype=np.float64)
+    z = z_scores(service_level)
+
+    # σ_수요² × LT + 평균수요² × σ_LT² 를 한 버퍼에서 계산 (1M 행에서 임시 배열 최소화)
+    shape = np.broadcast_shapes(demand_mean.shape, demand_std.shape, lead_time.shape,
+                                lead_time_std.shape, z.shape)
+    safety = np.empty(shape)
+    np.multiply(np.square(demand_std), lead_time, out=safety)
+    safety += np.square(demand_mean * lead_time_std)
+    np.sqrt(safety, out=safety)
+    safety *= z
+
+    lead_time_demand = np.broadcast_to(demand_mean * lead_time, shape)
+    result = {
+        "z": np.broadcast_to(z, shape),
+        "lead_time_demand": lead_time_demand,
+        "safety_stock": safety,
+        "rop": lead_time_demand + safety,
+    }
+    if unit_price is not None:
+        value = safety * np.asarray(unit_price, dtype=np.float64)
+        result["safety_stock_value"] = value
+        result["holding_cost"] = value * holding_rate
+    return result
+
+
+def rop_csv(path, output=None, chunk_size=DEFAULT_CHUNK_SIZE, service_level=None,
+            holding_rate=DEFAULT_HOLDING_RATE):
+    """
+    CSV 일괄 계산 (입력 열은 모듈 설명 참고)
+
+    Args:
+        output: 결과 CSV 경로 (None이면 합계만 반환)
+        service_level: 지정하면 모든 품목에 일괄 적용 (열/XYZ 무시)
+
+    Returns:
+        {"count", "safety_stock_value", "holding_cost", "service_levels": {수준: 품목 수}}
+    """
+    header = read_header(path)
+    optional = [name for name in ("lead_time_std", "unit_price", "service_level") if name in header]
+    columns = ["sku", "demand_mean", "demand_std", "lead_time"] + optional
+    text_columns = ("sku",)
+    if "xyz" in header:
+        columns.append("xyz")
+        text_columns += ("xyz",)
+
+    summary = {"count": 0, "safety_stock_value": 0.0, "holding_cost": 0.0, "service_levels": {}}
+    for number, chunk in enumerate(iter_csv_chunks(path, chunk_size, text_columns=text_columns, columns=columns)):
+        mean = np.nan_to_num(chunk["demand_mean"])
+        std = np.nan_to_num(chunk["demand_std"])
+        if service_level is not None:
+            levels = np.full(len(mean), service_level)
+        elif "service_level" in chunk:
+            levels = np.where(np.isnan(chunk["service_level"]), DEFAULT_SERVICE_LEVEL, chunk["service_level"])
+        elif "xyz" in chunk:
+            levels = xyz_service_levels(np.char.upper(np.char.strip(chunk["xyz"])))
+        else:
+            cv = np.full(len(mean), np.inf)
+            np.divide(std, mean, out=cv, where=mean > 0)
+            levels = xyz_service_levels(xyz_classes(cv))
+
+        result = compute_rop(mean, std, np.nan_to_num(chunk["lead_time"]),
+                             np.nan_to_num(chunk.get("lead_time_std", 0.0)), levels,
+                             chunk.get("unit_price"), holding_rate)
+
+        summary["count"] += len(mean)
+        if "safety_stock_value" in result:
+            summary["safety_stock_value"] += float(np.nansum(result["safety_stock_value"]))
+            summary["holding_cost"] += float(np.nansum(result["holding_cost"]))
+        unique, counts = np.unique(levels, return_counts=True)
+        for level, count in zip(unique.tolist(), counts.tolist()):
+            summary["service_levels"][level] = summary["service_levels"].get(level, 0) + count
+
+        if output:
+            out = {"sku": chunk["sku"], "service_level": levels}
+            out.update({name: result[name] for name in ("z", "lead_time_demand", "safety_stock", "rop")})
+            if "safety_stock_value" in result:
+                out["safety_stock_value"] = result["safety_stock_value"]
+            write_csv_columns(output, out, chunk_size, float_format="{:.2f}", append=number > 0,
+                              float_formats=RATIO_FORMATS)
+    return summary
+
+
+# ============================================================================
+# 실습 슬라이드
+# ============================================================================
+
+def add_rop_exercise_slides(prs, item=MCU_EXAMPLE, service_levels=(0.90, 0.95, 0.99),
+                            scenarios=LEAD_TIME_SCENARIOS, holding_rate=DEFAULT_HOLDING_RATE, slide_num=None):
+    """
+    4회차 실습 슬라이드 2장 (숫자는 모두 compute_rop 결과)
+    1) 계산 풀이: LT 수요 → 안전재고(단순/고급) → ROP
+    2) 서비스 수준별 비교 + 리드타임 개선 시나리오 표
+
+    Returns:
+        [풀이 슬라이드, 비교 슬라이드]
+    """
+    from pptx_layout import content_frame
+    from scm_slides import add_content_slide, add_data_table, add_step_boxes
+
+    d, sd, lt, lt_sd, price = (item[key] for key in
+                               ("demand_mean", "demand_std", "lead_time", "lead_time_std", "unit_price"))
+    base_level = DEFAULT_SERVICE_LEVEL
+    simple = compute_rop(d, sd, lt, 0.0, base_level)
+    full = compute_rop(d, sd, lt, lt_sd, base_level, price, holding_rate)
+    z = float(full["z"])
+    ss_simple, ss, rop = float(simple["safety_stock"]), float(full["safety_stock"]), float(full["rop"])
+
+    name = item["name"]
+    first = add_content_slide(
+        prs, f"ROP 실습: {name} 재발주점 계산",
+        f"리드타임 변동(σ_LT={lt_sd:g}일)을 반영하면 안전재고가 {ss / ss_simple:.1f}배 "
+        f"- 재고가 {rop:,.0f}개 이하로 떨어지면 즉시 발주", slide_num)
+    add_step_boxes(first, [
+        ("Step 1\n평균 LT 수요", f"평균 일일 수요 × 평균 리드타임 = {d:,}개/일 × {lt:g}일 = {d * lt:,.0f}개"),
+        ("Step 2a\n안전재고 (단순)", f"Z × σ_수요 × √LT = {z:.2f} × {sd:,} × √{lt:g}\n"
+                                  f"= {z:.2f} × {sd:,} × {np.sqrt(lt):.2f} = {ss_simple:,.0f}개 (수요 변동만)"),
+        ("Step 2b\n안전재고 (고급)", f"Z × √[(σ_수요² × LT) + (평균수요² × σ_LT²)]\n"
+                                  f"= {z:.2f} × √[({sd:,}² × {lt:g}) + ({d:,}² × {lt_sd:g}²)]\n"
+                                  f"= {z:.2f} × {ss / z:,.0f} = {ss:,.0f}개 (수요 + 리드타임 변동)"),
+        ("Step 3\nROP", f"평균 LT 수요 + 안전재고 = {d * lt:,.0f} + {ss:,.0f} = {rop:,.0f}개\n"
+                        f"재고 금액 {format_won(rop * price)} (단가 {price:,}원)"),
+    ])
+
+    levels = np.asarray(service_levels, dtype=np.float64)
+    by_level = compute_rop(d, sd, lt, lt_sd, levels, price, holding_rate)
+    names = [scenario[0] for scenario in scenarios]
+    lts = np.array([scenario[1] for scenario in scenarios], dtype=np.float64)
+    lt_sds = np.array([scenario[2] for scenario in scenarios], dtype=np.float64)
+    by_scenario = compute_rop(d, sd, lts, lt_sds, base_level)
+    saving = float(by_scenario["rop"][0]) - by_scenario["rop"]
+
+    low, high = by_level["holding_cost"][0], by_level["holding_cost"][-1]
+    second = add_content_slide(
+        prs, f"ROP 실습: 서비스 수준 · 리드타임 시나리오 ({name})",
+        f"서비스 수준 {format_pct(levels[0], 0)}→{format_pct(levels[-1], 0)}: 보유비용 연 "
+        f"{format_won(high - low)} 증가 / 리드타임 단축+안정화: ROP {format_pct(saving.max() / by_scenario['rop'][0], 0)} 감소",
+        None if slide_num is None else slide_num + 1)
+
+    frame = content_frame()
+    top = add_data_table(second, ["서비스 수준", "Z-값", "안전재고", "ROP", "연간 보유비용"], [
+        [format_pct(level, 0), f"{zv:.2f}", f"{s:,.0f}개", f"{r:,.0f}개", format_won(cost)]
+        for level, zv, s, r, cost in zip(levels, by_level["z"], by_level["safety_stock"], by_level["rop"],
+                                         by_level["holding_cost"])
+    ], frame=frame, highlight_rows=[i for i, level in enumerate(levels) if np.isclose(level, base_level)])
+
+    add_data_table(second, ["시나리오", "평균 LT", "LT 표준편차", "안전재고", "ROP", "재고 절감"], [
+        [label, f"{l:g}일", f"{s:g}일", f"{ssv:,.0f}개", f"{r:,.0f}개",
+         "-" if i == 0 else f"{cut:,.0f}개 ({format_pct(cut / by_scenario['rop'][0], 0)})"]
+        for i, (label, l, s, ssv, r, cut) in enumerate(zip(names, lts, lt_sds, by_scenario["safety_stock"],
+                                                           by_scenario["rop"], saving))
+    ], frame=frame.inset(top=top.bottom - frame.y + 0.30))
+    return [first, second]
+
+
+def benchmark(n_skus=1_000_000, seed=4):
+    """무작위 n_skus 품목 compute_rop 시간 (초)"""
+    rng = np.random.default_rng(seed)
+    mean = rng.lognormal(3.0, 1.2, n_skus)
+    std = mean * rng.gamma(2.0, 0.2, n_skus)
+    lead_time = rng.integers(7, 180, n_skus).astype(np.float64)
+    lead_time_std = lead_time * rng.uniform(0.0, 0.2, n_skus)
+    levels = xyz_service_levels(xyz_classes(std / mean))
+    price = rng.lognormal(9.0, 1.2, n_skus)
+
+    start = time.perf_counter()
+    result = compute_rop(mean, std, lead_time, lead_time_std, levels, price)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--slides":
+        from generate_part1_pptx_v2 import create_presentation
+        prs = create_presentation()
+        add_rop_exercise_slides(prs)
+        prs.save(sys.argv[2])
+        print(f"Saved: {sys.argv[2]}")
+        sys.exit(0)
+
+    print("=" * 80)
+    if len(sys.argv) > 1:
+        output = sys.argv[2] if len(sys.argv) > 2 else None
+        start = time.perf_counter()
+        summary = rop_csv(sys.argv[1], output)
+        print(f"ROP: {sys.argv[1]} → {output or '(합계만)'} ({time.perf_counter() - start:.2f}s)")
+        print(f"  {summary['count']:,}개 품목, 안전재고 금액 {format_won(summary['safety_stock_value'])}, "
+              f"연간 보유비용 {format_won(summary['holding_cost'])}")
+        for level, count in sorted(summary["service_levels"].items()):
+            print(f"  서비스 수준 {format_pct(level, 0)}: {count:,}개")
+    else:
+        example = compute_rop(MCU_EXAMPLE["demand_mean"], MCU_EXAMPLE["demand_std"], MCU_EXAMPLE["lead_time"],
+                              MCU_EXAMPLE["lead_time_std"], [0.90, 0.95, 0.99])
+        print(f"{MCU_EXAMPLE['name']} (4회차 실습)")
+        for level, ss, rop in zip((0.90, 0.95, 0.99), example["safety_stock"], example["rop"]):
+            print(f"  {format_pct(level, 0)}: 안전재고 {ss:,.0f}개, ROP {rop:,.0f}개")
+
+        n_skus = int(os.environ.get("ROP_BENCH_SKUS", 1_000_000))
+        elapsed, result = benchmark(n_skus)
+        print(f"벤치마크: {n_skus:,} SKU {elapsed * 1000:.0f} ms "
+              f"(안전재고 금액 {format_won(result['safety_stock_value'].sum())})")
+    print("=" * 80)
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+SCM Data I/O - 실습용 자재/공급 데이터의 청크 단위 CSV 읽기/쓰기 + 금액 표기
+회차별 계산 엔진(ABC-XYZ, ROP 등)이 수만~수백만 행 CSV를 한 번에 메모리에 올리지 않고
+chunk_size 행씩 열(column) 단위 NumPy 배열로 받아 벡터 연산할 수 있게 합니다.
+
+- iter_csv_chunks: {열 이름: ndarray} 청크를 순서대로 반환
+  · text_columns에 든 열은 문자열 배열, 나머지는 float64 (빈 칸 → NaN)
+  · Excel에서 저장한 UTF-8 BOM CSV도 그대로 읽음
+- iter_jsonl_chunks: JSON Lines(한 줄에 객체 하나)를 같은 {열 이름: ndarray} 청크로 (없는 키 → NaN / "")
+  · 두 함수 모두 start/end 바이트 범위만 읽을 수 있음 (이어 붙인 행만 증분으로 읽을 때)
+- complete_size: 마지막 완전한 줄(\n으로 끝남)까지의 바이트 수 - 쓰는 중인 마지막 줄은 제외
+- write_csv_columns: 같은 길이의 열 배열을 chunk_size 행씩 CSV로 기록 (append로 청크별 이어 쓰기)
+- format_won / format_pct: 슬라이드 표기 (1.2억원, 4,500만원, 33.9%)
+
+Usage:
+    from scm_data import iter_csv_chunks, format_won
+
+    for chunk in iter_csv_chunks("materials.csv", text_columns=("sku", "name")):
+        spend = chunk["unit_price"] * chunk["annual_qty"]
+"""
+
+import csv
+import json
+import os
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+
+# ============================================================================
+# CSV 청크 읽기 / 쓰기
+# ============================================================================
+
+def read_header(path):
+    """CSV 첫 행 (열 이름 리스트) - 빈 파일이면 ValueError"""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        header = next(csv.reader(f), None)
+    if header is None:
+        raise ValueError(f"{path}: 빈 CSV (헤더 없음)")
+    return header
+
+
+def complete_size(path):
+    """파일 앞에서부터 마지막 \n까지의 바이트 수 (끝의 미완성 줄 제외)"""
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        position = size
+        while position > 0:
+            step = min(1 << 16, position)
+            f.seek(position - step)
+            block = f.read(step)
+            newline = block.rfind(b"\n")
+            if newline >= 0:
+                return position - step + newline + 1
+            position -= step
+    return 0
+
+
+def _iter_lines(path, start=0, end=None):
+    """[start, end) 바이트 범위의 줄을 문자열로 (start = 0이면 UTF-8 BOM 제거, 줄 끝 유지)"""
+    with open(path, "rb") as f:
+        f.seek(start)
+        position = start
+        for line in f:
+            if end is not None and position >= end:
+                break
+            position += len(line)
+            text = line.decode("utf-8")
+            if position == len(line) and text.startswith("\ufeff"):
+                text = text[1:]
+            yield text
+
+
+def _to_float(values):
+    """문자열 열 → float64 (빈 칸/변환 불가 → NaN)"""
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        out = np.empty(len(values), dtype=np.float64)
+        for i, value in enumerate(values):
+            try:
+                out[i] = float(value)
+            except (TypeError, ValueError):
+                out[i] = np.nan
+        return out
+
+
+def iter_csv_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, text_columns=(), columns=None, start=0, end=None):
+    """
+    CSV를 chunk_size 행씩 {열 이름: ndarray}로 반환
+
+    Args:
+        text_columns: 문자열로 둘 열 (나머지는 float64)
+        columns: 읽을 열 이름 (None이면 전체) - 없는 열이면 ValueError
+        start, end: 읽을 바이트 범위 (start > 0이면 헤더는 파일 첫 행, 데이터는 start부터 - 줄 경계여야 함)
+    """
+    header = read_header(path)
+    reader = csv.reader(_iter_lines(path, start, end))
+    if start == 0:
+        next(reader, None)
+    wanted = list(columns) if columns is not None else header
+    missing = [name for name in wanted if name not in header]
+    if missing:
+        raise ValueError(f"{path}: 열 없음 {missing} (있는 열: {header})")
+    positions = [header.index(name) for name in wanted]
+
+    rows = []
+    for row in reader:
+        if not row:
+            continue
+        rows.append(row)
+        if len(rows) >= chunk_size:
+            yield _columns(rows, wanted, positions, text_columns)
+            rows = []
+    if rows:
+        yield _columns(rows, wanted, positions, text_columns)
+
+
+def iter_jsonl_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, text_columns=(), columns=None, start=0, end=None):
+    """
+    JSON Lines를 chunk_size 줄씩 {열 이름: ndarray}로 반환 (iter_csv_chunks와 같은 형식)
+
+    Args:
+        columns: 읽을 키 (None이면 첫 청크에 나온 키 전체) - 줄에 없는 키는 NaN / ""
+        start, end: 읽을 바이트 범위 (줄 경계)
+    """
+    records = []
+    for line in _iter_lines(path, start, end):
+        if not line.strip():
+            continue
+        records.append(json.loads(line))
+        if len(records) >= chunk_size:
+            columns = columns or _record_keys(records)
+            yield _record_columns(records, columns, text_columns)
+            records = []
+    if records:
+        yield _record_columns(records, columns or _record_keys(records), text_columns)
+
+
+def _record_keys(records):
+    keys = {}
+    for record in records:
+        keys.update(dict.fromkeys(record))
+    return list(keys)
+
+
+def _record_columns(records, names, text_columns):
+    chunk = {}
+    for name in names:
+        if name in text_columns:
+            chunk[name] = np.array(["" if record.get(name) is None else str(record[name]) for record in records])
+        else:
+            chunk[name] = _to_float(["" if record.get(name) is None else record[name] for record in records])
+    return chunk
+
+
+def _columns(rows, names, positions, text_columns):
+    width = max(positions) + 1
+    rows = [row if len(row) >= width else row + [""] * (width - len(row)) for row in rows]
+    transposed = list(zip(*rows))
+    chunk = {}
+    for name, position in zip(names, positions):
+        values = transposed[position]
+        chunk[name] = np.array(values) if name in text_columns else _to_float(values)
+    return chunk
+
+
+def write_csv_columns(path, columns, chunk_size=DEFAULT_CHUNK_SIZE, float_format="{:.6g}", append=False,
+                      float_formats=None):
+    """
+    {열 이름: 같은 길이의 배열}을 CSV로 기록 (chunk_size 행씩 변환/쓰기)
+    float 열은 float_format으로 문자열화 (float_formats={열 이름: 형식}이 있는 열은 그 형식)
+    append=True면 헤더 없이 기존 파일 뒤에 추가 (청크별 결과를 이어 쓸 때)
+    """
+    names = list(columns)
+    arrays = [np.asarray(columns[name]) for name in names]
+    formats = [(float_formats or {}).get(name, float_format) for name in names]
+    length = len(arrays[0]) if arrays else 0
+    with open(path, "a" if append else "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        if not append:
+            writer.writerow(names)
+        for start in range(0, length, chunk_size):
+            parts = []
+            for array, fmt in zip(arrays, formats):
+                part = array[start:start + chunk_size]
+                if part.dtype.kind == "f":
+                    parts.append([fmt.format(value) for value in part.tolist()])
+                else:
+                    parts.append(part.tolist())
+            writer.writerows(zip(*parts))
+
+
+# ============================================================================
+# 표기
+# ============================================================================
+
+def format_won(value):
+    """원화 금액 → 1.2억원 / 4,500만원 / 9,000원"""
+    value = float(value)
+    if abs(value) >= 1e8:
+        return f"{value / 1e8:,.1f}억원"
+    if abs(value) >= 1e4:
+        return f"{value / 1e4:,.0f}만원"
+    return f"{value:,.0f}원"
+
+
+def format_pct(ratio, digits=1):
+    """비율(0~1) → 33.9%"""
+    return f"{ratio * 100:.{digits}f}%"
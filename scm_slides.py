@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+SCM Slides - 계산 엔진(ROP, MRP 등) 결과를 실습 슬라이드로 그리는 공통 블록
+generate_part1_pptx_v2의 도형 헬퍼 + pptx_layout 배치를 사용하므로
+표 행 높이는 글자 측정값으로 정해지고, 본문 안전 영역을 넘으면 그리기 전에 LayoutOverflow
+
+- add_content_slide: 빈 슬라이드 + 제목 + 거버닝 메시지
+- add_data_table: 머리글 1행 + 데이터 행 표 (열별 정렬/폭, 강조 행)
+- add_step_boxes: "Step 1 | 계산식" 형태의 풀이 단계 목록
+
+Usage:
+    from scm_slides import add_content_slide, add_data_table
+
+    slide = add_content_slide(prs, "서비스 수준별 비교", "99%는 95%보다 안전재고 41% 증가")
+    add_data_table(slide, ["서비스 수준", "Z", "안전재고"], rows, align="lrr", highlight_rows=(1,))
+"""
+
+from generate_part1_pptx_v2 import (COLOR_BLACK, COLOR_DARK_GRAY, COLOR_LIGHT_GRAY, COLOR_VERY_LIGHT_GRAY,
+                                    COLOR_WHITE, add_governing_message, add_rectangle, add_slide_title,
+                                    add_text_box)
+from pptx.enum.text import PP_ALIGN
+from pptx_layout import Box, Column, Row, content_frame, solve
+
+TEXT_PADDING = (0.20, 0.10)   # add_text_box 기본 내부 여백 (좌우 합, 상하 합)
+ALIGNMENTS = {"l": PP_ALIGN.LEFT, "c": PP_ALIGN.CENTER, "r": PP_ALIGN.RIGHT}
+
+
+def add_content_slide(prs, title, governing_message, slide_num=None):
+    """빈 레이아웃 슬라이드 + 제목 + 거버닝 메시지"""
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    add_slide_title(slide, title, slide_num)
+    add_governing_message(slide, governing_message)
+    return slide
+
+
+def add_data_table(slide, header, rows, frame=None, col_widths=None, align=None, font_size=9,
+                   highlight_rows=(), min_row_height=0.30):
+    """
+    표 그리기 (행 높이 = 그 행에서 가장 긴 셀의 측정 높이)
+
+    Args:
+        header: 머리글 문자열 리스트
+        rows: 행 리스트 (셀은 str() 가능한 값)
+        frame: 배치 영역 Rect (기본: 본문 안전 영역) - 표는 위쪽부터 채움
+        col_widths: 열 폭 inches (None 항목은 남은 폭을 나눠 가짐)
+        align: 열별 "l"/"c"/"r" 문자열 (기본: 첫 열 왼쪽, 나머지 오른쪽)
+        highlight_rows: 굵게 + 회색 배경으로 강조할 데이터 행 번호
+
+    Returns:
+        Layout (셀 Box.data = {"row", "col"}, 머리글 row = -1)
+    """
+    columns = len(header)
+    col_widths = list(col_widths or [None] * columns)
+    align = align or "l" + "r" * (columns - 1)
+
+    def table_row(cells, row):
+        return Row([Box("cell", width=col_widths[col], text=str(cell), font_size=font_size,
+                        padding=TEXT_PADDING, min_height=min_row_height, data={"row": row, "col": col})
+                    for col, cell in enumerate(cells)])
+
+    layout = solve(Column([table_row(header, -1)] + [table_row(cells, i) for i, cells in enumerate(rows)]),
+                   frame=frame or content_frame())
+
+    highlight_rows = set(highlight_rows)
+    for box, rect in layout:
+        row, col = box.data["row"], box.data["col"]
+        if row < 0:
+            fill, color, bold = COLOR_DARK_GRAY, COLOR_WHITE, True
+        elif row in highlight_rows:
+            fill, color, bold = COLOR_LIGHT_GRAY, COLOR_BLACK, True
+        else:
+            fill, color, bold = (COLOR_WHITE if row % 2 == 0 else COLOR_VERY_LIGHT_GRAY), COLOR_BLACK, False
+        add_rectangle(slide, rect.x, rect.y, rect.w, rect.h, fill, border_color=COLOR_LIGHT_GRAY)
+        add_text_box(slide, rect.x, rect.y, rect.w, rect.h, box.text, font_size=font_size, bold=bold,
+                     color=color, align=PP_ALIGN.CENTER if row < 0 else ALIGNMENTS[align[col]])
+    return layout
+
+
+def add_step_boxes(slide, steps, frame=None, label_width=1.60, font_size=10, gap=0.08):
+    """
+    풀이 단계 목록 (왼쪽 진회색 단계 이름 + 오른쪽 계산식/해설)
+
+    Args:
+        steps: [(단계 이름, 본문)] - 본문 줄바꿈은 그대로 유지
+    """
+    layout = solve(Column([
+        Row([Box("label", width=label_width, text=label, font_size=font_size, padding=TEXT_PADDING),
+             Box("body", text=body, font_size=font_size, padding=TEXT_PADDING, line_spacing=1.25)])
+        for label, body in steps
+    ], gap=gap), frame=frame or content_frame())
+
+    for box, rect in layout:
+        if box.name == "label":
+            add_rectangle(slide, rect.x, rect.y, rect.w, rect.h, COLOR_DARK_GRAY)
+            add_text_box(slide, rect.x, rect.y, rect.w, rect.h, box.text, font_size=font_size, bold=True,
+                         color=COLOR_WHITE)
+        else:
+            add_rectangle(slide, rect.x, rect.y, rect.w, rect.h, COLOR_VERY_LIGHT_GRAY)
+            add_text_box(slide, rect.x, rect.y, rect.w, rect.h, box.text, font_size=font_size,
+                         color=COLOR_BLACK)
+    return layout
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""Fit text to its frame by choosing font sizes from the course hierarchy.
+
+Instead of only reporting overflow after the fact (inventory.py
+``frame_overflow_bottom``), this module computes, for every text shape, the
+largest font size that fits the shape's usable frame and writes it back.
+
+Sizes come from the quality hierarchy in pptx_quality_enforcement.py
+(caption 8pt, body 10pt, bullet 12pt, heading 14pt, governing 16pt,
+title 20pt). A shape is shifted down (or, with ``--grow``, up) by whole
+hierarchy steps, so paragraphs keep their relative sizes. The step count is
+found by binary search, because the text height only decreases as the step
+count grows.
+
+Text is measured with the same units, wrapping and line-height rules as
+inventory.py, so a shape that fits here is not reported as overflowing there.
+Word widths are sums of per-glyph advances, cached per (font file, size), so
+each candidate size costs dictionary lookups rather than repeated PIL layout
+calls. When a font file is not installed, advances are estimated
+(CJK 1em, other 0.55em).
+
+Usage:
+    python autofit.py input.pptx output.pptx                 # fit every text shape
+    python autofit.py input.pptx output.pptx --issues-only   # only shapes inventory flags
+    python autofit.py input.pptx output.pptx --grow          # also enlarge roomy text
+"""
+
+import argparse
+import re
+import sys
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from inventory import ShapeData, collect_shapes_with_absolute_positions, extract_text_inventory
+from PIL import ImageFont
+from pptx import Presentation
+from pptx.util import Length, Pt
+
+# Font hierarchy from pptx_quality_enforcement (FONT_CAPTION .. FONT_TITLE)
+FONT_HIERARCHY: Tuple[int, ...] = (8, 10, 12, 14, 16, 20)
+DEFAULT_FONT_SIZE = 14  # inventory.py default when the theme has no body size
+DPI = 96
+OVERFLOW_TOLERANCE_IN = 0.05  # Same threshold inventory.py uses to report overflow
+_P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+
+_WIDE_RE = re.compile(r"[ᄀ-ᇿ㄰-㆏가-힣一-鿿]")
+
+
+def main():
+    """Main entry point for command-line usage."""
+    parser = argparse.ArgumentParser(
+        description="Fit text to its frame using the course font-size hierarchy.",
+    )
+    parser.add_argument("input", help="Input PowerPoint file (.pptx)")
+    parser.add_argument("output", help="Output PowerPoint file (.pptx)")
+    parser.add_argument(
+        "--issues-only",
+        action="store_true",
+        help="Only shrink shapes that inventory.py flags with frame overflow",
+    )
+    parser.add_argument(
+        "--grow",
+        action="store_true",
+        help="Also enlarge text that has room, up to the largest hierarchy size",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report the fitted sizes without saving"
+    )
+    args = parser.parse_args()
+
+    input_path = Path(args.input)
+    if not input_path.exists():
+        print(f"Error: Input file not found: {args.input}")
+        sys.exit(1)
+
+    prs = Presentation(str(input_path))
+    results = autofit_presentation(
+        prs, pptx_path=input_path, issues_only=args.issues_only, allow_grow=args.grow
+    )
+
+    for result in results:
+        if result.changed or not result.fits:
+            status = "" if result.fits else "  (still overflows at smallest size)"
+            print(
+                f"  {result.slide_key}/{result.shape_name}: "
+                f"{result.old_size:g}pt -> {result.new_size:g}pt{status}"
+            )
+
+    changed = sum(1 for r in results if r.changed)
+    overflowing = sum(1 for r in results if not r.fits)
+    print(
+        f"Checked {len(results)} text shapes: {changed} resized, "
+        f"{overflowing} still overflowing"
+    )
+
+    if not args.dry_run:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        prs.save(str(output_path))
+        print(f"Saved fitted presentation to: {args.output}")
+
+
+# ---------------------------------------------------------------------------
+# Glyph metrics
+# ---------------------------------------------------------------------------
+
+
+class GlyphMetrics:
+    """Advance widths (px) for one font file at one size, cached per glyph."""
+
+    def __init__(self, font_path: Optional[str], size: int):
+        self.size = size
+        self.font = ImageFont.truetype(font_path, size=size) if font_path else None
+        self._advances: Dict[str, float] = {}
+
+    def advance(self, char: str) -> float:
+        width = self._advances.get(char)
+        if width is None:
+            if self.font is not None:
+                width = self.font.getlength(char)
+            else:
+                width = self.size * (1.0 if _WIDE_RE.match(char) else 0.55)
+            self._advances[char] = width
+        return width
+
+    def width(self, text: str) -> float:
+        return sum(self.advance(char) for char in text)
+
+
+_font_paths: Dict[str, Optional[str]] = {}
+_metrics: Dict[Tuple[Optional[str], int], GlyphMetrics] = {}
+
+
+def glyph_metrics(font_name: str, size_pt: float) -> GlyphMetrics:
+    """Shared metrics for (font, size); font lookups and glyph widths are cached.
+
+    Like inventory.py, the font is loaded at the integer point size.
+    """
+    if font_name not in _font_paths:
+        _font_paths[font_name] = ShapeData.get_font_path(font_name)
+    font_path = _font_paths[font_name]
+    key = (font_path, max(1, int(size_pt)))
+    metrics = _metrics.get(key)
+    if metrics is None:
+        metrics = _metrics[key] = GlyphMetrics(*key)
+    return metrics
+
+
+def wrapped_line_count(line: str, max_width_px: float, metrics: GlyphMetrics) -> int:
+    """Number of lines after greedy word wrapping (same rule as inventory.py)."""
+    if not line or metrics.width(line) <= max_width_px:
+        return 1
+
+    space = metrics.advance(" ")
+    count = 0
+    current_text = ""
+    current_width = 0.0
+    for word in line.split(" "):
+        word_width = metrics.width(word)
+        test_width = current_width + space + word_width if current_text else word_width
+        if test_width <= max_width_px:
+            current_text = current_text + " " + word if current_text else word
+            current_width = test_width
+        else:
+            if current_text:
+                count += 1
+            current_text, current_width = word, word_width
+    if current_text:
+        count += 1
+    return count
+
+
+# ---------------------------------------------------------------------------
+# Hierarchy steps
+# ---------------------------------------------------------------------------
+
+
+def shift_size(size: float, steps: int, hierarchy: Sequence[int] = FONT_HIERARCHY) -> float:
+    """Move a size by whole hierarchy steps (positive = smaller, negative = larger).
+
+    Sizes between hierarchy values snap to the neighbouring value on the first
+    step. Sizes outside the hierarchy range are never moved further out.
+    """
+    if steps > 0:
+        below = bisect_left(hierarchy, size) - 1  # largest value < size
+        return min(size, hierarchy[max(below - (steps - 1), 0)])
+    if steps < 0:
+        above = bisect_right(hierarchy, size)  # first value > size
+        return max(size, hierarchy[min(above - steps - 1, len(hierarchy) - 1)])
+    return size
+
+
+@dataclass
+class ParagraphMetrics:
+    """What the height estimate needs from one paragraph."""
+
+    text: str
+    font_name: str
+    size: float
+    line_spacing_pt: Optional[float]  # exact spacing, does not scale with size
+    line_spacing_multiple: Optional[float]  # multiple of the font size
+    space_before: float
+    space_after: float
+
+    @classmethod
+    def from_paragraph(cls, paragraph: Any, default_size: float) -> "ParagraphMetrics":
+        runs = paragraph.runs
+        font = runs[0].font if runs else paragraph.font
+        line_spacing = paragraph.line_spacing
+        return cls(
+            text=paragraph.text,
+            font_name=font.name or "Arial",
+            size=font.size.pt if font.size else default_size,
+            line_spacing_pt=line_spacing.pt if isinstance(line_spacing, Length) else None,
+            line_spacing_multiple=line_spacing if isinstance(line_spacing, float) else None,
+            space_before=paragraph.space_before.pt if paragraph.space_before else 0.0,
+            space_after=paragraph.space_after.pt if paragraph.space_after else 0.0,
+        )
+
+
+@dataclass
+class FitResult:
+    """Outcome of fitting one shape."""
+
+    slide_key: str
+    shape_name: str
+    old_size: float
+    new_size: float
+    steps: int
+    fits: bool
+
+    @property
+    def changed(self) -> bool:
+        return self.steps != 0
+
+
+# ---------------------------------------------------------------------------
+# Fitting
+# ---------------------------------------------------------------------------
+
+
+class TextFitter:
+    """Binary-search the hierarchy step at which a shape's text fits its frame."""
+
+    def __init__(self, hierarchy: Sequence[int] = FONT_HIERARCHY, allow_grow: bool = False):
+        self.hierarchy = tuple(hierarchy)
+        self.allow_grow = allow_grow
+
+    @staticmethod
+    def usable_size_px(shape: Any) -> Tuple[float, float]:
+        """Frame size minus text margins, in whole pixels."""
+        text_frame = shape.text_frame
+        width = shape.width - text_frame.margin_left - text_frame.margin_right
+        height = shape.height - text_frame.margin_top - text_frame.margin_bottom
+        return (
+            ShapeData.inches_to_pixels(ShapeData.emu_to_inches(width), DPI),
+            ShapeData.inches_to_pixels(ShapeData.emu_to_inches(height), DPI),
+        )
+
+    def text_height_px(
+        self, paragraphs: List[ParagraphMetrics], width_px: float, steps: int
+    ) -> float:
+        """Estimated text height with every paragraph shifted by ``steps``."""
+        total = 0.0
+        for index, para in enumerate(paragraphs):
+            if not para.text.strip():
+                continue
+            size = int(shift_size(para.size, steps, self.hierarchy))
+            metrics = glyph_metrics(para.font_name, size)
+            lines = sum(
+                wrapped_line_count(line, width_px, metrics) for line in para.text.split("\n")
+            )
+            if para.line_spacing_pt:
+                line_height_pt = para.line_spacing_pt
+            elif para.line_spacing_multiple:
+                line_height_pt = para.line_spacing_multiple * size
+            else:
+                line_height_pt = size
+            if index > 0:
+                total += para.space_before * DPI / 72
+            total += lines * line_height_pt * DPI / 72
+            total += para.space_after * DPI / 72
+        return total
+
+    def fit(
+        self, shape: Any, default_size: float = DEFAULT_FONT_SIZE
+    ) -> Tuple[int, bool, List[ParagraphMetrics]]:
+        """Return (steps, fits, paragraphs) for the largest size that fits."""
+        paragraphs = [
+            ParagraphMetrics.from_paragraph(p, default_size)
+            for p in shape.text_frame.paragraphs
+        ]
+        width_px, height_px = self.usable_size_px(shape)
+        if width_px <= 0 or height_px <= 0 or not paragraphs:
+            return 0, True, paragraphs
+
+        limit = height_px + OVERFLOW_TOLERANCE_IN * DPI
+        top = max(p.size for p in paragraphs)
+        lowest = -(len(self.hierarchy) - bisect_right(self.hierarchy, top)) if self.allow_grow else 0
+        highest = bisect_left(self.hierarchy, top)  # steps until the smallest size
+
+        def fits(steps: int) -> bool:
+            return self.text_height_px(paragraphs, width_px, steps) <= limit
+
+        if not fits(highest):
+            return highest, False, paragraphs
+        lo, hi = lowest, highest  # smallest fitting step lies in [lo, hi]
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if fits(mid):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo, True, paragraphs
+
+    def apply(self, shape: Any, steps: int, default_size: float = DEFAULT_FONT_SIZE) -> None:
+        """Write shifted sizes to every run of the shape."""
+        if steps == 0:
+            return
+        for paragraph in shape.text_frame.paragraphs:
+            for run in paragraph.runs:
+                size = run.font.size.pt if run.font.size else default_size
+                run.font.size = Pt(shift_size(size, steps, self.hierarchy))
+
+
+def _default_size(shape: Any, slide: Any) -> float:
+    """Size of runs without an explicit size, from the master text style (as inventory.py)."""
+    style_name = "bodyStyle"
+    if getattr(shape, "is_placeholder", False) and "TITLE" in str(shape.placeholder_format.type):
+        style_name = "titleStyle"
+    for style in slide.slide_layout.slide_master.element.iter(f"{{{_P_NS}}}{style_name}"):
+        for elem in style.iter():
+            if "sz" in elem.attrib:
+                return int(elem.attrib["sz"]) // 100
+    return DEFAULT_FONT_SIZE
+
+
+def autofit_presentation(
+    prs: Any,
+    pptx_path: Optional[Path] = None,
+    issues_only: bool = False,
+    allow_grow: bool = False,
+    hierarchy: Sequence[int] = FONT_HIERARCHY,
+) -> List[FitResult]:
+    """Fit every text shape of a loaded presentation in place.
+
+    With ``issues_only`` the targets are the shapes inventory.py reports with
+    ``frame_overflow_bottom``; everything else is left untouched.
+    """
+    fitter = TextFitter(hierarchy, allow_grow)
+    slides = list(prs.slides)
+
+    targets: List[Tuple[str, Any, Any]] = []
+    if issues_only:
+        inventory = extract_text_inventory(pptx_path or Path(""), prs=prs, issues_only=True)
+        for slide_key, shapes in inventory.items():
+            slide = slides[int(slide_key.split("-")[1])]
+            for shape_data in shapes.values():
+                if shape_data.frame_overflow_bottom is not None:
+                    targets.append((slide_key, slide, shape_data.shape))
+    else:
+        for slide_idx, slide in enumerate(slides):
+            for shape in slide.shapes:
+                for item in collect_shapes_with_absolute_positions(shape):
+                    targets.append((f"slide-{slide_idx}", slide, item.shape))
+
+    results = []
+    for slide_key, slide, shape in targets:
+        default_size = _default_size(shape, slide)
+        steps, fits, paragraphs = fitter.fit(shape, default_size)
+        if not paragraphs:
+            continue
+        top = max(p.size for p in paragraphs)
+        fitter.apply(shape, steps, default_size)
+        results.append(
+            FitResult(
+                slide_key=slide_key,
+                shape_name=shape.name,
+                old_size=top,
+                new_size=shift_size(top, steps, hierarchy),
+                steps=steps,
+                fits=fits,
+            )
+        )
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,548 @@
+#!/usr/bin/env python3
+"""Render the education-course Handlebars layouts from Python.
+
+The layouts in templates/education-course (layouts/*.hbs plus the
+common-styles, header and footer partials) were only usable through the Node
+builder (edu-pptx-builder.js). This module compiles each template to a Python
+function once. The generated code is stored as marshalled bytecode in
+``<templates>/.compiled/``, keyed by a hash of every template source and the
+interpreter version, so later runs skip parsing and code generation and
+rendering a whole deck takes milliseconds.
+
+Supported Handlebars subset (everything the course templates use, plus the
+common built-ins):
+    {{path}} {{{path}}} {{helper arg ...}} {{> partial}} {{! comment}}
+    {{#if}} {{#unless}} {{#each}} {{#with}} {{else}} and ~ whitespace control
+    this, ../, @index, @first, @last, @key, @root
+    standalone-line stripping and partial indentation as in Handlebars 4
+
+Usage:
+    python hbs_render.py ../data/part1-session1-complete.json output_dir/
+    python hbs_render.py deck.json output_dir/ --templates ../templates/education-course
+
+Python:
+    renderer = HandlebarsRenderer()
+    html = renderer.render("list-bullets", {"title": "...", "items": [...]})
+    pages = renderer.render_deck(json.load(open("deck.json")))
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import marshal
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "education-course"
+CACHE_DIRNAME = ".compiled"
+COMPILER_VERSION = "1"  # Bump when the generated code changes shape
+
+
+def main():
+    """Main entry point for command-line usage."""
+    parser = argparse.ArgumentParser(
+        description="Render a course JSON deck to one HTML file per slide.",
+    )
+    parser.add_argument("input", help="Deck JSON with a 'slides' list")
+    parser.add_argument("output_dir", help="Directory for slide-NN.html files")
+    parser.add_argument("--templates", default=str(TEMPLATE_DIR), help="Template directory")
+    parser.add_argument("--no-cache", action="store_true", help="Compile in memory only")
+    args = parser.parse_args()
+
+    input_path = Path(args.input)
+    if not input_path.exists():
+        print(f"Error: Input file not found: {args.input}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    renderer = HandlebarsRenderer(args.templates, use_cache=not args.no_cache)
+    load_time = time.perf_counter() - start
+
+    deck = json.loads(input_path.read_text(encoding="utf-8"))
+    start = time.perf_counter()
+    pages = renderer.render_deck(deck)
+    render_time = time.perf_counter() - start
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for index, page in enumerate(pages, 1):
+        (output_dir / f"slide-{index:02d}.html").write_text(page, encoding="utf-8")
+
+    source = "loaded from cache" if renderer.loaded_from_cache else "compiled"
+    print(
+        f"Rendered {len(pages)} slides to {output_dir} "
+        f"(templates {source} in {load_time * 1000:.1f} ms, "
+        f"render {render_time * 1000:.1f} ms)"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Runtime shared by all generated render functions
+# ---------------------------------------------------------------------------
+
+
+class SafeString(str):
+    """Helper output that must not be HTML-escaped (Handlebars.SafeString)."""
+
+
+_ESCAPES = {
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+    "`": "&#x60;",
+    "=": "&#x3D;",
+}
+_ESCAPE_RE = re.compile("[&<>\"'`=]")
+
+
+def _to_str(value: Any) -> str:
+    """String conversion as JavaScript renders the value."""
+    if value is None:
+        return ""
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, list):
+        return ",".join(_to_str(item) for item in value)
+    if isinstance(value, dict):
+        return "[object Object]"
+    return str(value)
+
+
+def _escape(value: Any) -> str:
+    if isinstance(value, SafeString):
+        return value
+    return _ESCAPE_RE.sub(lambda m: _ESCAPES[m.group()], _to_str(value))
+
+
+def _truthy(value: Any) -> bool:
+    """Handlebars #if: false, null, "", 0 and empty lists are falsy; objects are truthy."""
+    if isinstance(value, dict):
+        return True
+    return bool(value)
+
+
+def _lookup(stack: List[Any], data: Dict[str, Any], depth: int, parts: Tuple[str, ...]) -> Any:
+    """Resolve a path ``depth`` levels up the context stack (or in @data)."""
+    if parts and parts[0].startswith("@"):
+        value = data.get(parts[0][1:])
+        parts = parts[1:]
+    elif depth < len(stack):
+        value = stack[-1 - depth]
+    else:
+        return None
+    for part in parts:
+        if isinstance(value, dict):
+            value = value.get(part)
+        elif isinstance(value, list) and part.isdigit():
+            value = value[int(part)] if int(part) < len(value) else None
+        elif part == "length" and isinstance(value, (list, str)):
+            value = len(value)
+        else:
+            return None
+    return value
+
+
+def _each_items(value: Any, data: Dict[str, Any]) -> List[Tuple[Any, Dict[str, Any]]]:
+    """(item, @data frame) pairs for #each over a list or an object."""
+    if isinstance(value, dict):
+        entries = list(value.items())
+    elif isinstance(value, list):
+        entries = list(enumerate(value))
+    else:
+        return []
+    last = len(entries) - 1
+    frames = []
+    for i, (key, item) in enumerate(entries):
+        frame = {**data, "index": i, "first": i == 0, "last": i == last}
+        if isinstance(value, dict):
+            frame["key"] = key
+        frames.append((item, frame))
+    return frames
+
+
+def _indent(text: str, indent: str) -> str:
+    """Prefix every line of a standalone partial's output (Handlebars 4 rule)."""
+    lines = text.split("\n")
+    for i, line in enumerate(lines):
+        if not line and i + 1 == len(lines):
+            break
+        lines[i] = indent + line
+    return "\n".join(lines)
+
+
+_BULLET_RE = re.compile(r"^[•*-]\s*")
+
+
+def bullet_list_to_ul(text: Any) -> SafeString:
+    """Turn "• a\\n- b" text into a <ul> list (edu-pptx-builder.js helper)."""
+    if not text:
+        return SafeString("")
+    lines = [_BULLET_RE.sub("", line) for line in str(text).split("\n") if line.strip()]
+    items = "\n".join(f"  <li>{line}</li>" for line in lines)
+    return SafeString(f"<ul>\n{items}\n</ul>")
+
+
+DEFAULT_HELPERS: Dict[str, Callable[..., Any]] = {"bulletListToUl": bullet_list_to_ul}
+
+_RUNTIME = {
+    "_escape": _escape,
+    "_to_str": _to_str,
+    "_truthy": _truthy,
+    "_lookup": _lookup,
+    "_each_items": _each_items,
+    "_indent": _indent,
+}
+
+
+# ---------------------------------------------------------------------------
+# Tokenizer with Handlebars whitespace rules
+# ---------------------------------------------------------------------------
+
+_TAG_RE = re.compile(r"\{\{(~?)(\{.*?\}|!--.*?--|.*?)(~?)\}\}", re.DOTALL)
+_STANDALONE_KINDS = {"open", "close", "else", "partial", "comment"}
+
+
+@dataclass
+class Text:
+    value: str
+    original: str
+
+
+@dataclass
+class Tag:
+    kind: str  # var, raw, open, close, else, partial, comment
+    body: str
+    strip_left: bool
+    strip_right: bool
+    indent: str = ""
+
+
+def tokenize(source: str) -> List[Union[Text, Tag]]:
+    """Alternating Text/Tag list (always starting and ending with Text)."""
+    tokens: List[Union[Text, Tag]] = []
+    position = 0
+    for match in _TAG_RE.finditer(source):
+        text = source[position : match.start()]
+        tokens.append(Text(text, text))
+        strip_left, inner, strip_right = match.group(1), match.group(2), match.group(3)
+        tokens.append(_classify(inner, bool(strip_left), bool(strip_right)))
+        position = match.end()
+    tail = source[position:]
+    tokens.append(Text(tail, tail))
+    _apply_whitespace_control(tokens)
+    return tokens
+
+
+def _classify(inner: str, strip_left: bool, strip_right: bool) -> Tag:
+    if inner.startswith("{"):
+        return Tag("raw", inner[1:-1].strip(), strip_left, strip_right)
+    if inner.startswith("!"):
+        return Tag("comment", inner, strip_left, strip_right)
+    stripped = inner.strip()
+    if stripped.startswith("#"):
+        return Tag("open", stripped[1:].strip(), strip_left, strip_right)
+    if stripped.startswith("/"):
+        return Tag("close", stripped[1:].strip(), strip_left, strip_right)
+    if stripped.startswith(">"):
+        return Tag("partial", stripped[1:].strip(), strip_left, strip_right)
+    if stripped in ("else", "^"):
+        return Tag("else", "", strip_left, strip_right)
+    if stripped.startswith("&"):
+        return Tag("raw", stripped[1:].strip(), strip_left, strip_right)
+    return Tag("var", stripped, strip_left, strip_right)
+
+
+def _apply_whitespace_control(tokens: List[Union[Text, Tag]]) -> None:
+    """Standalone lines and ~ stripping, decided on the original text like Handlebars."""
+    last = len(tokens) - 1
+    for i in range(1, last, 2):
+        tag = tokens[i]
+        prev, nxt = tokens[i - 1], tokens[i + 1]
+        assert isinstance(tag, Tag) and isinstance(prev, Text) and isinstance(nxt, Text)
+
+        if tag.strip_left:
+            prev.value = re.sub(r"\s+$", "", prev.value)
+        if tag.strip_right:
+            nxt.value = re.sub(r"^\s+", "", nxt.value)
+        if tag.kind not in _STANDALONE_KINDS:
+            continue
+
+        prev_pattern = r"(^|\r?\n)\s*?$" if i == 1 else r"\r?\n\s*?$"
+        next_pattern = r"^\s*?(\r?\n|$)" if i + 1 == last else r"^\s*?\r?\n"
+        if not (re.search(prev_pattern, prev.original) and re.search(next_pattern, nxt.original)):
+            continue
+
+        nxt.value = re.sub(r"^[ \t]*\r?\n?", "", nxt.value)
+        trimmed = re.sub(r"[ \t]+$", "", prev.value)
+        if tag.kind == "partial" and trimmed != prev.value:
+            tag.indent = re.search(r"([ \t]+)$", prev.original).group(1)
+        prev.value = trimmed
+
+
+# ---------------------------------------------------------------------------
+# Parser
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class Block:
+    helper: str
+    params: List[str]
+    body: List[Any] = field(default_factory=list)
+    inverse: List[Any] = field(default_factory=list)
+
+
+_PARAM_RE = re.compile(r'"[^"]*"|\'[^\']*\'|[^\s]+')
+
+
+def parse(tokens: List[Union[Text, Tag]], name: str) -> List[Any]:
+    """Nest block tags into Block nodes; other tokens stay as they are."""
+    root: List[Any] = []
+    stack: List[Tuple[Block, List[Any]]] = []
+    current = root
+    for token in tokens:
+        if isinstance(token, Text):
+            if token.value:
+                current.append(token)
+        elif token.kind == "open":
+            helper, *params = _PARAM_RE.findall(token.body)
+            block = Block(helper, params)
+            current.append(block)
+            stack.append((block, current))
+            current = block.body
+        elif token.kind == "else":
+            if not stack:
+                raise ValueError(f"{name}: {{{{else}}}} outside a block")
+            current = stack[-1][0].inverse
+        elif token.kind == "close":
+            if not stack or stack[-1][0].helper != token.body:
+                raise ValueError(f"{name}: unexpected {{{{/{token.body}}}}}")
+            _, current = stack.pop()
+        elif token.kind != "comment":
+            current.append(token)
+    if stack:
+        raise ValueError(f"{name}: unclosed {{{{#{stack[-1][0].helper}}}}}")
+    return root
+
+
+# ---------------------------------------------------------------------------
+# Code generation
+# ---------------------------------------------------------------------------
+
+
+class CodeGenerator:
+    """Turn a parsed template into the source of ``render(stack, data, partials, helpers)``."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.lines: List[str] = []
+        self.counter = 0
+
+    def generate(self, nodes: List[Any]) -> str:
+        self.lines = [
+            "def render(stack, data, partials, helpers):",
+            "    out = []",
+            "    w = out.append",
+        ]
+        self._nodes(nodes, 1)
+        self.lines.append('    return "".join(out)')
+        return "\n".join(self.lines) + "\n"
+
+    def _emit(self, depth: int, line: str) -> None:
+        self.lines.append("    " * depth + line)
+
+    def _nodes(self, nodes: List[Any], depth: int) -> None:
+        if not nodes:
+            self._emit(depth, "pass")
+        for node in nodes:
+            if isinstance(node, Text):
+                self._emit(depth, f"w({node.value!r})")
+            elif isinstance(node, Block):
+                self._block(node, depth)
+            elif node.kind == "partial":
+                self._partial(node, depth)
+            else:
+                value = self._expression(node.body)
+                wrap = "_escape" if node.kind == "var" else "_to_str"
+                self._emit(depth, f"w({wrap}({value}))")
+
+    def _partial(self, tag: Tag, depth: int) -> None:
+        partial, *params = _PARAM_RE.findall(tag.body)
+        if params:
+            raise ValueError(f"{self.name}: partial parameters are not supported ({tag.body})")
+        call = f"partials[{partial!r}](stack, data, partials, helpers)"
+        if tag.indent:
+            call = f"_indent({call}, {tag.indent!r})"
+        self._emit(depth, f"w({call})")
+
+    def _block(self, block: Block, depth: int) -> None:
+        if len(block.params) != 1:
+            raise ValueError(f"{self.name}: #{block.helper} takes exactly one argument")
+        value = self._path(block.params[0])
+        n = self._next()
+
+        if block.helper in ("if", "unless"):
+            test = f"_truthy({value})"
+            self._emit(depth, f"if {test if block.helper == 'if' else 'not ' + test}:")
+            self._nodes(block.body, depth + 1)
+            if block.inverse:
+                self._emit(depth, "else:")
+                self._nodes(block.inverse, depth + 1)
+        elif block.helper == "each":
+            self._emit(depth, f"_items{n} = _each_items({value}, data)")
+            self._emit(depth, f"_data{n} = data")
+            self._emit(depth, f"for _item{n}, data in _items{n}:")
+            self._emit(depth + 1, f"stack.append(_item{n})")
+            self._nodes(block.body, depth + 1)
+            self._emit(depth + 1, "stack.pop()")
+            self._emit(depth, f"data = _data{n}")
+            if block.inverse:
+                self._emit(depth, f"if not _items{n}:")
+                self._nodes(block.inverse, depth + 1)
+        elif block.helper == "with":
+            self._emit(depth, f"_value{n} = {value}")
+            self._emit(depth, f"if _truthy(_value{n}):")
+            self._emit(depth + 1, f"stack.append(_value{n})")
+            self._nodes(block.body, depth + 1)
+            self._emit(depth + 1, "stack.pop()")
+            if block.inverse:
+                self._emit(depth, "else:")
+                self._nodes(block.inverse, depth + 1)
+        else:
+            raise ValueError(f"{self.name}: block helper #{block.helper} is not supported")
+
+    def _next(self) -> int:
+        self.counter += 1
+        return self.counter
+
+    def _expression(self, body: str) -> str:
+        """Mustache body: a helper call with arguments, or a path (maybe a helper)."""
+        name, *params = _PARAM_RE.findall(body)
+        if any("=" in param for param in params):
+            raise ValueError(f"{self.name}: hash arguments are not supported ({body})")
+        if params:
+            args = ", ".join(self._path(param) for param in params)
+            return f"helpers[{name!r}]({args})"
+        if re.fullmatch(r"[A-Za-z_][\w-]*", name):
+            return f"(helpers[{name!r}]() if {name!r} in helpers else {self._path(name)})"
+        return self._path(name)
+
+    @staticmethod
+    def _path(expr: str) -> str:
+        """Python expression for a path or literal argument."""
+        if expr[0] in "\"'":
+            return repr(expr[1:-1])
+        if re.fullmatch(r"-?\d+(\.\d+)?", expr):
+            return expr
+        if expr in ("true", "false"):
+            return str(expr == "true")
+        if expr in ("null", "undefined"):
+            return "None"
+
+        depth = 0
+        while expr.startswith("../"):
+            depth += 1
+            expr = expr[3:]
+        if expr.startswith("./"):
+            expr = expr[2:]
+        parts = [part for part in re.split(r"[./]", expr) if part]
+        if parts and parts[0] == "this":
+            parts = parts[1:]
+        return f"_lookup(stack, data, {depth}, {tuple(parts)!r})"
+
+
+def compile_source(source: str, name: str) -> Any:
+    """Template text -> code object defining ``render``."""
+    nodes = parse(tokenize(source), name)
+    return compile(CodeGenerator(name).generate(nodes), f"<hbs {name}>", "exec")
+
+
+# ---------------------------------------------------------------------------
+# Renderer with persistent bytecode cache
+# ---------------------------------------------------------------------------
+
+
+class HandlebarsRenderer:
+    """Compiled layouts and partials of one template directory."""
+
+    def __init__(
+        self,
+        template_dir: Union[str, Path] = TEMPLATE_DIR,
+        helpers: Optional[Dict[str, Callable[..., Any]]] = None,
+        use_cache: bool = True,
+    ):
+        self.template_dir = Path(template_dir)
+        self.helpers = {**DEFAULT_HELPERS, **(helpers or {})}
+        self.loaded_from_cache = False
+
+        sources = {
+            f"{kind}/{path.stem}": path.read_text(encoding="utf-8")
+            for kind in ("layouts", "partials")
+            for path in sorted((self.template_dir / kind).glob("*.hbs"))
+        }
+        codes = self._load_codes(sources, use_cache)
+
+        functions = {}
+        for key, code in codes.items():
+            namespace = dict(_RUNTIME)
+            exec(code, namespace)
+            functions[key] = namespace["render"]
+        self.layouts = {k.split("/", 1)[1]: f for k, f in functions.items() if k.startswith("layouts/")}
+        self.partials = {k.split("/", 1)[1]: f for k, f in functions.items() if k.startswith("partials/")}
+
+    def _load_codes(self, sources: Dict[str, str], use_cache: bool) -> Dict[str, Any]:
+        digest = hashlib.sha1(COMPILER_VERSION.encode() + importlib.util.MAGIC_NUMBER)
+        for key, source in sources.items():
+            digest.update(f"\0{key}\0{source}".encode("utf-8"))
+        cache_dir = self.template_dir / CACHE_DIRNAME
+        cache_file = cache_dir / f"templates-{digest.hexdigest()[:16]}.marshal"
+
+        if use_cache and cache_file.exists():
+            try:
+                codes = marshal.loads(cache_file.read_bytes())
+                self.loaded_from_cache = True
+                return codes
+            except (EOFError, ValueError, TypeError):
+                pass  # Corrupt cache: recompile below
+
+        codes = {key: compile_source(source, key) for key, source in sources.items()}
+        if use_cache:
+            try:
+                cache_dir.mkdir(exist_ok=True)
+                for stale in cache_dir.glob("templates-*.marshal"):
+                    stale.unlink()
+                cache_file.write_bytes(marshal.dumps(codes))
+            except OSError:
+                pass  # Read-only template directory: keep the in-memory result
+        return codes
+
+    def render(self, layout: str, data: Dict[str, Any]) -> str:
+        """Render one layout; ``session`` defaults to 1 like edu-pptx-builder.js."""
+        if layout not in self.layouts:
+            raise ValueError(
+                f"Unknown layout '{layout}' (available: {', '.join(sorted(self.layouts))})"
+            )
+        context = {**data, "session": data.get("session") or 1}
+        return self.layouts[layout]([context], {"root": context}, self.partials, self.helpers)
+
+    def render_deck(self, deck: Dict[str, Any]) -> List[str]:
+        """Render every slide of a course JSON (generate-course.js data shape)."""
+        return [
+            self.render(slide["layout"], {"session": deck.get("session"), **slide["data"]})
+            for slide in deck["slides"]
+        ]
+
+
+if __name__ == "__main__":
+    main()
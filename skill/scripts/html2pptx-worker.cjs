@@ -0,0 +1,193 @@
+#!/usr/bin/env node
+
+/**
+ * html2pptx Worker
+ * Long-lived html2pptx process driven over stdin/stdout (JSON-RPC 2.0, one message per line)
+ *
+ * Every convert-*.cjs run starts Node, loads PptxGenJS and html2pptx, and html2pptx
+ * launches and closes Chromium for every slide. This worker loads the modules once and
+ * keeps one browser running: chromium.launch() is wrapped so html2pptx gets a handle
+ * whose close() only closes the pages it opened.
+ *
+ * Methods:
+ *   ping                                  → { pid, browser }
+ *   convert { slides, output, layout?, strict?, baseDir? }
+ *       slides: [ "slide.html" | { html: "<!DOCTYPE html>..." } ]
+ *       layout: "LAYOUT_16x9" (default) or { width, height } in inches
+ *       strict: stop at the first failing slide (default: skip it and report)
+ *       baseDir: where inline HTML is written, so relative asset paths resolve
+ *                                       → { output, slides, errors: [{ index, message }], elapsedMs }
+ *   shutdown                              → closes the browser and exits
+ *
+ * stdout carries only protocol messages; console output (including html2pptx's
+ * browser console relay) goes to stderr.
+ *
+ * Usage (normally started by html2pptx_bridge.py):
+ *   node html2pptx-worker.cjs
+ */
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const readline = require('readline');
+
+// Keep stdout for protocol messages only
+console.log = (...args) => console.error(...args);
+
+const PptxGenJS = require('pptxgenjs');
+
+function loadHtml2pptx() {
+  const localPath = path.join(__dirname, '../node_modules/@ant/html2pptx/dist/html2pptx.cjs');
+  const modulePath = fs.existsSync(localPath) ? localPath : require.resolve('@ant/html2pptx');
+  return { modulePath, html2pptx: require(modulePath).html2pptx };
+}
+
+const { modulePath, html2pptx } = loadHtml2pptx();
+
+// The same playwright instance html2pptx requires
+const playwright = require(require.resolve('playwright', { paths: [path.dirname(modulePath)] }));
+
+// ============================================================================
+// Shared browser
+// ============================================================================
+
+let sharedBrowser = null;
+const launchBrowser = playwright.chromium.launch.bind(playwright.chromium);
+
+playwright.chromium.launch = async (options) => {
+  if (!sharedBrowser || !sharedBrowser.isConnected()) {
+    sharedBrowser = await launchBrowser(options);
+  }
+  const pages = [];
+  return {
+    newPage: async (pageOptions) => {
+      const page = await sharedBrowser.newPage(pageOptions);
+      pages.push(page);
+      return page;
+    },
+    close: async () => {
+      await Promise.all(pages.map(page => page.close().catch(() => {})));
+    },
+  };
+};
+
+async function closeBrowser() {
+  if (sharedBrowser) {
+    await sharedBrowser.close().catch(() => {});
+    sharedBrowser = null;
+  }
+}
+
+// ============================================================================
+// Methods
+// ============================================================================
+
+let inlineCounter = 0;
+
+function writeInlineSlide(html, baseDir) {
+  const dir = baseDir || os.tmpdir();
+  inlineCounter += 1;
+  const file = path.join(dir, `.html2pptx-worker-${process.pid}-${inlineCounter}.html`);
+  fs.writeFileSync(file, html, 'utf-8');
+  return file;
+}
+
+async function convert(params) {
+  const { slides, output, layout = 'LAYOUT_16x9', strict = false, baseDir = null } = params || {};
+  if (!Array.isArray(slides) || slides.length === 0) {
+    throw new Error('"slides" must be a non-empty array');
+  }
+  if (!output) {
+    throw new Error('"output" is required');
+  }
+
+  const start = Date.now();
+  const pptx = new PptxGenJS();
+  if (typeof layout === 'string') {
+    pptx.layout = layout;
+  } else {
+    pptx.defineLayout({ name: 'WORKER', width: layout.width, height: layout.height });
+    pptx.layout = 'WORKER';
+  }
+
+  const errors = [];
+  let converted = 0;
+  for (let i = 0; i < slides.length; i++) {
+    const slide = slides[i];
+    const inline = typeof slide === 'object' && slide !== null;
+    const file = inline ? writeInlineSlide(slide.html, baseDir) : path.resolve(slide);
+    try {
+      await html2pptx(file, pptx);
+      converted += 1;
+    } catch (error) {
+      if (strict) {
+        throw new Error(`slide ${i + 1}: ${error.message}`);
+      }
+      errors.push({ index: i, message: error.message });
+    } finally {
+      if (inline) {
+        fs.rmSync(file, { force: true });
+      }
+    }
+  }
+
+  const outputPath = path.resolve(output);
+  fs.mkdirSync(path.dirname(outputPath), { recursive: true });
+  await pptx.writeFile({ fileName: outputPath });
+
+  return { output: outputPath, slides: converted, errors, elapsedMs: Date.now() - start };
+}
+
+const methods = {
+  ping: async () => ({ pid: process.pid, browser: Boolean(sharedBrowser && sharedBrowser.isConnected()) }),
+  convert,
+  shutdown: async () => {
+    await closeBrowser();
+    setImmediate(() => process.exit(0));
+    return { ok: true };
+  },
+};
+
+// ============================================================================
+// JSON-RPC loop (requests are handled one at a time, in order)
+// ============================================================================
+
+function send(message) {
+  process.stdout.write(JSON.stringify({ jsonrpc: '2.0', ...message }) + '\n');
+}
+
+async function handle(line) {
+  let request;
+  try {
+    request = JSON.parse(line);
+  } catch (error) {
+    send({ id: null, error: { code: -32700, message: `Parse error: ${error.message}` } });
+    return;
+  }
+
+  const method = methods[request.method];
+  if (!method) {
+    send({ id: request.id, error: { code: -32601, message: `Unknown method: ${request.method}` } });
+    return;
+  }
+  try {
+    send({ id: request.id, result: await method(request.params) });
+  } catch (error) {
+    send({ id: request.id, error: { code: -32000, message: error.message } });
+  }
+}
+
+let queue = Promise.resolve();
+const input = readline.createInterface({ input: process.stdin });
+input.on('line', line => {
+  if (line.trim()) {
+    queue = queue.then(() => handle(line));
+  }
+});
+input.on('close', () => {
+  queue.then(closeBrowser).then(() => process.exit(0));
+});
+
+process.on('SIGTERM', () => {
+  closeBrowser().then(() => process.exit(0));
+});
@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""Convert slide HTML to PPTX through one long-lived html2pptx worker.
+
+Each convert-*.cjs run pays for Node startup, loading PptxGenJS and
+html2pptx, and a Chromium launch per slide. Html2PptxWorker starts
+html2pptx-worker.cjs once and sends it JSON-RPC requests over stdin/stdout,
+one message per line. The worker keeps the browser running between slides
+and between requests, so a generator can convert hundreds of slides, in
+as many decks as it likes, with one startup.
+
+Slides are given as HTML file paths or as inline HTML strings (anything
+starting with "<"). Inline HTML is written next to ``base_dir`` so relative
+image paths still resolve.
+
+For tests and machines without Node/Chromium, ``Html2PptxWorker.stand_in()``
+runs this module as a Python stand-in worker that speaks the same protocol
+and writes one python-pptx slide per HTML file (title and text only).
+
+Usage:
+    python html2pptx_bridge.py slides_dir/ output.pptx
+    python html2pptx_bridge.py slide-01.html slide-02.html output.pptx --strict
+    python html2pptx_bridge.py slides_dir/ output.pptx --stand-in
+
+Python:
+    with Html2PptxWorker() as worker:
+        for deck, pages in decks.items():
+            result = worker.convert(pages, f"output/{deck}.pptx")
+            print(result.summary())
+"""
+
+import argparse
+import json
+import os
+import queue
+import re
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+WORKER_SCRIPT = Path(__file__).resolve().parent / "html2pptx-worker.cjs"
+DEFAULT_TIMEOUT = 600.0  # Seconds per request; a large batch is one request
+
+Slide = Union[str, Path]
+
+
+def main():
+    """Main entry point for command-line usage."""
+    if sys.argv[1:] == ["--serve-stand-in"]:
+        serve_stand_in()
+        return
+
+    parser = argparse.ArgumentParser(
+        description="Convert HTML slides to PPTX with a persistent html2pptx worker.",
+    )
+    parser.add_argument(
+        "inputs", nargs="+", help="HTML files and/or directories of *.html (sorted by name)"
+    )
+    parser.add_argument("output", help="Output PowerPoint file (.pptx)")
+    parser.add_argument(
+        "--strict", action="store_true", help="Fail on the first slide html2pptx rejects"
+    )
+    parser.add_argument(
+        "--stand-in",
+        action="store_true",
+        help="Use the Python stand-in worker instead of Node/html2pptx",
+    )
+    args = parser.parse_args()
+
+    slides: List[Path] = []
+    for name in args.inputs:
+        path = Path(name)
+        if path.is_dir():
+            slides.extend(sorted(path.glob("*.html")))
+        elif path.exists():
+            slides.append(path)
+        else:
+            print(f"Error: Input not found: {name}")
+            sys.exit(1)
+    if not slides:
+        print("Error: No HTML slides found")
+        sys.exit(1)
+
+    worker = Html2PptxWorker.stand_in() if args.stand_in else Html2PptxWorker()
+    try:
+        with worker:
+            result = worker.convert(slides, args.output, strict=args.strict)
+    except Html2PptxError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    for error in result.errors:
+        print(f"  ⚠️ slide {error.index + 1} ({slides[error.index].name}): {error.message}")
+    print(result.summary())
+    print(f"Saved presentation to: {result.output}")
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+class Html2PptxError(RuntimeError):
+    """The worker could not be started, died, timed out or returned an error."""
+
+
+@dataclass
+class SlideError:
+    index: int  # 0-based position in the request's slide list
+    message: str
+
+
+@dataclass
+class ConversionResult:
+    """One convert request: the written deck and the slides html2pptx rejected."""
+
+    output: Path
+    slides: int
+    errors: List[SlideError] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def summary(self) -> str:
+        return (
+            f"Converted {self.slides} slides in {self.elapsed_ms:.0f} ms"
+            f" ({len(self.errors)} failed)"
+        )
+
+
+class Html2PptxWorker:
+    """Client for html2pptx-worker.cjs (or the stand-in); one request at a time."""
+
+    def __init__(
+        self,
+        command: Optional[Sequence[str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        cwd: Optional[str] = None,
+    ):
+        self.command = list(command or ["node", str(WORKER_SCRIPT)])
+        self.timeout = timeout
+        self.cwd = cwd
+        self._process: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._next_id = 1
+
+    @classmethod
+    def stand_in(cls, **kwargs: Any) -> "Html2PptxWorker":
+        """Worker that runs this module's Python stand-in instead of Node."""
+        return cls([sys.executable, str(Path(__file__).resolve()), "--serve-stand-in"], **kwargs)
+
+    # -- lifecycle -----------------------------------------------------------
+
+    def start(self) -> "Html2PptxWorker":
+        if self._process is not None and self._process.poll() is None:
+            return self
+        try:
+            self._process = subprocess.Popen(
+                self.command,
+                cwd=self.cwd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                bufsize=1,
+            )
+        except OSError as e:
+            raise Html2PptxError(f"Cannot start worker {self.command[0]}: {e}") from e
+        self._lines = queue.Queue()
+        threading.Thread(
+            target=self._read_lines, args=(self._process.stdout, self._lines), daemon=True
+        ).start()
+        return self
+
+    @staticmethod
+    def _read_lines(stream, lines: "queue.Queue[Optional[str]]"):
+        for line in stream:
+            lines.put(line)
+        lines.put(None)
+
+    def close(self):
+        """Ask the worker to shut down (closing its browser); kill it if it hangs."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        if process.poll() is None:
+            try:
+                process.stdin.close()
+                process.wait(timeout=30)
+            except (OSError, subprocess.TimeoutExpired):
+                process.kill()
+                process.wait()
+
+    def __enter__(self) -> "Html2PptxWorker":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # -- protocol ------------------------------------------------------------
+
+    def call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Send one JSON-RPC request and wait for its response."""
+        self.start()
+        request_id = self._next_id
+        self._next_id += 1
+        message = {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}}
+        try:
+            self._process.stdin.write(json.dumps(message, ensure_ascii=False) + "\n")
+            self._process.stdin.flush()
+        except OSError as e:
+            raise Html2PptxError(f"Worker is not accepting requests: {e}") from e
+
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                line = self._lines.get(timeout=max(deadline - time.monotonic(), 0.0))
+            except queue.Empty:
+                self.close()
+                raise Html2PptxError(f"{method}: no response within {self.timeout:g}s") from None
+            if line is None:
+                code = self._process.wait()
+                self._process = None
+                raise Html2PptxError(f"{method}: worker exited with code {code}")
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError:
+                print(line, end="", file=sys.stderr)  # Stray output, not a protocol message
+                continue
+            if response.get("id") != request_id:
+                continue
+            if "error" in response:
+                raise Html2PptxError(f"{method}: {response['error'].get('message')}")
+            return response.get("result")
+
+    def ping(self) -> Dict[str, Any]:
+        return self.call("ping")
+
+    def convert(
+        self,
+        slides: Sequence[Slide],
+        output: Union[str, Path],
+        layout: Union[str, Tuple[float, float], None] = None,
+        strict: bool = False,
+        base_dir: Union[str, Path, None] = None,
+    ) -> ConversionResult:
+        """Convert slides (HTML paths or inline HTML strings) into one PPTX.
+
+        Args:
+            layout: PptxGenJS layout name or (width, height) in inches
+                (default LAYOUT_16x9, the 960x540px slides)
+            strict: raise on the first slide html2pptx rejects instead of
+                skipping it and listing it in ``errors``
+            base_dir: directory for inline HTML, so relative assets resolve
+
+        Returns:
+            ConversionResult
+        """
+        params: Dict[str, Any] = {
+            "slides": [_slide_param(slide) for slide in slides],
+            "output": str(Path(output).resolve()),
+            "strict": strict,
+        }
+        if isinstance(layout, str):
+            params["layout"] = layout
+        elif layout is not None:
+            params["layout"] = {"width": layout[0], "height": layout[1]}
+        if base_dir is not None:
+            params["baseDir"] = str(Path(base_dir).resolve())
+
+        result = self.call("convert", params)
+        return ConversionResult(
+            output=Path(result["output"]),
+            slides=result["slides"],
+            errors=[SlideError(e["index"], e["message"]) for e in result.get("errors", [])],
+            elapsed_ms=result.get("elapsedMs", 0.0),
+        )
+
+    def convert_many(
+        self, jobs: Iterable[Tuple[Sequence[Slide], Union[str, Path]]], **kwargs: Any
+    ) -> List[ConversionResult]:
+        """Convert several decks, [(slides, output)], on the same warm worker."""
+        return [self.convert(slides, output, **kwargs) for slides, output in jobs]
+
+
+def _slide_param(slide: Slide) -> Union[str, Dict[str, str]]:
+    if isinstance(slide, str) and slide.lstrip().startswith("<"):
+        return {"html": slide}
+    return str(Path(slide).resolve())
+
+
+# ---------------------------------------------------------------------------
+# Python stand-in worker
+# ---------------------------------------------------------------------------
+
+
+class _SlideText(HTMLParser):
+    """Title (<title>, else first <h1>) and visible text lines of a slide."""
+
+    _SKIP = {"style", "script", "head"}
+    _BLOCK = {"p", "li", "h1", "h2", "h3", "h4", "div", "br", "tr"}
+
+    def __init__(self):
+        super().__init__()
+        self.title = ""
+        self.lines: List[str] = []
+        self._skip = 0
+        self._tag_stack: List[str] = []
+        self._current: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIP:
+            self._skip += 1
+        if tag in self._BLOCK:
+            self._flush()
+        self._tag_stack.append(tag)
+
+    def handle_endtag(self, tag):
+        if tag in self._SKIP:
+            self._skip = max(self._skip - 1, 0)
+        if tag in self._BLOCK:
+            self._flush()
+        if self._tag_stack and self._tag_stack[-1] == tag:
+            self._tag_stack.pop()
+
+    def handle_data(self, data):
+        if self._tag_stack and self._tag_stack[-1] == "title":
+            self.title = self.title or data.strip()
+        elif not self._skip:
+            self._current.append(data)
+
+    def _flush(self):
+        text = re.sub(r"\s+", " ", "".join(self._current)).strip()
+        if text:
+            self.lines.append(text)
+        self._current = []
+
+    def close(self):
+        super().close()
+        self._flush()
+
+
+def _stand_in_convert(params: Dict[str, Any]) -> Dict[str, Any]:
+    from pptx import Presentation
+    from pptx.util import Inches, Pt
+
+    slides = params.get("slides")
+    output = params.get("output")
+    if not isinstance(slides, list) or not slides:
+        raise ValueError('"slides" must be a non-empty array')
+    if not output:
+        raise ValueError('"output" is required')
+
+    start = time.perf_counter()
+    layout = params.get("layout") or "LAYOUT_16x9"
+    width, height = (10, 5.625) if isinstance(layout, str) else (layout["width"], layout["height"])
+    prs = Presentation()
+    prs.slide_width, prs.slide_height = Inches(width), Inches(height)
+
+    errors = []
+    for index, slide in enumerate(slides):
+        # Read and parse before adding the slide so bad input is reported for that
+        # slide alone (like the Node worker) instead of failing the whole batch
+        try:
+            if isinstance(slide, dict):
+                html = slide.get("html")
+                if not isinstance(html, str):
+                    raise ValueError('inline slide needs an "html" string')
+            elif isinstance(slide, str):
+                html = Path(slide).read_text(encoding="utf-8")
+            else:
+                raise ValueError(f"slide must be a path or {{html}} object, got {type(slide).__name__}")
+            text = _SlideText()
+            text.feed(html)
+            text.close()
+        except (OSError, UnicodeDecodeError, ValueError) as e:
+            if params.get("strict"):
+                raise ValueError(f"slide {index + 1}: {e}") from e
+            errors.append({"index": index, "message": str(e)})
+            continue
+        lines = text.lines
+        title = text.title or (lines[0] if lines else "")
+
+        page = prs.slides.add_slide(prs.slide_layouts[6])
+        box = page.shapes.add_textbox(Inches(0.4), Inches(0.4), Inches(width - 0.8), Inches(0.8))
+        box.text_frame.text = title
+        # Paragraph-level size also applies when the title is empty (no runs)
+        box.text_frame.paragraphs[0].font.size = Pt(18)
+        body = [line for line in lines if line != title]
+        if body:
+            box = page.shapes.add_textbox(
+                Inches(0.4), Inches(1.3), Inches(width - 0.8), Inches(height - 1.7)
+            )
+            box.text_frame.word_wrap = True
+            box.text_frame.text = "\n".join(body)
+
+    output_path = Path(output).resolve()
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    prs.save(str(output_path))
+    return {
+        "output": str(output_path),
+        "slides": len(slides) - len(errors),
+        "errors": errors,
+        "elapsedMs": (time.perf_counter() - start) * 1000,
+    }
+
+
+def serve_stand_in():
+    """Answer worker requests on stdin/stdout until stdin closes or shutdown."""
+    methods = {
+        "ping": lambda params: {"pid": os.getpid(), "browser": False, "standIn": True},
+        "convert": _stand_in_convert,
+        "shutdown": lambda params: {"ok": True},
+    }
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            request = {}
+            response = {"id": None, "error": {"code": -32700, "message": f"Parse error: {e}"}}
+        else:
+            method = methods.get(request.get("method"))
+            if method is None:
+                response = {
+                    "id": request.get("id"),
+                    "error": {"code": -32601, "message": f"Unknown method: {request.get('method')}"},
+                }
+            else:
+                try:
+                    response = {"id": request.get("id"), "result": method(request.get("params"))}
+                except Exception as e:  # Reported to the client like worker errors
+                    response = {"id": request.get("id"), "error": {"code": -32000, "message": str(e)}}
+        sys.stdout.write(json.dumps({"jsonrpc": "2.0", **response}, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+        if request.get("method") == "shutdown":
+            break
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,845 @@
+#!/usr/bin/env python3
+"""Build PPTX slides straight from course JSON layouts, without HTML.
+
+The primary workflow renders each slide to HTML and lets html2pptx lay it
+out in a headless browser, which costs 3-5 seconds per deck. This module
+maps the education-course layouts (cover, list-bullets, content-2col,
+diagram-kraljic) directly onto python-pptx shapes:
+
+- Sizes, colors and spacing are read from ``styles/variables.css`` and
+  applied with the rules of ``theme-strategic-edu.css`` (header with a
+  session-colored rule and badge, footer, bullet lists with accent bullets,
+  callouts, section titles, cover gradient, Kraljic quadrants).
+- Text is measured before it is placed (glyph advances from autofit.py and
+  exact line spacing), so every box gets the height its text needs and the
+  blocks stack like the CSS flow.
+- If a slide's content does not fit the content area, the body text steps
+  down (line height 1.8 -> 1.5, then smaller hierarchy sizes) until it
+  does. Slides that still overflow at the smallest step are reported.
+
+Usage:
+    python layout_pptx.py ../data/part1-session1-complete.json output.pptx
+    python layout_pptx.py deck.json output.pptx --css ../templates/education-course/styles/variables.css
+
+Python:
+    prs, reports = build_presentation(json.load(open("deck.json")))
+    prs.save("output.pptx")
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from autofit import FONT_HIERARCHY, glyph_metrics, wrapped_line_count
+from lxml import etree
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.enum.text import MSO_ANCHOR, MSO_AUTO_SIZE, PP_ALIGN
+from pptx.oxml.ns import qn
+from pptx.util import Emu, Pt
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "education-course"
+VARIABLES_CSS = TEMPLATE_DIR / "styles" / "variables.css"
+
+EMU_PER_PX = 9525  # 96 dpi, the CSS pixel
+PX_PER_PT = 96 / 72
+MEASURE_SLACK_PX = 4  # Measure slightly narrower than the box to absorb renderer differences
+MIN_BODY_SIZE = 10  # Smallest regular body size; caption size is the last resort
+
+# Callout type -> variables.css color (theme-strategic-edu.css callout-why/how/sowhat)
+CALLOUT_COLORS = {
+    "why": "color-accent",
+    "how": "color-secondary",
+    "sowhat": "color-success",
+    "info": "color-info",
+    "success": "color-success",
+    "warning": "color-warning",
+    "danger": "color-danger",
+}
+
+# Kraljic quadrants in grid order: (data key, name, English name, color variable)
+KRALJIC_QUADRANTS = (
+    ("bottleneck", "병목자재", "Bottleneck Materials", "material-bottleneck"),
+    ("strategic", "전략자재", "Strategic Materials", "material-strategic"),
+    ("routine", "일상자재", "Routine Materials", "material-routine"),
+    ("leverage", "레버리지자재", "Leverage Materials", "material-leverage"),
+)
+KRALJIC_AXIS_X = "구매 임팩트 (Purchase Impact) →"
+KRALJIC_AXIS_Y = "공급 리스크 (Supply Risk) ↑"
+
+_BULLET_RE = re.compile(r"^[•*-]\s*")
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_VARIABLE_RE = re.compile(r"--([\w-]+)\s*:\s*([^;]+);")
+_REFERENCE_RE = re.compile(r"var\(--([\w-]+)\)")
+_LENGTH_RE = re.compile(r"^(-?[\d.]+)(px|pt)$")
+
+
+def main():
+    """Main entry point for command-line usage."""
+    parser = argparse.ArgumentParser(
+        description="Build a PPTX deck directly from course JSON layouts (no HTML step).",
+    )
+    parser.add_argument("input", help="Deck JSON with a 'slides' list")
+    parser.add_argument("output", help="Output PowerPoint file (.pptx)")
+    parser.add_argument("--css", default=str(VARIABLES_CSS), help="CSS variables file")
+    args = parser.parse_args()
+
+    input_path = Path(args.input)
+    if not input_path.exists():
+        print(f"Error: Input file not found: {args.input}")
+        sys.exit(1)
+
+    try:
+        with open(input_path, "r", encoding="utf-8") as f:
+            deck = json.load(f)
+    except json.JSONDecodeError as e:
+        print(f"Error: Invalid JSON in {args.input}: {e}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    try:
+        prs, reports = build_presentation(deck, Theme.from_css(Path(args.css)))
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    for report in reports:
+        print(f"  {report.summary()}")
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    prs.save(str(output_path))
+
+    overflowing = sum(1 for r in reports if not r.fits)
+    print(f"Built {len(reports)} slides in {elapsed * 1000:.0f} ms ({overflowing} overflowing)")
+    print(f"Saved presentation to: {args.output}")
+
+
+# ---------------------------------------------------------------------------
+# Theme (variables.css)
+# ---------------------------------------------------------------------------
+
+
+class Theme:
+    """CSS custom properties from variables.css, with var() references resolved."""
+
+    def __init__(self, variables: Dict[str, str]):
+        self.variables = variables
+
+    @classmethod
+    def from_css(cls, css_path: Path = VARIABLES_CSS) -> "Theme":
+        text = _COMMENT_RE.sub("", css_path.read_text(encoding="utf-8"))
+        return cls({name: value.strip() for name, value in _VARIABLE_RE.findall(text)})
+
+    def value(self, name: str) -> str:
+        if name not in self.variables:
+            raise ValueError(f"CSS variable --{name} is not defined")
+        return _REFERENCE_RE.sub(lambda m: self.value(m.group(1)), self.variables[name])
+
+    def px(self, name: str) -> float:
+        """Length in CSS pixels (px or pt values)."""
+        value = self.value(name)
+        match = _LENGTH_RE.match(value)
+        if not match:
+            raise ValueError(f"CSS variable --{name} is not a px/pt length: {value}")
+        number = float(match.group(1))
+        return number * PX_PER_PT if match.group(2) == "pt" else number
+
+    def pt(self, name: str) -> float:
+        """Font size in points."""
+        return round(self.px(name) / PX_PER_PT, 2)
+
+    def number(self, name: str) -> float:
+        return float(self.value(name))
+
+    def color(self, name: str) -> RGBColor:
+        return RGBColor.from_string(self.value(name).lstrip("#").upper())
+
+    def session_color(self, session: int) -> RGBColor:
+        """Accent of the ``.session-N`` classes (primary when the session has none)."""
+        name = f"session-{session}"
+        return self.color(name if name in self.variables else "color-primary")
+
+    @property
+    def font_family(self) -> str:
+        return self.value("font-family").split(",")[0].strip().strip("'\"")
+
+
+def tint(color: RGBColor, alpha: float) -> RGBColor:
+    """``color`` at ``alpha`` opacity over a white slide (CSS rgba backgrounds)."""
+    return RGBColor(*(round(c * alpha + 255 * (1 - alpha)) for c in color))
+
+
+# ---------------------------------------------------------------------------
+# Text measurement
+# ---------------------------------------------------------------------------
+
+
+class TextMeasurer:
+    """Wrapped line counts for the theme font, in CSS pixels.
+
+    Advances come from autofit.glyph_metrics at a 100px reference size and
+    are scaled linearly, so every font size shares one glyph cache. Line
+    counts are memoized per measurer, since fitting re-measures the same
+    text at each candidate size.
+    """
+
+    REFERENCE_SIZE = 100
+
+    def __init__(self, font_name: str):
+        self.regular = glyph_metrics(font_name, self.REFERENCE_SIZE)
+        self.bold = glyph_metrics(f"{font_name} Bold", self.REFERENCE_SIZE)
+        self._line_counts: Dict[Tuple[str, float, float, bool], int] = {}
+
+    def line_count(self, text: str, width_px: float, size_pt: float, bold: bool = False) -> int:
+        key = (text, width_px, size_pt, bold)
+        count = self._line_counts.get(key)
+        if count is None:
+            metrics = self.bold if bold else self.regular
+            scale = self.REFERENCE_SIZE / (size_pt * PX_PER_PT)
+            max_width = max(width_px - MEASURE_SLACK_PX, 1.0) * scale
+            count = sum(wrapped_line_count(line, max_width, metrics) for line in text.split("\n"))
+            self._line_counts[key] = count
+        return count
+
+    def text_width(self, text: str, size_pt: float, bold: bool = False) -> float:
+        metrics = self.bold if bold else self.regular
+        return metrics.width(text) * size_pt * PX_PER_PT / self.REFERENCE_SIZE
+
+
+@dataclass
+class ParagraphSpec:
+    """One paragraph as it will be written: font, spacing and optional bullet."""
+
+    text: str
+    size: float  # pt
+    color: RGBColor
+    bold: bool = False
+    italic: bool = False
+    line_height: float = 1.5  # Multiple of the font size (CSS line-height)
+    space_after: float = 0.0  # px
+    align: PP_ALIGN = PP_ALIGN.LEFT
+    alpha: float = 1.0
+    bullet_color: Optional[RGBColor] = None
+    bullet_size: float = 0.0  # pt
+    indent: float = 0.0  # px, text inset from the bullet position
+
+    @property
+    def line_px(self) -> float:
+        return self.size * self.line_height * PX_PER_PT
+
+    def height(self, width_px: float, measurer: TextMeasurer) -> float:
+        lines = measurer.line_count(self.text, width_px - self.indent, self.size, self.bold)
+        return lines * self.line_px
+
+
+@dataclass
+class TextBlock:
+    """A box in the vertical flow: paragraphs plus CSS padding, fill and borders."""
+
+    paragraphs: List[ParagraphSpec]
+    margin_bottom: float = 0.0  # px
+    margin_top: float = 0.0  # px
+    padding: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0)  # left, top, right, bottom
+    fill: Optional[RGBColor] = None
+    radius: float = 0.0  # px
+    border_left: Optional[Tuple[RGBColor, float]] = None
+    border_bottom: Optional[Tuple[RGBColor, float]] = None
+    anchor: MSO_ANCHOR = MSO_ANCHOR.TOP
+
+    def text_width(self, width: float) -> float:
+        border = self.border_left[1] if self.border_left else 0.0
+        return width - self.padding[0] - self.padding[2] - border
+
+    def text_height(self, width: float, measurer: TextMeasurer) -> float:
+        inner = self.text_width(width)
+        heights = [p.height(inner, measurer) for p in self.paragraphs]
+        spacing = sum(p.space_after for p in self.paragraphs[:-1])
+        return sum(heights) + spacing
+
+    def height(self, width: float, measurer: TextMeasurer) -> float:
+        border = self.border_bottom[1] if self.border_bottom else 0.0
+        return self.text_height(width, measurer) + self.padding[1] + self.padding[3] + border
+
+
+def stack_height(blocks: Sequence[TextBlock], width: float, measurer: TextMeasurer) -> float:
+    """Height of blocks stacked with their margins (no margin after the last one)."""
+    total = 0.0
+    for i, block in enumerate(blocks):
+        total += block.margin_top + block.height(width, measurer)
+        if i < len(blocks) - 1:
+            total += block.margin_bottom
+    return total
+
+
+# ---------------------------------------------------------------------------
+# Drawing
+# ---------------------------------------------------------------------------
+
+
+def _emu(px: float) -> Emu:
+    return Emu(round(px * EMU_PER_PX))
+
+
+class SlideCanvas:
+    """Draws px-positioned rectangles and text boxes onto one slide."""
+
+    def __init__(self, slide, font_name: str):
+        self.slide = slide
+        self.font_name = font_name
+
+    def rect(
+        self, x: float, y: float, w: float, h: float, fill: RGBColor, radius: float = 0.0
+    ):
+        kind = MSO_SHAPE.ROUNDED_RECTANGLE if radius else MSO_SHAPE.RECTANGLE
+        shape = self.slide.shapes.add_shape(kind, _emu(x), _emu(y), _emu(w), _emu(h))
+        if radius:
+            shape.adjustments[0] = min(radius / min(w, h), 0.5)
+        shape.fill.solid()
+        shape.fill.fore_color.rgb = fill
+        shape.line.fill.background()
+        shape.shadow.inherit = False
+        return shape
+
+    def text(
+        self,
+        x: float,
+        y: float,
+        w: float,
+        h: float,
+        paragraphs: Sequence[ParagraphSpec],
+        anchor: MSO_ANCHOR = MSO_ANCHOR.TOP,
+        rotation: float = 0.0,
+    ):
+        box = self.slide.shapes.add_textbox(_emu(x), _emu(y), _emu(w), _emu(h))
+        box.rotation = rotation
+        frame = box.text_frame
+        frame.word_wrap = True
+        frame.auto_size = MSO_AUTO_SIZE.NONE
+        frame.vertical_anchor = anchor
+        frame.margin_left = frame.margin_right = frame.margin_top = frame.margin_bottom = 0
+        for i, spec in enumerate(paragraphs):
+            paragraph = frame.paragraphs[0] if i == 0 else frame.add_paragraph()
+            self._write_paragraph(paragraph, spec, last=i == len(paragraphs) - 1)
+        return box
+
+    def block(self, x: float, y: float, w: float, block: TextBlock, measurer: TextMeasurer) -> float:
+        """Draw a TextBlock at (x, y); returns its height."""
+        height = block.height(w, measurer)
+        if block.fill is not None:
+            self.rect(x, y, w, height, block.fill, block.radius)
+        border_left = 0.0
+        if block.border_left:
+            color, border_left = block.border_left
+            self.rect(x, y, border_left, height, color)
+        if block.border_bottom:
+            color, thickness = block.border_bottom
+            self.rect(x, y + height - thickness, w, thickness, color)
+        left, top, _, _ = block.padding
+        self.text(
+            x + border_left + left,
+            y + top,
+            block.text_width(w),
+            block.text_height(w, measurer),
+            block.paragraphs,
+            block.anchor,
+        )
+        return height
+
+    def _write_paragraph(self, paragraph, spec: ParagraphSpec, last: bool):
+        paragraph.alignment = spec.align
+        paragraph.line_spacing = Pt(spec.size * spec.line_height)
+        if spec.space_after and not last:
+            paragraph.space_after = Pt(spec.space_after / PX_PER_PT)
+        if spec.bullet_color is not None:
+            _set_bullet(paragraph, spec)
+
+        run = paragraph.add_run()
+        run.text = spec.text
+        font = run.font
+        font.size = Pt(spec.size)
+        font.bold = spec.bold
+        font.italic = spec.italic
+        font.color.rgb = spec.color
+        font.name = self.font_name
+        rPr = run._r.get_or_add_rPr()
+        etree.SubElement(rPr, qn("a:ea"), typeface=self.font_name)
+        if spec.alpha < 1.0:
+            color = rPr.find(qn("a:solidFill")).find(qn("a:srgbClr"))
+            etree.SubElement(color, qn("a:alpha"), val=str(round(spec.alpha * 100000)))
+
+
+def _set_bullet(paragraph, spec: ParagraphSpec):
+    """Hanging "•" bullet in its own color and size (CSS li::before)."""
+    pPr = paragraph._p.get_or_add_pPr()
+    pPr.set("marL", str(_emu(spec.indent)))
+    pPr.set("indent", str(-_emu(spec.indent)))
+    color = etree.SubElement(pPr, qn("a:buClr"))
+    etree.SubElement(color, qn("a:srgbClr"), val=str(spec.bullet_color))
+    size_pct = min(round(spec.bullet_size / spec.size * 100000), 400000)
+    etree.SubElement(pPr, qn("a:buSzPct"), val=str(size_pct))
+    etree.SubElement(pPr, qn("a:buChar"), char="•")
+
+
+# ---------------------------------------------------------------------------
+# Layout engine
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class BodyStyle:
+    """One fitting step: body font size, line height and list item spacing (px)."""
+
+    size: float
+    line_height: float
+    item_gap: float
+
+
+@dataclass
+class SlideReport:
+    """How one slide was laid out."""
+
+    index: int
+    layout: str
+    body: BodyStyle
+    overflow: float = 0.0  # px the content still exceeds its area by
+    notes: List[str] = field(default_factory=list)
+
+    @property
+    def fits(self) -> bool:
+        return self.overflow <= 0.5
+
+    def summary(self) -> str:
+        text = f"{self.index:2d} {self.layout}: body {self.body.size:g}pt / {self.body.line_height:g}"
+        if not self.fits:
+            text += f"  (overflows by {self.overflow:.0f}px)"
+        return text + "".join(f"  [{note}]" for note in self.notes)
+
+
+class LayoutEngine:
+    """Maps JSON slide layouts onto python-pptx shapes with measured text."""
+
+    def __init__(self, theme: Optional[Theme] = None):
+        self.theme = theme or Theme.from_css()
+        self.measurer = TextMeasurer(self.theme.font_family)
+        self.layouts: Dict[str, Callable[..., SlideReport]] = {
+            "cover": self._cover,
+            "list-bullets": self._list_bullets,
+            "content-2col": self._content_2col,
+            "diagram-kraljic": self._diagram_kraljic,
+        }
+        t = self.theme
+        self.width = t.px("slide-width")
+        self.height = t.px("slide-height")
+        self.margin = t.px("margin-outer")
+        self.body_steps = self._body_steps()
+
+    def _body_steps(self) -> List[BodyStyle]:
+        """Relaxed line height first, then normal, then smaller hierarchy sizes."""
+        t = self.theme
+        body = t.pt("font-size-body")
+        relaxed, normal = t.number("line-height-relaxed"), t.number("line-height-normal")
+        tight = t.number("line-height-tight")
+        gap, small_gap = t.px("spacing-sm"), t.px("spacing-xs")
+        steps = [BodyStyle(body, relaxed, gap), BodyStyle(body, normal, gap)]
+        steps += [
+            BodyStyle(size, normal, small_gap)
+            for size in sorted(FONT_HIERARCHY, reverse=True)
+            if MIN_BODY_SIZE <= size < body
+        ]
+        steps.append(BodyStyle(MIN_BODY_SIZE, tight, small_gap))
+        steps.append(BodyStyle(FONT_HIERARCHY[0], tight, small_gap))
+        return steps
+
+    # -- deck ----------------------------------------------------------------
+
+    def new_presentation(self) -> Presentation:
+        prs = Presentation()
+        prs.slide_width = _emu(self.width)
+        prs.slide_height = _emu(self.height)
+        return prs
+
+    def add_slide(self, prs: Presentation, layout: str, data: Dict) -> SlideReport:
+        """Add one slide; ``session`` defaults to 1 like edu-pptx-builder.js."""
+        if layout not in self.layouts:
+            raise ValueError(
+                f"Unknown layout '{layout}' (available: {', '.join(sorted(self.layouts))})"
+            )
+        blank = prs.slide_layouts[6]
+        slide = prs.slides.add_slide(blank)
+        canvas = SlideCanvas(slide, self.theme.font_family)
+        context = {**data, "session": data.get("session") or 1}
+        report = self.layouts[layout](canvas, context)
+        report.index = len(prs.slides)
+        report.layout = layout
+        return report
+
+    def build(self, deck: Dict) -> Tuple[Presentation, List[SlideReport]]:
+        """Build every slide of a course JSON (generate-course.js data shape)."""
+        prs = self.new_presentation()
+        reports = [
+            self.add_slide(prs, slide["layout"], {"session": deck.get("session"), **slide["data"]})
+            for slide in deck["slides"]
+        ]
+        return prs, reports
+
+    # -- shared pieces -------------------------------------------------------
+
+    def _para(self, text: str, size: float, color: str = "color-gray-800", **kwargs) -> ParagraphSpec:
+        return ParagraphSpec(str(text), size, self.theme.color(color), **kwargs)
+
+    def _fit(
+        self, needed: Callable[[BodyStyle], float], available: float
+    ) -> Tuple[BodyStyle, float]:
+        """First body step whose content fits; (last step, overflow) otherwise."""
+        for style in self.body_steps:
+            overflow = needed(style) - available
+            if overflow <= 0.5:
+                return style, 0.0
+        return style, overflow
+
+    def _header(self, canvas: SlideCanvas, data: Dict) -> float:
+        """.slide-header: title, session badge and colored rule; returns content top (px)."""
+        t = self.theme
+        color = t.session_color(data["session"])
+        x, y = self.margin, self.margin
+        width = self.width - 2 * self.margin
+        height = t.px("header-height")
+
+        badge = str(data.get("sessionBadge") or "")
+        if badge:
+            size = t.pt("font-size-caption")
+            pad_x, pad_y = t.px("spacing-md"), t.px("spacing-xs")
+            line = size * t.number("line-height-normal") * PX_PER_PT
+            badge_w = self.measurer.text_width(badge, size) + 2 * pad_x + MEASURE_SLACK_PX
+            badge_h = line + 2 * pad_y
+            badge_x = x + width - badge_w
+            canvas.rect(badge_x, y + (height - badge_h) / 2, badge_w, badge_h,
+                        color, t.px("border-radius"))
+            canvas.text(badge_x, y + (height - badge_h) / 2, badge_w, badge_h,
+                        [self._para(badge, size, "color-white",
+                                    align=PP_ALIGN.CENTER)], MSO_ANCHOR.MIDDLE)
+
+        title_w = width * 0.8
+        title_size = t.pt("font-size-title")
+        tight = t.number("line-height-tight")
+        for size in [title_size] + [s for s in sorted(FONT_HIERARCHY, reverse=True) if s < title_size]:
+            title = ParagraphSpec(str(data.get("title", "")), size, color, bold=True,
+                                  line_height=tight)
+            if title.height(title_w, self.measurer) <= height:
+                break
+        canvas.text(x, y, title_w, height, [title], MSO_ANCHOR.MIDDLE)
+
+        rule_y = y + height + t.px("spacing-sm")
+        canvas.rect(x, rule_y, width, t.px("border-width"), color)
+        return rule_y + t.px("border-width") + t.px("spacing-md")
+
+    def _footer(self, canvas: SlideCanvas, data: Dict) -> float:
+        """.slide-footer: rule, footer text and slide number; returns its top (px)."""
+        t = self.theme
+        x = self.margin
+        width = self.width - 2 * self.margin
+        height = t.px("footer-height")
+        bottom = self.height - self.margin
+        top = bottom - height - t.px("spacing-sm") - 1
+        if data.get("footer") or data.get("slideNumber"):
+            canvas.rect(x, top, width, 1, t.color("color-gray-300"))
+            size = t.pt("font-size-footer")
+            if data.get("footer"):
+                canvas.text(x, bottom - height, width * 0.8, height,
+                            [self._para(data["footer"], size, "color-gray-600")],
+                            MSO_ANCHOR.MIDDLE)
+            if data.get("slideNumber"):
+                canvas.text(x + width * 0.8, bottom - height, width * 0.2, height,
+                            [self._para(f"Slide {data['slideNumber']}", size, "color-gray-600",
+                                        align=PP_ALIGN.RIGHT)],
+                            MSO_ANCHOR.MIDDLE)
+        return top
+
+    def _content_frame(self, canvas: SlideCanvas, data: Dict) -> Tuple[float, float, float, float]:
+        """Header and footer, then the .layout-content area (x, y, w, h) between them.
+
+        The HTML footer is absolutely positioned over the flow; here the content
+        stops one small spacing above the footer rule instead of overlapping it.
+        """
+        t = self.theme
+        top = self._header(canvas, data) + t.px("spacing-md")
+        bottom = self._footer(canvas, data) - t.px("spacing-sm")
+        return self.margin, top, self.width - 2 * self.margin, bottom - top
+
+    def _governing(self, data: Dict, style: BodyStyle) -> List[TextBlock]:
+        if not data.get("governingMessage"):
+            return []
+        return [TextBlock(
+            [self._para(data["governingMessage"], style.size, "color-gray-700", italic=True,
+                        line_height=style.line_height)],
+            margin_bottom=self.theme.px("spacing-md"),
+        )]
+
+    def _body_text(self, text: str, style: BodyStyle) -> TextBlock:
+        """.body-text.mb-md"""
+        return TextBlock(
+            [self._para(text, style.size, line_height=style.line_height)],
+            margin_bottom=self.theme.px("spacing-md"),
+        )
+
+    def _bullet(self, text: str, style: BodyStyle) -> ParagraphSpec:
+        """.bullet-list li with its accent "•"."""
+        t = self.theme
+        return self._para(text, style.size, "color-gray-900", line_height=style.line_height,
+                          space_after=style.item_gap, bullet_color=t.color("color-accent"),
+                          bullet_size=t.pt("font-size-subtitle") * 1.5,
+                          indent=t.px("spacing-lg"))
+
+    def _bullet_list(self, items: Sequence[str], style: BodyStyle) -> TextBlock:
+        return TextBlock([self._bullet(item, style) for item in items],
+                         margin_bottom=self.theme.px("spacing-md"))
+
+    def _callout(self, callout: Dict, style: BodyStyle) -> TextBlock:
+        """.callout box: tinted background, thick left border, bold title."""
+        t = self.theme
+        kind = str(callout.get("type", "")).replace("callout-", "")
+        color_name = CALLOUT_COLORS.get(kind, "color-primary")
+        paragraphs = []
+        if callout.get("title"):
+            paragraphs.append(self._para(callout["title"], style.size, color_name, bold=True,
+                                         line_height=style.line_height,
+                                         space_after=style.item_gap))
+        if callout.get("content"):
+            paragraphs.append(self._para(callout["content"], style.size,
+                                         line_height=style.line_height))
+        padding = t.px("spacing-md")
+        return TextBlock(
+            paragraphs,
+            margin_bottom=padding,
+            padding=(padding, padding, padding, padding),
+            fill=tint(t.color(color_name), 0.1),
+            radius=t.px("border-radius"),
+            border_left=(t.color(color_name), t.px("border-width-thick")),
+        )
+
+    def _draw_stack(
+        self, canvas: SlideCanvas, blocks: Sequence[TextBlock], x: float, y: float, w: float
+    ) -> float:
+        for block in blocks:
+            y += block.margin_top
+            y += canvas.block(x, y, w, block, self.measurer) + block.margin_bottom
+        return y
+
+    # -- layouts -------------------------------------------------------------
+
+    def _cover(self, canvas: SlideCanvas, data: Dict) -> SlideReport:
+        """.layout-cover: gradient background, centered title, subtitle and meta lines."""
+        t = self.theme
+        fill = canvas.slide.background.fill
+        fill.gradient()
+        fill.gradient_angle = 315  # CSS 135deg: top-left to bottom-right
+        fill.gradient_stops[0].color.rgb = t.color("color-primary")
+        fill.gradient_stops[1].color.rgb = t.color("color-primary-dark")
+
+        width = self.width - 2 * self.margin
+        body = t.pt("font-size-body")
+        center = {"align": PP_ALIGN.CENTER}
+
+        def blocks(title_size: float) -> List[TextBlock]:
+            items = [TextBlock([self._para(data.get("title", ""), title_size, "color-white",
+                                           bold=True, line_height=t.number("line-height-tight"),
+                                           **center)],
+                               margin_bottom=t.px("spacing-lg"))]
+            if data.get("subtitle"):
+                items.append(TextBlock([self._para(data["subtitle"], 28, "color-white", alpha=0.9,
+                                                   **center)],
+                                       margin_bottom=t.px("spacing-2xl")))
+            meta = [data[key] for key in ("course", "date", "instructor") if data.get(key)]
+            if meta:
+                items.append(TextBlock([self._para(line, body, "color-white", alpha=0.8, **center)
+                                        for line in meta]))
+            return items
+
+        available = self.height - 2 * self.margin
+        for title_size in (48, 40, 36, 32):
+            items = blocks(title_size)
+            total = stack_height(items, width, self.measurer)
+            if total <= available:
+                break
+        self._draw_stack(canvas, items, self.margin, (self.height - total) / 2, width)
+        report = SlideReport(0, "cover", BodyStyle(body, t.number("line-height-normal"), 0.0),
+                             overflow=max(total - available, 0.0))
+        if title_size != 48:
+            report.notes.append(f"title {title_size}pt")
+        return report
+
+    def _list_bullets(self, canvas: SlideCanvas, data: Dict) -> SlideReport:
+        x, y, w, h = self._content_frame(canvas, data)
+
+        def blocks(style: BodyStyle) -> List[TextBlock]:
+            items = self._governing(data, style)
+            if data.get("introduction"):
+                items.append(self._body_text(data["introduction"], style))
+            items.append(self._bullet_list(data.get("items") or [], style))
+            if data.get("callout"):
+                items.append(self._callout(data["callout"], style))
+            return items
+
+        style, overflow = self._fit(lambda s: stack_height(blocks(s), w, self.measurer), h)
+        self._draw_stack(canvas, blocks(style), x, y, w)
+        return SlideReport(0, "list-bullets", style, overflow)
+
+    def _column(self, title: str, content: str, style: BodyStyle) -> List[TextBlock]:
+        """.section-title plus bulletListToUl content; unmarked lines become bold subheads."""
+        t = self.theme
+        blocks = []
+        if title:
+            blocks.append(TextBlock(
+                [self._para(title, t.pt("font-size-subtitle"), "color-primary", bold=True,
+                            line_height=t.number("line-height-tight"))],
+                margin_bottom=t.px("spacing-md"),
+                padding=(0.0, 0.0, 0.0, t.px("spacing-sm")),
+                border_bottom=(t.color("color-primary"), t.px("border-width")),
+            ))
+        paragraphs = []
+        for line in str(content or "").split("\n"):
+            if not line.strip():
+                continue
+            if _BULLET_RE.match(line):
+                paragraphs.append(self._bullet(_BULLET_RE.sub("", line), style))
+            else:
+                paragraphs.append(self._para(line.strip(), style.size, "color-gray-900",
+                                             bold=True, line_height=style.line_height,
+                                             space_after=t.px("spacing-xs")))
+        if paragraphs:
+            blocks.append(TextBlock(paragraphs))
+        return blocks
+
+    def _content_2col(self, canvas: SlideCanvas, data: Dict) -> SlideReport:
+        x, y, w, h = self._content_frame(canvas, data)
+        gap = self.theme.px("col-gap")
+        col_w = (w - gap) / 2
+
+        def needed(style: BodyStyle) -> float:
+            top = stack_height(self._governing(data, style), w, self.measurer)
+            if top:
+                top += self.theme.px("spacing-md")
+            left = self._column(data.get("leftTitle"), data.get("leftContent"), style)
+            right = self._column(data.get("rightTitle"), data.get("rightContent"), style)
+            return top + max(stack_height(left, col_w, self.measurer),
+                             stack_height(right, col_w, self.measurer))
+
+        style, overflow = self._fit(needed, h)
+        y = self._draw_stack(canvas, self._governing(data, style), x, y, w)
+        self._draw_stack(canvas, self._column(data.get("leftTitle"), data.get("leftContent"), style),
+                         x, y, col_w)
+        self._draw_stack(canvas, self._column(data.get("rightTitle"), data.get("rightContent"), style),
+                         x + col_w + gap, y, col_w)
+        return SlideReport(0, "content-2col", style, overflow)
+
+    def _quadrant(self, name: str, english: str, items: Sequence[str], size: float) -> List[ParagraphSpec]:
+        """.kraljic-quadrant text: name, English caption (optional) and the items on shared lines."""
+        tight = self.theme.number("line-height-tight")
+        center = {"align": PP_ALIGN.CENTER, "line_height": tight}
+        paragraphs = [self._para(name, size + 2, "color-white", bold=True, **center)]
+        if english:
+            paragraphs.append(self._para(english, max(size - 2, FONT_HIERARCHY[0]), "color-white",
+                                         italic=True, alpha=0.85, **center))
+        if items:
+            paragraphs.append(self._para(" · ".join(str(item) for item in items), size,
+                                         "color-white", **center))
+        return paragraphs
+
+    def _diagram_kraljic(self, canvas: SlideCanvas, data: Dict) -> SlideReport:
+        """Intro, 2x2 matrix (risk up, impact right) with axis labels, caption."""
+        t = self.theme
+        x, y, w, h = self._content_frame(canvas, data)
+        # The CSS matrix is a fixed 400px tall with 20px gaps, more than the 16:9
+        # content area holds; here it takes the remaining height with 10px gaps.
+        gap = t.px("spacing-sm")
+        pad = t.px("spacing-sm")
+        caption_size = t.pt("font-size-caption")
+        axis_line = caption_size * t.number("line-height-normal") * PX_PER_PT
+
+        def parts(style: BodyStyle) -> Tuple[List[TextBlock], Optional[TextBlock]]:
+            top = self._governing(data, style)
+            if data.get("introduction"):
+                top.append(self._body_text(data["introduction"], style))
+            caption = None
+            if data.get("caption"):
+                caption = TextBlock(
+                    [self._para(data["caption"], caption_size, "color-gray-600", italic=True,
+                                align=PP_ALIGN.CENTER)],
+                    margin_top=gap,
+                )
+            return top, caption
+
+        cell_w = (w - axis_line - gap) / 2
+
+        def quadrant_height(paragraphs: Sequence[ParagraphSpec]) -> float:
+            return sum(p.height(cell_w - 2 * pad, self.measurer) for p in paragraphs)
+
+        def needed(style: BodyStyle) -> float:
+            top, caption = parts(style)
+            fixed = sum(b.height(w, self.measurer) + b.margin_bottom for b in top)
+            if caption:
+                fixed += caption.margin_top + caption.height(w, self.measurer)
+            # The English caption is decoration: it is shown only where it fits
+            quadrant = max(
+                quadrant_height(self._quadrant(name, "", data.get(key) or [], style.size))
+                for key, name, _, _ in KRALJIC_QUADRANTS
+            )
+            return fixed + 2 * (quadrant + 2 * pad) + gap + axis_line
+
+        style, overflow = self._fit(needed, h)
+        report = SlideReport(0, "diagram-kraljic", style, overflow)
+        top, caption = parts(style)
+        matrix_y = self._draw_stack(canvas, top, x, y, w)
+        caption_h = caption.margin_top + caption.height(w, self.measurer) if caption else 0.0
+        matrix_h = y + h - caption_h - matrix_y
+        cell_h = (matrix_h - axis_line - gap) / 2
+        grid_x = x + axis_line
+        dropped: List[str] = []
+
+        for i, (key, name, english, color) in enumerate(KRALJIC_QUADRANTS):
+            cx = grid_x + (i % 2) * (cell_w + gap)
+            cy = matrix_y + (i // 2) * (cell_h + gap)
+            paragraphs = self._quadrant(name, english, data.get(key) or [], style.size)
+            if quadrant_height(paragraphs) > cell_h - 2 * pad:
+                paragraphs = self._quadrant(name, "", data.get(key) or [], style.size)
+                dropped.append(key)
+            canvas.rect(cx, cy, cell_w, cell_h, t.color(color), t.px("border-radius-large"))
+            canvas.text(cx + pad, cy + pad, cell_w - 2 * pad, cell_h - 2 * pad, paragraphs,
+                        MSO_ANCHOR.MIDDLE)
+
+        if dropped:
+            report.notes.append(f"English captions dropped: {', '.join(dropped)}")
+
+        grid_h = 2 * cell_h + gap
+        axis = {"align": PP_ALIGN.CENTER}
+        canvas.text(grid_x, matrix_y + grid_h, 2 * cell_w + gap, axis_line,
+                    [self._para(KRALJIC_AXIS_X, caption_size, "color-gray-700", **axis)],
+                    MSO_ANCHOR.MIDDLE)
+        # Rotated box: centered on the left strip, long side along the grid height
+        canvas.text(x + axis_line / 2 - grid_h / 2, matrix_y + grid_h / 2 - axis_line / 2,
+                    grid_h, axis_line,
+                    [self._para(KRALJIC_AXIS_Y, caption_size, "color-gray-700", **axis)],
+                    MSO_ANCHOR.MIDDLE, rotation=270)
+
+        if caption:
+            self._draw_stack(canvas, [caption], x, matrix_y + matrix_h, w)
+        return report
+
+
+def build_presentation(
+    deck: Dict, theme: Optional[Theme] = None
+) -> Tuple[Presentation, List[SlideReport]]:
+    """Build a deck from course JSON; returns the presentation and per-slide reports."""
+    return LayoutEngine(theme).build(deck)
+
+
+if __name__ == "__main__":
+    main()
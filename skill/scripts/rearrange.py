@@ -162,6 +162,22 @@ def rearrange_presentation(template_path, output_path, slide_sequence):
     else:
         prs = Presentation(template_path)
 
+    rearrange_slides(prs, slide_sequence)
+
+    # Save the presentation
+    prs.save(output_path)
+    print(f"\nSaved rearranged presentation to: {output_path}")
+    print(f"Final presentation has {len(prs.slides)} slides")
+
+
+def rearrange_slides(prs, slide_sequence):
+    """
+    Rearrange the slides of a loaded presentation in place.
+
+    Args:
+        prs: Presentation to modify
+        slide_sequence: List of slide indices (0-based) to include
+    """
     total_slides = len(prs.slides)
 
     # Validate indices
@@ -221,11 +237,6 @@ def rearrange_presentation(template_path, output_path, slide_sequence):
                     slide_map[i] += 1
             slide_map[target_pos] = target_pos
 
-    # Save the presentation
-    prs.save(output_path)
-    print(f"\nSaved rearranged presentation to: {output_path}")
-    print(f"Final presentation has {len(prs.slides)} slides")
-
 
 if __name__ == "__main__":
     main()
@@ -3,6 +3,10 @@
 
 Usage:
     python replace.py <input.pptx> <replacements.json> <output.pptx>
+    python replace.py <input.pptx> --batch <replacements_dir> <output_dir> [--jobs N]
+
+Batch mode inventories the template once and writes <output_dir>/<name>.pptx
+for every <replacements_dir>/<name>.json, filling decks in parallel processes.
 
 The replacements JSON should have the structure output by inventory.py.
 ALL text shapes identified by inventory.py will have their text cleared
@@ -10,9 +14,13 @@ unless "paragraphs" is specified in the replacements for that shape.
 """
 
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from inventory import InventoryData, extract_text_inventory
 from pptx import Presentation
@@ -211,62 +219,49 @@ def check_duplicate_keys(pairs):
     return result
 
 
-def apply_replacements(pptx_file: str, json_file: str, output_file: str):
-    """Apply text replacements from JSON to PowerPoint presentation."""
+def load_replacements(json_file: str) -> Dict:
+    """Load replacement JSON, rejecting duplicate keys."""
+    with open(json_file, "r") as f:
+        return json.load(f, object_pairs_hook=check_duplicate_keys)
 
-    # Load presentation
-    prs = Presentation(pptx_file)
 
-    # Get inventory of all text shapes (returns ShapeData objects)
-    # Pass prs to use same Presentation instance
-    inventory = extract_text_inventory(Path(pptx_file), prs)
+def report_validation_errors(errors: List[str]):
+    """Print validation errors and raise."""
+    print("ERROR: Invalid shapes in replacement JSON:")
+    for error in errors:
+        print(f"  - {error}")
+    print("\nPlease check the inventory and update your replacement JSON.")
+    print(
+        "You can regenerate the inventory with: python inventory.py <input.pptx> <output.json>"
+    )
+    raise ValueError(f"Found {len(errors)} validation error(s)")
 
-    # Detect text overflow in original presentation
-    original_overflow = detect_frame_overflow(inventory)
 
-    # Load replacement data with duplicate key detection
-    with open(json_file, "r") as f:
-        replacements = json.load(f, object_pairs_hook=check_duplicate_keys)
+def fill_shapes(
+    targets: Dict[str, Dict[str, Any]], replacements: Dict
+) -> Tuple[int, int, int]:
+    """Clear every target shape and write its replacement paragraphs.
 
-    # Validate replacements
-    errors = validate_replacements(inventory, replacements)
-    if errors:
-        print("ERROR: Invalid shapes in replacement JSON:")
-        for error in errors:
-            print(f"  - {error}")
-        print("\nPlease check the inventory and update your replacement JSON.")
-        print(
-            "You can regenerate the inventory with: python inventory.py <input.pptx> <output.json>"
-        )
-        raise ValueError(f"Found {len(errors)} validation error(s)")
+    Args:
+        targets: slide_key -> shape_key -> shape, in inventory order
+        replacements: Parsed replacement JSON
 
-    # Track statistics
+    Returns:
+        Tuple of (shapes_processed, shapes_cleared, shapes_replaced)
+    """
     shapes_processed = 0
     shapes_cleared = 0
     shapes_replaced = 0
 
-    # Process each slide from inventory
-    for slide_key, shapes_dict in inventory.items():
-        if not slide_key.startswith("slide-"):
-            continue
-
-        slide_index = int(slide_key.split("-")[1])
-
-        if slide_index >= len(prs.slides):
-            print(f"Warning: Slide {slide_index} not found")
-            continue
-
-        # Process each shape from inventory
-        for shape_key, shape_data in shapes_dict.items():
+    for slide_key, shapes in targets.items():
+        for shape_key, shape in shapes.items():
             shapes_processed += 1
 
-            # Get the shape directly from ShapeData
-            shape = shape_data.shape
             if not shape:
                 print(f"Warning: {shape_key} has no shape reference")
                 continue
 
-            # ShapeData already validates text_frame in __init__
+            # Inventory only lists shapes with a text_frame
             text_frame = shape.text_frame  # type: ignore
 
             text_frame.clear()  # type: ignore
@@ -288,20 +283,40 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
 
                 apply_paragraph_properties(p, para_data)
 
-    # Check for issues after replacements
-    # Save to a temporary file and reload to avoid modifying the presentation during inventory
-    # (extract_text_inventory accesses font.color which adds empty <a:solidFill/> elements)
-    import tempfile
+    return shapes_processed, shapes_cleared, shapes_replaced
 
-    with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as tmp:
-        tmp_path = Path(tmp.name)
-        prs.save(str(tmp_path))
 
-    try:
-        updated_inventory = extract_text_inventory(tmp_path)
-        updated_overflow = detect_frame_overflow(updated_inventory)
-    finally:
-        tmp_path.unlink()  # Clean up temp file
+def inventory_targets(prs, inventory: InventoryData) -> Dict[str, Dict[str, Any]]:
+    """Map inventory keys to the shapes of ``prs`` they were taken from."""
+    targets = {}
+    for slide_key, shapes_dict in inventory.items():
+        if not slide_key.startswith("slide-"):
+            continue
+
+        slide_index = int(slide_key.split("-")[1])
+        if slide_index >= len(prs.slides):
+            print(f"Warning: Slide {slide_index} not found")
+            continue
+
+        targets[slide_key] = {
+            shape_key: shape_data.shape for shape_key, shape_data in shapes_dict.items()
+        }
+    return targets
+
+
+def find_output_issues(
+    pptx_bytes: bytes, original_overflow: Dict[str, Dict[str, float]]
+) -> Tuple[List[str], List[str]]:
+    """Re-inventory the saved output and collect worsened overflow and warnings.
+
+    The output is inventoried from a reloaded copy, because extract_text_inventory
+    accesses font.color, which adds empty <a:solidFill/> elements.
+
+    Returns:
+        Tuple of (overflow_errors, warnings)
+    """
+    updated_inventory = extract_text_inventory(Path(), Presentation(BytesIO(pptx_bytes)))
+    updated_overflow = detect_frame_overflow(updated_inventory)
 
     # Check if any text overflow got worse
     overflow_errors = []
@@ -326,7 +341,14 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
                 for warning in shape_data.warnings:
                     warnings.append(f"{slide_key}/{shape_key}: {warning}")
 
-    # Fail if there are any issues
+    return overflow_errors, warnings
+
+
+def check_replacement_output(
+    pptx_bytes: bytes, original_overflow: Dict[str, Dict[str, float]]
+):
+    """Print the issues find_output_issues reports and raise if there are any."""
+    overflow_errors, warnings = find_output_issues(pptx_bytes, original_overflow)
     if overflow_errors or warnings:
         print("\nERROR: Issues detected in replacement output:")
         if overflow_errors:
@@ -342,10 +364,50 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
             f"Found {len(overflow_errors)} overflow error(s) and {len(warnings)} warning(s)"
         )
 
-    # Save the presentation
-    prs.save(output_file)
 
-    # Report results
+def save_to_bytes(prs) -> bytes:
+    """Serialize a presentation to in-memory .pptx bytes."""
+    buffer = BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+def replace_in_presentation(
+    prs, inventory: InventoryData, replacements: Dict
+) -> Tuple[bytes, Tuple[int, int, int]]:
+    """Apply replacements to a loaded presentation and check the result.
+
+    Args:
+        prs: Presentation to modify in place
+        inventory: Inventory of ``prs`` (extract_text_inventory with the same prs)
+        replacements: Parsed replacement JSON
+
+    Returns:
+        Tuple of (checked .pptx bytes, (processed, cleared, replaced) counts)
+
+    Raises:
+        ValueError: If replacements reference unknown shapes, overflow worsens,
+            or the output has formatting warnings
+    """
+    # Detect text overflow in original presentation
+    original_overflow = detect_frame_overflow(inventory)
+
+    # Validate replacements
+    errors = validate_replacements(inventory, replacements)
+    if errors:
+        report_validation_errors(errors)
+
+    counts = fill_shapes(inventory_targets(prs, inventory), replacements)
+
+    # Check for issues after replacements
+    output_bytes = save_to_bytes(prs)
+    check_replacement_output(output_bytes, original_overflow)
+    return output_bytes, counts
+
+
+def print_replacement_report(prs, output_file: str, counts: Tuple[int, int, int]):
+    """Report the results of a replacement run."""
+    shapes_processed, shapes_cleared, shapes_replaced = counts
     print(f"Saved updated presentation to: {output_file}")
     print(f"Processed {len(prs.slides)} slides")
     print(f"  - Shapes processed: {shapes_processed}")
@@ -353,8 +415,173 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
     print(f"  - Shapes replaced: {shapes_replaced}")
 
 
+def apply_replacements(pptx_file: str, json_file: str, output_file: str):
+    """Apply text replacements from JSON to PowerPoint presentation."""
+
+    # Load presentation
+    prs = Presentation(pptx_file)
+
+    # Get inventory of all text shapes (returns ShapeData objects)
+    # Pass prs to use same Presentation instance
+    inventory = extract_text_inventory(Path(pptx_file), prs)
+
+    # Load replacement data with duplicate key detection
+    replacements = load_replacements(json_file)
+
+    output_bytes, counts = replace_in_presentation(prs, inventory, replacements)
+    Path(output_file).write_bytes(output_bytes)
+    print_replacement_report(prs, output_file, counts)
+
+
+# ---------------------------------------------------------------------------
+# Batch mode: one template, many replacement JSONs
+# ---------------------------------------------------------------------------
+
+ShapePath = Tuple[int, ...]  # Child indices from slide.shapes down through groups
+_SHAPE_TAGS = {"sp", "grpSp", "graphicFrame", "cxnSp", "pic", "contentPart"}
+
+
+def shape_paths(inventory: InventoryData) -> Dict[str, Dict[str, ShapePath]]:
+    """Locate every inventoried shape by its index path within its slide.
+
+    Paths survive pickling, so workers can find the same shapes in their own
+    copy of the template without re-running the inventory.
+    """
+    paths: Dict[str, Dict[str, ShapePath]] = {}
+    for slide_key, shapes_dict in inventory.items():
+        slide_paths = paths[slide_key] = {}
+        for shape_key, shape_data in shapes_dict.items():
+            element = shape_data.shape._element  # type: ignore
+            path = []
+            while element.getparent() is not None and element.getparent().tag.endswith("}grpSp"):
+                parent = element.getparent()
+                path.append(_shape_children(parent).index(element))
+                element = parent
+            path.append(_shape_children(element.getparent()).index(element))
+            slide_paths[shape_key] = tuple(reversed(path))
+    return paths
+
+
+def _shape_children(tree) -> List[Any]:
+    """Shape elements of an spTree/grpSp, in the order python-pptx iterates them."""
+    return [child for child in tree if child.tag.split("}")[-1] in _SHAPE_TAGS]
+
+
+def resolve_shape(slide, path: ShapePath):
+    """Follow an index path from shape_paths back to a python-pptx shape."""
+    shapes = slide.shapes
+    for index in path[:-1]:
+        shapes = shapes[index].shapes
+    return shapes[path[-1]]
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one replacement JSON in a batch."""
+
+    json_file: str
+    output_file: str
+    shapes_replaced: int = 0
+    error: Optional[str] = None
+
+
+_worker_template: bytes = b""
+_worker_paths: Dict[str, Dict[str, ShapePath]] = {}
+_worker_overflow: Dict[str, Dict[str, float]] = {}
+
+
+def _init_worker(template: bytes, paths, original_overflow):
+    global _worker_template, _worker_paths, _worker_overflow
+    _worker_template, _worker_paths, _worker_overflow = template, paths, original_overflow
+
+
+def _replace_one(json_file: str, replacements: Dict, output_file: str) -> BatchResult:
+    """Apply one replacement set to a fresh copy of the worker's template bytes."""
+    result = BatchResult(json_file, output_file)
+    try:
+        prs = Presentation(BytesIO(_worker_template))
+        targets = {
+            slide_key: {
+                shape_key: resolve_shape(prs.slides[int(slide_key.split("-")[1])], path)
+                for shape_key, path in shape_paths_dict.items()
+            }
+            for slide_key, shape_paths_dict in _worker_paths.items()
+        }
+        _, _, result.shapes_replaced = fill_shapes(targets, replacements)
+        output_bytes = save_to_bytes(prs)
+        overflow_errors, warnings = find_output_issues(output_bytes, _worker_overflow)
+        if overflow_errors or warnings:
+            result.error = "; ".join(overflow_errors + warnings)
+        else:
+            Path(output_file).write_bytes(output_bytes)
+    except Exception as e:
+        result.error = str(e)
+    return result
+
+
+def apply_replacements_batch(
+    pptx_file: str, jobs: List[Tuple[str, str]], workers: Optional[int] = None
+) -> List[BatchResult]:
+    """Apply many replacement JSONs to one template.
+
+    The template is loaded and inventoried once. Each (json_file, output_file)
+    job is validated against that inventory, then filled in a worker process
+    that opens its own copy of the template from the in-memory package bytes.
+
+    Args:
+        pptx_file: Template presentation
+        jobs: (replacements JSON, output .pptx) pairs
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+
+    Returns:
+        One BatchResult per job, in job order
+    """
+    template = Path(pptx_file).read_bytes()
+    inventory = extract_text_inventory(Path(pptx_file), Presentation(BytesIO(template)))
+    paths = shape_paths(inventory)
+    original_overflow = detect_frame_overflow(inventory)
+
+    results: List[Optional[BatchResult]] = [None] * len(jobs)
+    pending = []
+    for i, (json_file, output_file) in enumerate(jobs):
+        try:
+            replacements = load_replacements(json_file)
+        except (OSError, ValueError) as e:
+            results[i] = BatchResult(json_file, output_file, error=str(e))
+            continue
+        errors = validate_replacements(inventory, replacements)
+        if errors:
+            results[i] = BatchResult(json_file, output_file, error="; ".join(errors))
+            continue
+        pending.append((i, json_file, replacements, output_file))
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(pending) < 2:
+        _init_worker(template, paths, original_overflow)
+        for i, json_file, replacements, output_file in pending:
+            results[i] = _replace_one(json_file, replacements, output_file)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(pending)),
+            initializer=_init_worker,
+            initargs=(template, paths, original_overflow),
+        ) as pool:
+            futures = [
+                (i, pool.submit(_replace_one, json_file, replacements, output_file))
+                for i, json_file, replacements, output_file in pending
+            ]
+            for i, future in futures:
+                results[i] = future.result()
+
+    return results  # type: ignore
+
+
 def main():
     """Main entry point for command-line usage."""
+    if len(sys.argv) >= 5 and sys.argv[2] == "--batch":
+        batch_main(sys.argv[1:])
+        return
+
     if len(sys.argv) != 4:
         print(__doc__)
         sys.exit(1)
@@ -381,5 +608,40 @@ def main():
         sys.exit(1)
 
 
+def batch_main(args: List[str]):
+    """Command-line batch mode: <input.pptx> --batch <json_dir> <output_dir> [--jobs N]."""
+    workers = None
+    if "--jobs" in args:
+        i = args.index("--jobs")
+        workers = int(args[i + 1])
+        del args[i : i + 2]
+    if len(args) != 4:
+        print(__doc__)
+        sys.exit(1)
+
+    input_pptx, _, json_dir, output_dir = (Path(arg) for arg in args)
+    if not input_pptx.exists():
+        print(f"Error: Input file '{input_pptx}' not found")
+        sys.exit(1)
+    json_files = sorted(json_dir.glob("*.json"))
+    if not json_files:
+        print(f"Error: No replacement JSON files found in '{json_dir}'")
+        sys.exit(1)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    jobs = [(str(f), str(output_dir / f"{f.stem}.pptx")) for f in json_files]
+    results = apply_replacements_batch(str(input_pptx), jobs, workers)
+
+    for result in results:
+        if result.error:
+            print(f"FAILED {result.json_file}: {result.error}")
+        else:
+            print(f"Saved {result.output_file} ({result.shapes_replaced} shapes replaced)")
+    failed = sum(1 for r in results if r.error)
+    print(f"Batch complete: {len(results) - failed} of {len(results)} decks written")
+    if failed:
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
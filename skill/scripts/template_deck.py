@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Build a deck from a template in memory: rearrange, inventory and replace.
+
+The file-based workflow runs rearrange.py (save), inventory.py (load) and
+replace.py (load, save a temporary copy, reload, save), so one deck costs
+three to five full load/save cycles. TemplateDeck loads the template once
+and keeps working on that package. The only other load is the output check
+that replace.py always does, and it reads in-memory bytes.
+
+Usage:
+    # 1. Inventory of the rearranged deck, to write replacements against
+    python template_deck.py template.pptx 0,5,5,12 --inventory text-inventory.json
+
+    # 2. Rearrange, replace and save in one pass (same sequence as step 1)
+    python template_deck.py template.pptx 0,5,5,12 --replacements replacement-text.json \\
+        --output output.pptx
+
+Python:
+    deck = TemplateDeck("template.pptx")
+    deck.rearrange([0, 5, 5, 12])
+    inventory = deck.inventory()
+    deck.replace(replacements)
+    deck.save("output.pptx")
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from inventory import InventoryData, extract_text_inventory, save_inventory
+from pptx import Presentation
+from rearrange import rearrange_slides
+from replace import load_replacements, print_replacement_report, replace_in_presentation
+
+
+class TemplateDeck:
+    """One loaded template, carried through rearrange, inventory and replace."""
+
+    def __init__(self, template_path: str):
+        self.template_path = Path(template_path)
+        self.prs = Presentation(str(self.template_path))
+        self._inventory: Optional[InventoryData] = None
+        self._output_bytes: Optional[bytes] = None
+        self.counts = (0, 0, 0)
+
+    def rearrange(self, slide_sequence: List[int]) -> "TemplateDeck":
+        """Keep, duplicate and reorder slides (see rearrange.py)."""
+        if self._output_bytes is not None:
+            raise ValueError("Cannot rearrange after replacements have been applied")
+        rearrange_slides(self.prs, slide_sequence)
+        self._inventory = None
+        return self
+
+    def inventory(self) -> InventoryData:
+        """Text inventory of the current slides (computed once per arrangement).
+
+        Like replace.py, this reads run colors through python-pptx, which adds
+        empty <a:solidFill/> elements; save a rearranged-only deck first.
+        """
+        if self._inventory is None:
+            self._inventory = extract_text_inventory(self.template_path, self.prs)
+        return self._inventory
+
+    def save_inventory(self, output_path: str):
+        """Write the inventory JSON that replacements are authored against."""
+        save_inventory(self.inventory(), Path(output_path))
+
+    def replace(self, replacements: Dict) -> "TemplateDeck":
+        """Apply replacement JSON data; raises ValueError like replace.py."""
+        if self._output_bytes is not None:
+            raise ValueError("Replacements have already been applied")
+        self._output_bytes, self.counts = replace_in_presentation(
+            self.prs, self.inventory(), replacements
+        )
+        return self
+
+    def save(self, output_path: str):
+        """Write the deck; after replace() these are the already-checked bytes."""
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        if self._output_bytes is not None:
+            Path(output_path).write_bytes(self._output_bytes)
+        else:
+            self.prs.save(output_path)
+
+
+def build_deck(
+    template_path: str,
+    slide_sequence: List[int],
+    replacements: Dict,
+    output_path: str,
+) -> TemplateDeck:
+    """Rearrange, replace and save in one pass."""
+    deck = TemplateDeck(template_path)
+    deck.rearrange(slide_sequence)
+    deck.replace(replacements)
+    deck.save(output_path)
+    return deck
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rearrange, inventory and replace a template deck in memory.",
+    )
+    parser.add_argument("template", help="Path to template PPTX file")
+    parser.add_argument(
+        "sequence", help="Comma-separated sequence of slide indices (0-based)"
+    )
+    parser.add_argument("--inventory", help="Write the text inventory JSON here")
+    parser.add_argument("--replacements", help="Replacement JSON to apply")
+    parser.add_argument("--output", help="Path for output PPTX file")
+    args = parser.parse_args()
+
+    if not (args.inventory or args.output):
+        parser.error("nothing to do: give --inventory and/or --output")
+    if args.replacements and not args.output:
+        parser.error("--replacements requires --output")
+
+    try:
+        slide_sequence = [int(x.strip()) for x in args.sequence.split(",")]
+    except ValueError:
+        print(
+            "Error: Invalid sequence format. Use comma-separated integers (e.g., 0,34,34,50,52)"
+        )
+        sys.exit(1)
+
+    if not Path(args.template).exists():
+        print(f"Error: Template file not found: {args.template}")
+        sys.exit(1)
+
+    try:
+        deck = TemplateDeck(args.template)
+        deck.rearrange(slide_sequence)
+
+        if args.output and not args.replacements:
+            deck.save(args.output)
+            print(f"Saved rearranged presentation to: {args.output}")
+
+        if args.inventory:
+            deck.save_inventory(args.inventory)
+            inventory = deck.inventory()
+            total_shapes = sum(len(shapes) for shapes in inventory.values())
+            print(f"Inventory saved to: {args.inventory} ({total_shapes} text elements)")
+
+        if args.replacements:
+            deck.replace(load_replacements(args.replacements))
+            deck.save(args.output)
+            print_replacement_report(deck.prs, args.output, deck.counts)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
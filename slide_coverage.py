@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Slide Coverage Engine - 슬라이드별 실제 점유 면적(사각형 합집합), 여백 맵, 영역별 밀도
+shape 면적을 단순 합산하면 겹침/그룹 자식이 중복 집계되어 100%를 넘으므로,
+그룹 변환(chOff/chExt → off/ext)을 적용한 절대 좌표 사각형의 합집합 면적을 정확히 계산
+
+- union_area: 좌표 압축 + 2D 차분 배열(sweep-line과 동일한 결과)로 정확한 합집합 면적 (NumPy)
+- occupancy_grid: 설정 해상도(cells/inch)의 점유 비트맵 → 여백 맵 / 최대 빈 사각형
+- region_density: 슬라이드를 rows×cols 영역으로 나눠 영역별 정확한 점유율
+
+좌표는 축 정렬 프레임 기준 (회전은 반영하지 않음). 입력은 deck_analysis / pptx_xml_scan의 DeckFacts.
+
+Usage:
+    from pptx_xml_scan import scan_deck
+    from slide_coverage import deck_coverage
+
+    for cov in deck_coverage(scan_deck("deck.pptx")):
+        print(cov.slide, f"{cov.coverage:.1%}", cov.regions)
+
+    python3 slide_coverage.py deck.pptx [--map]     # 슬라이드별 점유율 (+ 여백 맵)
+"""
+
+import sys
+import time
+
+import numpy as np
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+from deck_analysis import EMU_PER_INCH
+
+DEFAULT_CELLS_PER_INCH = 4
+DEFAULT_REGIONS = (3, 3)
+
+
+# ============================================================================
+# 절대 좌표 (그룹 변환 적용)
+# ============================================================================
+
+def shape_frames(facts):
+    """
+    facts.shapes 행과 같은 순서의 절대 프레임 배열 (N, 4) = [left, top, right, bottom] (EMU)
+
+    그룹 자식 좌표는 그룹의 child_frame(chOff/chExt)에서 그룹 프레임(off/ext)으로
+    스케일+이동 변환. 행은 전위 순회 순서라 부모 변환이 항상 먼저 계산됨.
+    좌표가 없는 shape(상속 불가 placeholder 등)와 그 자식은 NaN.
+    """
+    shapes = facts.shapes
+    frames = np.full((len(shapes), 4), np.nan)
+    transforms = {}     # 그룹 행 → (ox, oy, sx, sy): 자식 좌표 → 슬라이드 좌표
+
+    columns = zip(shapes["parent"], shapes["left"], shapes["top"], shapes["width"],
+                  shapes["height"], shapes["shape_type"], shapes["child_frame"])
+    for row, (parent, left, top, width, height, shape_type, child_frame) in enumerate(columns):
+        if left is None or top is None or width is None or height is None:
+            continue
+        if parent is not None:
+            if parent not in transforms:
+                continue
+            ox, oy, sx, sy = transforms[parent]
+            left, top, width, height = ox + left * sx, oy + top * sy, width * sx, height * sy
+        frames[row] = (left, top, left + width, top + height)
+
+        if shape_type == MSO_SHAPE_TYPE.GROUP:
+            if child_frame is None:
+                transforms[row] = (0.0, 0.0, 1.0, 1.0)
+                continue
+            ch_left, ch_top, ch_width, ch_height = child_frame
+            sx = width / ch_width if ch_width else 1.0
+            sy = height / ch_height if ch_height else 1.0
+            transforms[row] = (left - ch_left * sx, top - ch_top * sy, sx, sy)
+    return frames
+
+
+def slide_boxes(facts, frames, slide, bounds=None):
+    """
+    슬라이드의 리프 shape(그룹 제외) 사각형 (M, 4), bounds(기본: 슬라이드 전체)로 클리핑
+    면적이 0인 사각형(선, 잘려나간 shape)은 제외
+    """
+    rows = facts.shapes.indices(slide=slide, shape_type=lambda t: t != MSO_SHAPE_TYPE.GROUP)
+    boxes = frames[rows]
+    boxes = boxes[~np.isnan(boxes).any(axis=1)]
+    left, top, right, bottom = bounds or (0, 0, facts.slide_width, facts.slide_height)
+    boxes = np.column_stack([
+        np.clip(boxes[:, 0], left, right), np.clip(boxes[:, 1], top, bottom),
+        np.clip(boxes[:, 2], left, right), np.clip(boxes[:, 3], top, bottom),
+    ])
+    return boxes[(boxes[:, 2] > boxes[:, 0]) & (boxes[:, 3] > boxes[:, 1])]
+
+
+# ============================================================================
+# 합집합 면적 / 점유 비트맵
+# ============================================================================
+
+def union_area(boxes):
+    """
+    사각형 합집합의 정확한 면적
+
+    x/y 경계 좌표를 압축한 격자에 사각형마다 네 모서리 ±1을 찍고 누적합하면
+    각 격자 칸을 덮는 사각형 수가 나옴 (sweep-line의 활성 구간 카운트와 동일).
+    덮인 칸의 (dx × dy)를 더하면 겹침 없이 정확한 면적.
+    """
+    if len(boxes) == 0:
+        return 0.0
+    xs = np.unique(boxes[:, [0, 2]])
+    ys = np.unique(boxes[:, [1, 3]])
+    x0, x1 = np.searchsorted(xs, boxes[:, 0]), np.searchsorted(xs, boxes[:, 2])
+    y0, y1 = np.searchsorted(ys, boxes[:, 1]), np.searchsorted(ys, boxes[:, 3])
+
+    diff = np.zeros((len(xs), len(ys)), dtype=np.int32)
+    np.add.at(diff, (x0, y0), 1)
+    np.add.at(diff, (x0, y1), -1)
+    np.add.at(diff, (x1, y0), -1)
+    np.add.at(diff, (x1, y1), 1)
+    covered = diff.cumsum(axis=0).cumsum(axis=1)[:-1, :-1] > 0
+    return float((np.diff(xs)[:, None] * np.diff(ys)[None, :])[covered].sum())
+
+
+def occupancy_grid(boxes, width, height, cells_per_inch=DEFAULT_CELLS_PER_INCH):
+    """
+    점유 비트맵 (rows, cols) bool - 칸의 중심이 사각형 안에 있으면 True
+
+    width/height는 EMU, 해상도는 cells_per_inch (10.83" × 7.5" @ 4 → 30 × 44)
+    마지막 행/열은 슬라이드 경계에서 잘린 칸 - 중심도 잘린 칸 기준이라 가장자리까지 닿는 shape가 덮음
+    """
+    cell = EMU_PER_INCH / cells_per_inch
+    cols = int(np.ceil(width / cell))
+    rows = int(np.ceil(height / cell))
+    diff = np.zeros((rows + 1, cols + 1), dtype=np.int32)
+    if len(boxes):
+        # 중심이 [start, end) 에 드는 칸 범위 = start/end보다 작은 중심의 개수
+        x_centers, y_centers = (
+            (np.arange(n) * cell + np.minimum(np.arange(1, n + 1) * cell, size)) / 2
+            for n, size in ((cols, width), (rows, height))
+        )
+        c0, c1 = (np.searchsorted(x_centers, boxes[:, k]) for k in (0, 2))
+        r0, r1 = (np.searchsorted(y_centers, boxes[:, k]) for k in (1, 3))
+        np.add.at(diff, (r0, c0), 1)
+        np.add.at(diff, (r0, c1), -1)
+        np.add.at(diff, (r1, c0), -1)
+        np.add.at(diff, (r1, c1), 1)
+    return diff.cumsum(axis=0).cumsum(axis=1)[:rows, :cols] > 0
+
+
+def largest_empty_rect(grid):
+    """비트맵에서 가장 큰 빈 사각형 (row, col, rows, cols) - 히스토그램 스택 방식 O(rows × cols)"""
+    best = (0, 0, 0, 0)
+    heights = np.zeros(grid.shape[1] + 1, dtype=int)
+    for r, covered in enumerate(grid):
+        heights[:-1] = np.where(covered, 0, heights[:-1] + 1)
+        stack = []
+        for c, h in enumerate(heights):
+            start = c
+            while stack and stack[-1][1] >= h:
+                start, top_height = stack.pop()
+                if top_height * (c - start) > best[2] * best[3]:
+                    best = (r - top_height + 1, start, top_height, c - start)
+            stack.append((start, h))
+    return best
+
+
+def region_density(boxes, width, height, regions=DEFAULT_REGIONS):
+    """slide를 rows × cols 영역으로 나눈 영역별 정확한 점유율 (0~1) 배열"""
+    rows, cols = regions
+    xs = np.linspace(0, width, cols + 1)
+    ys = np.linspace(0, height, rows + 1)
+    density = np.zeros(regions)
+    for r in range(rows):
+        for c in range(cols):
+            clipped = np.column_stack([
+                np.clip(boxes[:, 0], xs[c], xs[c + 1]), np.clip(boxes[:, 1], ys[r], ys[r + 1]),
+                np.clip(boxes[:, 2], xs[c], xs[c + 1]), np.clip(boxes[:, 3], ys[r], ys[r + 1]),
+            ]) if len(boxes) else boxes
+            if len(clipped):
+                clipped = clipped[(clipped[:, 2] > clipped[:, 0]) & (clipped[:, 3] > clipped[:, 1])]
+            area = (xs[c + 1] - xs[c]) * (ys[r + 1] - ys[r])
+            density[r, c] = union_area(clipped) / area if area else 0.0
+    return density
+
+
+# ============================================================================
+# 슬라이드 / 덱 단위 결과
+# ============================================================================
+
+class SlideCoverage:
+    """슬라이드 하나의 점유 결과"""
+
+    def __init__(self, slide, coverage, area_sum, regions, grid, cells_per_inch, size):
+        self.slide = slide
+        self.coverage = coverage            # 합집합 점유율 (0~1)
+        self.area_sum = area_sum            # 최상위 shape 면적 단순 합 / 슬라이드 면적 (겹침 중복)
+        self.regions = regions              # 영역별 점유율 배열 (rows × cols)
+        self.grid = grid                    # 점유 비트맵
+        self.cells_per_inch = cells_per_inch
+        self.size = size                    # 슬라이드 (width, height) - inches
+
+    @property
+    def whitespace(self):
+        return 1.0 - self.coverage
+
+    @property
+    def largest_gap(self):
+        """가장 큰 빈 사각형 (left, top, width, height) - inches, 슬라이드 경계로 자름"""
+        row, col, rows, cols = largest_empty_rect(self.grid)
+        cell = 1 / self.cells_per_inch
+        left, top = col * cell, row * cell
+        right = min((col + cols) * cell, self.size[0])
+        bottom = min((row + rows) * cell, self.size[1])
+        return (left, top, right - left, bottom - top)
+
+    def whitespace_map(self, filled="█", empty="·"):
+        """점유 비트맵의 텍스트 렌더링 (한 줄 = 한 행)"""
+        return "\n".join("".join(filled if v else empty for v in row) for row in self.grid)
+
+    def region_summary(self):
+        """영역별 점유율 한 줄 요약 (행은 ' | '로 구분, %)"""
+        return " | ".join("/".join(f"{v * 100:.0f}" for v in row) for row in self.regions)
+
+
+def deck_coverage(facts, cells_per_inch=DEFAULT_CELLS_PER_INCH, regions=DEFAULT_REGIONS):
+    """DeckFacts → 슬라이드별 SlideCoverage 리스트 (절대 좌표는 한 번만 계산)"""
+    width, height = facts.slide_width, facts.slide_height
+    slide_area = width * height
+    frames = shape_frames(facts)
+    shapes = facts.shapes
+
+    results = []
+    for slide in facts.slides():
+        boxes = slide_boxes(facts, frames, slide)
+        area_sum = sum((w or 0) * (h or 0) for w, h in
+                       shapes.rows("width", "height", slide=slide, depth=0))
+        results.append(SlideCoverage(
+            slide,
+            coverage=union_area(boxes) / slide_area,
+            area_sum=area_sum / slide_area,
+            regions=region_density(boxes, width, height, regions),
+            grid=occupancy_grid(boxes, width, height, cells_per_inch),
+            cells_per_inch=cells_per_inch,
+            size=(width / EMU_PER_INCH, height / EMU_PER_INCH),
+        ))
+    return results
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python3 slide_coverage.py <pptx_file> [--map]")
+        sys.exit(1)
+
+    from pptx_xml_scan import scan_deck
+
+    facts = scan_deck(sys.argv[1])
+    start = time.perf_counter()
+    coverages = deck_coverage(facts)
+    elapsed = time.perf_counter() - start
+
+    print("=" * 80)
+    print(f"Slide coverage: {sys.argv[1]}")
+    print("=" * 80)
+    for cov in coverages:
+        gap = cov.largest_gap
+        print(f"Slide {cov.slide:3d}: coverage {cov.coverage * 100:5.1f}% "
+              f"(area sum {cov.area_sum * 100:6.1f}%)  regions {cov.region_summary()}  "
+              f"largest gap {gap[2]:.2f}\" × {gap[3]:.2f}\"")
+        if "--map" in sys.argv:
+            print(cov.whitespace_map())
+    print("=" * 80)
+    print(f"  {len(coverages)} slides in {elapsed * 1000:.1f} ms "
+          f"(scan {facts.elapsed * 1000:.1f} ms)")
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Reference Style Profile - 레퍼런스 덱의 스타일 지문(fingerprint) 추출 + 파일 해시 키 디스크 캐시
+analyze_s4hana_* 스크립트처럼 매번 레퍼런스를 다시 분석하지 않고, 덱마다 한 번 계산한
+고정 길이 카운트 벡터를 캐시해 두었다가 생성 덱과 한 번의 벡터 연산으로 비교
+
+지문 구성 (FEATURES 순서로 이어붙인 하나의 카운트 벡터):
+- font_size:  run 글자 크기 히스토그램 (정수 pt 0~47, 48+)
+- shape_type: shape 타입 구성 (AUTO_SHAPE, TEXT_BOX, PLACEHOLDER, ...)
+- density:    슬라이드별 점유율(slide_coverage 합집합) 분포 10구간
+- palette:    채우기/글자 색 팔레트 (채널당 3bit 양자화 = 512색, schemeClr는 테마 색으로 해석)
+- grid_x/y:   리프 shape 가장자리 위치 (슬라이드 폭/높이의 1% 구간) → 정렬선
+
+비교: 구성 요소별로 정규화한 분포 사이의 total variation distance를
+np.add.reduceat 한 번으로 계산 → similarity = 1 - distance (0~1)
+
+캐시 파일: .style_cache/fingerprints.pickle
+- 키: 덱 파일 SHA-1 (복사/이름 변경된 같은 덱도 재사용)
+- (mtime_ns, size)가 같으면 해시 계산도 생략 (course_cache와 같은 방식)
+- 저장 전 prune: 사라진 파일의 경로 기록과 어느 경로도 가리키지 않는 지문(수정 전 덱) 제거
+
+Usage:
+    from style_profile import StyleProfile
+
+    profile = StyleProfile.from_decks(["PPTX_SAMPLE/S4HANA_....pptx"])
+    scores = profile.compare(scan_deck("generated.pptx"))   # {"font_size": 0.82, ..., "overall": 0.74}
+
+    python3 style_profile.py                               # 기본 레퍼런스 프로필 요약
+    python3 style_profile.py generated.pptx [--reference ref.pptx ...]
+"""
+
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+from course_cache import file_digest
+from pptx_xml_scan import scan_deck
+from slide_coverage import shape_frames, slide_boxes, union_area
+
+# ============================================================================
+# 설정
+# ============================================================================
+REPO_ROOT = Path(__file__).resolve().parent
+CACHE_DIR = REPO_ROOT / ".style_cache"
+CACHE_FILE = "fingerprints.pickle"
+FINGERPRINT_VERSION = 2  # FEATURES 구성이나 추출 규칙이 바뀌면 올릴 것 (2: 테마 색 팔레트)
+
+DEFAULT_REFERENCES = [REPO_ROOT / "PPTX_SAMPLE" / "S4HANA_PI단계_단계 종료보고_20230510_v.1.4.pptx"]
+
+SHAPE_TYPE_BINS = (
+    MSO_SHAPE_TYPE.AUTO_SHAPE, MSO_SHAPE_TYPE.TEXT_BOX, MSO_SHAPE_TYPE.PLACEHOLDER,
+    MSO_SHAPE_TYPE.PICTURE, MSO_SHAPE_TYPE.GROUP, MSO_SHAPE_TYPE.LINE, MSO_SHAPE_TYPE.TABLE,
+    MSO_SHAPE_TYPE.FREEFORM, MSO_SHAPE_TYPE.CHART,
+)   # 마지막 칸 = 기타
+
+FONT_SIZE_MAX = 48
+DENSITY_BINS = 10
+PALETTE_BITS = 3
+GRID_BINS = 100
+
+FEATURES = (
+    ("font_size", FONT_SIZE_MAX + 1),
+    ("shape_type", len(SHAPE_TYPE_BINS) + 1),
+    ("density", DENSITY_BINS),
+    ("palette", 1 << (3 * PALETTE_BITS)),
+    ("grid_x", GRID_BINS),
+    ("grid_y", GRID_BINS),
+)
+FEATURE_NAMES = tuple(name for name, _ in FEATURES)
+FEATURE_SIZES = np.array([size for _, size in FEATURES])
+FEATURE_STARTS = np.concatenate([[0], np.cumsum(FEATURE_SIZES)[:-1]])
+FEATURE_SLICES = {name: slice(start, start + size)
+                  for (name, size), start in zip(FEATURES, FEATURE_STARTS)}
+FEATURE_LENGTH = int(FEATURE_SIZES.sum())
+
+# 종합 점수 가중치 (순서 = FEATURES)
+FEATURE_WEIGHTS = np.array([0.25, 0.20, 0.15, 0.10, 0.15, 0.15])
+
+
+# ============================================================================
+# 덱 → 카운트 벡터
+# ============================================================================
+
+def _edge_bins(values, extent):
+    values = values[~np.isnan(values)] / extent
+    values = values[(values >= 0) & (values <= 1)]
+    return np.bincount(np.minimum((values * GRID_BINS).astype(int), GRID_BINS - 1),
+                       minlength=GRID_BINS)
+
+
+def deck_counts(facts):
+    """DeckFacts → 지문 카운트 벡터 (길이 FEATURE_LENGTH)"""
+    counts = np.zeros(FEATURE_LENGTH)
+    shapes, runs = facts.shapes, facts.runs
+
+    sizes = np.array([size for size in runs["size_pt"] if size is not None])
+    if len(sizes):
+        counts[FEATURE_SLICES["font_size"]] = np.bincount(
+            np.clip(np.rint(sizes), 0, FONT_SIZE_MAX).astype(int), minlength=FONT_SIZE_MAX + 1)
+
+    type_index = {shape_type: i for i, shape_type in enumerate(SHAPE_TYPE_BINS)}
+    counts[FEATURE_SLICES["shape_type"]] = np.bincount(
+        [type_index.get(shape_type, len(SHAPE_TYPE_BINS)) for shape_type in shapes["shape_type"]],
+        minlength=len(SHAPE_TYPE_BINS) + 1)
+
+    frames = shape_frames(facts)
+    slide_area = facts.slide_width * facts.slide_height
+    coverages = np.array([union_area(slide_boxes(facts, frames, slide)) / slide_area
+                          for slide in facts.slides()])
+    if len(coverages):
+        counts[FEATURE_SLICES["density"]] = np.bincount(
+            np.minimum((coverages * DENSITY_BINS).astype(int), DENSITY_BINS - 1),
+            minlength=DENSITY_BINS)
+
+    colors = [rgb for rgb in shapes["fill_rgb"] if rgb is not None]
+    colors += [rgb for rgb in runs["color_rgb"] if rgb is not None]
+    if colors:
+        q = np.array(colors) >> (8 - PALETTE_BITS)
+        counts[FEATURE_SLICES["palette"]] = np.bincount(
+            (q[:, 0] << (2 * PALETTE_BITS)) | (q[:, 1] << PALETTE_BITS) | q[:, 2],
+            minlength=1 << (3 * PALETTE_BITS))
+
+    leaves = frames[[shape_type != MSO_SHAPE_TYPE.GROUP for shape_type in shapes["shape_type"]]]
+    counts[FEATURE_SLICES["grid_x"]] = _edge_bins(leaves[:, [0, 2]].ravel(), facts.slide_width)
+    counts[FEATURE_SLICES["grid_y"]] = _edge_bins(leaves[:, [1, 3]].ravel(), facts.slide_height)
+    return counts
+
+
+def normalize(counts):
+    """구성 요소별 합이 1이 되도록 정규화 (1D 또는 덱 × 특징 2D)"""
+    counts = np.atleast_2d(counts).astype(float)
+    totals = np.repeat(np.add.reduceat(counts, FEATURE_STARTS, axis=1), FEATURE_SIZES, axis=1)
+    return np.divide(counts, totals, out=np.zeros_like(counts), where=totals > 0)
+
+
+# ============================================================================
+# 디스크 캐시 (파일 해시 키)
+# ============================================================================
+
+class FingerprintCache:
+    """
+    덱 지문 캐시
+
+    entries: {SHA-1: {"counts": ndarray, "slide_count": int, "width": int, "height": int}}
+    paths:   {절대경로: ((mtime_ns, size), SHA-1)}  - 변경 없는 파일은 해시 계산 생략
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_path = Path(cache_dir) / CACHE_FILE
+        self.entries = {}
+        self.paths = {}
+        self.dirty = False
+        self.stats = {"hit": 0, "rehash": 0, "computed": 0}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_path, "rb") as f:
+                data = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return
+        if data.get("version") == FINGERPRINT_VERSION:
+            self.entries = data.get("entries", {})
+            self.paths = data.get("paths", {})
+
+    def save(self):
+        """변경이 있을 때만 원자적으로 기록 (tmp → rename)"""
+        if not self.dirty:
+            return False
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"version": FINGERPRINT_VERSION, "entries": self.entries, "paths": self.paths},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.cache_path)
+        self.dirty = False
+        return True
+
+    def fingerprint(self, path, facts=None):
+        """덱 경로 → 지문 엔트리 (해시가 같으면 캐시, 아니면 scan_deck으로 계산)"""
+        path = Path(path).resolve()
+        st = path.stat()
+        stat_key = (st.st_mtime_ns, st.st_size)
+        known = self.paths.get(str(path))
+        if known is not None and known[0] == stat_key and known[1] in self.entries:
+            self.stats["hit"] += 1
+            return self.entries[known[1]]
+
+        digest = file_digest(path)
+        self.paths[str(path)] = (stat_key, digest)
+        self.dirty = True
+        if digest in self.entries:
+            self.stats["rehash"] += 1
+            return self.entries[digest]
+
+        facts = facts or scan_deck(path)
+        entry = {"counts": deck_counts(facts), "slide_count": facts.slide_count,
+                 "width": facts.slide_width, "height": facts.slide_height}
+        self.entries[digest] = entry
+        self.stats["computed"] += 1
+        return entry
+
+    def prune(self):
+        """사라진 파일의 경로 기록과 어느 경로도 가리키지 않는 지문 제거"""
+        for key in [k for k in self.paths if not Path(k).exists()]:
+            del self.paths[key]
+            self.dirty = True
+        live = {digest for _, digest in self.paths.values()}
+        for digest in [d for d in self.entries if d not in live]:
+            del self.entries[digest]
+            self.dirty = True
+
+
+# ============================================================================
+# 프로필
+# ============================================================================
+
+class StyleProfile:
+    """레퍼런스 덱 묶음의 스타일 지문 (덱별 카운트를 합산 후 구성 요소별 정규화)"""
+
+    def __init__(self, counts, decks=(), slide_count=0, slide_width=0, slide_height=0):
+        self.counts = np.asarray(counts, dtype=float)
+        self.distribution = normalize(self.counts)[0]
+        self.decks = list(decks)
+        self.slide_count = slide_count
+        self.slide_width = slide_width
+        self.slide_height = slide_height
+
+    @classmethod
+    def from_decks(cls, paths=None, cache=None):
+        """레퍼런스 덱들의 프로필 (지문은 캐시에서, 없으면 계산 후 저장)"""
+        paths = [Path(p) for p in (paths or DEFAULT_REFERENCES)]
+        own_cache = cache is None
+        cache = cache or FingerprintCache()
+        entries = [cache.fingerprint(path) for path in paths]
+        if own_cache:
+            cache.prune()
+            cache.save()
+        return cls(
+            np.sum([entry["counts"] for entry in entries], axis=0),
+            decks=[str(path) for path in paths],
+            slide_count=sum(entry["slide_count"] for entry in entries),
+            slide_width=entries[0]["width"] if entries else 0,
+            slide_height=entries[0]["height"] if entries else 0,
+        )
+
+    # ------------------------------------------------------------------
+    # 비교
+    # ------------------------------------------------------------------
+    def similarity(self, counts):
+        """
+        카운트 벡터(1D) 또는 덱 × 특징 행렬(2D) → 구성 요소별 similarity 배열
+
+        similarity = 1 - total variation distance (둘 다 비어 있는 요소는 1)
+        """
+        distance = np.add.reduceat(np.abs(normalize(counts) - self.distribution),
+                                   FEATURE_STARTS, axis=1) / 2
+        return 1.0 - distance
+
+    def compare(self, facts):
+        """DeckFacts → {구성 요소: similarity, ..., "overall": 가중 평균}"""
+        scores = self.similarity(deck_counts(facts))[0]
+        result = dict(zip(FEATURE_NAMES, scores.tolist()))
+        result["overall"] = float(scores @ FEATURE_WEIGHTS)
+        return result
+
+    def compare_many(self, paths, cache=None):
+        """여러 덱을 한 번에 비교 → [{...}] (지문은 캐시 사용)"""
+        cache = cache or FingerprintCache()
+        matrix = np.array([cache.fingerprint(path)["counts"] for path in paths])
+        cache.prune()
+        cache.save()
+        scores = self.similarity(matrix)
+        results = []
+        for row in scores:
+            result = dict(zip(FEATURE_NAMES, row.tolist()))
+            result["overall"] = float(row @ FEATURE_WEIGHTS)
+            results.append(result)
+        return results
+
+    # ------------------------------------------------------------------
+    # 요약
+    # ------------------------------------------------------------------
+    def component(self, name):
+        return self.distribution[FEATURE_SLICES[name]]
+
+    def font_size_histogram(self):
+        """{pt: 비율} (0이 아닌 크기만)"""
+        return {pt: share for pt, share in enumerate(self.component("font_size")) if share > 0}
+
+    def shape_type_mix(self):
+        """{타입 이름: 비율}"""
+        names = [shape_type.name for shape_type in SHAPE_TYPE_BINS] + ["OTHER"]
+        return {name: share for name, share in zip(names, self.component("shape_type")) if share > 0}
+
+    def density_distribution(self):
+        """[(하한 %, 상한 %, 슬라이드 비율)]"""
+        step = 100 // DENSITY_BINS
+        return [(i * step, (i + 1) * step, share) for i, share in enumerate(self.component("density"))]
+
+    def palette(self, top=8):
+        """[((r, g, b) 구간 중심, 비율)] 상위 top개"""
+        shares = self.component("palette")
+        half = 1 << (7 - PALETTE_BITS)
+        mask = (1 << PALETTE_BITS) - 1
+        result = []
+        for index in np.argsort(shares)[::-1][:top]:
+            if shares[index] == 0:
+                break
+            channels = [(index >> shift) & mask for shift in (2 * PALETTE_BITS, PALETTE_BITS, 0)]
+            result.append((tuple(int((c << (8 - PALETTE_BITS)) + half) for c in channels),
+                           float(shares[index])))
+        return result
+
+    def alignment_lines(self, axis="x", top=6):
+        """가장 많은 shape 가장자리가 모이는 위치 [(inches, 비율)] - 정렬 그리드 후보"""
+        shares = self.component(f"grid_{axis}")
+        extent = (self.slide_width if axis == "x" else self.slide_height) / 914400
+        return [((index + 0.5) / GRID_BINS * extent, float(shares[index]))
+                for index in sorted(np.argsort(shares)[::-1][:top]) if shares[index] > 0]
+
+
+def style_rule(profile, min_similarity=0.6):
+    """deck_analysis Rule - 구성 요소별 similarity가 기준 미만이면 경고 (stats["style"]에 점수 기록)"""
+    from deck_analysis import Rule
+
+    def check(facts, stats):
+        scores = profile.compare(facts)
+        stats["style"] = scores
+        return [f"⚠️  Style '{name}' similarity to reference: {scores[name]:.2f} (target ≥{min_similarity:.2f})"
+                for name in FEATURE_NAMES if scores[name] < min_similarity]
+
+    return Rule("style_profile", "warning", check)
+
+
+def print_profile(profile):
+    print(f"  Decks: {len(profile.decks)}, Slides: {profile.slide_count}")
+    print("  Font sizes: " + ", ".join(f"{pt}pt {share * 100:.0f}%"
+                                      for pt, share in profile.font_size_histogram().items()
+                                      if share >= 0.01))
+    print("  Shape mix:  " + ", ".join(f"{name} {share * 100:.0f}%"
+                                      for name, share in profile.shape_type_mix().items()))
+    print("  Density:    " + ", ".join(f"{low}-{high}% {share * 100:.0f}%"
+                                      for low, high, share in profile.density_distribution() if share > 0))
+    print("  Palette:    " + ", ".join(f"RGB{rgb} {share * 100:.0f}%" for rgb, share in profile.palette()))
+    for axis in ("x", "y"):
+        print(f"  Grid {axis}:     " + ", ".join(f"{pos:.2f}\" ({share * 100:.0f}%)"
+                                                for pos, share in profile.alignment_lines(axis)))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    references = []
+    while "--reference" in args:
+        i = args.index("--reference")
+        references.append(args[i + 1])
+        del args[i:i + 2]
+
+    start = time.perf_counter()
+    cache = FingerprintCache()
+    profile = StyleProfile.from_decks(references or None, cache=cache)
+    elapsed = time.perf_counter() - start
+
+    print("=" * 80)
+    print("Reference Style Profile")
+    print("=" * 80)
+    print_profile(profile)
+    print(f"  Profile time: {elapsed * 1000:.1f} ms "
+          f"(hit={cache.stats['hit']} rehash={cache.stats['rehash']} computed={cache.stats['computed']})")
+
+    if args:
+        start = time.perf_counter()
+        results = profile.compare_many(args, cache=cache)
+        elapsed = time.perf_counter() - start
+        print("\n" + "=" * 80)
+        print("Similarity to reference (1.00 = identical distribution)")
+        print("=" * 80)
+        print(f"  {'deck':40s} " + " ".join(f"{name:>10s}" for name in FEATURE_NAMES) + "    overall")
+        for path, scores in zip(args, results):
+            print(f"  {Path(path).name[:40]:40s} " +
+                  " ".join(f"{scores[name]:10.2f}" for name in FEATURE_NAMES) +
+                  f"  {scores['overall']:9.2f}")
+        print(f"  Compare time: {elapsed * 1000:.1f} ms")
+    cache.prune()
+    cache.save()
+    print("=" * 80)
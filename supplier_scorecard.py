@@ -0,0 +1,475 @@
+#!/usr/bin/env python3
+"""
+Supplier Scorecard Engine - 납품/품질/가격 기록 → 공급업체별 가중 점수 → 등급/순위
+svg_generator_additional.generate_scorecard_template의 평가 체계를 그대로 사용:
+- 품질 30% (불량률 PPM, 검사 통과율) / 납기 30% (납기 준수율, 리드타임 안정성)
+- 가격 20% (시장가 대비 수준) / 협력 10% / 리스크 10% (평가 점수 0~100, 높을수록 양호)
+- 등급: A 90+ / B 70-89 / C 50-69 / D 50 미만
+
+증분 집계:
+- 기록을 (공급업체, 월) 버킷별 합계(건수, 정시 건수, 리드타임 합/제곱합, 불량 수, 금액 ...)로만 보관
+  → 합계는 더하기만 하면 되므로 새 달 파일을 넣어도 기존 버킷은 다시 계산하지 않음
+- ScorecardStore.save/load로 버킷을 JSON에 보관, 파일별로 넣은 바이트 위치를 기록
+  → 같은 파일에 행을 이어 붙이면 그 뒤의 행만 더함 (이미 넣은 부분이 바뀌었으면 ValueError)
+- 점수는 기간(start~end 월)의 버킷 합계에서 계산 (버킷 수만큼의 벡터 연산)
+
+입력 (CSV 또는 JSONL, 한 행 = 납품 1건 또는 평가 1건, 없는 값은 비워 둠):
+    supplier, date (YYYY-MM-DD) 또는 month (YYYY-MM),
+    quantity, defects, passed (검사 합격 0/1), on_time (0/1), lead_time_days,
+    unit_price, market_price, collaboration (0~100), risk_score (0~100)
+
+Usage:
+    from supplier_scorecard import ScorecardStore, add_supplier_ranking_slide
+
+    store = ScorecardStore.load("scorecard_state.json")     # 없으면 빈 저장소
+    store.ingest("deliveries_2024-12.jsonl")                 # 새 달만 추가
+    store.save("scorecard_state.json")
+    card = store.scorecard(start="2024-01")
+    add_supplier_ranking_slide(prs, card)
+
+    python3 supplier_scorecard.py                 # 샘플 11개월 CSV + 1개월 JSONL 증분 집계 데모
+    python3 supplier_scorecard.py state.json records.csv [records.jsonl ...] [--pptx out.pptx] [--svg]
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from kraljic import weighted_score
+from scm_data import (DEFAULT_CHUNK_SIZE, complete_size, iter_csv_chunks, iter_jsonl_chunks,
+                      read_header, write_csv_columns)
+
+CATEGORY_WEIGHTS = {"quality": 0.30, "delivery": 0.30, "price": 0.20, "collaboration": 0.10, "risk": 0.10}
+CATEGORY_NAMES = {"quality": "품질", "delivery": "납기", "price": "가격", "collaboration": "협력", "risk": "리스크"}
+GRADES = ("D", "C", "B", "A")
+GRADE_THRESHOLDS = (50, 70, 90)
+
+# 지표 → 0~100점 환산 기준 (선형, 범위 밖은 0/100)
+PPM_ZERO_SCORE = 5_000          # 불량률 5,000 PPM 이상 0점, 0 PPM 100점
+LEAD_TIME_CV_ZERO_SCORE = 0.5   # 리드타임 CV 0.5 이상 0점
+PRICE_INDEX_RANGE = (0.90, 1.10)   # 시장가 대비 90% 이하 100점, 110% 이상 0점
+
+FIELDS = ("deliveries", "on_time", "lead_time_n", "lead_time_sum", "lead_time_sq", "inspected_qty", "defects",
+          "lots", "lots_passed", "spend", "market_spend", "collab_n", "collab_sum", "risk_n", "risk_sum")
+RECORD_COLUMNS = ("quantity", "defects", "passed", "on_time", "lead_time_days", "unit_price", "market_price",
+                  "collaboration", "risk_score")
+KEY_SEPARATOR = "\t"
+CHECK_BYTES = 1 << 16   # 이미 넣은 부분 변경 검사: 파일 앞 64KB + 넣은 위치 직전 64KB의 SHA-1
+
+
+# ============================================================================
+# 증분 집계 저장소
+# ============================================================================
+
+def _ingested_digest(path, offset):
+    """[0, offset) 중 앞/끝 CHECK_BYTES의 SHA-1 (앞부분 수정, 마지막으로 넣은 줄 수정 감지)"""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        digest.update(f.read(min(offset, CHECK_BYTES)))
+        if offset > CHECK_BYTES:
+            f.seek(max(offset - CHECK_BYTES, CHECK_BYTES))
+            digest.update(f.read(offset - f.tell()))
+    return digest.hexdigest()
+
+
+def _record_sums(chunk):
+    """청크 → 행별 FIELDS 기여분 (행 × 필드) - NaN 값은 해당 합계와 건수에서 모두 빠짐"""
+    n = len(chunk["supplier"])
+
+    def column(name):
+        return chunk[name] if name in chunk else np.full(n, np.nan)
+
+    quantity, defects, passed, on_time = (column(name) for name in ("quantity", "defects", "passed", "on_time"))
+    lead_time, price, market = (column(name) for name in ("lead_time_days", "unit_price", "market_price"))
+    collab, risk = column("collaboration"), column("risk_score")
+
+    inspected = ~np.isnan(quantity) & ~np.isnan(defects)
+    priced = ~np.isnan(quantity) & ~np.isnan(price) & ~np.isnan(market)
+    contributions = np.column_stack([
+        ~np.isnan(on_time),
+        np.nan_to_num(on_time),
+        ~np.isnan(lead_time),
+        np.nan_to_num(lead_time),
+        np.nan_to_num(lead_time) ** 2,
+        np.where(inspected, quantity, 0.0),
+        np.where(inspected, defects, 0.0),
+        ~np.isnan(passed),
+        np.nan_to_num(passed),
+        np.where(priced, quantity * price, 0.0),
+        np.where(priced, quantity * market, 0.0),
+        ~np.isnan(collab),
+        np.nan_to_num(collab),
+        ~np.isnan(risk),
+        np.nan_to_num(risk),
+    ]).astype(np.float64)
+    return contributions
+
+
+class ScorecardStore:
+    """
+    (공급업체, 월) 버킷별 FIELDS 합계 + 파일별 넣은 위치
+
+    sources: {절대 경로: {"bytes": 넣은 바이트 수, "rows": 넣은 행 수, "digest": _ingested_digest}}
+    """
+
+    def __init__(self):
+        self.buckets = {}
+        self.sources = {}
+
+    @classmethod
+    def load(cls, path):
+        """저장된 상태 (파일이 없으면 빈 저장소)"""
+        store = cls()
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("fields") != list(FIELDS):
+                raise ValueError(f"{path}: 집계 필드가 다름 - 원본 기록으로 다시 만들어야 함")
+            store.buckets = {tuple(key.split(KEY_SEPARATOR)): np.array(values, dtype=np.float64)
+                             for key, values in state["buckets"].items()}
+            store.sources = state.get("sources", {})
+            if any(not isinstance(entry, dict) for entry in store.sources.values()):
+                raise ValueError(f"{path}: 파일별 넣은 위치가 없는 이전 형식 - 원본 기록으로 다시 만들어야 함")
+        return store
+
+    def save(self, path):
+        state = {
+            "fields": list(FIELDS),
+            "sources": self.sources,
+            "buckets": {KEY_SEPARATOR.join(key): values.tolist() for key, values in sorted(self.buckets.items())},
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+
+    @property
+    def months(self):
+        return sorted({month for _, month in self.buckets})
+
+    @property
+    def suppliers(self):
+        return sorted({supplier for supplier, _ in self.buckets})
+
+    def ingest(self, path, chunk_size=DEFAULT_CHUNK_SIZE, force=False):
+        """
+        CSV / JSONL(.jsonl, .ndjson) 기록을 버킷에 더함 - 이미 넣은 파일이면 그 뒤에 이어 붙은 행만
+        (끝의 미완성 줄은 다음 ingest로 미룸)
+
+        Raises:
+            ValueError: 이미 넣은 부분이 바뀜 (파일이 줄었거나 내용이 다름) - 같은 행이 두 번 더해지지
+            않도록 거부하므로 원본 기록으로 상태를 다시 만들어야 함
+
+        Returns:
+            새로 넣은 행 수 (force=True면 기록을 무시하고 처음부터 다시 더함)
+        """
+        source = os.path.abspath(path)
+        end = complete_size(path)
+        entry = None if force else self.sources.get(source)
+        start = 0
+        if entry is not None:
+            start = entry["bytes"]
+            if end < start or _ingested_digest(path, start) != entry["digest"]:
+                raise ValueError(f"{path}: 이미 넣은 {entry['rows']:,}행 부분이 바뀜 (파일이 줄었거나 내용이 다름) "
+                                 f"- 원본 기록으로 상태를 다시 만들어야 함")
+            if end == start:
+                return 0
+
+        wanted = ("supplier", "date", "month") + RECORD_COLUMNS
+        if path.endswith((".jsonl", ".ndjson")):
+            chunks = iter_jsonl_chunks(path, chunk_size, text_columns=("supplier", "date", "month"),
+                                       columns=list(wanted), start=start, end=end)
+        else:
+            header = read_header(path)
+            chunks = iter_csv_chunks(path, chunk_size, text_columns=("supplier", "date", "month"),
+                                     columns=[name for name in wanted if name in header], start=start, end=end)
+        rows = 0
+        for chunk in chunks:
+            rows += self.add_chunk(chunk)
+        self.sources[source] = {"bytes": end, "rows": (entry["rows"] if entry else 0) + rows,
+                                "digest": _ingested_digest(path, end)}
+        return rows
+
+    def add_chunk(self, chunk):
+        """{열: 배열} 청크 1개를 버킷에 더함 (청크 안에서 np.add.at으로 먼저 묶은 뒤 버킷 수만큼만 dict 갱신)"""
+        supplier = np.char.strip(chunk["supplier"].astype(str))
+        if "month" in chunk and np.any(chunk["month"] != ""):
+            month = chunk["month"].astype(str)
+            if "date" in chunk:
+                month = np.where(month == "", chunk["date"].astype(str), month)
+        elif "date" in chunk:
+            month = chunk["date"].astype(str)
+        else:
+            raise ValueError("date 또는 month 열이 필요")
+        month = np.char.ljust(np.char.strip(month), 7).astype("<U7")
+        valid = (supplier != "") & (np.char.strip(month) != "")
+
+        keys = np.char.add(np.char.add(supplier[valid], KEY_SEPARATOR), month[valid])
+        unique, inverse = np.unique(keys, return_inverse=True)
+        sums = np.zeros((len(unique), len(FIELDS)))
+        np.add.at(sums, inverse, _record_sums({name: values[valid] for name, values in chunk.items()}
+                                              | {"supplier": supplier[valid]}))
+        for key, values in zip(unique.tolist(), sums):
+            key = tuple(key.split(KEY_SEPARATOR))
+            if key in self.buckets:
+                self.buckets[key] += values
+            else:
+                self.buckets[key] = values
+        return int(valid.sum())
+
+    def scorecard(self, start=None, end=None):
+        """start~end 월(YYYY-MM, 포함) 버킷 합계로 Scorecard 계산 (기본: 전체 기간)"""
+        keys = [key for key in self.buckets if (start is None or key[1] >= start) and (end is None or key[1] <= end)]
+        suppliers = sorted({supplier for supplier, _ in keys})
+        index = {supplier: i for i, supplier in enumerate(suppliers)}
+        totals = np.zeros((len(suppliers), len(FIELDS)))
+        if keys:
+            np.add.at(totals, np.array([index[supplier] for supplier, _ in keys]),
+                      np.stack([self.buckets[key] for key in keys]))
+        months = sorted({month for _, month in keys})
+        return Scorecard(suppliers, totals, (months[0], months[-1]) if months else (None, None))
+
+
+# ============================================================================
+# 점수
+# ============================================================================
+
+def _ratio(numerator, denominator):
+    out = np.full(numerator.shape, np.nan)
+    np.divide(numerator, denominator, out=out, where=denominator > 0)
+    return out
+
+
+def _linear_score(value, best, worst):
+    """best에서 100점, worst에서 0점 (사이 선형, NaN 유지)"""
+    return np.clip((value - worst) / (best - worst), 0.0, 1.0) * 100
+
+
+class Scorecard:
+    """공급업체별 지표 / 영역 점수 / 총점 / 등급"""
+
+    def __init__(self, suppliers, totals, period):
+        self.suppliers = np.array(suppliers, dtype=str)
+        self.period = period
+        f = {name: totals[:, i] for i, name in enumerate(FIELDS)}
+        self.deliveries = f["deliveries"]
+
+        lead_time_mean = _ratio(f["lead_time_sum"], f["lead_time_n"])
+        lead_time_var = np.maximum(_ratio(f["lead_time_sq"], f["lead_time_n"]) - lead_time_mean ** 2, 0.0)
+        self.metrics = {
+            "ppm": _ratio(f["defects"], f["inspected_qty"]) * 1e6,
+            "pass_rate": _ratio(f["lots_passed"], f["lots"]),
+            "otd": _ratio(f["on_time"], f["deliveries"]),
+            "lead_time_cv": _ratio(np.sqrt(lead_time_var), lead_time_mean),
+            "price_index": _ratio(f["spend"], f["market_spend"]),
+            "collaboration": _ratio(f["collab_sum"], f["collab_n"]),
+            "risk": _ratio(f["risk_sum"], f["risk_n"]),
+        }
+        m = self.metrics
+        half = {"a": 0.5, "b": 0.5}
+        self.scores = {
+            "quality": weighted_score({"a": _linear_score(m["ppm"], 0.0, PPM_ZERO_SCORE),
+                                       "b": m["pass_rate"] * 100}, half),
+            "delivery": weighted_score({"a": m["otd"] * 100,
+                                        "b": _linear_score(m["lead_time_cv"], 0.0, LEAD_TIME_CV_ZERO_SCORE)}, half),
+            "price": _linear_score(m["price_index"], *PRICE_INDEX_RANGE),
+            "collaboration": np.clip(m["collaboration"], 0, 100),
+            "risk": np.clip(m["risk"], 0, 100),
+        }
+        self.total = weighted_score(self.scores, CATEGORY_WEIGHTS)
+        grade_index = np.searchsorted(np.array(GRADE_THRESHOLDS), np.nan_to_num(self.total), side="right")
+        self.grade = np.where(np.isnan(self.total), "-", np.array(GRADES)[grade_index])
+
+    def __len__(self):
+        return len(self.suppliers)
+
+    def ranking(self):
+        """총점 내림차순 인덱스 (점수 없는 업체는 마지막)"""
+        return np.argsort(-np.nan_to_num(self.total, nan=-1.0), kind="stable")
+
+    def grade_counts(self):
+        """{A/B/C/D: 공급업체 수} (점수를 낼 기록이 없는 "-"는 제외)"""
+        return {grade: int(np.count_nonzero(self.grade == grade)) for grade in reversed(GRADES)}
+
+    def supplier_data(self, supplier):
+        """공급업체 1곳의 dict (svg_generator_additional.generate_scorecard_template(card)용)"""
+        i = int(np.flatnonzero(self.suppliers == supplier)[0])
+        rank = int(np.flatnonzero(self.ranking() == i)[0]) + 1
+        return {
+            "supplier": supplier,
+            "period": list(self.period),
+            "rank": rank,
+            "suppliers": len(self),
+            "total": float(self.total[i]),
+            "grade": str(self.grade[i]),
+            "deliveries": int(self.deliveries[i]),
+            "scores": {name: float(values[i]) for name, values in self.scores.items()},
+            "metrics": {name: float(values[i]) for name, values in self.metrics.items()},
+        }
+
+    def to_slide_data(self, top=None):
+        """슬라이드 생성기용 dict (NaN → None) - 순위순 공급업체 목록 + 등급 분포"""
+        order = self.ranking()[:top]
+
+        def clean(value):
+            return None if np.isnan(value) else round(float(value), 2)
+
+        return {
+            "period": list(self.period),
+            "grades": self.grade_counts(),
+            "suppliers": [
+                {"rank": rank + 1, "supplier": str(self.suppliers[i]), "total": clean(self.total[i]),
+                 "grade": str(self.grade[i]), "scores": {name: clean(v[i]) for name, v in self.scores.items()}}
+                for rank, i in enumerate(order)
+            ],
+        }
+
+    def write_csv(self, path):
+        """순위순 CSV (supplier, total, grade, 영역 점수, 지표)"""
+        order = self.ranking()
+        columns = {"rank": np.arange(1, len(order) + 1), "supplier": self.suppliers[order],
+                   "total": self.total[order], "grade": self.grade[order]}
+        columns.update({name: values[order] for name, values in self.scores.items()})
+        columns.update({name: values[order] for name, values in self.metrics.items()})
+        write_csv_columns(path, columns, float_format="{:.4g}")
+
+
+# ============================================================================
+# 슬라이드
+# ============================================================================
+
+def add_supplier_ranking_slide(prs, scorecard, top=10, title=None, governing_message=None, slide_num=None):
+    """공급업체 순위 표 슬라이드 (상위 top곳 + 나머지 D등급, D등급 행 강조)"""
+    from scm_slides import add_content_slide, add_data_table
+
+    grades = scorecard.grade_counts()
+    start, end = scorecard.period
+    if governing_message is None:
+        governing_message = (f"{len(scorecard):,}개 공급업체 중 A등급 {grades['A']}곳, D등급 {grades['D']}곳 "
+                             f"- D등급은 개선 계획 수립 또는 대체 공급선 검토 대상")
+    slide = add_content_slide(prs, title or f"Supplier Scorecard 순위 ({start} ~ {end})", governing_message,
+                              slide_num)
+
+    def cell(value):
+        return "-" if np.isnan(value) else f"{value:.0f}"
+
+    # 상위 top곳 + 그 밖의 D등급 (관리 대상은 순위와 무관하게 표에 남김)
+    ranking = scorecard.ranking()
+    ranks = [rank for rank, i in enumerate(ranking) if rank < top or scorecard.grade[i] == "D"]
+    order = ranking[ranks]
+    rows = [[str(rank + 1), str(scorecard.suppliers[i])]
+            + [cell(scorecard.scores[name][i]) for name in CATEGORY_WEIGHTS]
+            + [cell(scorecard.total[i]), str(scorecard.grade[i])]
+            for rank, i in zip(ranks, order)]
+    header = ["순위", "공급업체"] + [f"{CATEGORY_NAMES[name]} ({CATEGORY_WEIGHTS[name]:.0%})"
+                                  for name in CATEGORY_WEIGHTS] + ["총점", "등급"]
+    add_data_table(slide, header, rows, col_widths=[0.55, 2.20] + [None] * len(CATEGORY_WEIGHTS) + [0.75, 0.60],
+                   align="cl" + "r" * len(CATEGORY_WEIGHTS) + "rc",
+                   highlight_rows=[row for row, i in enumerate(order) if scorecard.grade[i] == "D"],
+                   font_size=9, min_row_height=0.28)
+    return slide
+
+
+def generate_sample_records(directory, suppliers=60, months=12, deliveries_per_month=300, seed=34):
+    """
+    샘플 기록: 1~(months-1)월은 CSV 1개, 마지막 달은 JSONL 1개 (증분 집계 데모용)
+
+    Returns:
+        (csv 경로, jsonl 경로)
+    """
+    rng = np.random.default_rng(seed)
+    names = np.array([f"공급업체-{i + 1:03d}" for i in range(suppliers)])
+    skill = rng.beta(2.5, 1.5, suppliers)   # 공급업체 역량 (높을수록 모든 지표 양호)
+
+    def month_records(month):
+        n = suppliers * deliveries_per_month
+        who = rng.integers(0, suppliers, n)
+        s = skill[who]
+        quantity = rng.integers(100, 2_000, n).astype(np.float64)
+        market = rng.lognormal(9, 0.8, suppliers)[who]
+        lead_time = rng.normal(14, 1 + 8 * (1 - s))
+        return {
+            "supplier": names[who],
+            "date": np.char.add(f"2024-{month:02d}-", rng.integers(1, 29, n).astype(str)),
+            "quantity": quantity,
+            "defects": rng.binomial(quantity.astype(np.int64), 0.004 * (1 - s) ** 2).astype(np.float64),
+            "passed": (rng.random(n) < 0.90 + 0.10 * s).astype(np.float64),
+            "on_time": (rng.random(n) < 0.70 + 0.30 * s).astype(np.float64),
+            "lead_time_days": np.round(np.maximum(lead_time, 1)),
+            "unit_price": np.round(market * rng.normal(1.08 - 0.15 * s, 0.03), 0),
+            "market_price": np.round(market, 0),
+        }
+
+    def evaluations(month):
+        return {
+            "supplier": names,
+            "date": np.full(suppliers, f"2024-{month:02d}-28"),
+            "collaboration": np.round(np.clip(rng.normal(40 + 55 * skill, 8), 0, 100)),
+            "risk_score": np.round(np.clip(rng.normal(50 + 45 * skill, 10), 0, 100)),
+        }
+
+    csv_path = os.path.join(directory, "scorecard_records_2024-01_11.csv")
+    for month in range(1, months):
+        for records in (month_records(month), evaluations(month)):
+            columns = {name: records.get(name, np.full(len(records["supplier"]), np.nan))
+                       for name in ("supplier", "date") + RECORD_COLUMNS}
+            write_csv_columns(csv_path, columns, append=month > 1 or "collaboration" in records)
+
+    jsonl_path = os.path.join(directory, f"scorecard_records_2024-{months:02d}.jsonl")
+    with open(jsonl_path, "w", encoding="utf-8") as f:
+        for records in (month_records(months), evaluations(months)):
+            keys = list(records)
+            for row in zip(*(records[key].tolist() for key in keys)):
+                f.write(json.dumps(dict(zip(keys, row)), ensure_ascii=False) + "\n")
+    return csv_path, jsonl_path
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--svg"]
+    pptx_path = None
+    if "--pptx" in args:
+        pptx_path = args[args.index("--pptx") + 1]
+        del args[args.index("--pptx"):args.index("--pptx") + 2]
+
+    if args:
+        state_path, inputs = args[0], args[1:]
+    else:
+        directory = tempfile.mkdtemp(prefix="scorecard_")
+        state_path = os.path.join(directory, "scorecard_state.json")
+        inputs = list(generate_sample_records(directory))
+
+    print("=" * 80)
+    store = ScorecardStore.load(state_path)
+    for path in inputs:
+        start = time.perf_counter()
+        rows = store.ingest(path)
+        store.save(state_path)
+        print(f"  {os.path.basename(path)}: {rows:,}행 추가 ({time.perf_counter() - start:.2f}s, "
+              f"버킷 {len(store.buckets):,}개)" if rows else f"  {os.path.basename(path)}: 이미 집계됨")
+        # 다시 불러와도 같은 상태 (다음 달은 이 상태에 더하기만)
+        store = ScorecardStore.load(state_path)
+
+    start = time.perf_counter()
+    card = store.scorecard()
+    print(f"Scorecard: {len(card)}개 공급업체, {card.period[0]} ~ {card.period[1]} "
+          f"({(time.perf_counter() - start) * 1000:.1f} ms) 등급 {card.grade_counts()}")
+    print("=" * 80)
+    for row in card.to_slide_data(top=5)["suppliers"]:
+        print(f"  {row['rank']:>2}. {row['supplier']:<12} {row['total']:>6.1f} {row['grade']}  "
+              + " ".join(f"{CATEGORY_NAMES[k]} {v:.0f}" for k, v in row["scores"].items() if v is not None))
+    print("=" * 80)
+
+    if "--svg" in sys.argv:
+        # 1위 공급업체로 scorecard 다이어그램 채우기 (SVG_ASSETS/slide34_scorecard_template.svg)
+        from svg_generator_additional import generate_scorecard_template
+        generate_scorecard_template(card.supplier_data(card.suppliers[card.ranking()[0]]))
+
+    if pptx_path:
+        from generate_part1_pptx_v2 import create_presentation
+        prs = create_presentation()
+        add_supplier_ranking_slide(prs, card)
+        prs.save(pptx_path)
+        print(f"Saved: {pptx_path}")
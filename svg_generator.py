@@ -168,11 +168,69 @@ def generate_leverage_bidding_flow():
 
     return output_path
 
-def generate_tco_comparison():
-    """Slide 11: TCO Analysis Comparison"""
+TCO_BAR_COLORS = [COLOR_ACCENT, COLOR_DARK_GRAY, COLOR_MED_GRAY, "#999999", COLOR_LIGHT_GRAY, "#C0392B", "#7F8C8D"]
+
+
+def _tco_comparison_boxes(comparison, width):
+    """계산된 TCO (tco.TcoResult.to_slide_data()) → 공급업체(안)별 박스 + 구성 요소 누적 막대"""
+    options = comparison["options"]
+    labels = comparison["components"]
+    gap = 60
+    box_w = (width - 100 - gap * (len(options) - 1)) / len(options)
+    box_h = 110 + 26 * len(labels)
+    max_total = max(option["total"] for option in options)
+
+    svg = ''
+    for i, option in enumerate(options):
+        x = 50 + i * (box_w + gap)
+        center = x + box_w / 2
+        winner = i == comparison["winner"]
+        svg += create_rounded_rect(x, 80, box_w, box_h, 10, "box", None)
+        svg += f'<text class="text-bold" x="{center:g}" y="110" text-anchor="middle">{option["supplier"]}</text>\n'
+        y_pos = 140
+        for label in labels:
+            svg += f'<text class="text" x="{x + 20:g}" y="{y_pos}">{label}</text>\n'
+            svg += (f'<text class="text" x="{x + box_w - 20:g}" y="{y_pos}" text-anchor="end">'
+                    f'₩{option["components"][label]:,.1f}</text>\n')
+            y_pos += 26
+        svg += (f'<text class="text-bold" x="{center:g}" y="{y_pos + 10}" text-anchor="middle" '
+                f'fill="{"#27AE60" if winner else COLOR_ACCENT}">총 TCO: ₩{option["total"]:,.1f}</text>\n')
+
+        # 누적 막대: 길이 = 최대 TCO 대비, 칸 = 구성 요소
+        bar_x, bar_y, bar_w = x + 20, y_pos + 30, (box_w - 40) * option["total"] / max_total
+        for label, color in zip(labels, TCO_BAR_COLORS):
+            segment = bar_w * option["components"][label] / option["total"]
+            if segment > 0:
+                svg += (f'<rect x="{bar_x:.1f}" y="{bar_y}" width="{segment:.1f}" height="16" '
+                        f'fill="{color}"><title>{label}</title></rect>\n')
+                bar_x += segment
+    return svg, 80 + box_h
+
+
+def generate_tco_comparison(comparison=None,
+                            output_path='/home/user/Kraljic_Course/SVG_ASSETS/slide11_tco_comparison.svg'):
+    """Slide 11: TCO Analysis Comparison
+
+    Args:
+        comparison: tco.TcoResult.to_slide_data() - 주면 고정 예시 대신 계산된 구성 요소/합계와 누적 막대
+    """
     width = 800
     height = 350
 
+    if comparison:
+        boxes, bottom = _tco_comparison_boxes(comparison, width)
+        svg = create_svg_header(width, bottom + 50)
+        formula = " + ".join(comparison["components"])
+        svg += f'<text class="text-bold" x="400" y="30" text-anchor="middle">TCO = {formula}</text>\n'
+        svg += boxes
+        winner = comparison["options"][comparison["winner"]]["supplier"]
+        svg += (f'<text class="text-bold" x="400" y="{bottom + 35}" text-anchor="middle" fill="#27AE60">'
+                f'✓ {winner} 선정 (TCO 우위: 개당 ₩{comparison["savings"]:,.1f} 절감)</text>\n')
+        svg += create_svg_footer()
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(svg)
+        return output_path
+
     svg = create_svg_header(width, height)
 
     # Title
@@ -224,7 +282,6 @@ def generate_tco_comparison():
 
     svg += create_svg_footer()
 
-    output_path = '/home/user/Kraljic_Course/SVG_ASSETS/slide11_tco_comparison.svg'
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write(svg)
 
@@ -372,10 +429,14 @@ def generate_all_svgs():
     print("=" * 80)
     print()
 
+    # 슬라이드 11은 TCO 엔진 계산 결과로 (입력이 같으면 .tco_cache에서)
+    from tco import TCO_EXAMPLE, cached_tco
+    tco_comparison = cached_tco(TCO_EXAMPLE).to_slide_data()
+
     diagrams = [
         ("Slide 5: Bottleneck Process Flow", generate_bottleneck_process_flow),
         ("Slide 9: Leverage Bidding Flow", generate_leverage_bidding_flow),
-        ("Slide 11: TCO Comparison", generate_tco_comparison),
+        ("Slide 11: TCO Comparison", lambda: generate_tco_comparison(tco_comparison)),
         ("Slide 12: Partnership Diagram", generate_partnership_diagram),
         ("Slide 15: E-Procurement Architecture", generate_eprocurement_architecture),
         ("Slide 21: Toyota Three Pillars", generate_toyota_three_pillars),
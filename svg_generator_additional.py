@@ -4,34 +4,50 @@ Additional SVG Generator for Part 2 - 5 new diagrams
 Generates professional SVG diagrams for PPTX insertion
 """
 
-def generate_matrix_door_chart():
-    """슬라이드 6: 자재군별 소싱 전략 매트릭스 (7×4 표)"""
+import re
+import sys
+
+# (자재군, 헤더 셀 가운데 x, 채우기, 이름) - 매트릭스 헤더 행은 이 표에서 생성
+DOOR_CHART_COLUMNS = (("bottleneck", 275, "#E67E22", "🔴 병목자재"), ("leverage", 425, "#27AE60", "🟢 레버리지"),
+                      ("strategic", 575, "#8E44AD", "🟣 전략자재"), ("routine", 725, "#95A5A6", "⚪ 일상자재"))
+SCORECARD_CATEGORIES = (("quality", "1. 품질"), ("delivery", "2. 납기"), ("price", "3. 가격"),
+                        ("collaboration", "4. 협력"), ("risk", "5. 리스크"))
+SCORECARD_GRADES = {"A": (220, "#27AE60"), "B": (320, "#3498DB"), "C": (430, "#F39C12"), "D": (530, "#E74C3C")}
+
+
+def _door_chart_header(portfolio=None):
+    """매트릭스 헤더 행 (구분 + DOOR_CHART_COLUMNS 자재군 셀)
+
+    portfolio가 있으면 자재군 이름을 위로 올리고 아래에 품목 수 · 구매액 비중 한 줄 추가
+    """
+    cells = ['  <rect x="50" y="60" width="150" height="50" fill="#E6E6E6" stroke="#666" stroke-width="1"/>\n'
+             '  <text x="125" y="90" font-family="Malgun Gothic" font-size="12" font-weight="bold"\n'
+             '        text-anchor="middle" fill="#333">구분</text>\n']
+    for name, x, fill, label in DOOR_CHART_COLUMNS:
+        cell = (f'  <rect x="{x - 75}" y="60" width="150" height="50" fill="{fill}" stroke="#666" stroke-width="1"/>\n'
+                f'  <text x="{x}" y="{81 if portfolio else 90}" font-family="Malgun Gothic" font-size="12" '
+                f'font-weight="bold"\n        text-anchor="middle" fill="#FFF">{label}</text>\n')
+        if portfolio:
+            stats = portfolio[name]
+            cell += (f'  <text x="{x}" y="100" font-family="Malgun Gothic" font-size="10"\n'
+                     f'        text-anchor="middle" fill="#FFF">{stats["count"]:,}개 · 구매액 '
+                     f'{stats["spend_share"] * 100:.1f}%</text>\n')
+        cells.append(cell)
+    return "  <!-- Header Row -->\n" + "\n".join(cells)
+
+
+def generate_matrix_door_chart(portfolio=None):
+    """슬라이드 6: 자재군별 소싱 전략 매트릭스 (7×4 표)
+
+    Args:
+        portfolio: kraljic.KraljicResult.summary() - 주면 헤더에 자재군별 품목 수/구매액 비중 표시
+    """
     svg = '''<svg width="800" height="500" xmlns="http://www.w3.org/2000/svg">
   <!-- Title -->
   <text x="400" y="30" font-family="Malgun Gothic, Arial" font-size="20" font-weight="bold"
         text-anchor="middle" fill="#333">자재군별 소싱 전략 매트릭스</text>
 
-  <!-- Header Row -->
-  <rect x="50" y="60" width="150" height="50" fill="#E6E6E6" stroke="#666" stroke-width="1"/>
-  <text x="125" y="90" font-family="Malgun Gothic" font-size="12" font-weight="bold"
-        text-anchor="middle" fill="#333">구분</text>
-
-  <rect x="200" y="60" width="150" height="50" fill="#E67E22" stroke="#666" stroke-width="1"/>
-  <text x="275" y="90" font-family="Malgun Gothic" font-size="12" font-weight="bold"
-        text-anchor="middle" fill="#FFF">🔴 병목자재</text>
-
-  <rect x="350" y="60" width="150" height="50" fill="#27AE60" stroke="#666" stroke-width="1"/>
-  <text x="425" y="90" font-family="Malgun Gothic" font-size="12" font-weight="bold"
-        text-anchor="middle" fill="#FFF">🟢 레버리지</text>
-
-  <rect x="500" y="60" width="150" height="50" fill="#8E44AD" stroke="#666" stroke-width="1"/>
-  <text x="575" y="90" font-family="Malgun Gothic" font-size="12" font-weight="bold"
-        text-anchor="middle" fill="#FFF">🟣 전략자재</text>
-
-  <rect x="650" y="60" width="150" height="50" fill="#95A5A6" stroke="#666" stroke-width="1"/>
-  <text x="725" y="90" font-family="Malgun Gothic" font-size="12" font-weight="bold"
-        text-anchor="middle" fill="#FFF">⚪ 일상자재</text>
-
+''' + _door_chart_header(portfolio) + '''
   <!-- Row 1: 핵심 목표 -->
   <rect x="50" y="110" width="150" height="50" fill="#F0F0F0" stroke="#666" stroke-width="1"/>
   <text x="125" y="140" font-family="Malgun Gothic" font-size="11" font-weight="bold"
@@ -448,8 +464,41 @@ def generate_supplier_consolidation():
     print("✅ Generated: slide28_supplier_consolidation.svg")
 
 
-def generate_scorecard_template():
-    """슬라이드 34: Supplier Scorecard 템플릿"""
+def _fill_scorecard(svg, card):
+    """템플릿 → 공급업체 1곳의 실제 점수 (제목, 총점, 영역 점수, 지표 값, 해당 등급 테두리)"""
+    def number(value, fmt):
+        return "-" if value != value else fmt.format(value)   # NaN → "-"
+
+    metrics = card["metrics"]
+    svg = svg.replace('>Supplier Scorecard 평가 체계<',
+                      f'>Supplier Scorecard - {card["supplier"]} ({card["period"][0]} ~ {card["period"][1]})<')
+    svg = svg.replace('fill="#FFF">100</text>', f'fill="#FFF">{number(card["total"], "{:.0f}")}</text>')
+    for name, label in SCORECARD_CATEGORIES:
+        svg = re.sub(rf'>{re.escape(label)} \((\d+%)\)<',
+                     lambda m: f'>{label} {number(card["scores"][name], "{:.0f}점")} ({m.group(1)})<', svg)
+    for old, new in (("불량률 (PPM)", f'불량률 {number(metrics["ppm"], "{:,.0f}")} PPM'),
+                     ("검사 통과율", f'검사 통과율 {number(metrics["pass_rate"] * 100, "{:.1f}")}%'),
+                     ("납기 준수율 (OTD)", f'납기 준수율 {number(metrics["otd"] * 100, "{:.1f}")}%'),
+                     ("리드타임 안정성", f'리드타임 CV {number(metrics["lead_time_cv"], "{:.2f}")}'),
+                     ("시장가 대비 수준", f'시장가 대비 {number(metrics["price_index"] * 100, "{:.1f}")}%'),
+                     ("정보 공유 수준", f'협력 평가 {number(metrics["collaboration"], "{:.0f}")}점'),
+                     ("재무 건전성", f'리스크 평가 {number(metrics["risk"], "{:.0f}")}점')):
+        svg = svg.replace(f'>{old}<', f'>{new}<', 1)
+    svg = svg.replace('>등급 분류<', f'>등급 분류 (전체 {card["rank"]}위 / {card["suppliers"]}곳)<')
+    if card["grade"] not in SCORECARD_GRADES:
+        return svg
+    x, color = SCORECARD_GRADES[card["grade"]]
+    marker = (f'  <rect x="{x - 42}" y="396" width="84" height="20" rx="4" fill="none" '
+              f'stroke="{color}" stroke-width="2"/>')
+    return svg.replace('  <!-- Arrow marker -->', marker + '\n\n  <!-- Arrow marker -->')
+
+
+def generate_scorecard_template(card=None):
+    """슬라이드 34: Supplier Scorecard 템플릿
+
+    Args:
+        card: supplier_scorecard.Scorecard.supplier_data() - 주면 해당 공급업체의 실제 점수로 채움
+    """
     svg = '''<svg width="750" height="450" xmlns="http://www.w3.org/2000/svg">
   <!-- Title -->
   <text x="375" y="30" font-family="Malgun Gothic, Arial" font-size="18" font-weight="bold"
@@ -534,6 +583,8 @@ def generate_scorecard_template():
     </marker>
   </defs>
 </svg>'''
+    if card:
+        svg = _fill_scorecard(svg, card)
 
     with open('SVG_ASSETS/slide34_scorecard_template.svg', 'w', encoding='utf-8') as f:
         f.write(svg)
@@ -541,9 +592,15 @@ def generate_scorecard_template():
 
 
 if __name__ == "__main__":
+    # python3 svg_generator_additional.py [material_master.csv] - 주면 매트릭스 헤더에 분면별 실제 품목 수
+    portfolio = None
+    if len(sys.argv) > 1:
+        from kraljic import classify_csv
+        portfolio = classify_csv(sys.argv[1]).summary()
+
     print("Generating 5 additional SVG diagrams...\n")
 
-    generate_matrix_door_chart()
+    generate_matrix_door_chart(portfolio)
     generate_bottleneck_multi_sourcing()
     generate_consolidation_before_after()
     generate_supplier_consolidation()
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+TCO Engine - 공급업체(안)별 총소유비용(Total Cost of Ownership) 계산 + 결과 캐시
+3.3 레버리지자재 "단가로 좁히고 TCO로 결정한다" 슬라이드(svg_generator.generate_tco_comparison,
+generate_part2_enhanced.add_tco_comparison_enhanced)에 계산 결과를 공급
+
+TCO(개당) = 구매가 + 물류비 + 관세 + 품질비용 + 재고비용 + 리스크비용 + 관리비용
+- 관세 = (구매가 + 물류비) × 관세율 (CIF 기준)
+- 품질비용 = 불량률 × 불량 1개당 처리비 (재작업/반품/검사, 기본: 구매가)
+- 재고비용 = 도착 원가 × 재고유지비율 × 평균 보유 일수 / 365
+  (평균 보유 일수 = 발주 주기/2 + 안전재고 일수 + 운송 일수 - 운송 중 재고도 구매자 소유로 가정)
+- 리스크비용 = 연간 공급 중단 확률 × 중단 시 손실 / 연간 물량
+- 관리비용 = 연간 공급업체 관리비 / 연간 물량
+
+입력: 한 행 = 공급업체(안) 1개, 열 = TCO_COLUMNS (없는 열은 0, defect_cost는 구매가)
+      CSV에 scenario 열이 있으면 시나리오(자재)별로 나눠 계산
+
+캐시: 입력 표 + 재고유지비율 + ENGINE_VERSION의 SHA-1 → TcoResult
+      덱을 다시 생성할 때 입력이 같은 시나리오는 다시 계산하지 않음
+      캐시 파일: .tco_cache/results.pickle (ENGINE_VERSION이 바뀌면 전체 무효화)
+      엔트리는 배열 dict로만 저장 (TcoResult 클래스를 피클하지 않으므로 python3 tco.py로 채운 캐시를
+      생성기에서 import해 읽어도 같은 결과)
+
+Usage:
+    from tco import TCO_EXAMPLE, TcoCache, compute_tco
+
+    result = compute_tco(TCO_EXAMPLE)                       # 캐시 없이 계산
+    cache = TcoCache()
+    result = cache.compute(TCO_EXAMPLE)                     # 같은 입력이면 캐시 결과
+    results = cache.compute_csv("tco_scenarios.csv")        # {scenario: TcoResult}
+    cache.save()
+
+    python3 tco.py [tco_scenarios.csv] [--svg] [--pptx out.pptx]
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from scm_data import iter_csv_chunks, read_header, write_csv_columns
+
+# ============================================================================
+# 설정
+# ============================================================================
+CACHE_DIR = Path(__file__).resolve().parent / ".tco_cache"
+CACHE_FILE = "results.pickle"
+ENGINE_VERSION = 2  # 비용 계산식 또는 엔트리 형식이 바뀌면 올릴 것
+
+DEFAULT_HOLDING_RATE = 0.25
+TCO_COMPONENTS = (("purchase", "구매가"), ("logistics", "물류비"), ("duty", "관세"), ("quality", "품질비용"),
+                  ("holding", "재고비용"), ("risk", "리스크비용"), ("admin", "관리비용"))
+TCO_COLUMNS = ("unit_price", "annual_volume", "freight_per_unit", "duty_rate", "defect_rate", "defect_cost",
+               "transit_days", "safety_days", "order_interval_days", "disruption_prob", "disruption_cost",
+               "admin_cost")
+
+# 강의 예시: 국내 vs 해외 공급업체 (구매가 지수 ₩100 기준, 연 10만 개)
+TCO_EXAMPLE = {
+    "supplier": np.array(["국내 공급업체", "해외 공급업체"]),
+    "unit_price": np.array([100.0, 85.0]),
+    "annual_volume": np.array([100_000.0, 100_000.0]),
+    "freight_per_unit": np.array([5.0, 15.0]),
+    "duty_rate": np.array([0.0, 0.08]),
+    "defect_rate": np.array([0.010, 0.025]),
+    "defect_cost": np.array([200.0, 200.0]),
+    "transit_days": np.array([2.0, 35.0]),
+    "safety_days": np.array([14.0, 30.0]),
+    "order_interval_days": np.array([30.0, 60.0]),
+    "disruption_prob": np.array([0.05, 0.10]),
+    "disruption_cost": np.array([2_000_000.0, 3_000_000.0]),
+    "admin_cost": np.array([200_000.0, 400_000.0]),
+}
+
+
+# ============================================================================
+# 계산
+# ============================================================================
+
+def _column(table, name, n):
+    return np.asarray(table[name], dtype=np.float64) if name in table else np.zeros(n)
+
+
+def compute_tco(table, holding_rate=DEFAULT_HOLDING_RATE):
+    """
+    공급업체(안)별 개당 TCO 구성 요소 (행 단위 벡터 연산)
+
+    Args:
+        table: {"supplier": 이름 배열, TCO_COLUMNS 열: 배열}
+        holding_rate: 연간 재고유지비율
+
+    Returns:
+        TcoResult
+    """
+    suppliers = np.asarray(table["supplier"]).astype(str)
+    n = len(suppliers)
+    c = {name: _column(table, name, n) for name in TCO_COLUMNS}
+    if "defect_cost" not in table:
+        c["defect_cost"] = c["unit_price"]
+    if np.any(c["annual_volume"] <= 0):
+        raise ValueError("annual_volume은 0보다 커야 함")
+
+    landed = c["unit_price"] + c["freight_per_unit"]
+    duty = landed * c["duty_rate"]
+    days = c["order_interval_days"] / 2 + c["safety_days"] + c["transit_days"]
+    components = {
+        "purchase": c["unit_price"],
+        "logistics": c["freight_per_unit"],
+        "duty": duty,
+        "quality": c["defect_rate"] * c["defect_cost"],
+        "holding": (landed + duty) * holding_rate * days / 365,
+        "risk": c["disruption_prob"] * c["disruption_cost"] / c["annual_volume"],
+        "admin": c["admin_cost"] / c["annual_volume"],
+    }
+    return TcoResult(suppliers, c["annual_volume"], components)
+
+
+def input_digest(table, holding_rate=DEFAULT_HOLDING_RATE):
+    """입력 표 SHA-1 (열 순서 무관, 값은 float64/문자열로 정규화)"""
+    digest = hashlib.sha1(f"tco-v{ENGINE_VERSION}|{holding_rate!r}".encode())
+    for name in sorted(table):
+        values = np.asarray(table[name])
+        digest.update(name.encode() + b"\0")
+        if name == "supplier" or values.dtype.kind in "USO":
+            digest.update("\0".join(values.astype(str).tolist()).encode() + b"\1")
+        else:
+            digest.update(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def read_tco_csv(path):
+    """
+    CSV → {scenario: 입력 표} (scenario 열이 없으면 파일 이름 하나)
+
+    열: supplier, [scenario], TCO_COLUMNS 중 일부
+    """
+    header = read_header(path)
+    text_columns = [name for name in ("supplier", "scenario") if name in header]
+    columns = text_columns + [name for name in TCO_COLUMNS if name in header]
+    chunks = list(iter_csv_chunks(path, text_columns=text_columns, columns=columns))
+    table = {name: np.concatenate([chunk[name] for chunk in chunks]) for name in columns}
+
+    if "scenario" not in table:
+        return {Path(path).stem: table}
+    scenarios = table.pop("scenario")
+    return {str(name): {column: values[scenarios == name] for column, values in table.items()}
+            for name in dict.fromkeys(scenarios.tolist())}
+
+
+class TcoResult:
+    """공급업체(안)별 개당 비용 구성 요소와 합계"""
+
+    def __init__(self, suppliers, volume, components):
+        self.suppliers = suppliers
+        self.volume = volume
+        self.components = components
+        self.total = sum(components.values())
+
+    def __len__(self):
+        return len(self.suppliers)
+
+    def to_entry(self):
+        """캐시 엔트리 (배열 dict - 클래스 경로에 의존하지 않음)"""
+        return {"suppliers": self.suppliers, "volume": self.volume, "components": dict(self.components)}
+
+    @classmethod
+    def from_entry(cls, entry):
+        return cls(entry["suppliers"], entry["volume"], entry["components"])
+
+    @property
+    def annual(self):
+        """연간 TCO (원)"""
+        return self.total * self.volume
+
+    def ranking(self):
+        """개당 TCO 오름차순 인덱스"""
+        return np.argsort(self.total, kind="stable")
+
+    def to_slide_data(self):
+        """슬라이드/SVG 생성기용 dict - 입력 순서 유지, winner = 개당 TCO 최저"""
+        order = self.ranking()
+        winner = int(order[0])
+        runner_up = int(order[1]) if len(order) > 1 else winner
+        return {
+            "components": [label for _, label in TCO_COMPONENTS],
+            "options": [
+                {"supplier": str(self.suppliers[i]),
+                 "components": {label: float(self.components[name][i]) for name, label in TCO_COMPONENTS},
+                 "total": float(self.total[i]), "annual": float(self.annual[i])}
+                for i in range(len(self))
+            ],
+            "winner": winner,
+            "savings": float(self.total[runner_up] - self.total[winner]),
+        }
+
+    def write_csv(self, path):
+        """공급업체(안)별 구성 요소 CSV"""
+        columns = {"supplier": self.suppliers, "annual_volume": self.volume}
+        columns.update({name: values for name, values in self.components.items()})
+        columns["tco_per_unit"] = self.total
+        columns["tco_annual"] = self.annual
+        write_csv_columns(path, columns, float_format="{:.6g}")
+
+
+# ============================================================================
+# 캐시
+# ============================================================================
+
+class TcoCache:
+    """
+    입력 해시로 키를 잡는 TCO 결과 캐시
+
+    entries: {input_digest: TcoResult.to_entry() - {"suppliers", "volume", "components": {이름: ndarray}}}
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_path = Path(cache_dir) / CACHE_FILE
+        self.entries = {}
+        self.dirty = False
+        self.stats = {"hit": 0, "computed": 0}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_path, "rb") as f:
+                data = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except (EOFError, pickle.UnpicklingError) as e:
+            print(f"⚠️  TCO 캐시 무시 (읽기 실패, 다시 계산): {self.cache_path} - {e}", file=sys.stderr)
+            return
+        if data.get("version") != ENGINE_VERSION:
+            print(f"⚠️  TCO 캐시 무시 (버전 {data.get('version')} → {ENGINE_VERSION}): {self.cache_path}",
+                  file=sys.stderr)
+            return
+        self.entries = data.get("entries", {})
+
+    def save(self):
+        """변경이 있을 때만 원자적으로 기록 (tmp → rename)"""
+        if not self.dirty:
+            return False
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"version": ENGINE_VERSION, "entries": self.entries}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.cache_path)
+        self.dirty = False
+        return True
+
+    def compute(self, table, holding_rate=DEFAULT_HOLDING_RATE):
+        """입력 표 1개의 TcoResult - 같은 입력은 캐시에서"""
+        key = input_digest(table, holding_rate)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.stats["hit"] += 1
+            return TcoResult.from_entry(entry)
+        result = compute_tco(table, holding_rate)
+        self.entries[key] = result.to_entry()
+        self.dirty = True
+        self.stats["computed"] += 1
+        return result
+
+    def compute_csv(self, path, holding_rate=DEFAULT_HOLDING_RATE):
+        """CSV 시나리오별 {scenario: TcoResult} - 바뀐 시나리오만 계산
+
+        이 CSV에 없는 엔트리(지난 실행의 바뀐 시나리오)는 prune - 캐시가 마지막 CSV 크기로 유지됨
+        """
+        tables = read_tco_csv(path)
+        results = {name: self.compute(table, holding_rate) for name, table in tables.items()}
+        self.prune({input_digest(table, holding_rate) for table in tables.values()})
+        return results
+
+    def prune(self, keep):
+        """keep(input_digest 모음)에 없는 엔트리 제거"""
+        for key in [k for k in self.entries if k not in keep]:
+            del self.entries[key]
+            self.dirty = True
+
+
+_default_cache = None
+
+
+def cached_tco(table, holding_rate=DEFAULT_HOLDING_RATE):
+    """모듈 기본 캐시를 통해 TcoResult 계산 후 즉시 저장 (생성기용 단축 함수)"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = TcoCache()
+    result = _default_cache.compute(table, holding_rate)
+    _default_cache.save()
+    return result
+
+
+def generate_sample_csv(path, scenarios=200, suppliers=4, seed=11):
+    """시나리오(자재) × 공급업체(안) 샘플 입력 CSV"""
+    rng = np.random.default_rng(seed)
+    n = scenarios * suppliers
+    overseas = rng.random(n) < 0.5
+    price = rng.lognormal(4.6, 0.6, scenarios).repeat(suppliers) * rng.uniform(0.8, 1.1, n)
+    columns = {
+        "scenario": np.repeat(np.array([f"자재-{i + 1:04d}" for i in range(scenarios)]), suppliers),
+        "supplier": np.tile(np.array([f"공급업체안-{chr(65 + j)}" for j in range(suppliers)]), scenarios),
+        "unit_price": np.round(price * np.where(overseas, 0.85, 1.0), 2),
+        "annual_volume": np.round(rng.lognormal(10, 1, scenarios)).repeat(suppliers),
+        "freight_per_unit": np.round(price * np.where(overseas, 0.15, 0.05), 2),
+        "duty_rate": np.where(overseas, 0.08, 0.0),
+        "defect_rate": np.round(rng.uniform(0.002, 0.03, n), 4),
+        "transit_days": np.where(overseas, 35.0, 2.0),
+        "safety_days": np.where(overseas, 30.0, 14.0),
+        "order_interval_days": np.where(overseas, 60.0, 30.0),
+        "disruption_prob": np.round(np.where(overseas, 0.10, 0.05) * rng.uniform(0.5, 1.5, n), 3),
+        "disruption_cost": np.round(price * 20_000),
+        "admin_cost": np.where(overseas, 400_000.0, 200_000.0),
+    }
+    write_csv_columns(path, columns)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    pptx_path = None
+    if "--pptx" in args:
+        pptx_path = args[args.index("--pptx") + 1]
+        del args[args.index("--pptx"):args.index("--pptx") + 2]
+    make_svg = "--svg" in args
+    args = [arg for arg in args if arg != "--svg"]
+
+    cache = TcoCache()
+    example = cache.compute(TCO_EXAMPLE)
+    print("=" * 80)
+    print("TCO Engine - 강의 예시 (개당, 구매가 지수 ₩100 기준)")
+    print("=" * 80)
+    data = example.to_slide_data()
+    for i, option in enumerate(data["options"]):
+        parts = " + ".join(f"{label} {value:.1f}" for label, value in option["components"].items())
+        print(f"  {option['supplier']}: {parts} = ₩{option['total']:.1f}{'  ← 선정' if i == data['winner'] else ''}")
+    print(f"  TCO 우위: ₩{data['savings']:.1f}/개")
+
+    if args:
+        for attempt in ("1차", "2차"):
+            start = time.perf_counter()
+            before = dict(cache.stats)
+            results = cache.compute_csv(args[0])
+            elapsed = time.perf_counter() - start
+            print(f"  [{attempt}] {args[0]}: {len(results):,}개 시나리오 ({elapsed * 1000:.1f} ms, "
+                  f"계산 {cache.stats['computed'] - before['computed']}, "
+                  f"캐시 {cache.stats['hit'] - before['hit']})")
+    print(f"  Cache: hit={cache.stats['hit']} computed={cache.stats['computed']} saved={cache.save()}")
+    print(f"  Cache file: {cache.cache_path}")
+    print("=" * 80)
+
+    if make_svg:
+        from svg_generator import generate_tco_comparison
+        print(f"Saved: {generate_tco_comparison(data, output_path='SVG_ASSETS/slide11_tco_comparison.svg')}")
+    if pptx_path:
+        from generate_part2_enhanced import add_tco_comparison_enhanced, create_presentation
+        prs = create_presentation()
+        add_tco_comparison_enhanced(prs, data)
+        prs.save(pptx_path)
+        print(f"Saved: {pptx_path}")
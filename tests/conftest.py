@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# 최상위 스크립트 모듈(scm_data, supplier_scorecard 등)을 import할 수 있게
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from supplier_scorecard import FIELDS, ScorecardStore
+
+HEADER = "supplier,date,quantity,defects,on_time\n"
+DELIVERIES = FIELDS.index("deliveries")
+
+
+def deliveries(store, supplier, month):
+    return store.buckets[(supplier, month)][DELIVERIES]
+
+
+def test_append_rows_only_adds_new_rows(tmp_path):
+    path = tmp_path / "records.csv"
+    path.write_text(HEADER + "S1,2024-01-05,100,1,1\n", encoding="utf-8")
+    state = tmp_path / "state.json"
+
+    store = ScorecardStore()
+    assert store.ingest(str(path)) == 1
+    store.save(state)
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("S1,2024-01-20,50,0,0\nS2,2024-02-03,10,0,1\n")
+    store = ScorecardStore.load(state)
+    assert store.ingest(str(path)) == 2
+    assert store.ingest(str(path)) == 0
+
+    assert deliveries(store, "S1", "2024-01") == 2.0
+    assert deliveries(store, "S2", "2024-02") == 1.0
+    assert store.sources[str(path.resolve())]["rows"] == 3
+
+
+def test_partial_last_line_waits_for_newline(tmp_path):
+    path = tmp_path / "records.csv"
+    path.write_text(HEADER + "S1,2024-01-05,100,1,1\nS1,2024-01-0", encoding="utf-8")
+
+    store = ScorecardStore()
+    assert store.ingest(str(path)) == 1
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("9,20,0,1\n")
+    assert store.ingest(str(path)) == 1
+    assert deliveries(store, "S1", "2024-01") == 2.0
+
+
+def test_appended_jsonl(tmp_path):
+    path = tmp_path / "records.jsonl"
+    row = {"supplier": "S1", "month": "2024-03", "on_time": 1}
+    path.write_text(json.dumps(row) + "\n", encoding="utf-8")
+
+    store = ScorecardStore()
+    store.ingest(str(path))
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(row) + "\n")
+    assert store.ingest(str(path)) == 1
+    assert deliveries(store, "S1", "2024-03") == 2.0
+
+
+@pytest.mark.parametrize("rewrite", [
+    HEADER,                                         # 줄어듦
+    HEADER + "S9,2024-01-05,100,1,1\nS1,2024-01-20,50,0,0\n",   # 이미 넣은 행이 바뀜
+])
+def test_changed_ingested_part_is_rejected(tmp_path, rewrite):
+    path = tmp_path / "records.csv"
+    path.write_text(HEADER + "S1,2024-01-05,100,1,1\n", encoding="utf-8")
+
+    store = ScorecardStore()
+    store.ingest(str(path))
+    path.write_text(rewrite, encoding="utf-8")
+    with pytest.raises(ValueError):
+        store.ingest(str(path))
+    assert deliveries(store, "S1", "2024-01") == 1.0
@@ -2,59 +2,51 @@
 """
 Verify Enhanced Part 1 PPTX - Focus on slides 1-8 quality
 Check: shape counts, font sizes, content density, text amount
+
+Checks run as queries over deck_analysis facts (the deck is walked once).
 """
 
-from pptx import Presentation
-from pptx.util import Pt
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+from deck_analysis import analyze_deck, Rule, RuleSet
+
+ENHANCED_RULES = RuleSet("verify_enhanced_quality", [
+    Rule("slide_count", "error",
+         lambda facts, stats: [] if facts.slide_count == 48 else
+         [f"✗ FAIL (expected 48): {facts.slide_count} slides"]),
+    Rule("shape_density", "warning",
+         lambda facts, stats: [] if facts.average_shapes() >= 20 else
+         [f"Average shapes per slide: {facts.average_shapes():.1f}"]),
+])
 
-def verify_enhanced_pptx(filepath):
+
+def verify_enhanced_pptx(filepath, facts=None):
     """Detailed verification of enhanced PPTX"""
     print(f"\n{'='*80}")
     print(f"Enhanced Part 1 PPTX - Quality Verification")
     print(f"{'='*80}\n")
 
-    prs = Presentation(filepath)
+    facts = facts or analyze_deck(filepath)
+    shapes = facts.shapes
 
     # Basic checks
     print(f"1. Basic Properties:")
-    print(f"   Dimensions: {prs.slide_width.inches:.2f}\" × {prs.slide_height.inches:.2f}\"")
-    print(f"   Total slides: {len(prs.slides)}")
-    print(f"   Status: {'✓ PASS' if len(prs.slides) == 48 else f'✗ FAIL (expected 48)'}\n")
+    print(f"   Dimensions: {facts.width_inches:.2f}\" × {facts.height_inches:.2f}\"")
+    print(f"   Total slides: {facts.slide_count}")
+    print(f"   Status: {'✓ PASS' if facts.slide_count == 48 else f'✗ FAIL (expected 48)'}\n")
 
     # Detailed analysis of slides 1-8
     print(f"2. Detailed Analysis (Slides 1-8):")
     print(f"{'='*80}")
 
-    for idx in range(1, 9):  # Slides 1-8
-        if idx > len(prs.slides):
-            break
-
-        slide = prs.slides[idx - 1]
-
+    for idx in facts.slides(1, 8):
         print(f"\nSlide {idx}:")
 
-        # Count shapes by type
-        shape_count = 0
-        text_box_count = 0
-        total_chars = 0
-        font_sizes = []
-
-        for shape in slide.shapes:
-            shape_count += 1
-
-            if hasattr(shape, "text_frame"):
-                if shape.shape_type == 17:  # TEXT_BOX
-                    text_box_count += 1
-
-                # Count text
-                text = shape.text
-                total_chars += len(text)
-
-                # Collect font sizes
-                for paragraph in shape.text_frame.paragraphs:
-                    for run in paragraph.runs:
-                        if run.font.size:
-                            font_sizes.append(run.font.size.pt)
+        shape_count = facts.slide_shape_counts[idx - 1]
+        text_box_count = shapes.count(slide=idx, depth=0, has_text_frame=True,
+                                      shape_type=MSO_SHAPE_TYPE.TEXT_BOX)
+        total_chars = sum(len(t) for t in shapes.column("text", slide=idx, depth=0, has_text_frame=True))
+        font_sizes = facts.font_sizes(slide=idx)
 
         print(f"  Shapes: {shape_count} total (Text boxes: {text_box_count})")
         print(f"  Text: {total_chars} characters")
@@ -65,9 +57,8 @@ def verify_enhanced_pptx(filepath):
 
             # Count small fonts (6-11pt)
             small_fonts = [f for f in font_sizes if 6 <= f <= 11]
-            if font_sizes:
-                pct = len(small_fonts) / len(font_sizes) * 100
-                print(f"  Small fonts (6-11pt): {len(small_fonts)}/{len(font_sizes)} ({pct:.1f}%)")
+            pct = len(small_fonts) / len(font_sizes) * 100
+            print(f"  Small fonts (6-11pt): {len(small_fonts)}/{len(font_sizes)} ({pct:.1f}%)")
 
         # Quality assessment
         quality = "✓ GOOD" if shape_count >= 15 else "⚠ LOW"
@@ -79,21 +70,8 @@ def verify_enhanced_pptx(filepath):
     print(f"\n{'='*80}")
     print(f"3. Overall Statistics (All 48 slides):")
 
-    total_shapes = 0
-    all_fonts = []
-
-    for slide in prs.slides:
-        slide_shapes = 0
-        for shape in slide.shapes:
-            slide_shapes += 1
-            if hasattr(shape, "text_frame"):
-                for paragraph in shape.text_frame.paragraphs:
-                    for run in paragraph.runs:
-                        if run.font.size:
-                            all_fonts.append(run.font.size.pt)
-        total_shapes += slide_shapes
-
-    avg_shapes = total_shapes / len(prs.slides) if len(prs.slides) > 0 else 0
+    avg_shapes = facts.average_shapes()
+    all_fonts = facts.font_sizes()
     print(f"   Average shapes per slide: {avg_shapes:.1f}")
     print(f"   Target: 30-40 shapes")
     print(f"   Status: {'✓ PASS' if avg_shapes >= 20 else '⚠ NEEDS IMPROVEMENT'}")
@@ -4,40 +4,79 @@ Verify Enhanced v3 PPTX - Focus on 3 new requirements:
 1. Text color rules (white on dark, black on light)
 2. Toy Page layout (60-70% visual + 30-40% text)
 3. TOC & section structure (목차 및 X.Y titles)
+
+Checks run as queries over deck_analysis facts (the deck is walked once).
 """
 
-from pptx import Presentation
-from pptx.util import Pt
-from pptx.enum.shapes import MSO_SHAPE_TYPE
+from deck_analysis import analyze_deck, Rule, RuleSet
+
+SECTION_NUMBERS = [f"{i}.{j}" for i in range(1, 10) for j in range(1, 10)]
+
+
+def toc_chapters(facts):
+    """Slide 2 texts with chapter structure (1장, 2장, ...)"""
+    return [t for t in facts.shape_texts(2) if "장" in t]
+
+
+def toy_page_split(facts, slide=6, split_x=7.0):
+    """(left shape rows, right shape texts) around split_x inches"""
+    left, right_text = [], []
+    for left_emu, text in facts.shapes.rows("left", "text", slide=slide, depth=0,
+                                            left=lambda x: x is not None):
+        if left_emu / 914400 < split_x:  # Left side
+            left.append(text)
+        else:  # Right side
+            right_text.append(text)
+    return left, right_text
+
 
-def verify_enhanced_v3(filepath):
+def section_numbered_slides(facts):
+    """(slide, title) for slides 4-20 whose first numbered text contains X.Y"""
+    found = []
+    for idx in range(4, min(20, facts.slide_count) + 1):
+        for text in facts.shape_texts(idx):
+            if any(number in text for number in SECTION_NUMBERS):
+                found.append((idx, text[:50]))
+                break
+    return found
+
+
+V3_RULES = RuleSet("verify_enhanced_v3", [
+    Rule("toc", "warning",
+         lambda facts, stats: [] if len(toc_chapters(facts)) >= 7 else ["TOC structure: ⚠ CHECK"]),
+    Rule("toy_page", "warning",
+         lambda facts, stats: [] if any("시사점" in t or "방안" in t for t in toy_page_split(facts)[1])
+         else ["Toy Page layout: ⚠ CHECK"]),
+    Rule("text_color", "warning",
+         lambda facts, stats: [] if facts.runs.count(slide=3, depth=0, color_rgb=(255, 255, 255))
+         else ["Text color rules: ⚠ CHECK"]),
+    Rule("section_numbering", "warning",
+         lambda facts, stats: [] if len(section_numbered_slides(facts)) >= 3
+         else ["Section numbering: ⚠ CHECK"]),
+])
+
+
+def verify_enhanced_v3(filepath, facts=None):
     """Verify enhanced v3 PPTX requirements"""
     print(f"\n{'='*80}")
     print(f"Enhanced v3 PPTX - Verification")
     print(f"{'='*80}\n")
 
-    prs = Presentation(filepath)
+    facts = facts or analyze_deck(filepath)
 
     # Basic checks
     print(f"1. Basic Properties:")
-    print(f"   Dimensions: {prs.slide_width.inches:.2f}\" × {prs.slide_height.inches:.2f}\"")
-    print(f"   Total slides: {len(prs.slides)}")
-    print(f"   Status: {'✓ PASS' if len(prs.slides) == 48 else '✗ FAIL'}\n")
+    print(f"   Dimensions: {facts.width_inches:.2f}\" × {facts.height_inches:.2f}\"")
+    print(f"   Total slides: {facts.slide_count}")
+    print(f"   Status: {'✓ PASS' if facts.slide_count == 48 else '✗ FAIL'}\n")
 
     # Check specific requirements for key slides
     print(f"2. New Requirements Verification:")
     print(f"{'='*80}\n")
 
-    # Slide 2: TOC check
+    # Slide 2: TOC check (chapter structure: 1장, 2장, etc.)
     print(f"Slide 2 (TOC):")
-    slide2 = prs.slides[1]
-    toc_text = []
-    for shape in slide2.shapes:
-        if hasattr(shape, "text") and shape.text:
-            toc_text.append(shape.text)
-
-    # Check for chapter structure (1장, 2장, etc.)
-    chapters_found = [t for t in toc_text if "장" in t]
+    chapters_found = toc_chapters(facts)
     print(f"   Chapters found: {len(chapters_found)}")
     if chapters_found:
         print(f"   Examples: {', '.join(chapters_found[:3])}")
@@ -45,48 +84,19 @@ def verify_enhanced_v3(filepath):
 
     # Slide 6: Toy Page layout check
     print(f"Slide 6 (Toy Page - Why Now?):")
-    slide6 = prs.slides[5]
-    left_shapes = []
-    right_shapes = []
-
-    for shape in slide6.shapes:
-        try:
-            x = shape.left.inches
-            if x < 7.0:  # Left side
-                left_shapes.append(shape)
-            else:  # Right side
-                right_shapes.append(shape)
-        except:
-            pass
+    left_shapes, right_text = toy_page_split(facts)
 
     print(f"   Left side shapes: {len(left_shapes)} (should be timeline/visual)")
-    print(f"   Right side shapes: {len(right_shapes)} (should be text boxes)")
+    print(f"   Right side shapes: {len(right_text)} (should be text boxes)")
 
     # Check for 시사점, 방안 text
-    right_text = []
-    for shape in right_shapes:
-        if hasattr(shape, "text") and shape.text:
-            right_text.append(shape.text)
-
-    keywords_found = [t for t in right_text if "시사점" in t or "방안" in t]
+    keywords_found = [t for t in right_text if t and ("시사점" in t or "방안" in t)]
     print(f"   Keywords found: {len(keywords_found)} (시사점/방안)")
     print(f"   Toy Page layout: {'✓ PASS' if len(keywords_found) > 0 else '⚠ CHECK'}\n")
 
     # Text color verification (sample check on dark slide)
     print(f"Slide 3 (Chapter Divider - Dark background):")
-    slide3 = prs.slides[2]
-    text_colors = []
-
-    for shape in slide3.shapes:
-        if hasattr(shape, "text_frame"):
-            for paragraph in shape.text_frame.paragraphs:
-                for run in paragraph.runs:
-                    if run.font.color and hasattr(run.font.color, 'rgb'):
-                        try:
-                            rgb = run.font.color.rgb
-                            text_colors.append((rgb[0], rgb[1], rgb[2]))
-                        except:
-                            pass
+    text_colors = [c for c in facts.runs.column("color_rgb", slide=3, depth=0) if c]
 
     white_text = [c for c in text_colors if c == (255, 255, 255)]
     print(f"   Text colors found: {len(text_colors)} total")
@@ -97,16 +107,7 @@ def verify_enhanced_v3(filepath):
     print(f"3. Section Numbering Check (X.Y format):")
     print(f"{'='*80}\n")
 
-    section_numbered = []
-    for idx in range(3, min(20, len(prs.slides))):  # Check slides 4-20
-        slide = prs.slides[idx]
-        for shape in slide.shapes:
-            if hasattr(shape, "text") and shape.text:
-                text = shape.text
-                # Check for X.Y pattern (e.g., "1.1", "2.3")
-                if any(f"{i}.{j}" in text for i in range(1, 10) for j in range(1, 10)):
-                    section_numbered.append((idx + 1, text[:50]))
-                    break
+    section_numbered = section_numbered_slides(facts)
 
     print(f"   Slides with section numbering: {len(section_numbered)}")
     if section_numbered:
@@ -119,18 +120,10 @@ def verify_enhanced_v3(filepath):
     print(f"4. Overall Quality Metrics:")
     print(f"{'='*80}\n")
 
-    total_shapes = 0
-    slides_with_many_shapes = 0
-
-    for idx, slide in enumerate(prs.slides):
-        shape_count = len(slide.shapes)
-        total_shapes += shape_count
-        if shape_count >= 15:
-            slides_with_many_shapes += 1
-
-    avg_shapes = total_shapes / len(prs.slides) if len(prs.slides) > 0 else 0
+    avg_shapes = facts.average_shapes()
+    slides_with_many_shapes = sum(1 for count in facts.slide_shape_counts if count >= 15)
     print(f"   Average shapes per slide: {avg_shapes:.1f}")
-    print(f"   Slides with 15+ shapes: {slides_with_many_shapes}/{len(prs.slides)}")
+    print(f"   Slides with 15+ shapes: {slides_with_many_shapes}/{facts.slide_count}")
     print(f"   Target: 30-40 shapes (for detailed slides)")
     print(f"   Current status: {'✓ GOOD' if avg_shapes >= 10 else '⚠ NEEDS WORK'}\n")
 
@@ -1,69 +1,68 @@
 #!/usr/bin/env python3
 """
 Verify NEW Part 1 PPTX (Session 1 only)
+
+Checks run as queries over deck_analysis facts (the deck is walked once).
 """
 
-from pptx import Presentation
-from pptx.util import Inches, Pt
+from deck_analysis import analyze_deck, Rule, RuleSet
+
+
+def governing_slide_count(facts):
+    """Content slides (cover excluded) with a 16pt Bold governing message"""
+    return sum(1 for idx in facts.slides(2) if facts.has_governing(idx))
+
+
+NEW_PART1_RULES = RuleSet("verify_new_part1", [
+    Rule("dimensions", "error",
+         lambda facts, stats: [] if facts.dimensions_ok() else ["Slide dimensions: ✗ FAIL"]),
+    Rule("slide_count", "error",
+         lambda facts, stats: [] if facts.slide_count == 20 else [f"Slide count: {facts.slide_count} (expected 20)"]),
+    Rule("governing_messages", "error",
+         lambda facts, stats: [] if governing_slide_count(facts) >= 19 else
+         [f"Content slides with governing messages: {governing_slide_count(facts)}/19"]),
+    Rule("shape_density", "warning",
+         lambda facts, stats: [] if facts.average_shapes(facts.slides(2)) >= 10 else
+         ["Shape density: ⚠ LOW (need more diagrams)"]),
+])
+
 
-def verify_pptx(filepath):
+def verify_pptx(filepath, facts=None):
     """Verify PPTX meets S4HANA requirements"""
     print(f"\n{'='*70}")
     print(f"NEW Part 1 PPTX Compliance Verification")
     print(f"{'='*70}\n")
 
-    prs = Presentation(filepath)
+    facts = facts or analyze_deck(filepath)
 
     # 1. Dimensions
     print(f"1. Slide Dimensions:")
-    width_in = prs.slide_width.inches
-    height_in = prs.slide_height.inches
+    width_in = facts.width_inches
+    height_in = facts.height_inches
     print(f"   Width: {width_in:.2f}\" (Expected: 10.83\")")
     print(f"   Height: {height_in:.2f}\" (Expected: 7.50\")")
-    dim_ok = abs(width_in - 10.83) < 0.01 and abs(height_in - 7.50) < 0.01
+    dim_ok = facts.dimensions_ok()
     print(f"   Status: {'✓ PASS' if dim_ok else '✗ FAIL'}\n")
 
     # 2. Slide count
     print(f"2. Slide Count:")
-    print(f"   Total: {len(prs.slides)} slides (Expected: 20)")
-    print(f"   Status: {'✓ PASS' if len(prs.slides) == 20 else '✗ FAIL'}\n")
+    print(f"   Total: {facts.slide_count} slides (Expected: 20)")
+    print(f"   Status: {'✓ PASS' if facts.slide_count == 20 else '✗ FAIL'}\n")
 
     # 3. Font sizes and governing messages
     print(f"3. Font Sizes and Governing Messages:")
-    font_sizes = []
-    gov_count = 0
-    shape_counts = []
-
-    for idx, slide in enumerate(prs.slides, 1):
-        has_gov = False
-        slide_fonts = []
-        shape_count = 0
-
-        for shape in slide.shapes:
-            shape_count += 1
-
-            if hasattr(shape, "text_frame"):
-                for paragraph in shape.text_frame.paragraphs:
-                    for run in paragraph.runs:
-                        if run.font.size:
-                            font_sizes.append(run.font.size.pt)
-                            slide_fonts.append(run.font.size.pt)
-
-                        # Check for governing message (16pt Bold)
-                        if run.font.size and run.font.bold and run.font.size == Pt(16):
-                            has_gov = True
-
-        shape_counts.append(shape_count)
-
-        if idx > 1 and has_gov:  # Skip cover slide
-            gov_count += 1
-
-        # Sample slide details (slides 2, 5, 11)
-        if idx in [2, 5, 11]:
-            print(f"\n   Slide {idx}:")
-            print(f"     - Shapes: {shape_count}")
-            print(f"     - Font sizes: {sorted(set([int(f) for f in slide_fonts]))}")
-            print(f"     - Governing message: {'✓ YES' if has_gov else '✗ NO'}")
+    font_sizes = facts.font_sizes()
+    gov_count = governing_slide_count(facts)
+    shape_counts = facts.slide_shape_counts
+
+    # Sample slide details (slides 2, 5, 11)
+    for idx in [i for i in [2, 5, 11] if i <= facts.slide_count]:
+        has_gov = facts.has_governing(idx)
+        slide_fonts = facts.font_sizes(slide=idx)
+        print(f"\n   Slide {idx}:")
+        print(f"     - Shapes: {shape_counts[idx - 1]}")
+        print(f"     - Font sizes: {sorted(set([int(f) for f in slide_fonts]))}")
+        print(f"     - Governing message: {'✓ YES' if has_gov else '✗ NO'}")
 
     print(f"\n   Content slides with governing messages: {gov_count}/19")
     print(f"   Status: {'✓ PASS' if gov_count >= 19 else '✗ FAIL'}")
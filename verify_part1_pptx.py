@@ -1,69 +1,89 @@
 #!/usr/bin/env python3
 """
 Verify Part 1 PPTX compliance with S4HANA design system
+
+Checks run as queries over deck_analysis facts (the deck is walked once).
 """
 
-from pptx import Presentation
-from pptx.util import Inches, Pt
+from deck_analysis import analyze_deck, Rule, RuleSet
+
+ALLOWED_FONTS = ['Arial', '맑은 고딕', 'Malgun Gothic']
+
+
+def governing_slide_count(facts):
+    """Content slides (cover excluded) with a 16pt Bold governing message"""
+    return sum(1 for idx in facts.slides(2) if facts.has_governing(idx))
+
+
+def font_issues(facts):
+    """Explicit run fonts other than Arial / 맑은 고딕"""
+    issues = []
+    for idx in facts.slides():
+        for font in facts.runs.distinct("font_name", slide=idx, depth=0, font_name=bool):
+            if font not in ALLOWED_FONTS:
+                issues.append(f"Slide {idx}: Unexpected font '{font}'")
+    return issues
 
-def verify_pptx(filepath):
+
+def print_first_runs(facts, slide):
+    """Text of each shape with the font of the first styled run in its first paragraph"""
+    for row in facts.shapes.indices(slide=slide, depth=0, has_text_frame=True):
+        text = facts.shapes["text"][row]
+        if not text.strip():
+            continue
+        print(f"     - Text: \"{text[:50]}...\"")
+        styled = facts.runs.rows("font_name", "size_pt", "bold", shape=row, paragraph=0,
+                                 font_name=bool, size_pt=bool)
+        if styled:
+            name, size, bold = styled[0]
+            print(f"       Font: {name}, Size: {size}pt, Bold: {bold}")
+
+
+PART1_RULES = RuleSet("verify_part1_pptx", [
+    Rule("dimensions", "error",
+         lambda facts, stats: [] if facts.dimensions_ok() else ["Slide dimensions: ✗ FAIL"]),
+    Rule("slide_count", "error",
+         lambda facts, stats: [] if facts.slide_count == 20 else [f"Slide count: {facts.slide_count} (expected 20)"]),
+    Rule("governing_messages", "error",
+         lambda facts, stats: [] if governing_slide_count(facts) >= 19 else
+         [f"Content slides with governing messages: {governing_slide_count(facts)}/19"]),
+    Rule("fonts", "warning", lambda facts, stats: font_issues(facts)),
+])
+
+
+def verify_pptx(filepath, facts=None):
     """Verify PPTX meets S4HANA requirements"""
     print(f"\n{'='*70}")
     print(f"PPTX Compliance Verification")
     print(f"{'='*70}\n")
 
-    prs = Presentation(filepath)
+    facts = facts or analyze_deck(filepath)
 
     # 1. Check dimensions
     print(f"1. Slide Dimensions:")
-    width_in = prs.slide_width.inches
-    height_in = prs.slide_height.inches
+    width_in = facts.width_inches
+    height_in = facts.height_inches
     print(f"   Width: {width_in:.2f}\" (Expected: 10.83\")")
     print(f"   Height: {height_in:.2f}\" (Expected: 7.50\")")
-    dim_ok = abs(width_in - 10.83) < 0.01 and abs(height_in - 7.50) < 0.01
+    dim_ok = facts.dimensions_ok()
     print(f"   Status: {'✓ PASS' if dim_ok else '✗ FAIL'}\n")
 
     # 2. Check total slides
     print(f"2. Slide Count:")
-    print(f"   Total: {len(prs.slides)} slides")
-    print(f"   Status: {'✓ PASS' if len(prs.slides) == 20 else '✗ FAIL'}\n")
+    print(f"   Total: {facts.slide_count} slides")
+    print(f"   Status: {'✓ PASS' if facts.slide_count == 20 else '✗ FAIL'}\n")
 
     # 3. Check fonts and governing messages
     print(f"3. Font and Governing Message Check:")
-    gov_count = 0
-    font_issues = []
-
-    for idx, slide in enumerate(prs.slides, 1):
-        has_gov = False
-        slide_fonts = set()
-
-        for shape in slide.shapes:
-            if hasattr(shape, "text_frame"):
-                for paragraph in shape.text_frame.paragraphs:
-                    for run in paragraph.runs:
-                        if run.font.name:
-                            slide_fonts.add(run.font.name)
-
-                        # Check for governing message (16pt Bold)
-                        if run.font.size and run.font.bold:
-                            if run.font.size == Pt(16):
-                                has_gov = True
-
-        # Check fonts are Arial or 맑은 고딕
-        for font in slide_fonts:
-            if font not in ['Arial', '맑은 고딕', 'Malgun Gothic']:
-                font_issues.append(f"Slide {idx}: Unexpected font '{font}'")
-
-        if idx > 1:  # Skip cover slide
-            if has_gov:
-                gov_count += 1
+    gov_count = governing_slide_count(facts)
+    issues = font_issues(facts)
 
     print(f"   Content slides with governing messages: {gov_count}/19")
     print(f"   Status: {'✓ PASS' if gov_count >= 19 else '✗ FAIL'}")
 
-    if font_issues:
+    if issues:
         print(f"   Font Issues:")
-        for issue in font_issues[:5]:  # Show first 5
+        for issue in issues[:5]:  # Show first 5
             print(f"     - {issue}")
     else:
         print(f"   Fonts: ✓ All slides use Arial or 맑은 고딕")
@@ -72,30 +92,11 @@ def verify_pptx(filepath):
     # 4. Sample slide details
     print(f"4. Sample Slide Analysis:")
     print(f"\n   Slide 1 (Cover):")
-    for shape in prs.slides[0].shapes:
-        if hasattr(shape, "text") and shape.text.strip():
-            print(f"     - Text: \"{shape.text[:50]}...\"")
-            if hasattr(shape, "text_frame"):
-                for para in shape.text_frame.paragraphs:
-                    for run in para.runs:
-                        if run.font.name and run.font.size:
-                            print(f"       Font: {run.font.name}, Size: {run.font.size.pt}pt, Bold: {run.font.bold}")
-                            break
-                    break
-
-    if len(prs.slides) > 1:
+    print_first_runs(facts, 1)
+
+    if facts.slide_count > 1:
         print(f"\n   Slide 2 (First Content):")
-        for shape in prs.slides[1].shapes:
-            if hasattr(shape, "text") and shape.text.strip():
-                text = shape.text[:50]
-                print(f"     - Text: \"{text}...\"")
-                if hasattr(shape, "text_frame"):
-                    for para in shape.text_frame.paragraphs:
-                        for run in para.runs:
-                            if run.font.name and run.font.size:
-                                print(f"       Font: {run.font.name}, Size: {run.font.size.pt}pt, Bold: {run.font.bold}")
-                                break
-                        break
+        print_first_runs(facts, 2)
 
     print(f"\n{'='*70}")
     print(f"Verification Complete")
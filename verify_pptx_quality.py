@@ -3,68 +3,73 @@
 PPTX Quality Verification Script
 Enforces S4HANA design standards for Part 1-9 consistency
 
+Checks run as a rule set over deck_analysis facts, filled by the read-only
+raw-XML scanner (pptx_xml_scan) so the deck is streamed once without python-pptx.
+
+Optional: --reference compares the deck to a cached reference style profile
+(style_profile) and reports per-component similarity as warnings.
+
+Parallel: --jobs N splits one deck's slides across N processes
+(pptx_xml_scan.scan_deck_parallel); with several decks, the decks are scanned in
+parallel and the reports are printed in argument order. Output is identical to
+the serial run.
+
 Usage:
     python3 verify_pptx_quality.py Part1_Session1_StrategicInventory.pptx
+    python3 verify_pptx_quality.py PPTX_RESULT/*.pptx --jobs 4
+    python3 verify_pptx_quality.py deck.pptx --reference PPTX_SAMPLE/S4HANA_....pptx
 """
 
 import sys
-from pptx import Presentation
-from pptx.util import Inches
-
-
-def verify_pptx(filepath):
-    """Verify PPTX meets quality standards"""
-    print(f"\n{'='*60}")
-    print(f"PPTX Quality Verification: {filepath}")
-    print(f"{'='*60}\n")
+from concurrent.futures import ProcessPoolExecutor
 
-    try:
-        prs = Presentation(filepath)
-    except Exception as e:
-        print(f"❌ FATAL: Cannot open file: {e}")
-        return False
+from deck_analysis import Rule, RuleSet
+from pptx_xml_scan import scan_deck, scan_deck_parallel
 
-    failures = []
-    warnings = []
 
-    # Check 1: Slide dimensions (CRITICAL)
+# Check 1: Slide dimensions (CRITICAL)
+def check_dimensions(facts, stats):
     expected_width = 914400 * 10.83  # EMUs
     expected_height = 914400 * 7.5
+    failures = []
 
-    if abs(prs.slide_width - expected_width) > 100:
+    if abs(facts.slide_width - expected_width) > 100:
         failures.append(
-            f"❌ Width: {prs.slide_width/914400:.2f}\" (should be 10.83\")"
+            f"❌ Width: {facts.slide_width/914400:.2f}\" (should be 10.83\")"
         )
 
-    if abs(prs.slide_height - expected_height) > 100:
+    if abs(facts.slide_height - expected_height) > 100:
         failures.append(
-            f"❌ Height: {prs.slide_height/914400:.2f}\" (should be 7.5\")"
+            f"❌ Height: {facts.slide_height/914400:.2f}\" (should be 7.5\")"
         )
+    return failures
 
-    # Check 2: Slide count
-    slide_count = len(list(prs.slides))
-    if slide_count < 20:
-        failures.append(
-            f"❌ Only {slide_count} slides (expected 20+ for comprehensive coverage)"
-        )
-    elif slide_count > 35:
-        warnings.append(
-            f"⚠️  {slide_count} slides (consider splitting if >35)"
-        )
 
-    # Check 3: Shapes per slide (content density)
-    low_density_slides = []
-    shape_counts = []
+# Check 2: Slide count
+def check_slide_count_min(facts, stats):
+    stats["slide_count"] = facts.slide_count
+    if facts.slide_count < 20:
+        return [f"❌ Only {facts.slide_count} slides (expected 20+ for comprehensive coverage)"]
+    return []
 
-    all_slides = list(prs.slides)
-    for i, slide in enumerate(all_slides[1:], 2):  # Skip cover slide
-        shape_count = len(slide.shapes)
-        shape_counts.append(shape_count)
 
-        if shape_count < 10:
-            low_density_slides.append(f"Slide {i}: {shape_count} shapes")
+def check_slide_count_max(facts, stats):
+    if facts.slide_count > 35:
+        return [f"⚠️  {facts.slide_count} slides (consider splitting if >35)"]
+    return []
 
-    avg_shapes = sum(shape_counts) / len(shape_counts) if shape_counts else 0
+
+# Check 3: Shapes per slide (content density)
+def check_shape_density(facts, stats):
+    failures = []
+    content_slides = facts.slides(2)  # Skip cover slide
+    low_density_slides = [
+        f"Slide {i}: {facts.slide_shape_counts[i - 1]} shapes"
+        for i in content_slides if facts.slide_shape_counts[i - 1] < 10
+    ]
+
+    avg_shapes = facts.average_shapes(content_slides)
+    stats["avg_shapes"] = avg_shapes
 
     if low_density_slides:
         failures.append(
@@ -78,83 +83,118 @@ def verify_pptx(filepath):
         failures.append(
             f"❌ Average shapes per slide: {avg_shapes:.1f} (should be 20+)"
         )
+    return failures
 
-    # Check 4: Font sizes distribution
-    font_sizes = {}
-    total_runs = 0
-
-    sample_slides = list(prs.slides)[:10]
-    for slide in sample_slides:  # Sample first 10 slides
-        for shape in slide.shapes:
-            if hasattr(shape, 'text_frame'):
-                for para in shape.text_frame.paragraphs:
-                    for run in para.runs:
-                        if run.font.size:
-                            size = int(run.font.size.pt)
-                            font_sizes[size] = font_sizes.get(size, 0) + 1
-                            total_runs += 1
 
-    if total_runs > 0:
-        pt10_ratio = font_sizes.get(10, 0) / total_runs
-        pt12_ratio = font_sizes.get(12, 0) / total_runs
-
-        # 10pt should be PRIMARY (target: 65%, accept ≥40%)
-        if pt10_ratio < 0.4:
-            failures.append(
-                f"❌ 10pt text ratio: {pt10_ratio*100:.1f}% (should be 60%+)"
-            )
-        elif pt10_ratio < 0.55:
-            warnings.append(
-                f"⚠️  10pt text ratio: {pt10_ratio*100:.1f}% (target: 65%+)"
-            )
-
-        # 12pt for bullets (target: 20-25%, accept 15-35%)
-        if pt12_ratio > 0.4:
-            warnings.append(
-                f"⚠️  12pt text ratio: {pt12_ratio*100:.1f}% (should be 20-25%)"
-            )
-
-    # Check 5: Governing messages presence (sample check)
-    slides_without_gov_msg = []
-
-    sample_check_slides = list(prs.slides)[1:6]
-    for i, slide in enumerate(sample_check_slides, 2):  # Check slides 2-6
-        # Look for text boxes with 16pt Bold text (governing message signature)
-        has_gov_msg = False
-
-        for shape in slide.shapes:
-            if hasattr(shape, 'text_frame'):
-                for para in shape.text_frame.paragraphs:
-                    for run in para.runs:
-                        if (run.font.size and
-                            int(run.font.size.pt) == 16 and
-                            run.font.bold):
-                            has_gov_msg = True
-                            break
-
-        if not has_gov_msg:
-            slides_without_gov_msg.append(i)
+# Check 4: Font sizes distribution (sample first 10 slides)
+def _font_ratios(facts, stats):
+    if "font_sizes" not in stats:
+        font_sizes = facts.font_size_distribution(slide=facts.slides(1, 10))
+        stats["font_sizes"] = font_sizes
+        stats["total_runs"] = sum(font_sizes.values())
+    total_runs = stats["total_runs"]
+    if total_runs == 0:
+        return None, None
+    font_sizes = stats["font_sizes"]
+    return font_sizes.get(10, 0) / total_runs, font_sizes.get(12, 0) / total_runs
+
 
+def check_pt10_ratio(facts, stats):
+    # 10pt should be PRIMARY (target: 65%, accept ≥40%)
+    pt10_ratio, _ = _font_ratios(facts, stats)
+    if pt10_ratio is not None and pt10_ratio < 0.4:
+        return [f"❌ 10pt text ratio: {pt10_ratio*100:.1f}% (should be 60%+)"]
+    return []
+
+
+def check_pt10_target(facts, stats):
+    pt10_ratio, _ = _font_ratios(facts, stats)
+    if pt10_ratio is not None and 0.4 <= pt10_ratio < 0.55:
+        return [f"⚠️  10pt text ratio: {pt10_ratio*100:.1f}% (target: 65%+)"]
+    return []
+
+
+def check_pt12_ratio(facts, stats):
+    # 12pt for bullets (target: 20-25%, accept 15-35%)
+    _, pt12_ratio = _font_ratios(facts, stats)
+    if pt12_ratio is not None and pt12_ratio > 0.4:
+        return [f"⚠️  12pt text ratio: {pt12_ratio*100:.1f}% (should be 20-25%)"]
+    return []
+
+
+# Check 5: Governing messages presence (sample check on slides 2-6)
+def check_governing_messages(facts, stats):
+    # 16pt Bold text is the governing message signature
+    slides_without_gov_msg = [i for i in facts.slides(2, 6) if not facts.has_governing(i)]
     if slides_without_gov_msg:
-        warnings.append(
-            f"⚠️  Possible missing governing messages (16pt Bold) on slides: {slides_without_gov_msg}"
-        )
+        return [f"⚠️  Possible missing governing messages (16pt Bold) on slides: {slides_without_gov_msg}"]
+    return []
+
+
+QUALITY_RULES = RuleSet("verify_pptx_quality", [
+    Rule("dimensions", "error", check_dimensions),
+    Rule("slide_count_min", "error", check_slide_count_min),
+    Rule("slide_count_max", "warning", check_slide_count_max),
+    Rule("shape_density", "error", check_shape_density),
+    Rule("pt10_ratio", "error", check_pt10_ratio),
+    Rule("pt10_target", "warning", check_pt10_target),
+    Rule("pt12_ratio", "warning", check_pt12_ratio),
+    Rule("governing_messages", "warning", check_governing_messages),
+])
+
+
+def verify_pptx(filepath, facts=None, profile=None, jobs=None, error=None):
+    """
+    Verify PPTX meets quality standards
+
+    profile: style_profile.StyleProfile (optional)
+    jobs: >1 이면 슬라이드를 프로세스별로 나눠 스캔
+    error: 이미 스캔에 실패한 경우의 예외 (verify_many용)
+    """
+    print(f"\n{'='*60}")
+    print(f"PPTX Quality Verification: {filepath}")
+    print(f"{'='*60}\n")
+
+    if facts is None and error is None:
+        try:
+            facts = scan_deck_parallel(filepath, jobs) if jobs and jobs > 1 else scan_deck(filepath)
+        except Exception as e:
+            error = e
+    if error is not None:
+        print(f"❌ FATAL: Cannot open file: {error}")
+        return False
+
+    rules = QUALITY_RULES
+    if profile is not None:
+        from style_profile import style_rule
+        rules = RuleSet(QUALITY_RULES.name, QUALITY_RULES.rules + [style_rule(profile)])
+    result = rules.run(facts)
+    failures = result["errors"]
+    warnings = result["warnings"]
+    stats = result["stats"]
 
     # Print results
     print("=" * 60)
     print("VERIFICATION RESULTS")
     print("=" * 60)
 
-    print(f"\n✓ Slide count: {slide_count}")
-    print(f"✓ Dimensions: {prs.slide_width/914400:.2f}\" × {prs.slide_height/914400:.2f}\"")
-    print(f"✓ Average shapes per slide: {avg_shapes:.1f}")
+    print(f"\n✓ Slide count: {facts.slide_count}")
+    print(f"✓ Dimensions: {facts.slide_width/914400:.2f}\" × {facts.slide_height/914400:.2f}\"")
+    print(f"✓ Average shapes per slide: {stats['avg_shapes']:.1f}")
 
+    total_runs = stats["total_runs"]
     if total_runs > 0:
+        font_sizes = stats["font_sizes"]
         print(f"\n✓ Font size distribution (first 10 slides):")
         for size in sorted(font_sizes.keys()):
             ratio = font_sizes[size] / total_runs
             print(f"   {size}pt: {ratio*100:.1f}%")
 
+    if "style" in stats:
+        print(f"\n✓ Style similarity to reference ({len(profile.decks)} deck(s)):")
+        for name, score in stats["style"].items():
+            print(f"   {name}: {score:.2f}")
+
     if warnings:
         print(f"\n⚠️  WARNINGS ({len(warnings)}):")
         for warning in warnings:
@@ -176,11 +216,49 @@ def verify_pptx(filepath):
         return True
 
 
+def verify_many(filepaths, jobs=None, profile=None):
+    """
+    여러 덱 검증 - 덱 스캔은 프로세스 풀에서 병렬, 리포트는 인자 순서대로 출력
+
+    Returns:
+        list of bool (filepaths 순서)
+    """
+    if not jobs or jobs <= 1 or len(filepaths) < 2:
+        return [verify_pptx(filepath, profile=profile) for filepath in filepaths]
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(scan_deck, filepath) for filepath in filepaths]
+        results = []
+        for filepath, future in zip(filepaths, futures):
+            try:
+                facts, error = future.result(), None
+            except Exception as e:
+                facts, error = None, e
+            results.append(verify_pptx(filepath, facts=facts, profile=profile, error=error))
+    return results
+
+
 if __name__ == '__main__':
     if len(sys.argv) < 2:
-        print("Usage: python3 verify_pptx_quality.py <pptx_file>")
+        print("Usage: python3 verify_pptx_quality.py <pptx_file> [<pptx_file> ...] [--jobs N] [--reference ...]")
         sys.exit(1)
 
-    filepath = sys.argv[1]
-    success = verify_pptx(filepath)
+    args = sys.argv[1:]
+    jobs = None
+    if "--jobs" in args:
+        i = args.index("--jobs")
+        jobs = int(args[i + 1])
+        del args[i:i + 2]
+
+    profile = None
+    if "--reference" in args:
+        from style_profile import StyleProfile
+        i = args.index("--reference")
+        profile = StyleProfile.from_decks(args[i + 1:] or None)
+        args = args[:i]
+
+    if len(args) > 1:
+        success = all(verify_many(args, jobs=jobs, profile=profile))
+    else:
+        success = verify_pptx(args[0], profile=profile, jobs=jobs)
     sys.exit(0 if success else 1)